@@ -24,6 +24,64 @@ def acquire_write_lock_study_value(uid: str) -> None:
     )
 
 
+@trace_calls
+def get_library_change_marker() -> tuple[str | None, int]:
+    """
+    Returns a marker which changes with every change of library items and controlled terminology.
+
+    Versioned items get a new `HAS_VERSION` relationship on every change and end-date the previous one,
+    and terms are added to or removed from codelists with `HAS_TERM` relationships, so the number of these
+    relationships and their latest start or end date change with every update. The counts come from
+    the count store and the dates from the relationship indexes, so the marker is cheap to get.
+
+    Returns:
+        tuple[str | None, int]: latest start or end date and number of the relationships
+    """
+    results, _ = db.cypher_query(
+        """
+        CALL {
+            MATCH ()-[r:HAS_VERSION]->() RETURN count(r) AS changes
+            UNION ALL
+            MATCH ()-[r:HAS_TERM]->() RETURN count(r) AS changes
+        }
+        WITH sum(changes) AS changes
+        CALL {
+            MATCH ()-[r:HAS_VERSION]->() WHERE r.start_date IS NOT NULL
+            RETURN r.start_date AS date ORDER BY date DESC LIMIT 1
+            UNION
+            MATCH ()-[r:HAS_VERSION]->() WHERE r.end_date IS NOT NULL
+            RETURN r.end_date AS date ORDER BY date DESC LIMIT 1
+            UNION
+            MATCH ()-[r:HAS_TERM]->() WHERE r.start_date IS NOT NULL
+            RETURN r.start_date AS date ORDER BY date DESC LIMIT 1
+            UNION
+            MATCH ()-[r:HAS_TERM]->() WHERE r.end_date IS NOT NULL
+            RETURN r.end_date AS date ORDER BY date DESC LIMIT 1
+        }
+        RETURN toString(max(date)) AS latest, changes
+        """
+    )
+    latest, changes = results[0]
+    return latest, changes
+
+
+def number_selections_in_study(columns: list[str]) -> str:
+    """
+    Returns Cypher clauses which set the `order` of each study selection row to its 1-based position
+    among the rows of its study, the way the study selection aggregates number their selections.
+
+    The incoming rows must have a `study_uid` and be sorted by their stored order,
+    `columns` are the other columns to keep.
+    """
+    row = ", ".join(f"{column}: {column}" for column in columns)
+    unpacked = ", ".join(f"rows[index].{column} AS {column}" for column in columns)
+    return f"""
+        WITH study_uid, collect({{ {row} }}) AS rows
+        UNWIND range(0, size(rows) - 1) AS index
+        WITH study_uid, index + 1 AS order, {unpacked}
+        """
+
+
 # Helper to get the version properties of the latest version of a versioned item.
 def get_latest_version_properties(item) -> VersionProperties | None:
     latest = item.has_latest_value.get_or_none()
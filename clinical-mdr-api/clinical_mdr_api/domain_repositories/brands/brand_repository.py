@@ -1,6 +1,6 @@
 from threading import Lock
 
-from cachetools import TTLCache, cached
+from cachetools import cached
 from cachetools.keys import hashkey
 
 from clinical_mdr_api.domain_repositories.generic_repository import (
@@ -9,13 +9,11 @@ from clinical_mdr_api.domain_repositories.generic_repository import (
 from clinical_mdr_api.domain_repositories.models.brand import Brand
 from clinical_mdr_api.domains.brands.brand import BrandAR
 from clinical_mdr_api.repositories._utils import sb_clear_cache
-from common.config import settings
+from common.cache import create_cache
 
 
 class BrandRepository:
-    cache_store_item_by_uid = TTLCache(
-        maxsize=settings.cache_max_size, ttl=settings.cache_ttl
-    )
+    cache_store_item_by_uid = create_cache("BrandRepository.cache_store_item_by_uid")
     lock_store_item_by_uid = Lock()
 
     def generate_uid(self) -> str:
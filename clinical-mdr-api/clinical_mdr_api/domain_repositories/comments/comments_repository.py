@@ -3,7 +3,7 @@ from datetime import datetime
 from threading import Lock
 from typing import Collection
 
-from cachetools import TTLCache, cached
+from cachetools import cached
 from cachetools.keys import hashkey
 from neo4j.exceptions import CypherSyntaxError
 from neomodel import db
@@ -26,16 +26,14 @@ from clinical_mdr_api.domains.comments.comments import (
 )
 from clinical_mdr_api.repositories._utils import sb_clear_cache
 from common import exceptions
-from common.config import settings
+from common.cache import create_cache
 from common.utils import convert_to_datetime, validate_max_skip_clause
 
 log = logging.getLogger(__name__)
 
 
 class CommentsRepository:
-    cache_store_item_by_uid = TTLCache(
-        maxsize=settings.cache_max_size, ttl=settings.cache_ttl
-    )
+    cache_store_item_by_uid = create_cache("CommentsRepository.cache_store_item_by_uid")
     lock_store_item_by_uid = Lock()
 
     def generate_topic_uid(self) -> str:
@@ -0,0 +1,220 @@
+from collections import defaultdict
+from typing import Any
+
+from neomodel import db
+
+from common.config import settings
+
+
+class DataExtractorRepository:
+    """
+    Reads the ODM elements to export as plain dicts.
+
+    `find_elements` walks from the targets down through forms, item groups and items and
+    projects every element together with its refs, vendor extensions, unit definitions and
+    codelist terms. `find_references` reads the conditions, methods and vendor definitions
+    the elements refer to by OID or UID.
+    """
+
+    HIERARCHY = [
+        ("OdmStudyEvent", "study_events", None),
+        ("OdmForm", "forms", "FORM_REF"),
+        ("OdmItemGroup", "item_groups", "ITEM_GROUP_REF"),
+        ("OdmItem", "items", "ITEM_REF"),
+    ]
+
+    LATEST_VERSION_CALL = """
+    CALL {
+        WITH level, concept_value
+        MATCH (concept_root)-[hv:HAS_VERSION]->(concept_value)
+        WHERE level <> $target_label OR $version IS NULL OR hv.version = $version
+        WITH concept_root, hv
+        ORDER BY
+            toInteger(split(hv.version, '.')[0]) ASC,
+            toInteger(split(hv.version, '.')[1]) ASC,
+            hv.end_date ASC,
+            hv.start_date ASC
+        WITH collect([concept_root, hv]) AS versions
+        RETURN last(versions)[0] AS concept_root, last(versions)[1] AS version_rel
+    }
+    """
+
+    COMMON_PROJECTION = """
+        .*,
+        uid: concept_root.uid,
+        version: version_rel.version,
+        descriptions: [(concept_value)-[:HAS_DESCRIPTION]->(description:OdmDescription) |
+            description {.name, .language, .description, .instruction, .sponsor_instruction}],
+        aliases: [(concept_value)-[:HAS_ALIAS]->(alias:OdmAlias) | alias {.name, .context}]
+    """
+
+    ELEMENT_PROJECTION = f"""
+    concept_value {{
+        {COMMON_PROJECTION},
+        vendor_elements: [(concept_value)-[hve:HAS_VENDOR_ELEMENT]->(vev:OdmVendorElementValue)<-[:HAS_VERSION]-(ver:OdmVendorElementRoot) |
+            {{uid: ver.uid, name: vev.name, value: hve.value,
+            vendor_namespace: head([(ver)-[:LATEST]->(:OdmVendorElementValue)<-[:HAS_VENDOR_ELEMENT]-(vnv:OdmVendorNamespaceValue)<-[:HAS_VERSION]-(vnr:OdmVendorNamespaceRoot) |
+                {{uid: vnr.uid, name: vnv.name, prefix: vnv.prefix, url: vnv.url}}])}}],
+        vendor_attributes: [(concept_value)-[hva:HAS_VENDOR_ATTRIBUTE]->(vav:OdmVendorAttributeValue)<-[:HAS_VERSION]-(var:OdmVendorAttributeRoot) |
+            {{uid: var.uid, name: vav.name, value: hva.value,
+            vendor_namespace_uid: head([(vav)<-[:HAS_VENDOR_ATTRIBUTE]-(:OdmVendorNamespaceValue)<-[:HAS_VERSION]-(vnr:OdmVendorNamespaceRoot) | vnr.uid])}}],
+        vendor_element_attributes: [(concept_value)-[hvea:HAS_VENDOR_ELEMENT_ATTRIBUTE]->(vav:OdmVendorAttributeValue)<-[:HAS_VERSION]-(var:OdmVendorAttributeRoot) |
+            {{uid: var.uid, name: vav.name, value: hvea.value,
+            vendor_element_uid: head([(vav)<-[:HAS_VENDOR_ATTRIBUTE]-(:OdmVendorElementValue)<-[:HAS_VERSION]-(ver:OdmVendorElementRoot) | ver.uid])}}],
+        forms: [(concept_value)-[ref:FORM_REF]->(form:OdmFormValue)<-[ref_hv:HAS_VERSION]-(form_root:OdmFormRoot) |
+            ref {{.order_number, .mandatory, .locked, .collection_exception_condition_oid,
+            uid: form_root.uid, oid: form.oid, name: form.name, version: ref_hv.version}}],
+        item_groups: [(concept_value)-[ref:ITEM_GROUP_REF]->(item_group:OdmItemGroupValue)<-[ref_hv:HAS_VERSION]-(item_group_root:OdmItemGroupRoot) |
+            ref {{.order_number, .mandatory, .collection_exception_condition_oid, .vendor,
+            uid: item_group_root.uid, oid: item_group.oid, name: item_group.name, version: ref_hv.version}}],
+        items: [(concept_value)-[ref:ITEM_REF]->(item:OdmItemValue)<-[ref_hv:HAS_VERSION]-(item_root:OdmItemRoot) |
+            ref {{.order_number, .mandatory, .key_sequence, .method_oid, .imputation_method_oid, .role,
+            .role_codelist_oid, .collection_exception_condition_oid, .vendor,
+            uid: item_root.uid, oid: item.oid, name: item.name, version: ref_hv.version}}],
+        sdtm_domains: [(concept_value)-[:HAS_SDTM_DOMAIN]->(:CTTermContext)-[:HAS_SELECTED_TERM]->(domain_root:CTTermRoot)
+            <-[:HAS_TERM_ROOT]-(domain_term:CTCodelistTerm)<-[domain_ht:HAS_TERM]-(:CTCodelistRoot)
+            -[:HAS_ATTRIBUTES_ROOT]->(:CTCodelistAttributesRoot)-[:LATEST_FINAL]->(:CTCodelistAttributesValue {{submission_value: $sdtm_domain_codelist}})
+            WHERE domain_ht.end_date IS NULL |
+            {{term_uid: domain_root.uid, submission_value: domain_term.submission_value,
+            preferred_term: head([(domain_root)-[:HAS_ATTRIBUTES_ROOT]->(:CTTermAttributesRoot)-[:LATEST_FINAL]->(domain_attributes:CTTermAttributesValue) |
+                domain_attributes.preferred_term])}}],
+        unit_definitions: [(concept_value)-[hud:HAS_UNIT_DEFINITION]->(unit_root:UnitDefinitionRoot)-[:LATEST]->(unit_value:UnitDefinitionValue) |
+            {{uid: unit_root.uid, name: unit_value.name, mandatory: hud.mandatory, order: hud.order,
+            version: head([(unit_root)-[unit_hv:HAS_VERSION]->(unit_value) WHERE unit_hv.end_date IS NULL | unit_hv.version])}}],
+        codelist: head([(concept_value)-[:HAS_CODELIST]->(codelist_root:CTCodelistRoot)-[:HAS_ATTRIBUTES_ROOT]->
+            (codelist_attributes_root:CTCodelistAttributesRoot)-[:LATEST]->(codelist_value:CTCodelistAttributesValue) |
+            {{uid: codelist_root.uid, name: codelist_value.name, submission_value: codelist_value.submission_value,
+            preferred_term: codelist_value.preferred_term,
+            version: head([(codelist_attributes_root)-[codelist_hv:HAS_VERSION]->(codelist_value) WHERE codelist_hv.end_date IS NULL |
+                codelist_hv.version])}}]),
+        terms: [(concept_value)-[hct:HAS_CODELIST_TERM]->(:CTTermContext)-[:HAS_SELECTED_TERM]->(term_root:CTTermRoot) |
+            {{term_uid: term_root.uid, mandatory: hct.mandatory, order: hct.order, display_text: hct.display_text,
+            name: head([(term_root)-[:HAS_NAME_ROOT]->(:CTTermNameRoot)-[:LATEST]->(term_name:CTTermNameValue) | term_name.name]),
+            nci_preferred_name: head([(term_root)-[:HAS_ATTRIBUTES_ROOT]->(:CTTermAttributesRoot)-[:LATEST]->(term_attributes:CTTermAttributesValue) |
+                term_attributes.preferred_term]),
+            version: head(
+                [(term_root)-[:HAS_ATTRIBUTES_ROOT]->(:CTTermAttributesRoot)-[term_hv:HAS_VERSION {{status: 'Draft'}}]->(:CTTermAttributesValue)
+                WHERE term_hv.end_date IS NULL | term_hv.version]
+                + [(term_root)-[:HAS_ATTRIBUTES_ROOT]->(:CTTermAttributesRoot)-[term_hv:HAS_VERSION {{status: 'Final'}}]->(:CTTermAttributesValue)
+                WHERE term_hv.end_date IS NULL | term_hv.version]),
+            submission_value: head([(concept_value)-[:HAS_CODELIST]->(:CTCodelistRoot)-[:HAS_TERM]->(codelist_term:CTCodelistTerm)-[:HAS_TERM_ROOT]->(term_root) |
+                codelist_term.submission_value])}}]
+    }}
+    """
+
+    REFERENCES_QUERY = f"""
+    MATCH (concept_root:OdmConditionRoot)-[:LATEST]->(concept_value:OdmConditionValue)
+    WHERE concept_value.oid IN $condition_oids
+    WITH "OdmCondition" AS level, concept_value
+    {LATEST_VERSION_CALL}
+    RETURN level AS type, concept_value {{
+        {COMMON_PROJECTION},
+        formal_expressions: [(concept_value)-[:HAS_FORMAL_EXPRESSION]->(expression:OdmFormalExpression) | expression {{.context, .expression}}]
+    }} AS element
+    UNION ALL
+    MATCH (concept_root:OdmMethodRoot)-[:LATEST]->(concept_value:OdmMethodValue)
+    WHERE concept_value.oid IN $method_oids
+    WITH "OdmMethod" AS level, concept_value
+    {LATEST_VERSION_CALL}
+    RETURN level AS type, concept_value {{
+        {COMMON_PROJECTION},
+        formal_expressions: [(concept_value)-[:HAS_FORMAL_EXPRESSION]->(expression:OdmFormalExpression) | expression {{.context, .expression}}]
+    }} AS element
+    UNION ALL
+    MATCH (attribute_root:OdmVendorAttributeRoot)-[:LATEST]->(attribute_value:OdmVendorAttributeValue)
+    <-[:HAS_VENDOR_ATTRIBUTE]-(namespace_value:OdmVendorNamespaceValue)<-[:HAS_VERSION]-(namespace_root:OdmVendorNamespaceRoot)
+    WHERE attribute_root.uid IN $vendor_attribute_uids
+    WITH DISTINCT attribute_root, attribute_value, namespace_root, namespace_value
+    RETURN "OdmVendorAttribute" AS type, {{
+        uid: attribute_root.uid,
+        name: attribute_value.name,
+        vendor_namespace: namespace_value {{.name, .prefix, .url, uid: namespace_root.uid}}
+    }} AS element
+    UNION ALL
+    MATCH (namespace_root:OdmVendorNamespaceRoot)-[:LATEST]->(namespace_value:OdmVendorNamespaceValue)
+    RETURN "OdmVendorNamespace" AS type, namespace_value {{.name, .prefix, .url, uid: namespace_root.uid}} AS element
+    """
+
+    def _elements_query(self, target_label: str, version: str | None) -> str:
+        labels = [label for label, _, _ in self.HIERARCHY]
+        levels = self.HIERARCHY[labels.index(target_label) :]
+
+        _, target_alias, _ = levels[0]
+        where_version = "AND hv.version = $version" if version is not None else ""
+        rel = "hv:HAS_VERSION" if version is not None else ":LATEST"
+        traversal = [
+            f"""
+            MATCH (target_root:{target_label}Root)-[{rel}]->(target_value:{target_label}Value)
+            WHERE target_root.uid IN $target_uids {where_version}
+            WITH collect(DISTINCT target_value) AS {target_alias}
+            """
+        ]
+        for (_, parent_alias, _), (label, alias, ref) in zip(levels, levels[1:]):
+            traversal.append(
+                f"""
+            WITH *, apoc.coll.toSet(apoc.coll.flatten([parent IN {parent_alias} |
+                [(parent)-[:{ref}]->(:{label}Value)<-[:HAS_VERSION]-(:{label}Root)-[:LATEST]->(child:{label}Value) | child]
+            ])) AS {alias}
+            """
+            )
+
+        unwound_levels = ", ".join(
+            f'["{label}", {alias}]' for label, alias, _ in levels
+        )
+        return f"""
+            {"".join(traversal)}
+            UNWIND [{unwound_levels}] AS level_values
+            WITH level_values[0] AS level, level_values[1] AS concept_values
+            UNWIND concept_values AS concept_value
+            {self.LATEST_VERSION_CALL}
+            RETURN level AS type, {self.ELEMENT_PROJECTION} AS element
+        """
+
+    def find_elements(
+        self, target_label: str, target_uids: list[str], version: str | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Returns the targets and every study event, form, item group and item below them,
+        keyed by their label. The targets are read at `version` if given, everything they
+        reference at its latest version.
+        """
+        rs, _ = db.cypher_query(
+            self._elements_query(target_label, version),
+            params={
+                "target_label": target_label,
+                "target_uids": target_uids,
+                "version": version,
+                "sdtm_domain_codelist": settings.stdm_domain_cl_submval,
+            },
+        )
+
+        elements: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for element_type, element in rs:
+            elements[element_type].append(element)
+        return elements
+
+    def find_references(
+        self,
+        condition_oids: list[str],
+        method_oids: list[str],
+        vendor_attribute_uids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Returns the conditions and methods with the given OIDs, the vendor attributes with the
+        given UIDs and all vendor namespaces, keyed by their label.
+        """
+        rs, _ = db.cypher_query(
+            self.REFERENCES_QUERY,
+            params={
+                "target_label": None,
+                "version": None,
+                "condition_oids": condition_oids,
+                "method_oids": method_oids,
+                "vendor_attribute_uids": vendor_attribute_uids,
+            },
+        )
+
+        references: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for reference_type, reference in rs:
+            references[reference_type].append(reference)
+        return references
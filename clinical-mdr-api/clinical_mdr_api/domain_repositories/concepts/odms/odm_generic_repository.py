@@ -44,6 +44,38 @@ from clinical_mdr_api.repositories._utils import (
 )
 from common.exceptions import BusinessLogicException
 
+# node classes (root, latest value if relationships connect to it) and origin value relationship by relation type
+_RELATION_MAPPING = {
+    RelationType.ITEM_GROUP: (
+        OdmItemGroupRoot,
+        OdmItemGroupValue,
+        "item_group_ref",
+    ),
+    RelationType.ITEM: (OdmItemRoot, OdmItemValue, "item_ref"),
+    RelationType.FORM: (OdmFormRoot, OdmFormValue, "form_ref"),
+    RelationType.TERM: (CTTermRoot, None, "has_codelist_term"),
+    RelationType.UNIT_DEFINITION: (
+        UnitDefinitionRoot,
+        None,
+        "has_unit_definition",
+    ),
+    RelationType.VENDOR_ELEMENT: (
+        OdmVendorElementRoot,
+        OdmVendorElementValue,
+        "has_vendor_element",
+    ),
+    RelationType.VENDOR_ATTRIBUTE: (
+        OdmVendorAttributeRoot,
+        OdmVendorAttributeValue,
+        "has_vendor_attribute",
+    ),
+    RelationType.VENDOR_ELEMENT_ATTRIBUTE: (
+        OdmVendorAttributeRoot,
+        OdmVendorAttributeValue,
+        "has_vendor_element_attribute",
+    ),
+}
+
 
 class OdmGenericRepository(ConceptGenericRepository[_AggregateRootType], ABC):
     def find_all(
@@ -123,43 +155,12 @@ class OdmGenericRepository(ConceptGenericRepository[_AggregateRootType], ABC):
         root_class_node = cls.root_class.nodes.get_or_none(uid=uid)
         value_class_node = root_class_node.has_latest_value.single()
 
-        relation_mapping = {
-            RelationType.ITEM_GROUP: (
-                OdmItemGroupRoot,
-                OdmItemGroupValue,
-                "item_group_ref",
-            ),
-            RelationType.ITEM: (OdmItemRoot, OdmItemValue, "item_ref"),
-            RelationType.FORM: (OdmFormRoot, OdmFormValue, "form_ref"),
-            RelationType.TERM: (CTTermRoot, None, "has_codelist_term"),
-            RelationType.UNIT_DEFINITION: (
-                UnitDefinitionRoot,
-                None,
-                "has_unit_definition",
-            ),
-            RelationType.VENDOR_ELEMENT: (
-                OdmVendorElementRoot,
-                OdmVendorElementValue,
-                "has_vendor_element",
-            ),
-            RelationType.VENDOR_ATTRIBUTE: (
-                OdmVendorAttributeRoot,
-                OdmVendorAttributeValue,
-                "has_vendor_attribute",
-            ),
-            RelationType.VENDOR_ELEMENT_ATTRIBUTE: (
-                OdmVendorAttributeRoot,
-                OdmVendorAttributeValue,
-                "has_vendor_element_attribute",
-            ),
-        }
-
         BusinessLogicException.raise_if(
-            relationship_type not in relation_mapping, msg="Invalid relation type."
+            relationship_type not in _RELATION_MAPPING, msg="Invalid relation type."
         )
 
         relation_node_root_cls, relation_node_value_cls, origin_label = (
-            relation_mapping[relationship_type]
+            _RELATION_MAPPING[relationship_type]
         )
         relation_node = relation_node_root_cls.nodes.get_or_none(uid=relation_uid)
 
@@ -192,6 +193,113 @@ class OdmGenericRepository(ConceptGenericRepository[_AggregateRootType], ABC):
         else:
             origin.connect(relation_node)
 
+    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def add_relations(
+        self,
+        uid: str,
+        relationship_type: RelationType,
+        parameters_by_uid: dict[str, dict[str, Any]],
+    ) -> None:
+        """
+        Connects the latest value of the node to many nodes in one query, replacing existing relationships like
+        `add_relation` does. Nothing is connected if the node or any of the nodes to connect doesn't exist.
+
+        :param uid: The uid of the node to connect.
+        :param relationship_type: The type of the relationships, any but `RelationType.TERM`.
+        :param parameters_by_uid: The properties of the relationships by the uid of the node to connect.
+        """
+        BusinessLogicException.raise_if(
+            relationship_type not in _RELATION_MAPPING
+            or relationship_type == RelationType.TERM,
+            msg="Invalid relation type.",
+        )
+
+        if not parameters_by_uid:
+            return
+
+        relation_root_cls, relation_value_cls, origin_label = _RELATION_MAPPING[
+            relationship_type
+        ]
+        definition = getattr(self.value_class, origin_label).definition
+        relation_type = definition["relation_type"]
+        relation_match = (
+            f"(:{relation_root_cls.__label__} {{uid: relation.uid}})-[:LATEST]->(relation_node:{relation_value_cls.__label__})"
+            if relation_value_cls is not None
+            else f"(relation_node:{relation_root_cls.__label__} {{uid: relation.uid}})"
+        )
+
+        rs, _ = db.cypher_query(
+            f"""
+            MATCH (:{self.root_class.__label__} {{uid: $uid}})-[:LATEST]->(origin:{self.value_class.__label__})
+            UNWIND $relations AS relation
+            OPTIONAL MATCH {relation_match}
+            WITH origin,
+                collect([relation, relation_node]) AS rows,
+                collect(CASE WHEN relation_node IS NULL THEN relation.uid END) AS missing
+            CALL {{
+                WITH origin, rows, missing
+                UNWIND CASE WHEN missing = [] THEN rows ELSE [] END AS row
+                WITH origin, row[0] AS relation, row[1] AS relation_node
+                OPTIONAL MATCH (origin)-[existing:{relation_type}]->(relation_node)
+                DELETE existing
+                WITH DISTINCT origin, relation, relation_node
+                CREATE (origin)-[new:{relation_type}]->(relation_node)
+                SET new = relation.properties
+            }}
+            RETURN missing
+            """,
+            params={
+                "uid": uid,
+                "relations": [
+                    {
+                        "uid": relation_uid,
+                        "properties": definition["model"].deflate(parameters or {}),
+                    }
+                    for relation_uid, parameters in parameters_by_uid.items()
+                ],
+            },
+        )
+
+        # no row if the node itself doesn't exist
+        missing = rs[0][0] if rs else [uid]
+        if missing:
+            raise BusinessLogicException(
+                msg=f"Object with UID '{missing[0]}' doesn't exist."
+            )
+
+    def add_vendor_relations(
+        self,
+        uid: str,
+        relationship_type: RelationType,
+        values_by_uid: dict[str, str],
+    ) -> None:
+        """
+        Connects the latest value of the node to the latest values of many vendor elements or attributes in one query.
+        Nothing is connected if the node or any of the vendor elements or attributes doesn't exist.
+
+        :param uid: The uid of the node to connect.
+        :param relationship_type: One of the vendor relationship types.
+        :param values_by_uid: The values of the relationships by the uid of the vendor element or attribute.
+        """
+        BusinessLogicException.raise_if(
+            relationship_type
+            not in (
+                RelationType.VENDOR_ELEMENT,
+                RelationType.VENDOR_ATTRIBUTE,
+                RelationType.VENDOR_ELEMENT_ATTRIBUTE,
+            ),
+            msg="Invalid relation type.",
+        )
+
+        self.add_relations(
+            uid,
+            relationship_type,
+            {
+                relation_uid: {"value": value}
+                for relation_uid, value in values_by_uid.items()
+            },
+        )
+
     @sb_clear_cache(caches=["cache_store_item_by_uid"])
     def remove_relation(
         self,
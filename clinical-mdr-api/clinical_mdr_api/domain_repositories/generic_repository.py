@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import Any, Mapping
 
-from cachetools import TTLCache
 from neomodel import RelationshipDefinition, RelationshipManager
 
 from clinical_mdr_api.domain_repositories.models.generic import (
@@ -13,7 +12,7 @@ from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyA
 from clinical_mdr_api.domain_repositories.models.study_field import StudyField
 from clinical_mdr_api.domain_repositories.models.study_selections import StudySelection
 from clinical_mdr_api.repositories._utils import sb_clear_cache
-from common.config import settings
+from common.cache import create_cache
 from common.exceptions import ValidationException
 
 
@@ -38,9 +37,7 @@ class RepositoryImpl:
     Results from a repository should be used to build aggregate root (AR) objects.
     """
 
-    cache_store_item_by_uid = TTLCache(
-        maxsize=settings.cache_max_size, ttl=settings.cache_ttl
-    )
+    cache_store_item_by_uid = create_cache("RepositoryImpl.cache_store_item_by_uid")
 
     value_class: type
     root_class: type
@@ -5,7 +5,7 @@ from threading import Lock
 from typing import Any, Iterable, Literal, Mapping, TypeVar, overload
 
 import neo4j.time
-from cachetools import TTLCache, cached
+from cachetools import cached
 from cachetools.keys import hashkey
 from neomodel import (
     OUTGOING,
@@ -44,7 +44,7 @@ from clinical_mdr_api.repositories._utils import (
 )
 from clinical_mdr_api.services.user_info import UserInfoService
 from clinical_mdr_api.utils import convert_to_plain, validate_dict
-from common.config import settings
+from common.cache import create_cache
 from common.exceptions import (
     BusinessLogicException,
     NotFoundException,
@@ -64,12 +64,12 @@ MATCH_NODE_BY_ID = "MATCH (node) WHERE elementId(node)=$id RETURN node"
 class LibraryItemRepositoryImplBase(
     RepositoryImpl, GenericRepository[_AggregateRootType], abc.ABC
 ):
-    cache_store_item_by_uid = TTLCache(
-        maxsize=settings.cache_max_size, ttl=settings.cache_ttl
+    cache_store_item_by_uid = create_cache(
+        "LibraryItemRepositoryImplBase.cache_store_item_by_uid"
     )
     lock_store_item_by_uid = Lock()
-    cache_store_term_by_uid_and_submval = TTLCache(
-        maxsize=settings.cache_max_size, ttl=settings.cache_ttl
+    cache_store_term_by_uid_and_submval = create_cache(
+        "LibraryItemRepositoryImplBase.cache_store_term_by_uid_and_submval"
     )
     lock_store_term_by_uid_and_submval = Lock()
     has_library = True
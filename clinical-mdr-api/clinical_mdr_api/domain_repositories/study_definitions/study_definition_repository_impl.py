@@ -12,6 +12,7 @@ from neomodel.sync_.match import Collect, Last
 from clinical_mdr_api import utils
 from clinical_mdr_api.domain_repositories._utils.helpers import (
     acquire_write_lock_study_value,
+    get_library_change_marker,
 )
 from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_codelist_attributes_repository import (
     CTCodelistAttributesRepository,
@@ -69,6 +70,7 @@ from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import
     StudyVersionMetadataVO,
 )
 from clinical_mdr_api.models.study_selections.study import (
+    CompactStudy,
     StudySoaPreferencesInput,
     StudySubpartAuditTrail,
 )
@@ -2532,6 +2534,162 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
             total=total,
         )
 
+    def find_compact_studies(
+        self,
+        has_study_footnote: bool | None = None,
+        has_study_objective: bool | None = None,
+        has_study_endpoint: bool | None = None,
+        has_study_criteria: bool | None = None,
+        has_study_activity: bool | None = None,
+        has_study_activity_instruction: bool | None = None,
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+        deleted: bool = False,
+    ) -> GenericFilteringReturn[dict[str, Any]]:
+        """
+        Retrieves (a part of) the study list in the shape of the CompactStudy model, read directly from
+        the current version of each study instead of rehydrating StudyDefinitionAR instances.
+        Filtering, sorting and pagination are done in the database.
+
+        Filter and sort keys refer to the CompactStudy model fields, except `study_parent_part` and
+        `possible_actions` which are derived later from `study_parent_part_uid` and `has_locked_version`.
+
+        :return: Dictionary of 'items' and 'total_count'. 'items' contains one dictionary per study with 'uid',
+        'study_parent_part_uid', 'study_subpart_uids', 'has_locked_version' and 'current_metadata' keys.
+        """
+        # The current version of each study is selected the way StudyDefinitionAR.current_metadata does it:
+        # the latest locked version, unless the study was unlocked and has a newer draft, else the draft
+        # and finally the released version.
+        # Project, clinical programme, title and parent part study id are read in the same query,
+        # so that the rows match the CompactStudy model and can be filtered, sorted and paginated here.
+        filter_query_parameters: dict[Any, Any] = {
+            "draft_status": (
+                StudyStatus.DELETED.value if deleted else StudyStatus.DRAFT.value
+            )
+        }
+        match_clause = self._build_snapshot_match_clause(
+            None, None, filter_query_parameters, deleted
+        )
+        match_clause += """
+            WITH sr, sv,
+                head([(sr)-[ld:LATEST_DRAFT]->() | ld]) AS draft_version,
+                head([(sr)-[lr:LATEST_RELEASED]->() WHERE lr.end_date IS NULL | lr]) AS released_version,
+                head(COLLECT {
+                    MATCH (sr)-[hv:HAS_VERSION {status: 'LOCKED'}]->()
+                    RETURN hv ORDER BY hv.start_date DESC LIMIT 1
+                }) AS locked_version
+            WITH sr, sv, locked_version,
+                CASE
+                    WHEN locked_version IS NOT NULL
+                        AND NOT coalesce(draft_version.start_date > locked_version.start_date, false)
+                    THEN {version: locked_version, status: 'LOCKED'}
+                    WHEN draft_version IS NOT NULL THEN {version: draft_version, status: $draft_status}
+                    ELSE {version: released_version, status: 'RELEASED'}
+                END AS current
+            WITH sr, sv, locked_version, current.version AS current_version, current.status AS study_status,
+                endNode(current.version) AS cv
+            OPTIONAL MATCH (cv)-[:HAS_PROJECT]->(:StudyProjectField)<-[:HAS_FIELD]-(project:Project)
+            OPTIONAL MATCH (project)<-[:HOLDS_PROJECT]-(clinical_programme:ClinicalProgramme)
+            OPTIONAL MATCH (sv)<-[:HAS_STUDY_SUBPART]-(parent_value:StudyValue)<-[:LATEST]-(parent:StudyRoot)
+            OPTIONAL MATCH (author:User {user_id: current_version.author_id})
+            WITH sr, sv, parent,
+                locked_version IS NOT NULL AS has_locked_version,
+                {
+                    study_number: cv.study_number,
+                    subpart_id: cv.subpart_id,
+                    study_acronym: cv.study_acronym,
+                    study_subpart_acronym: cv.study_subpart_acronym,
+                    project_number: project.project_number,
+                    project_name: project.name,
+                    description: cv.description,
+                    clinical_programme_name: clinical_programme.name,
+                    study_id: coalesce(
+                        parent_value.study_id_prefix + '-' + parent_value.study_number + '-' + cv.subpart_id,
+                        cv.study_id_prefix + '-' + cv.study_number
+                    )
+                } AS identification_metadata,
+                {
+                    study_status: study_status,
+                    version_number: current_version.version,
+                    version_timestamp: current_version.start_date,
+                    version_author: coalesce(author.username, current_version.author_id),
+                    version_description: current_version.change_description
+                } AS version_metadata,
+                {
+                    study_title: head([(cv)-[:HAS_TEXT_FIELD]->(t:StudyTextField) WHERE t.field_name = "study_title" | t.value]),
+                    study_short_title: head([(cv)-[:HAS_TEXT_FIELD]->(st:StudyTextField) WHERE st.field_name = "study_short_title" | st.value])
+                } AS study_description
+            """
+        alias_clause = """
+            sr.uid AS uid,
+            parent.uid AS study_parent_part_uid,
+            COLLECT {
+                MATCH (sv)-[:HAS_STUDY_SUBPART]->(:StudyValue)<-[:LATEST]-(sub:StudyRoot)
+                RETURN sub.uid ORDER BY sub.uid
+            } AS study_subpart_uids,
+            has_locked_version,
+            identification_metadata,
+            version_metadata,
+            study_description,
+            {
+                identification_metadata: identification_metadata,
+                version_metadata: version_metadata,
+                study_description: study_description
+            } AS current_metadata,
+            exists((sv)-[:HAS_STUDY_FOOTNOTE]->()) AS has_study_footnote,
+            exists((sv)-[:HAS_STUDY_OBJECTIVE]->()) AS has_study_objective,
+            exists((sv)-[:HAS_STUDY_ENDPOINT]->()) AS has_study_endpoint,
+            exists((sv)-[:HAS_STUDY_CRITERIA]->()) AS has_study_criteria,
+            exists((sv)-[:HAS_STUDY_ACTIVITY]->()) AS has_study_activity,
+            exists((sv)-[:HAS_STUDY_ACTIVITY_INSTRUCTION]->()) AS has_study_activity_instruction
+            """
+        filter_by = self._update_snapshot_filter_by(
+            dict(filter_by or {}),
+            has_study_footnote,
+            has_study_objective,
+            has_study_endpoint,
+            has_study_criteria,
+            has_study_activity,
+            has_study_activity_instruction,
+        )
+
+        query = CypherQueryBuilder(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by or {"uid": True},
+            implicit_sort_by="uid",
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=FilterDict.model_validate({"elements": filter_by}),
+            filter_operator=filter_operator,
+            total_count=total_count,
+            return_model=CompactStudy,
+        )
+        query.parameters.update(filter_query_parameters)
+        result_array, attributes_names = query.execute()
+
+        studies = []
+        for study in utils.db_result_to_list((result_array, attributes_names)):
+            study["current_metadata"]["version_metadata"]["version_timestamp"] = (
+                convert_to_datetime(
+                    study["current_metadata"]["version_metadata"]["version_timestamp"]
+                )
+            )
+            studies.append(study)
+
+        total = 0
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=query.count_query, params=query.parameters
+            )
+            total = count_result[0][0] if count_result else 0
+
+        return GenericFilteringReturn(items=studies, total=total)
+
     def _retrieve_study_snapshot_history(
         self,
         study_uid: str,
@@ -2899,6 +3057,65 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
 
         return len(result) > 0 and len(result[0]) > 0
 
+    @staticmethod
+    def check_if_study_version_is_locked(
+        study_uid: str, study_value_version: str
+    ) -> bool:
+        """Checks whether `study_value_version` is a locked version of the study with `study_uid`"""
+
+        query = """
+            MATCH (:StudyRoot {uid: $uid})-[hv:HAS_VERSION {status: 'LOCKED'}]->(:StudyValue)
+            WHERE hv.version = $version
+            RETURN count(hv) > 0
+            """
+        result, _ = db.cypher_query(
+            query, {"uid": study_uid, "version": study_value_version}
+        )
+        return bool(result and result[0][0])
+
+    @staticmethod
+    def get_study_change_token(
+        study_uid: str, study_value_version: str | None = None
+    ) -> str | None:
+        """
+        Returns a token which changes whenever the data of the study (version) changes.
+
+        The study data of a locked version doesn't change, its part of the token is the version.
+        Otherwise it is built from the latest study value, the latest study action and the number of actions
+        and versions of the study, as every change of the study adds a study action or a study value.
+        The study resources also show library items and CT terms (e.g. visit and epoch names, allowed time references),
+        which change without a study action, also for locked versions, so the library change marker is part
+        of every token.
+        Returns `None` if the study doesn't exist.
+        """
+
+        if study_value_version:
+            if StudyDefinitionRepositoryImpl.check_if_study_version_is_locked(
+                study_uid=study_uid, study_value_version=study_value_version
+            ):
+                return ":".join(
+                    str(value)
+                    for value in (
+                        "locked",
+                        study_value_version,
+                        *get_library_change_marker(),
+                    )
+                )
+
+        query = """
+            MATCH (sr:StudyRoot {uid: $uid})-[:LATEST]->(sv:StudyValue)
+            OPTIONAL MATCH (sr)-[:AUDIT_TRAIL]->(sa:StudyAction)
+            WITH sr, sv, max(sa.date) AS last_action, count(sa) AS actions
+            OPTIONAL MATCH (sr)-[hv:HAS_VERSION]->(:StudyValue)
+            RETURN elementId(sv), toString(last_action), actions, count(hv)
+            """
+        result, _ = db.cypher_query(query, {"uid": study_uid})
+        if not result:
+            return None
+        return ":".join(
+            str(value) for value in (*result[0], *get_library_change_marker())
+        )
+
     def get_latest_released_version_from_specific_datetime(
         self, study_uid: str, specified_datetime: str
     ) -> str | None:
@@ -1,5 +1,8 @@
+from typing import Any
+
 from neomodel import db
 
+from clinical_mdr_api import utils
 from clinical_mdr_api.domain_repositories.models.study import StudyValue
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivityInstruction,
@@ -9,7 +12,16 @@ from clinical_mdr_api.domain_repositories.study_selections import base
 from clinical_mdr_api.domains.study_selections.study_activity_instruction import (
     StudyActivityInstructionVO,
 )
+from clinical_mdr_api.models.study_selections.study_selection import (
+    StudyActivityInstruction as StudyActivityInstructionModel,
+)
+from clinical_mdr_api.repositories._utils import (
+    CypherQueryBuilder,
+    FilterDict,
+    FilterOperator,
+)
 from common.exceptions import NotFoundException
+from common.telemetry import trace_calls
 
 
 class StudyActivityInstructionRepository(base.StudySelectionRepository):
@@ -89,6 +101,70 @@ class StudyActivityInstructionRepository(base.StudySelectionRepository):
             },
         )
 
+    @trace_calls
+    def find_all_for_all_studies(
+        self,
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> tuple[list[StudyActivityInstructionModel], int]:
+        """
+        Returns a page of the activity instructions of the latest version of all studies,
+        filtering, sorting, counting and paginating in the database.
+
+        Filter and sort keys refer to the StudyActivityInstruction API model fields,
+        which are all exposed by the alias clause below.
+        """
+        match_clause = """
+            MATCH (:StudyRoot)-[:LATEST]->(:StudyValue)-[:HAS_STUDY_ACTIVITY_INSTRUCTION]->(sai:StudyActivityInstruction)
+            MATCH (sr:StudyRoot)-[:AUDIT_TRAIL]->(sa:StudyAction)-[:AFTER]->(sai)
+            MATCH (sai)<-[:STUDY_ACTIVITY_HAS_INSTRUCTION]-(study_activity:StudyActivity)
+            MATCH (sai)-[:HAS_SELECTED_ACTIVITY_INSTRUCTION]->(aiv:ActivityInstructionValue)<-[:LATEST]-(air:ActivityInstructionRoot)
+            WITH DISTINCT sai, sr, sa, study_activity, aiv, air
+            OPTIONAL MATCH (author:User {user_id: sa.author_id})
+            """
+        alias_clause = """
+            sai.uid AS study_activity_instruction_uid,
+            sr.uid AS study_uid,
+            null AS study_version,
+            study_activity.uid AS study_activity_uid,
+            air.uid AS activity_instruction_uid,
+            aiv.name AS activity_instruction_name,
+            sa.date AS start_date,
+            coalesce(author.username, sa.author_id) AS author_username,
+            null AS end_date
+            """
+
+        query_builder = CypherQueryBuilder(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            implicit_sort_by="study_activity_instruction_uid",
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=FilterDict.model_validate({"elements": filter_by or {}}),
+            filter_operator=filter_operator,
+            total_count=total_count,
+            return_model=StudyActivityInstructionModel,
+        )
+        result_array, attributes_names = query_builder.execute()
+
+        items = [
+            StudyActivityInstructionModel(**item)
+            for item in utils.db_result_to_list((result_array, attributes_names))
+        ]
+
+        total = 0
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=query_builder.count_query, params=query_builder.parameters
+            )
+            total = count_result[0][0] if count_result else 0
+        return items, total
+
     def get_study_selection(
         self, study_value_node: StudyValue, selection_uid: str
     ) -> StudyActivityInstruction:
@@ -1,3 +1,4 @@
+import datetime
 from dataclasses import dataclass
 from typing import Any
 
@@ -6,6 +7,7 @@ from neomodel import db
 from clinical_mdr_api import utils
 from clinical_mdr_api.domain_repositories.models._utils import ListDistinct
 from clinical_mdr_api.domain_repositories.models.study import StudyValue
+from clinical_mdr_api.domain_repositories.models.study_audit_trail import Create, Delete
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivity,
     StudyActivitySchedule,
@@ -294,6 +296,165 @@ class StudyActivityScheduleRepository(base.StudySelectionRepository):
             )
         return result
 
+    def get_schedule_pairs_for_bulk_create(
+        self, study_uid: str, pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], tuple[bool, bool, list[str]]]:
+        """
+        Validates (study activity uid, study visit uid) pairs of schedules to create in the latest version of a study.
+
+        Returns:
+            dict[tuple[str, str], tuple[bool, bool, list[str]]]: for each pair, whether the study activity
+                and the study visit exist in the study, and the uids of the existing schedules of the pair.
+        """
+        rows, _ = db.cypher_query(
+            """
+            MATCH (:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)
+            UNWIND $pairs AS pair
+            OPTIONAL MATCH (sv)-[:HAS_STUDY_ACTIVITY]->(sa:StudyActivity {uid: pair[0]})
+            OPTIONAL MATCH (sv)-[:HAS_STUDY_VISIT]->(svi:StudyVisit {uid: pair[1]})
+            OPTIONAL MATCH (sv)-[:HAS_STUDY_ACTIVITY_SCHEDULE]->(sas:StudyActivitySchedule)
+                <-[:STUDY_ACTIVITY_HAS_SCHEDULE]-(:StudyActivity {uid: pair[0]}),
+                (sas)<-[:STUDY_VISIT_HAS_SCHEDULE]-(:StudyVisit {uid: pair[1]})
+            WHERE NOT EXISTS { (sas)<-[:BEFORE]-(:StudyAction) }
+            RETURN pair, sa IS NOT NULL AS activity_exists, svi IS NOT NULL AS visit_exists,
+                collect(DISTINCT sas.uid) AS schedule_uids
+            """,
+            {"study_uid": study_uid, "pairs": [list(pair) for pair in set(pairs)]},
+        )
+        return {
+            (pair[0], pair[1]): (activity_exists, visit_exists, schedule_uids)
+            for pair, activity_exists, visit_exists, schedule_uids in rows
+        }
+
+    def get_schedules_for_bulk_delete(
+        self, study_uid: str, schedule_uids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetches schedules to delete from the latest version of a study.
+
+        Returns:
+            dict[str, dict[str, Any]]: by schedule uid, the uids of its study activity and study visit,
+                whether they exist in the study and whether the schedule visit is a baseline visit
+                of a study activity instance.
+        """
+        rows, columns = db.cypher_query(
+            """
+            MATCH (:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)
+            UNWIND $schedule_uids AS schedule_uid
+            MATCH (sv)-[:HAS_STUDY_ACTIVITY_SCHEDULE]->(sas:StudyActivitySchedule {uid: schedule_uid})
+            OPTIONAL MATCH (sas)<-[:STUDY_ACTIVITY_HAS_SCHEDULE]-(sa:StudyActivity)
+            OPTIONAL MATCH (sas)<-[:STUDY_VISIT_HAS_SCHEDULE]-(svi:StudyVisit)
+            RETURN
+                sas.uid AS uid,
+                sa.uid AS study_activity_uid,
+                EXISTS { (sv)-[:HAS_STUDY_ACTIVITY]->(sa) } AS activity_exists,
+                svi.uid AS study_visit_uid,
+                EXISTS { (sv)-[:HAS_STUDY_VISIT]->(svi) } AS visit_exists,
+                EXISTS {
+                    MATCH (sv)-[:HAS_STUDY_ACTIVITY_INSTANCE]->(sai:StudyActivityInstance)-[:HAS_BASELINE]->(svi)
+                    WHERE (sa)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_INSTANCE]->(sai)
+                        AND NOT EXISTS { (sai)<-[:BEFORE]-(:StudyAction) }
+                } AS is_baseline
+            """,
+            {"study_uid": study_uid, "schedule_uids": list(set(schedule_uids))},
+        )
+        return {row[0]: dict(zip(columns, row)) for row in rows}
+
+    @trace_calls(args=[1], kwargs=["study_uid"])
+    def bulk_create(
+        self, study_uid: str, pairs: list[tuple[str, str]], author_id: str
+    ) -> list[StudyActivityScheduleVO]:
+        """
+        Creates schedules of (study activity uid, study visit uid) pairs in the latest version of a study,
+        with their `Create` audit trail, in a single query. Pairs must be validated beforehand.
+
+        Returns:
+            list[StudyActivityScheduleVO]: the created schedules, in the order of the pairs.
+        """
+        if not pairs:
+            return []
+
+        rows, _ = db.cypher_query(
+            f"""
+            MATCH (sr:StudyRoot {{uid: $study_uid}})-[:LATEST]->(sv:StudyValue)
+            MERGE (counter:Counter {{counterId: 'StudyActivityScheduleCounter'}})
+            ON CREATE SET counter:StudyActivityScheduleCounter, counter.count = 0
+            WITH sr, sv, counter
+            CALL apoc.atomic.add(counter, 'count', size($pairs), 1) YIELD oldValue
+            WITH sr, sv, toInteger(oldValue) AS last_uid_number
+            UNWIND range(0, size($pairs) - 1) AS index
+            MATCH (sv)-[:HAS_STUDY_ACTIVITY]->(sa:StudyActivity {{uid: $pairs[index][0]}})
+            MATCH (sv)-[:HAS_STUDY_VISIT]->(svi:StudyVisit {{uid: $pairs[index][1]}})
+            CREATE (sas:{":".join(StudyActivitySchedule.inherited_labels())} {{
+                uid: "StudyActivitySchedule_" + apoc.text.lpad(toString(last_uid_number + index + 1), $uid_digits, "0")
+            }})
+            CREATE (sa)-[:STUDY_ACTIVITY_HAS_SCHEDULE]->(sas)
+            CREATE (svi)-[:STUDY_VISIT_HAS_SCHEDULE]->(sas)
+            CREATE (sv)-[:HAS_STUDY_ACTIVITY_SCHEDULE]->(sas)
+            CREATE (sr)-[:AUDIT_TRAIL]->(action:{":".join(Create.inherited_labels())} {{author_id: $author_id, date: $date}})
+            CREATE (action)-[:AFTER]->(sas)
+            WITH index, sas, sa, svi, action
+            OPTIONAL MATCH (sa)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_INSTANCE]->(sai:StudyActivityInstance)
+            WITH index, sas, sa, svi, action, head(collect(sai.uid)) AS study_activity_instance_uid
+            RETURN sas.uid, sa.uid, study_activity_instance_uid, svi.uid, action.date, action.author_id
+            ORDER BY index
+            """,
+            {
+                "study_uid": study_uid,
+                "pairs": [list(pair) for pair in pairs],
+                "uid_digits": settings.number_of_uid_digits,
+                "author_id": author_id,
+                "date": datetime.datetime.now(datetime.timezone.utc),
+            },
+        )
+        return [
+            StudyActivityScheduleVO(
+                uid=uid,
+                study_uid=study_uid,
+                study_activity_uid=study_activity_uid,
+                study_activity_instance_uid=study_activity_instance_uid,
+                study_visit_uid=study_visit_uid,
+                start_date=convert_to_datetime(value=start_date),
+                author_id=action_author_id,
+            )
+            for uid, study_activity_uid, study_activity_instance_uid, study_visit_uid, start_date, action_author_id in rows
+        ]
+
+    @trace_calls(args=[1], kwargs=["study_uid"])
+    def bulk_delete(
+        self, study_uid: str, schedule_uids: list[str], author_id: str
+    ) -> None:
+        """
+        Deletes schedules from the latest version of a study, with their `Delete` audit trail, in a single query.
+        Like `delete`, the deleted version of each schedule stays connected to its study activity and visit.
+        Schedules must be validated beforehand.
+        """
+        if not schedule_uids:
+            return
+
+        db.cypher_query(
+            f"""
+            MATCH (sr:StudyRoot {{uid: $study_uid}})-[:LATEST]->(sv:StudyValue)
+            UNWIND $schedule_uids AS schedule_uid
+            MATCH (sv)-[rel:HAS_STUDY_ACTIVITY_SCHEDULE]->(old:StudyActivitySchedule {{uid: schedule_uid}})
+            MATCH (old)<-[:STUDY_ACTIVITY_HAS_SCHEDULE]-(sa:StudyActivity)<-[:HAS_STUDY_ACTIVITY]-(sv)
+            MATCH (old)<-[:STUDY_VISIT_HAS_SCHEDULE]-(svi:StudyVisit)<-[:HAS_STUDY_VISIT]-(sv)
+            DELETE rel
+            CREATE (new:{":".join(StudyActivitySchedule.inherited_labels())} {{uid: schedule_uid}})
+            CREATE (sa)-[:STUDY_ACTIVITY_HAS_SCHEDULE]->(new)
+            CREATE (svi)-[:STUDY_VISIT_HAS_SCHEDULE]->(new)
+            CREATE (sr)-[:AUDIT_TRAIL]->(action:{":".join(Delete.inherited_labels())} {{author_id: $author_id, date: $date}})
+            CREATE (action)-[:BEFORE]->(old)
+            CREATE (action)-[:AFTER]->(new)
+            """,
+            {
+                "study_uid": study_uid,
+                "schedule_uids": schedule_uids,
+                "author_id": author_id,
+                "date": datetime.datetime.now(datetime.timezone.utc),
+            },
+        )
+
     def close(self) -> None:
         # Our repository guidelines state that repos should have a close method
         # But nothing needs to be done in this one
@@ -7,6 +7,7 @@ from neomodel import db
 from clinical_mdr_api import utils
 from clinical_mdr_api.domain_repositories._utils.helpers import (
     acquire_write_lock_study_value,
+    number_selections_in_study,
 )
 from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_codelist_attributes_repository import (
     CTCodelistAttributesRepository,
@@ -30,8 +31,14 @@ from clinical_mdr_api.domains.study_selections.study_selection_arm import (
     StudySelectionArmAR,
     StudySelectionArmVO,
 )
+from clinical_mdr_api.repositories._utils import (
+    CypherQueryBuilder,
+    FilterDict,
+    FilterOperator,
+)
 from common.config import settings
 from common.exceptions import BusinessLogicException
+from common.telemetry import trace_calls
 from common.utils import convert_to_datetime, get_db_result_as_dict
 
 
@@ -167,13 +174,13 @@ class StudySelectionArmRepository:
         rows, columns = db.cypher_query(query, query_parameters)
         return [get_db_result_as_dict(row, columns) for row in rows]
 
-    def _retrieves_all_data(
+    def _all_data_query(
         self,
         study_uid: str | None = None,
         project_name: str | None = None,
         project_number: str | None = None,
         study_value_version: str | None = None,
-    ) -> tuple[StudySelectionArmVO]:
+    ) -> tuple[str, dict[str, Any]]:
         query = ""
         query_parameters: dict[str, Any] = {}
         if study_value_version:
@@ -247,33 +254,137 @@ class StudySelectionArmRepository:
                 sa.author_id AS author_id
                 ORDER BY order
             """
+        return query, query_parameters
 
+    @staticmethod
+    def _create_vo_from_db_output(selection: dict[str, Any]) -> StudySelectionArmVO:
+        return StudySelectionArmVO.from_input_values(
+            author_id=selection["author_id"],
+            study_uid=selection["study_uid"],
+            name=selection["arm_name"],
+            short_name=selection["arm_short_name"],
+            code=selection["arm_code"],
+            description=selection["arm_description"],
+            study_selection_uid=selection["study_selection_uid"],
+            arm_type_uid=selection["arm_type_uid"],
+            number_of_subjects=selection["number_of_subjects"],
+            randomization_group=selection["randomization_group"],
+            merge_branch_for_this_arm_for_sdtm_adam=selection[
+                "merge_branch_for_this_arm_for_sdtm_adam"
+            ],
+            start_date=convert_to_datetime(value=selection["start_date"]),
+            accepted_version=selection["accepted_version"],
+        )
+
+    def _retrieves_all_data(
+        self,
+        study_uid: str | None = None,
+        project_name: str | None = None,
+        project_number: str | None = None,
+        study_value_version: str | None = None,
+    ) -> tuple[StudySelectionArmVO]:
+        query, query_parameters = self._all_data_query(
+            study_uid=study_uid,
+            project_name=project_name,
+            project_number=project_number,
+            study_value_version=study_value_version,
+        )
         all_arm_selections = db.cypher_query(query, query_parameters)
-        all_selections = []
-
-        for selection in utils.db_result_to_list(all_arm_selections):
-            acv = selection.get("accepted_version", False)
-            if acv is None:
-                acv = False
-            selection_vo = StudySelectionArmVO.from_input_values(
-                author_id=selection["author_id"],
-                study_uid=selection["study_uid"],
-                name=selection["arm_name"],
-                short_name=selection["arm_short_name"],
-                code=selection["arm_code"],
-                description=selection["arm_description"],
-                study_selection_uid=selection["study_selection_uid"],
-                arm_type_uid=selection["arm_type_uid"],
-                number_of_subjects=selection["number_of_subjects"],
-                randomization_group=selection["randomization_group"],
-                merge_branch_for_this_arm_for_sdtm_adam=selection[
-                    "merge_branch_for_this_arm_for_sdtm_adam"
-                ],
-                start_date=convert_to_datetime(value=selection["start_date"]),
-                accepted_version=selection["accepted_version"],
+        return tuple(
+            self._create_vo_from_db_output(selection)
+            for selection in utils.db_result_to_list(all_arm_selections)
+        )
+
+    # Columns of the selection query kept by find_selections_page, besides study_uid and order
+    PAGE_COLUMNS = [
+        "study_selection_uid",
+        "arm_name",
+        "arm_short_name",
+        "arm_code",
+        "arm_description",
+        "accepted_version",
+        "number_of_subjects",
+        "randomization_group",
+        "merge_branch_for_this_arm_for_sdtm_adam",
+        "arm_type_uid",
+        "text",
+        "start_date",
+        "author_id",
+    ]
+
+    @trace_calls
+    def find_selections_page(
+        self,
+        study_uid: str | None = None,
+        project_name: str | None = None,
+        project_number: str | None = None,
+        study_value_version: str | None = None,
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> tuple[list[tuple[StudySelectionArmVO, int]], int]:
+        """
+        Returns a page of study arms along with their 1-based position in the study,
+        filtering, sorting, counting and paginating in the database.
+
+        Filter and sort keys refer to the StudySelectionArm API model fields
+        exposed by the alias clause below, `arm_type` and `arm_connected_branch_arms` are not supported.
+        """
+        # The API models module imports this module, so the model can't be imported at the top
+        from clinical_mdr_api.models.study_selections.study_selection import (
+            StudySelectionArm,
+        )
+
+        query, query_parameters = self._all_data_query(
+            study_uid=study_uid,
+            project_name=project_name,
+            project_number=project_number,
+            study_value_version=study_value_version,
+        )
+        match_clause = f"""
+            CALL {{ {query} }}
+            {number_selections_in_study(self.PAGE_COLUMNS)}
+            OPTIONAL MATCH (author:User {{user_id: author_id}})
+            """
+        alias_clause = """
+            study_uid, study_selection_uid, arm_name, arm_short_name, arm_code, arm_description,
+            order, accepted_version, number_of_subjects, randomization_group,
+            merge_branch_for_this_arm_for_sdtm_adam, arm_type_uid, start_date, author_id,
+            study_selection_uid AS arm_uid, arm_name AS name, arm_short_name AS short_name,
+            arm_code AS code, arm_description AS description,
+            coalesce(author.username, author_id) AS author_username
+            """
+
+        query_builder = CypherQueryBuilder(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by or {"study_uid": True, "order": True},
+            implicit_sort_by="order",
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=FilterDict.model_validate({"elements": filter_by or {}}),
+            filter_operator=filter_operator,
+            total_count=total_count,
+            return_model=StudySelectionArm,
+        )
+        query_builder.parameters.update(query_parameters)
+        result_array, attributes_names = query_builder.execute()
+
+        selections = [
+            (self._create_vo_from_db_output(selection), selection["order"])
+            for selection in utils.db_result_to_list((result_array, attributes_names))
+        ]
+
+        total = 0
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=query_builder.count_query, params=query_builder.parameters
             )
-            all_selections.append(selection_vo)
-        return tuple(all_selections)
+            total = count_result[0][0] if count_result else 0
+        return selections, total
 
     def find_all(
         self,
@@ -13,6 +13,7 @@ from neomodel.sync_.match import (
 from clinical_mdr_api import utils
 from clinical_mdr_api.domain_repositories._utils.helpers import (
     acquire_write_lock_study_value,
+    number_selections_in_study,
 )
 from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_codelist_attributes_repository import (
     CTCodelistAttributesRepository,
@@ -36,8 +37,14 @@ from clinical_mdr_api.domains.study_selections.study_selection_compound import (
     StudySelectionCompoundsAR,
     StudySelectionCompoundVO,
 )
+from clinical_mdr_api.repositories._utils import (
+    CypherQueryBuilder,
+    FilterDict,
+    FilterOperator,
+)
 from common.config import settings
 from common.exceptions import BusinessLogicException, NotFoundException
+from common.telemetry import trace_calls
 from common.utils import convert_to_datetime
 
 
@@ -65,14 +72,14 @@ class StudyCompoundSelectionHistory:
 
 class StudySelectionCompoundRepository:
 
-    def _retrieves_all_data(
+    def _all_data_query(
         self,
         study_uid: str | None = None,
         study_value_version: str | None = None,
         project_name: str | None = None,
         project_number: str | None = None,
         type_of_treatment: str | None = None,
-    ) -> tuple[StudySelectionCompoundVO]:
+    ) -> tuple[str, dict[str, Any]]:
         query = ""
         query_parameters: dict[str, Any] = {}
         if study_uid:
@@ -149,30 +156,151 @@ class StudySelectionCompoundRepository:
                 sa.author_id AS author_id
                 ORDER BY order
             """
+        return query, query_parameters
+
+    @staticmethod
+    def _create_vo_from_db_output(
+        selection: dict[str, Any],
+    ) -> StudySelectionCompoundVO:
+        return StudySelectionCompoundVO.from_input_values(
+            study_uid=selection["study_uid"],
+            other_info=selection["other_information"],
+            compound_uid=selection["compound_uid"],
+            compound_alias_uid=selection["compound_alias_uid"],
+            medicinal_product_uid=selection["medicinal_product_uid"],
+            type_of_treatment_uid=selection["type_of_treatment_uid"],
+            dose_frequency_uid=selection["dose_frequency_uid"],
+            dose_frequency=selection["dose_frequency"],
+            delivery_device_uid=selection["delivery_device_uid"],
+            delivery_device=selection["delivery_device"],
+            dispenser_uid=selection["dispenser_uid"],
+            dispenser=selection["dispenser"],
+            reason_for_missing_value_uid=selection["reason_for_missing"],
+            study_compound_dosing_count=selection["study_compound_dosing_count"],
+            study_selection_uid=selection["study_compound_uid"],
+            start_date=convert_to_datetime(value=selection["start_date"]),
+            author_id=selection["author_id"],
+        )
+
+    def _retrieves_all_data(
+        self,
+        study_uid: str | None = None,
+        study_value_version: str | None = None,
+        project_name: str | None = None,
+        project_number: str | None = None,
+        type_of_treatment: str | None = None,
+    ) -> tuple[StudySelectionCompoundVO]:
+        query, query_parameters = self._all_data_query(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            project_name=project_name,
+            project_number=project_number,
+            type_of_treatment=type_of_treatment,
+        )
         all_compound_selections = db.cypher_query(query, query_parameters)
-        all_selections = []
-        for selection in utils.db_result_to_list(all_compound_selections):
-            selection_vo = StudySelectionCompoundVO.from_input_values(
-                study_uid=selection["study_uid"],
-                other_info=selection["other_information"],
-                compound_uid=selection["compound_uid"],
-                compound_alias_uid=selection["compound_alias_uid"],
-                medicinal_product_uid=selection["medicinal_product_uid"],
-                type_of_treatment_uid=selection["type_of_treatment_uid"],
-                dose_frequency_uid=selection["dose_frequency_uid"],
-                dose_frequency=selection["dose_frequency"],
-                delivery_device_uid=selection["delivery_device_uid"],
-                delivery_device=selection["delivery_device"],
-                dispenser_uid=selection["dispenser_uid"],
-                dispenser=selection["dispenser"],
-                reason_for_missing_value_uid=selection["reason_for_missing"],
-                study_compound_dosing_count=selection["study_compound_dosing_count"],
-                study_selection_uid=selection["study_compound_uid"],
-                start_date=convert_to_datetime(value=selection["start_date"]),
-                author_id=selection["author_id"],
+        return tuple(
+            self._create_vo_from_db_output(selection)
+            for selection in utils.db_result_to_list(all_compound_selections)
+        )
+
+    # Columns of the selection query kept by find_selections_page, besides study_uid and order
+    PAGE_COLUMNS = [
+        "study_compound_uid",
+        "other_information",
+        "compound_uid",
+        "compound_alias_uid",
+        "medicinal_product_uid",
+        "type_of_treatment_uid",
+        "dose_frequency_uid",
+        "dose_frequency",
+        "delivery_device_uid",
+        "delivery_device",
+        "dispenser_uid",
+        "dispenser",
+        "reason_for_missing",
+        "study_compound_dosing_count",
+        "start_date",
+        "author_id",
+    ]
+
+    @trace_calls
+    def find_selections_page(
+        self,
+        study_uid: str | None = None,
+        study_value_version: str | None = None,
+        project_name: str | None = None,
+        project_number: str | None = None,
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> tuple[list[tuple[StudySelectionCompoundVO, int]], int]:
+        """
+        Returns a page of study compounds along with their 1-based position in the study,
+        filtering, sorting, counting and paginating in the database.
+
+        Filter and sort keys refer to the StudySelectionCompound API model fields
+        exposed by the alias clause below, the codelist terms and the properties
+        of the connected library concepts other than their uid are not supported.
+        """
+        # The API models module imports this module, so the model can't be imported at the top
+        from clinical_mdr_api.models.study_selections.study_selection import (
+            StudySelectionCompound,
+        )
+
+        query, query_parameters = self._all_data_query(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            project_name=project_name,
+            project_number=project_number,
+        )
+        match_clause = f"""
+            CALL {{ {query} }}
+            {number_selections_in_study(self.PAGE_COLUMNS)}
+            OPTIONAL MATCH (author:User {{user_id: author_id}})
+            """
+        alias_clause = """
+            study_uid, study_compound_uid, order, other_information, compound_uid,
+            compound_alias_uid, medicinal_product_uid, type_of_treatment_uid,
+            dose_frequency_uid, dose_frequency, delivery_device_uid, delivery_device,
+            dispenser_uid, dispenser, reason_for_missing, study_compound_dosing_count,
+            start_date, author_id,
+            other_information AS other_info,
+            {uid: compound_uid} AS compound,
+            {uid: compound_alias_uid} AS compound_alias,
+            {uid: medicinal_product_uid} AS medicinal_product,
+            coalesce(author.username, author_id) AS author_username
+            """
+
+        query_builder = CypherQueryBuilder(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by or {"study_uid": True, "order": True},
+            implicit_sort_by="order",
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=FilterDict.model_validate({"elements": filter_by or {}}),
+            filter_operator=filter_operator,
+            total_count=total_count,
+            return_model=StudySelectionCompound,
+        )
+        query_builder.parameters.update(query_parameters)
+        result_array, attributes_names = query_builder.execute()
+
+        selections = [
+            (self._create_vo_from_db_output(selection), selection["order"])
+            for selection in utils.db_result_to_list((result_array, attributes_names))
+        ]
+
+        total = 0
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=query_builder.count_query, params=query_builder.parameters
             )
-            all_selections.append(selection_vo)
-        return tuple(all_selections)
+            total = count_result[0][0] if count_result else 0
+        return selections, total
 
     def find_all(
         self,
@@ -1,3 +1,4 @@
+import copy
 import datetime
 from dataclasses import dataclass
 from textwrap import dedent
@@ -6,6 +7,9 @@ from neomodel import db
 from neomodel.sync_.match import Collect, Last, Optional
 
 from clinical_mdr_api import utils
+from clinical_mdr_api.domain_repositories._utils.helpers import (
+    acquire_write_lock_study_value,
+)
 from clinical_mdr_api.domain_repositories.generic_repository import (
     manage_previous_connected_study_selection_relationships,
 )
@@ -29,6 +33,7 @@ from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import
     StudyStatus,
 )
 from clinical_mdr_api.domains.study_selections.study_design_cell import (
+    StudyDesignCellsAR,
     StudyDesignCellVO,
 )
 from common import exceptions
@@ -148,6 +153,338 @@ class StudyDesignCellRepository:
 
         return [StudyDesignCellVO(**result[0]) for result in results]
 
+    def find_by_study(
+        self, study_uid: str, for_update: bool = False
+    ) -> StudyDesignCellsAR:
+        """
+        Finds all the design cells of a given study
+        :param study_uid:
+        :param for_update:
+        :return:
+        """
+        if for_update:
+            acquire_write_lock_study_value(study_uid)
+        design_cells_aggregate = StudyDesignCellsAR(
+            study_uid=study_uid,
+            design_cells=self.find_all_design_cells_by_study(study_uid),
+        )
+        if for_update:
+            design_cells_aggregate.repository_closure_data = copy.deepcopy(
+                design_cells_aggregate.design_cells
+            )
+        return design_cells_aggregate
+
+    @trace_calls
+    def save_all(
+        self,
+        design_cells_aggregate: StudyDesignCellsAR,
+        author_id: str,
+        allow_none_arm_branch_arm=False,
+    ) -> None:
+        """
+        Persist the design cells removed, changed or added in the aggregate to the database.
+
+        The cells are checked with one query against the latest study value, then the removed cells are written
+        with one query and the changed and added cells with another one, and the saved cells are read back at once.
+        :param design_cells_aggregate:
+        :param author_id:
+        :param allow_none_arm_branch_arm: whether cells stored without a study arm or branch arm may be changed
+        """
+        assert design_cells_aggregate.repository_closure_data is not None
+        study_uid = design_cells_aggregate.study_uid
+        previous_design_cells = {
+            design_cell.uid: design_cell
+            for design_cell in design_cells_aggregate.repository_closure_data
+        }
+        current_uids = {
+            design_cell.uid for design_cell in design_cells_aggregate.design_cells
+        }
+        deleted_uids = [
+            design_cell_uid
+            for design_cell_uid in previous_design_cells
+            if design_cell_uid not in current_uids
+        ]
+        changed_design_cells = [
+            design_cell
+            for design_cell in design_cells_aggregate.design_cells
+            if design_cell.uid not in previous_design_cells
+            or self._stored_values(design_cell)
+            != self._stored_values(previous_design_cells[design_cell.uid])
+        ]
+
+        self._validate_design_cells(
+            design_cells_aggregate,
+            changed_design_cells,
+            previous_design_cells,
+            allow_none_arm_branch_arm,
+        )
+        date = datetime.datetime.now(datetime.timezone.utc)
+        if deleted_uids:
+            self._delete_all(study_uid, deleted_uids, author_id, date)
+        if changed_design_cells:
+            self._save_all(
+                study_uid,
+                changed_design_cells,
+                set(previous_design_cells),
+                author_id,
+                date,
+            )
+            saved_design_cells = {
+                design_cell.uid: design_cell
+                for design_cell in self.find_all_design_cells_by_study(study_uid)
+            }
+            changed_uids = {design_cell.uid for design_cell in changed_design_cells}
+            design_cells_aggregate.design_cells = [
+                (
+                    saved_design_cells[design_cell.uid]
+                    if design_cell.uid in changed_uids
+                    else design_cell
+                )
+                for design_cell in design_cells_aggregate.design_cells
+            ]
+        design_cells_aggregate.repository_closure_data = copy.deepcopy(
+            design_cells_aggregate.design_cells
+        )
+
+    @staticmethod
+    def _stored_values(design_cell: StudyDesignCellVO) -> tuple:
+        """The values of a design cell which are stored in its node and relationships"""
+        return (
+            (
+                design_cell.study_arm_uid
+                if not design_cell.study_branch_arm_uid
+                else None
+            ),
+            design_cell.study_branch_arm_uid,
+            design_cell.study_epoch_uid,
+            design_cell.study_element_uid,
+            design_cell.transition_rule,
+            design_cell.order,
+        )
+
+    def _validate_design_cells(
+        self,
+        design_cells_aggregate: StudyDesignCellsAR,
+        changed_design_cells: list[StudyDesignCellVO],
+        previous_design_cells: dict[str | None, StudyDesignCellVO],
+        allow_none_arm_branch_arm: bool,
+    ) -> None:
+        if not changed_design_cells:
+            return
+        rows, _ = db.cypher_query(
+            """
+            MATCH (sr:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)
+            RETURN
+                [(sv)-[:HAS_STUDY_ARM]->(sarm:StudyArm) | [
+                    sarm.uid,
+                    EXISTS { (sarm)-[:STUDY_ARM_HAS_BRANCH_ARM]->(:StudyBranchArm)<-[:HAS_STUDY_BRANCH_ARM]-(sv) }
+                ]],
+                [(sv)-[:HAS_STUDY_BRANCH_ARM]->(sbarm:StudyBranchArm) | sbarm.uid],
+                [(sv)-[:HAS_STUDY_EPOCH]->(sep:StudyEpoch) | sep.uid],
+                [(sv)-[:HAS_STUDY_ELEMENT]->(sel:StudyElement) | sel.uid]
+            """,
+            {"study_uid": design_cells_aggregate.study_uid},
+        )
+        exceptions.NotFoundException.raise_if(
+            not rows, "Study", design_cells_aggregate.study_uid
+        )
+        arm_rows, branch_arm_uids, epoch_uids, element_uids = rows[0]
+        arms_with_branch_arms = dict(arm_rows)
+
+        for design_cell in changed_design_cells:
+            previous_design_cell = previous_design_cells.get(design_cell.uid)
+            exceptions.BusinessLogicException.raise_if(
+                previous_design_cell is not None
+                and not previous_design_cell.study_arm_uid
+                and not previous_design_cell.study_branch_arm_uid
+                and not allow_none_arm_branch_arm,
+                msg="Broken Existing Design Cell without Arm and BranchArm",
+            )
+            exceptions.BusinessLogicException.raise_if(
+                arms_with_branch_arms.get(design_cell.study_arm_uid),
+                msg=f"The Study Arm with UID '{design_cell.study_arm_uid}' cannot be "
+                "assigned to a Study Design Cell because it has Study Branch Arms assigned to it",
+            )
+            exceptions.NotFoundException.raise_if(
+                design_cell.study_arm_uid not in arms_with_branch_arms
+                and design_cell.study_branch_arm_uid not in branch_arm_uids,
+                msg=f"Study Arm with UID '{design_cell.study_arm_uid}' or Study Branch Arm with UID '{design_cell.study_branch_arm_uid}' must exist.",
+            )
+            exceptions.NotFoundException.raise_if(
+                design_cell.study_epoch_uid not in epoch_uids,
+                "Study Epoch",
+                design_cell.study_epoch_uid,
+            )
+            exceptions.NotFoundException.raise_if(
+                design_cell.study_element_uid not in element_uids,
+                "Study Element",
+                design_cell.study_element_uid,
+            )
+
+            # check if the cell already exists
+            for existing in design_cells_aggregate.design_cells:
+                if (
+                    existing.uid == design_cell.uid
+                    or existing.study_epoch_uid != design_cell.study_epoch_uid
+                ):
+                    continue
+                exceptions.AlreadyExistsException.raise_if(
+                    existing.study_branch_arm_uid
+                    and existing.study_branch_arm_uid
+                    == design_cell.study_branch_arm_uid,
+                    msg="A study design cell already exists for the given combination study branch arm and study epoch.",
+                )
+                exceptions.AlreadyExistsException.raise_if(
+                    not existing.study_branch_arm_uid
+                    and existing.study_arm_uid
+                    and existing.study_arm_uid == design_cell.study_arm_uid,
+                    msg="A study design cell already exists for the given combination of study arm and study epoch.",
+                )
+
+    def _save_all(
+        self,
+        study_uid: str,
+        design_cells: list[StudyDesignCellVO],
+        previous_uids: set[str | None],
+        author_id: str,
+        date: datetime.datetime,
+    ) -> None:
+        """Writes new versions of changed and added design cells with their `Edit` and `Create` audit trail"""
+        db.cypher_query(
+            f"""
+            MATCH (sr:StudyRoot {{uid: $study_uid}})-[:LATEST]->(sv:StudyValue)
+            UNWIND $design_cells AS cell
+            MATCH (sv)-[:HAS_STUDY_EPOCH]->(sep:StudyEpoch {{uid: cell.study_epoch_uid}})
+            MATCH (sv)-[:HAS_STUDY_ELEMENT]->(sel:StudyElement {{uid: cell.study_element_uid}})
+            OPTIONAL MATCH (sv)-[:HAS_STUDY_ARM]->(sarm:StudyArm {{uid: cell.study_arm_uid}})
+            OPTIONAL MATCH (sv)-[:HAS_STUDY_BRANCH_ARM]->(sbarm:StudyBranchArm {{uid: cell.study_branch_arm_uid}})
+            OPTIONAL MATCH (sv)-[previous_rel:HAS_STUDY_DESIGN_CELL]->(previous:StudyDesignCell {{uid: cell.uid}})
+                WHERE cell.update
+            CREATE (sdc:{":".join(StudyDesignCell.inherited_labels())} {{
+                uid: cell.uid, transition_rule: cell.transition_rule, order: cell.order
+            }})
+            CREATE (sv)-[:HAS_STUDY_DESIGN_CELL]->(sdc)
+            CREATE (sep)-[:STUDY_EPOCH_HAS_DESIGN_CELL]->(sdc)
+            CREATE (sel)-[:STUDY_ELEMENT_HAS_DESIGN_CELL]->(sdc)
+            // a branch arm takes precedence over the study arm
+            FOREACH (_ IN CASE WHEN sbarm IS NOT NULL THEN [1] ELSE [] END |
+                CREATE (sbarm)-[:STUDY_BRANCH_ARM_HAS_DESIGN_CELL]->(sdc)
+            )
+            FOREACH (_ IN CASE WHEN sbarm IS NULL THEN [1] ELSE [] END |
+                CREATE (sarm)-[:STUDY_ARM_HAS_DESIGN_CELL]->(sdc)
+            )
+            FOREACH (_ IN CASE WHEN previous IS NULL THEN [1] ELSE [] END |
+                CREATE (sr)-[:AUDIT_TRAIL]->(:{":".join(Create.inherited_labels())} {{author_id: $author_id, date: $date}})-[:AFTER]->(sdc)
+            )
+            FOREACH (_ IN CASE WHEN previous IS NOT NULL THEN [1] ELSE [] END |
+                CREATE (sr)-[:AUDIT_TRAIL]->(action:{":".join(Edit.inherited_labels())} {{author_id: $author_id, date: $date}})
+                CREATE (action)-[:BEFORE]->(previous)
+                CREATE (action)-[:AFTER]->(sdc)
+                DELETE previous_rel
+            )
+            """,
+            {
+                "study_uid": study_uid,
+                "design_cells": [
+                    {
+                        "uid": design_cell.uid,
+                        "update": design_cell.uid in previous_uids,
+                        "study_arm_uid": design_cell.study_arm_uid,
+                        "study_branch_arm_uid": design_cell.study_branch_arm_uid,
+                        "study_epoch_uid": design_cell.study_epoch_uid,
+                        "study_element_uid": design_cell.study_element_uid,
+                        "transition_rule": design_cell.transition_rule,
+                        "order": design_cell.order,
+                    }
+                    for design_cell in design_cells
+                ],
+                "author_id": author_id,
+                "date": date,
+            },
+        )
+
+    def _delete_all(
+        self,
+        study_uid: str,
+        design_cell_uids: list[str],
+        author_id: str,
+        date: datetime.datetime,
+    ) -> None:
+        """
+        Removes design cells from the latest study value with their `Delete` audit trail.
+        Like `delete`, the deleted version of each cell stays connected to the arm or branch arm, epoch and element
+        of the removed version.
+        """
+        rows, _ = db.cypher_query(
+            f"""
+            MATCH (sr:StudyRoot {{uid: $study_uid}})-[:LATEST]->(sv:StudyValue)
+            UNWIND $design_cell_uids AS design_cell_uid
+            MATCH (sv)-[rel:HAS_STUDY_DESIGN_CELL]->(old:StudyDesignCell {{uid: design_cell_uid}})
+            CALL {{
+                WITH old
+                OPTIONAL MATCH (old)<-[:STUDY_ARM_HAS_DESIGN_CELL]-(sarm:StudyArm)
+                RETURN sarm LIMIT 1
+            }}
+            CALL {{
+                WITH old
+                OPTIONAL MATCH (old)<-[:STUDY_BRANCH_ARM_HAS_DESIGN_CELL]-(sbarm:StudyBranchArm)
+                RETURN sbarm LIMIT 1
+            }}
+            CALL {{
+                WITH old
+                OPTIONAL MATCH (old)<-[:STUDY_EPOCH_HAS_DESIGN_CELL]-(sep:StudyEpoch)
+                RETURN sep LIMIT 1
+            }}
+            CALL {{
+                WITH old
+                OPTIONAL MATCH (old)<-[:STUDY_ELEMENT_HAS_DESIGN_CELL]-(sel:StudyElement)
+                RETURN sel LIMIT 1
+            }}
+            CREATE (new:{":".join(StudyDesignCell.inherited_labels())} {{
+                uid: old.uid, transition_rule: old.transition_rule, order: old.order
+            }})
+            FOREACH (_ IN CASE WHEN sarm IS NOT NULL THEN [1] ELSE [] END |
+                CREATE (sarm)-[:STUDY_ARM_HAS_DESIGN_CELL]->(new)
+            )
+            FOREACH (_ IN CASE WHEN sarm IS NULL AND sbarm IS NOT NULL THEN [1] ELSE [] END |
+                CREATE (sbarm)-[:STUDY_BRANCH_ARM_HAS_DESIGN_CELL]->(new)
+            )
+            FOREACH (_ IN CASE WHEN sep IS NOT NULL THEN [1] ELSE [] END |
+                CREATE (sep)-[:STUDY_EPOCH_HAS_DESIGN_CELL]->(new)
+            )
+            FOREACH (_ IN CASE WHEN sel IS NOT NULL THEN [1] ELSE [] END |
+                CREATE (sel)-[:STUDY_ELEMENT_HAS_DESIGN_CELL]->(new)
+            )
+            CREATE (sr)-[:AUDIT_TRAIL]->(action:{":".join(Delete.inherited_labels())} {{author_id: $author_id, date: $date}})
+            CREATE (action)-[:BEFORE]->(old)
+            CREATE (action)-[:AFTER]->(new)
+            DELETE rel
+            RETURN old.uid, sarm IS NOT NULL OR sbarm IS NOT NULL, sep IS NOT NULL, sel IS NOT NULL
+            """,
+            {
+                "study_uid": study_uid,
+                "design_cell_uids": design_cell_uids,
+                "author_id": author_id,
+                "date": date,
+            },
+        )
+        # raising rolls the transaction back
+        deleted = {uid: checks for uid, *checks in rows}
+        for design_cell_uid in design_cell_uids:
+            exceptions.NotFoundException.raise_if(
+                design_cell_uid not in deleted, "Study Design Cell", design_cell_uid
+            )
+            has_arm, has_epoch, has_element = deleted[design_cell_uid]
+            exceptions.NotFoundException.raise_if_not(
+                has_arm, msg="Study arm or Study Branch Arm must exist"
+            )
+            exceptions.NotFoundException.raise_if_not(
+                has_epoch, msg="Study epoch must exists"
+            )
+            exceptions.NotFoundException.raise_if_not(
+                has_element, msg="Study element must exists"
+            )
+
     @trace_calls
     def _from_repository_values(
         self,
@@ -6,6 +6,7 @@ from neomodel import db
 from clinical_mdr_api import utils
 from clinical_mdr_api.domain_repositories._utils.helpers import (
     acquire_write_lock_study_value,
+    number_selections_in_study,
 )
 from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_codelist_attributes_repository import (
     CTCodelistAttributesRepository,
@@ -36,20 +37,29 @@ from clinical_mdr_api.domains.study_selections.study_selection_endpoint import (
     StudySelectionEndpointsAR,
     StudySelectionEndpointVO,
 )
+from clinical_mdr_api.models.study_selections.study_selection import (
+    StudySelectionEndpoint,
+)
+from clinical_mdr_api.repositories._utils import (
+    CypherQueryBuilder,
+    FilterDict,
+    FilterOperator,
+)
 from common.config import settings
 from common.exceptions import BusinessLogicException
+from common.telemetry import trace_calls
 from common.utils import convert_to_datetime
 
 
 class StudySelectionEndpointRepository:
 
-    def _retrieves_all_data(
+    def _all_data_query(
         self,
         study_uids: str | list[str] | None = None,
         project_name: str | None = None,
         project_number: str | None = None,
         study_value_version: str | None = None,
-    ) -> tuple[StudySelectionEndpointVO]:
+    ) -> tuple[str, dict[str, Any]]:
         query = ""
         query_parameters: dict[str, Any] = {}
 
@@ -166,49 +176,160 @@ class StudySelectionEndpointRepository:
                 values
                 ORDER BY order
             """
+        return query, query_parameters
 
-        all_endpoint_selections = db.cypher_query(query, query_parameters)
-        all_selections = []
-
-        for selection in utils.db_result_to_list(all_endpoint_selections):
-            if not selection["endpoint_uid"]:
-                continue
-
-            if selection["values"] is not None:
-                if "units" in selection["values"]:
-                    units = selection["values"]["units"]
-                else:
-                    units = None
-                if "separator" in selection["values"]:
-                    separator = selection["values"]["separator"]
-                else:
-                    separator = None
+    @staticmethod
+    def _create_vo_from_db_output(
+        selection: dict[str, Any],
+    ) -> StudySelectionEndpointVO:
+        if selection["values"] is not None:
+            if "units" in selection["values"]:
+                units = selection["values"]["units"]
             else:
                 units = None
+            if "separator" in selection["values"]:
+                separator = selection["values"]["separator"]
+            else:
                 separator = None
-            acv = selection.get("accepted_version", False)
-            if acv is None:
-                acv = False
-            selection_vo = StudySelectionEndpointVO.from_input_values(
-                study_uid=selection["study_uid"],
-                endpoint_uid=selection["endpoint_uid"],
-                endpoint_version=selection["endpoint_version"],
-                endpoint_level_uid=selection["endpoint_level_uid"],
-                endpoint_sublevel_uid=selection["endpoint_sublevel_uid"],
-                endpoint_level_order=selection["endpoint_order"],
-                endpoint_units=units,
-                timeframe_uid=selection["timeframe_uid"],
-                timeframe_version=selection["timeframe_version"],
-                unit_separator=separator,
-                study_objective_uid=selection["study_objective_uid"],
-                study_selection_uid=selection["study_endpoint_uid"],
-                is_instance=selection["is_instance"],
-                start_date=convert_to_datetime(value=selection["start_date"]),
-                author_id=selection["author_id"],
-                accepted_version=acv,
+        else:
+            units = None
+            separator = None
+        acv = selection.get("accepted_version", False)
+        if acv is None:
+            acv = False
+        return StudySelectionEndpointVO.from_input_values(
+            study_uid=selection["study_uid"],
+            endpoint_uid=selection["endpoint_uid"],
+            endpoint_version=selection["endpoint_version"],
+            endpoint_level_uid=selection["endpoint_level_uid"],
+            endpoint_sublevel_uid=selection["endpoint_sublevel_uid"],
+            endpoint_level_order=selection["endpoint_order"],
+            endpoint_units=units,
+            timeframe_uid=selection["timeframe_uid"],
+            timeframe_version=selection["timeframe_version"],
+            unit_separator=separator,
+            study_objective_uid=selection["study_objective_uid"],
+            study_selection_uid=selection["study_endpoint_uid"],
+            is_instance=selection["is_instance"],
+            start_date=convert_to_datetime(value=selection["start_date"]),
+            author_id=selection["author_id"],
+            accepted_version=acv,
+        )
+
+    def _retrieves_all_data(
+        self,
+        study_uids: str | list[str] | None = None,
+        project_name: str | None = None,
+        project_number: str | None = None,
+        study_value_version: str | None = None,
+    ) -> tuple[StudySelectionEndpointVO]:
+        query, query_parameters = self._all_data_query(
+            study_uids=study_uids,
+            project_name=project_name,
+            project_number=project_number,
+            study_value_version=study_value_version,
+        )
+        all_endpoint_selections = db.cypher_query(query, query_parameters)
+        return tuple(
+            self._create_vo_from_db_output(selection)
+            for selection in utils.db_result_to_list(all_endpoint_selections)
+            if selection["endpoint_uid"]
+        )
+
+    # Columns of the selection query kept by find_selections_page, besides study_uid and order
+    PAGE_COLUMNS = [
+        "study_endpoint_uid",
+        "accepted_version",
+        "endpoint_uid",
+        "endpoint_order",
+        "timeframe_uid",
+        "endpoint_version",
+        "timeframe_version",
+        "endpoint_level_uid",
+        "endpoint_sublevel_uid",
+        "study_objective_uid",
+        "text",
+        "start_date",
+        "is_instance",
+        "author_id",
+        "values",
+    ]
+
+    @trace_calls
+    def find_selections_page(
+        self,
+        study_uids: str | list[str] | None = None,
+        project_name: str | None = None,
+        project_number: str | None = None,
+        study_value_version: str | None = None,
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> tuple[list[tuple[StudySelectionEndpointVO, int]], int]:
+        """
+        Returns a page of study endpoints along with their 1-based position in the study,
+        filtering, sorting, counting and paginating in the database.
+
+        Filter and sort keys refer to the StudySelectionEndpoint API model fields
+        exposed by the alias clause below, the rendered endpoints, timeframes and
+        study objectives are only supported by their uid.
+        """
+        query, query_parameters = self._all_data_query(
+            study_uids=study_uids,
+            project_name=project_name,
+            project_number=project_number,
+            study_value_version=study_value_version,
+        )
+        match_clause = f"""
+            CALL {{ {query} }}
+            WITH * WHERE endpoint_uid IS NOT NULL
+            {number_selections_in_study(self.PAGE_COLUMNS)}
+            OPTIONAL MATCH (author:User {{user_id: author_id}})
+            """
+        alias_clause = """
+            study_uid, study_endpoint_uid, order, endpoint_uid, endpoint_order,
+            timeframe_uid, endpoint_version, timeframe_version, endpoint_level_uid,
+            endpoint_sublevel_uid, study_objective_uid, start_date, is_instance, author_id, values,
+            coalesce(accepted_version, false) AS accepted_version,
+            CASE WHEN is_instance THEN {uid: endpoint_uid} END AS endpoint,
+            CASE WHEN NOT is_instance THEN {uid: endpoint_uid} END AS template,
+            {uid: timeframe_uid} AS timeframe,
+            {study_objective_uid: study_objective_uid} AS study_objective,
+            {term_uid: endpoint_level_uid} AS endpoint_level,
+            {term_uid: endpoint_sublevel_uid} AS endpoint_sublevel,
+            coalesce(author.username, author_id) AS author_username
+            """
+
+        query_builder = CypherQueryBuilder(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by or {"study_uid": True, "order": True},
+            implicit_sort_by="order",
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=FilterDict.model_validate({"elements": filter_by or {}}),
+            filter_operator=filter_operator,
+            total_count=total_count,
+            return_model=StudySelectionEndpoint,
+        )
+        query_builder.parameters.update(query_parameters)
+        result_array, attributes_names = query_builder.execute()
+
+        selections = [
+            (self._create_vo_from_db_output(selection), selection["order"])
+            for selection in utils.db_result_to_list((result_array, attributes_names))
+        ]
+
+        total = 0
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=query_builder.count_query, params=query_builder.parameters
             )
-            all_selections.append(selection_vo)
-        return tuple(all_selections)
+            total = count_result[0][0] if count_result else 0
+        return selections, total
 
     def find_all(
         self,
@@ -29,6 +29,14 @@ from clinical_mdr_api.domains.study_selections.study_soa_footnote import (
     StudySoAFootnoteVO,
     StudySoAFootnoteVOHistory,
 )
+from clinical_mdr_api.models.study_selections.study_soa_footnote import (
+    StudySoAFootnote as StudySoAFootnoteModel,
+)
+from clinical_mdr_api.repositories._utils import (
+    CypherQueryBuilder,
+    FilterDict,
+    FilterOperator,
+)
 from common.exceptions import (
     BusinessLogicException,
     NotFoundException,
@@ -39,6 +47,24 @@ from common.utils import convert_to_datetime
 
 
 class StudySoAFootnoteRepository:
+    # Columns returned by the footnotes query, see `with_query`
+    BASE_COLUMNS = [
+        "study_uid",
+        "uid",
+        "footnote",
+        "footnote_template",
+        "referenced_items",
+    ]
+    FULL_QUERY_COLUMNS = [
+        "latest_footnote",
+        "accepted_version",
+        "author_id",
+        "modified_date",
+        "end_date",
+        "change_type",
+        "author_username",
+    ]
+
     def generate_soa_footnote_uid(self) -> str:
         return StudySoAFootnote.get_next_free_uid_and_increment_counter()
 
@@ -457,13 +483,12 @@ class StudySoAFootnoteRepository:
         )
         return selection_vo
 
-    @trace_calls
-    def find_all_footnotes(
+    def _find_all_footnotes_query(
         self,
         study_uids: str | list[str] | None = None,
         study_value_version: str | None = None,
         full_query: bool = True,
-    ) -> list[StudySoAFootnoteVO]:
+    ) -> tuple[str, dict[str, Any]]:
         query_parameters: dict[str, Any] = {}
         if study_uids:
             if isinstance(study_uids, str):
@@ -500,6 +525,20 @@ class StudySoAFootnoteRepository:
             query += self.where_query()
         query += self.with_query(full_query=full_query)
         query += self.order_by_soa_order()
+        return query, query_parameters
+
+    @trace_calls
+    def find_all_footnotes(
+        self,
+        study_uids: str | list[str] | None = None,
+        study_value_version: str | None = None,
+        full_query: bool = True,
+    ) -> list[StudySoAFootnoteVO]:
+        query, query_parameters = self._find_all_footnotes_query(
+            study_uids=study_uids,
+            study_value_version=study_value_version,
+            full_query=full_query,
+        )
         all_study_soa_footnotes = db.cypher_query(query, query_parameters)
         all_selections: list[StudySoAFootnoteVO] = []
         for selection in utils.db_result_to_list(all_study_soa_footnotes):
@@ -510,6 +549,79 @@ class StudySoAFootnoteRepository:
 
         return all_selections
 
+    @trace_calls
+    def find_footnotes_page(
+        self,
+        study_uids: str | list[str] | None = None,
+        study_value_version: str | None = None,
+        full_query: bool = True,
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> tuple[list[tuple[StudySoAFootnoteVO, int]], int]:
+        """
+        Returns a page of SoA footnotes along with their 1-based position in SoA order,
+        filtering, sorting, counting and paginating in the database.
+
+        Filter and sort keys refer to the StudySoAFootnote API model fields
+        exposed by the alias clause below, `referenced_items` and `study_version` are not supported.
+        """
+        query, query_parameters = self._find_all_footnotes_query(
+            study_uids=study_uids,
+            study_value_version=study_value_version,
+            full_query=full_query,
+        )
+        columns = self.BASE_COLUMNS + (self.FULL_QUERY_COLUMNS if full_query else [])
+        row = ", ".join(f"{column}: {column}" for column in columns)
+        match_clause = f"""
+            CALL {{ {query} }}
+            WITH collect({{ {row} }}) AS rows
+            UNWIND range(0, size(rows) - 1) AS index
+            WITH rows[index] AS row, index + 1 AS order
+            """
+        alias_clause = """
+            row, order, row.uid AS uid, row.study_uid AS study_uid,
+            CASE WHEN row.footnote.uid IS NULL THEN NULL ELSE row.footnote END AS footnote,
+            CASE WHEN row.footnote.uid IS NULL THEN row.footnote_template END AS template
+            """
+        if full_query:
+            alias_clause += """,
+            row.modified_date AS modified, row.accepted_version AS accepted_version,
+            row.author_username AS author_username
+            """
+
+        query_builder = CypherQueryBuilder(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by or {"order": True},
+            implicit_sort_by="order",
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=FilterDict.model_validate({"elements": filter_by or {}}),
+            filter_operator=filter_operator,
+            total_count=total_count,
+            return_model=StudySoAFootnoteModel,
+        )
+        query_builder.parameters.update(query_parameters)
+        result_array, attributes_names = query_builder.execute()
+
+        selections = []
+        for item in utils.db_result_to_list((result_array, attributes_names)):
+            selections.append(
+                (self.create_vo_from_db_output(selection=item["row"]), item["order"])
+            )
+
+        total = 0
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=query_builder.count_query, params=query_builder.parameters
+            )
+            total = count_result[0][0] if count_result else 0
+        return selections, total
+
     def find_by_uid(
         self, study_uid: str, uid: str, study_value_version: str | None = None
     ) -> StudySoAFootnoteVO:
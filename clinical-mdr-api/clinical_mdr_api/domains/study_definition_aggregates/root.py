@@ -280,18 +280,29 @@ class StudyDefinitionAR:
         """
         Returns set of possible actions
         """
-        if self.study_status == StudyStatus.DRAFT and not self.latest_locked_metadata:
-            if self.study_parent_part_uid:
+        return self.possible_actions_for(
+            study_status=self.study_status,
+            has_locked_version=self.latest_locked_metadata is not None,
+            is_subpart=bool(self.study_parent_part_uid),
+        )
+
+    @staticmethod
+    def possible_actions_for(
+        study_status: StudyStatus, has_locked_version: bool, is_subpart: bool
+    ):
+        """
+        Returns set of possible actions for a study in the given state,
+        used as well for studies read without rehydrating the aggregate
+        """
+        if study_status == StudyStatus.DRAFT and not has_locked_version:
+            if is_subpart:
                 return {StudyAction.DELETE}
             return {StudyAction.LOCK, StudyAction.RELEASE, StudyAction.DELETE}
-        if (
-            self.study_status in [StudyStatus.DRAFT, StudyStatus.RELEASED]
-            and not self.study_parent_part_uid
-        ):
+        if study_status in [StudyStatus.DRAFT, StudyStatus.RELEASED] and not is_subpart:
             return {StudyAction.LOCK, StudyAction.RELEASE}
-        if self.study_status == StudyStatus.LOCKED and not self.study_parent_part_uid:
+        if study_status == StudyStatus.LOCKED and not is_subpart:
             return {StudyAction.UNLOCK}
-        if self.study_status == StudyStatus.DELETED:
+        if study_status == StudyStatus.DELETED:
             return set()
         return frozenset()
 
@@ -1,5 +1,8 @@
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
+
+from common import exceptions
 
 
 @dataclass
@@ -38,3 +41,60 @@ class StudyDesignCellVO:
         self.study_branch_arm_uid = study_branch_arm_uid
         self.transition_rule = transition_rule
         self.order = order
+
+
+@dataclass
+class StudyDesignCellsAR:
+    """
+    The StudyDesignCellsAR holds all the design cells of a study, sorted by their order
+    """
+
+    study_uid: str
+    design_cells: list[StudyDesignCellVO]
+    repository_closure_data: Any = field(
+        init=False, compare=False, repr=True, default=None
+    )
+
+    def get_specific_object_selection(
+        self, design_cell_uid: str
+    ) -> tuple[StudyDesignCellVO, int]:
+        for design_cell in self.design_cells:
+            if design_cell.uid == design_cell_uid:
+                return design_cell, design_cell.order
+        raise exceptions.NotFoundException("Study Design Cell", design_cell_uid)
+
+    def add_design_cell(self, design_cell: StudyDesignCellVO) -> None:
+        # if the order want an specific order
+        if design_cell.order:
+            exceptions.BusinessLogicException.raise_if(
+                len(self.design_cells) + 1 < design_cell.order,
+                msg="Order is too big.",
+            )
+            # shift one order more to fit the added one
+            for existing_design_cell in self.design_cells[design_cell.order - 1 :]:
+                existing_design_cell.order += 1
+        # if not just add one to the order
+        else:
+            design_cell.order = len(self.design_cells) + 1
+        self.design_cells.insert(design_cell.order - 1, design_cell)
+
+    def remove_design_cell(self, design_cell_uid: str) -> None:
+        design_cell, order = self.get_specific_object_selection(design_cell_uid)
+        self.design_cells.remove(design_cell)
+        # shift one order less to fill the gap
+        for existing_design_cell in self.design_cells[order - 1 :]:
+            existing_design_cell.order -= 1
+
+    def move_design_cell(self, design_cell_uid: str, order: int) -> None:
+        """
+        Moves the design cell to the given order and renumbers all design cells,
+        so that the position of every cell in `design_cells` stays `order - 1`.
+        An order beyond the last design cell moves it to the end.
+        """
+        design_cell, _ = self.get_specific_object_selection(design_cell_uid)
+        self.design_cells.remove(design_cell)
+        self.design_cells.insert(
+            min(max(order, 1), len(self.design_cells) + 1) - 1, design_cell
+        )
+        for position, existing_design_cell in enumerate(self.design_cells, start=1):
+            existing_design_cell.order = position
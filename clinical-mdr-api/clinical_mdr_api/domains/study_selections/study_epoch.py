@@ -289,14 +289,17 @@ class TimelineAR(BaseTimelineAR):
         """
         Add visits to a list of visits - used for preparation of adding new visit - creates order for added visit
         """
-        visits = self._visits
-        visits.append(visit)
-        self._visits = visits
-        self._visits = self.ordered_study_visits
+        self._visits.append(visit)
+        self._invalidate_timeline()
+        ordered_visits = self._get_ordered_visits()
+        if any(v is not o for v, o in zip(self._visits, ordered_visits)):
+            # visits anchored to the previous visit depend on the order of _visits, so the timeline is derived again
+            self._visits = list(ordered_visits)
+            self._invalidate_timeline()
 
     def remove_visit(self, visit: StudyVisitVO):
-        visits = [v for v in self._visits if v != visit]
-        self._visits = visits
+        self._visits = [v for v in self._visits if v is not visit]
+        self._invalidate_timeline()
 
     def update_visit(self, visit: StudyVisitVO):
         """
@@ -305,14 +308,14 @@ class TimelineAR(BaseTimelineAR):
         new_visits = [v for v in self._visits if v.uid != visit.uid]
         new_visits.append(visit)
         self._visits = new_visits
+        self._invalidate_timeline()
 
     @property
     def ordered_study_visits(self) -> list[StudyVisitVO]:
         """
-        Accessor for generated order
+        Accessor for generated order, the timeline is derived again only after visits were added, removed or updated
         """
-        visits = self._generate_timeline()
-        return visits
+        return list(self._get_ordered_visits())
 
 
 @dataclass
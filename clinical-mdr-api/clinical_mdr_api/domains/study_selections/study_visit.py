@@ -358,21 +358,36 @@ class StudyVisitVO:
             return ["edit", "delete", "lock"]
         return None
 
-    def get_absolute_duration(self) -> int | None:
+    def get_absolute_duration(
+        self, durations: dict[int, int | None] | None = None
+    ) -> int | None:
+        """
+        Derives the timing of the visit through its chain of anchor visits.
+        When deriving the timings of many visits, `durations` memoizes them by visit object id,
+        so each anchor visit chain is followed only once.
+        """
+        if durations is not None and id(self) in durations:
+            return durations[id(self)]
+
+        duration: int | None = None
         # Special visit doesn't have a timing but we want to place it
         # after the anchor visit for the special visit hence we derive timing based on the anchor visit
         if self.visit_class == VisitClass.SPECIAL_VISIT and self.anchor_visit:
-            return self.anchor_visit.get_absolute_duration()
-        if self.timepoint:
+            duration = self.anchor_visit.get_absolute_duration(durations)
+        elif self.timepoint:
             if self.timepoint.visit_value == 0:
-                return 0
-            if self.anchor_visit is not None:
-                return (
+                duration = 0
+            elif self.anchor_visit is not None:
+                duration = (
                     self.get_unified_duration()
-                    + self.anchor_visit.get_absolute_duration()
+                    + self.anchor_visit.get_absolute_duration(durations)
                 )
-            return self.get_unified_duration()
-        return None
+            else:
+                duration = self.get_unified_duration()
+
+        if durations is not None:
+            durations[id(self)] = duration
+        return duration
 
     def get_unified_window(self):
         absolute_duration: int | None = self.get_absolute_duration()
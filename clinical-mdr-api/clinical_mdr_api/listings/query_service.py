@@ -413,18 +413,72 @@ class QueryService:
 
         return GenericFilteringReturn(items=result, total=total)
 
+    def _get_study_listing(
+        self,
+        study_uid: str,
+        study_value_version: str | None,
+        match_clause: str,
+        alias_clause: str,
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> GenericFilteringReturn:
+        """
+        Runs a listing query of the given study (version), filtering, sorting and paginating in the database.
+
+        The match clause continues the match of the study, bound to `sr` and `sv`,
+        the alias clause defines the listing columns and their default order.
+        """
+        if study_value_version:
+            match_clause = MATCH_SPECIFIC_STUDY_VERSION + match_clause
+        else:
+            match_clause = MATCH_LATEST_STUDY + match_clause
+
+        query = CypherQueryBuilder(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=FilterDict.model_validate({"elements": filter_by or {}}),
+            filter_operator=filter_operator,
+            total_count=total_count,
+        )
+
+        query.parameters.update(
+            {
+                "study_uid": str(study_uid),
+                "study_value_version": str(study_value_version),
+            }
+        )
+        result_array, attributes_names = query.execute()
+        result = utils.db_result_to_list((result_array, attributes_names))
+
+        total = 0
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=query.count_query, params=query.parameters
+            )
+            if len(count_result) > 0:
+                total = count_result[0][0]
+
+        return GenericFilteringReturn(items=result, total=total)
+
     def get_tv(
         self,
         study_uid,
         study_value_version: str | None = None,
-    ) -> list[Any]:
-        if study_value_version:
-            query = MATCH_SPECIFIC_STUDY_VERSION
-        else:
-            query = MATCH_LATEST_STUDY
-        query = (
-            query
-            + """
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> GenericFilteringReturn:
+        match_clause = """
         // Query to retrieve TV data from the Study Visit table
         // We are looking for the latest visit name, study day, and study week values associated with a specific study value version or all (latest) study versions.
         // The query filters by domain (TV), selecting the 'StudID', 'VisitNum', 'StudyDayValue' (or 'StudyWeekValue'), 'ArmCD', 'Arm', and any other fields we want to include.
@@ -435,8 +489,9 @@ class QueryService:
                         (v)-->(wr:StudyWeekRoot)-[:LATEST]->(wv:StudyWeekValue)
         OPTIONAL MATCH (udv:UnitDefinitionValue)-[:LATEST_FINAL]-(udr:UnitDefinitionRoot)--(stf:StudyTimeField)--(sv)
             WHERE stf.field_name = "soa_preferred_time_unit"
-
-        RETURN toUpper(sv.study_id_prefix + '-' + sv.study_number) AS STUDYID,
+        """
+        alias_clause = """
+            toUpper(sv.study_id_prefix + '-' + sv.study_number) AS STUDYID,
             'TV' AS DOMAIN,
             toInteger(v.unique_visit_number) AS VISITNUM,
             CASE
@@ -451,19 +506,21 @@ class QueryService:
             NULL AS ARM,
             toUpper(v.start_rule) AS TVSTRL,
             toUpper(v.end_rule) AS TVENRL
-        ORDER BY v.unique_visit_number;
+        ORDER BY v.unique_visit_number
         """
-        )
-        result_array = db.cypher_query(
-            query=query,
-            params={
-                "study_uid": str(study_uid),
-                "study_value_version": str(study_value_version),
-            },
+        return self._get_study_listing(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
         )
 
-        return utils.db_result_to_list(result_array)
-
     def get_mdvisit(
         self,
         study_uid: str,
@@ -693,14 +750,14 @@ class QueryService:
         self,
         study_uid,
         study_value_version: str | None = None,
-    ) -> list[Any]:
-        if study_value_version:
-            query = MATCH_SPECIFIC_STUDY_VERSION
-        else:
-            query = MATCH_LATEST_STUDY
-        query = (
-            query
-            + """
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> GenericFilteringReturn:
+        match_clause = """
         MATCH (sv)-[:HAS_STUDY_ELEMENT]->(se:StudyElement)
         CALL 
             {
@@ -745,7 +802,8 @@ class QueryService:
                 END AS ARMCD,
                 sba.name AS TABRANCH
         }
-        RETURN 
+        """
+        alias_clause = """
             STUDYID,
             DOMAIN,
             ELEMENT,
@@ -753,42 +811,43 @@ class QueryService:
             TAETORD,
             TATRANS,
             EPOCH,
-            ARM, 
+            ARM,
             ARMCD,
             TABRANCH
         ORDER BY ARMCD, TAETORD
-            
-
-
         """
+        return self._get_study_listing(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
         )
-        result_array = db.cypher_query(
-            query=query,
-            params={
-                "study_uid": str(study_uid),
-                "study_value_version": str(study_value_version),
-            },
-        )
-
-        return utils.db_result_to_list(result_array)
 
     def get_ti(
         self,
         study_uid,
         study_value_version: str | None = None,
-    ) -> list[Any]:
-        if study_value_version:
-            query = MATCH_SPECIFIC_STUDY_VERSION
-        else:
-            query = MATCH_LATEST_STUDY
-        query = (
-            query
-            + """
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> GenericFilteringReturn:
+        match_clause = """
         MATCH (sv)-->(sc:StudyCriteria)
         MATCH (sc)-->(cv:CriteriaValue)<-[:LATEST]-(cr:CriteriaRoot)<--(ctr:CriteriaTemplateRoot)-[:HAS_TYPE]->(ctx:CTTermContext)-[:HAS_SELECTED_TERM]->(tr:CTTermRoot)-->(atr:CTTermAttributesRoot)-[:LATEST]->(atv:CTTermAttributesValue)
         WHERE atv.concept_id = 'C25532' or atv.concept_id = 'C25370'
         MATCH (ctx)-[:HAS_SELECTED_CODELIST]->(clr:CTCodelistRoot)-[ht:HAS_TERM]-(clterm:CTCodelistTerm)-[:HAS_TERM_ROOT]->(tr)
-        RETURN  toUpper(sv.study_id_prefix) + '-' + toUpper(sv.study_number) AS STUDYID,
+        """
+        alias_clause = """
+                toUpper(sv.study_id_prefix) + '-' + toUpper(sv.study_number) AS STUDYID,
                 'TI' AS DOMAIN,
                 TOUPPER(substring(clterm.submission_value,0,1)) + toInteger(sc.order) AS IETESTCD,
                 cv.name_plain AS IETEST,
@@ -796,31 +855,33 @@ class QueryService:
                 '' AS IESCAT,
                 '' AS TIRL,
                 '' AS TIVERS
-        ORDER BY IETESTCD;
+        ORDER BY IETESTCD
         """
+        return self._get_study_listing(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
         )
-        result_array = db.cypher_query(
-            query=query,
-            params={
-                "study_uid": str(study_uid),
-                "study_value_version": str(study_value_version),
-            },
-        )
-
-        return utils.db_result_to_list(result_array)
 
     def get_ts(
         self,
         study_uid,
         study_value_version: str | None = None,
-    ) -> list[Any]:
-        if study_value_version:
-            query = MATCH_SPECIFIC_STUDY_VERSION
-        else:
-            query = MATCH_LATEST_STUDY
-        query = (
-            query
-            + f"""
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> GenericFilteringReturn:
+        match_clause = f"""
         WITH sr, sv
         CALL {{
         WITH sr, sv
@@ -1132,37 +1193,51 @@ class QueryService:
                 '' as TSVCDREF,
                 '' AS TSVCDVER
         }}
-        RETURN *
+        """
+        alias_clause = """
+            STUDYID,
+            DOMAIN,
+            TSPARMCD,
+            TSPARM,
+            controlled_by,
+            TSVAL,
+            TSVALNF,
+            TSVALCD,
+            TSVCDREF,
+            TSVCDVER
         ORDER BY TSPARMCD
         """
-        )
-        result_array = db.cypher_query(
-            query=query,
-            params={
-                "study_uid": str(study_uid),
-                "study_value_version": str(study_value_version),
-            },
+        return self._get_study_listing(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
         )
 
-        return utils.db_result_to_list(result_array)
-
     def get_te(
         self,
         study_uid,
         study_value_version: str | None = None,
-    ) -> list[Any]:
-        if study_value_version:
-            query = MATCH_SPECIFIC_STUDY_VERSION
-        else:
-            query = MATCH_LATEST_STUDY
-        query = (
-            query
-            + """
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> GenericFilteringReturn:
+        match_clause = """
         MATCH (sv)-[:HAS_STUDY_ELEMENT]->(se:StudyElement)
-        RETURN 
+        """
+        alias_clause = """
             toUpper(sv.study_id_prefix + '-' + sv.study_number) AS STUDYID,
             'TE' AS DOMAIN,
-            se.uid,
+            se.uid AS uid,
             se.order AS ETCD,
             se.name AS ELEMENT,
             se.start_rule AS TESTRL,
@@ -1170,32 +1245,37 @@ class QueryService:
             se.planned_duration AS TEDUR
             ORDER BY se.order
         """
+        return self._get_study_listing(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
         )
-        result_array = db.cypher_query(
-            query=query,
-            params={
-                "study_uid": str(study_uid),
-                "study_value_version": str(study_value_version),
-            },
-        )
-        return utils.db_result_to_list(result_array)
 
     def get_tdm(
         self,
         study_uid,
         study_value_version: str | None = None,
-    ) -> list[Any]:
-        if study_value_version:
-            query = MATCH_SPECIFIC_STUDY_VERSION
-        else:
-            query = MATCH_LATEST_STUDY
-        query = (
-            query
-            + """
+        sort_by: dict[str, bool] | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        filter_by: dict[str, dict[str, Any]] | None = None,
+        filter_operator: FilterOperator = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> GenericFilteringReturn:
+        match_clause = """
         MATCH (sv)-[:HAS_STUDY_DISEASE_MILESTONE]->(sdm:StudyDiseaseMilestone)
         MATCH (sdm)-[:HAS_DISEASE_MILESTONE_TYPE]-(:CTTermContext)-[:HAS_SELECTED_TERM]->(tr:CTTermRoot)-[:HAS_NAME_ROOT]-(:CTTermNameRoot)-[:LATEST]-(sdm_term:CTTermNameValue)
         MATCH (tr)-[HAS_ATTRIBUTES_ROOT]->(CTTermAttributesRoot)-[LATEST]->(ctav:CTTermAttributesValue)
-        RETURN DISTINCT toUpper(sv.study_id_prefix + '-' + sv.study_number) AS STUDYID,
+        """
+        alias_clause = """
+            DISTINCT toUpper(sv.study_id_prefix + '-' + sv.study_number) AS STUDYID,
             'TM' AS DOMAIN,
             sdm_term.name AS MIDSTYPE ,
             ctav.definition AS TMDEF,
@@ -1204,12 +1284,15 @@ class QueryService:
                 when false then 'N'
             END AS TMRPT
         """
+        return self._get_study_listing(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
         )
-        result_array = db.cypher_query(
-            query=query,
-            params={
-                "study_uid": str(study_uid),
-                "study_value_version": str(study_value_version),
-            },
-        )
-        return utils.db_result_to_list(result_array)
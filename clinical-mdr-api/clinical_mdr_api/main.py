@@ -19,6 +19,7 @@ configure_database(
 # pylint: disable=wrong-import-position,wrong-import-order,ungrouped-imports
 import logging
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request, status
@@ -35,9 +36,12 @@ from starlette.middleware import Middleware
 from starlette_context.middleware import RawContextMiddleware
 
 from clinical_mdr_api.utils.api_version import get_api_version
-from common.auth.dependencies import security
+from common.auth.dependencies import is_request_authorized, security
 from common.auth.discovery import reconfigure_with_openid_discovery
+from common.conditional_get import ConditionalGetMiddleware
 from common.exceptions import MDRApiBaseException
+from common.executor import shutdown_fetch_executor, start_fetch_executor
+from common.jobs import shutdown_job_runner
 from common.models.error import ErrorResponse
 from common.telemetry.request_metrics import patch_neomodel_database
 from common.telemetry.traceback_middleware import ExceptionTracebackMiddleware
@@ -114,12 +118,58 @@ middlewares.append(
 middlewares.append(Middleware(ExceptionTracebackMiddleware))
 
 
+def get_study_change_token(
+    study_uid: str, study_value_version: str | None
+) -> str | None:
+    # loaded with the routers, see below
+    # pylint: disable=import-outside-toplevel
+    from clinical_mdr_api.domain_repositories.study_definitions.study_definition_repository_impl import (
+        StudyDefinitionRepositoryImpl,
+    )
+
+    return StudyDefinitionRepositoryImpl.get_study_change_token(
+        study_uid, study_value_version
+    )
+
+
+# ETags and 304 Not Modified for study-scoped resources built from the study data, library items and CT terms
+if settings.study_etag_enabled:
+    middlewares.append(
+        Middleware(
+            ConditionalGetMiddleware,
+            paths=[
+                r"/studies/(?P<uid>[^/]+)/(study-visits|study-epochs)(/.*)?",
+                r"/studies/(?P<uid>[^/]+)/study-activity-schedules",
+                r"/studies/(?P<uid>[^/]+)/flowchart(/coordinates|\.html|\.docx|\.xlsx)?",
+                r"/studies/(?P<uid>[^/]+)/(operational|detailed)-soa\.(html|xlsx)",
+                r"/studies/(?P<uid>[^/]+)/design\.svg",
+                r"/usdm/v3/studyDefinitions/(?P<uid>[^/]+)",
+            ],
+            get_change_token=get_study_change_token,
+            authorize=partial(is_request_authorized, roles={"Study.Read"}),
+            salt=get_api_version(),
+        )
+    )
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     if settings.oauth_enabled:
         # Reconfiguring Swagger UI settings with OpenID Connect discovery
         await reconfigure_with_openid_discovery()
+    start_fetch_executor()
+    # loaded with the routers, see below
+    # pylint: disable=import-outside-toplevel
+    from clinical_mdr_api.services.jobs import start_job_runner
+    from clinical_mdr_api.services.studies.study_artifacts import (
+        shutdown_prerender_executor,
+    )
+
+    start_job_runner()
     yield
+    shutdown_job_runner()
+    shutdown_prerender_executor()
+    shutdown_fetch_executor()
 
 
 app = FastAPI(
@@ -254,6 +304,11 @@ app.include_router(
     prefix="/notifications",
     tags=["Notifications"],
 )
+app.include_router(
+    routers.jobs_router,
+    prefix="/jobs",
+    tags=["Jobs"],
+)
 app.include_router(
     routers.odm_study_events_router,
     prefix="/concepts/odms/study-events",
@@ -0,0 +1,138 @@
+from datetime import date, datetime, timezone
+from typing import Annotated, Any, Self
+
+from pydantic import Field
+
+from clinical_mdr_api.domains.concepts.utils import TargetType
+from clinical_mdr_api.models.study_selections.study import StudyCloneInput
+from clinical_mdr_api.models.utils import BaseModel, PostInputModel
+from common import jobs
+
+
+def _to_datetime(timestamp: float | None) -> datetime | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class Job(BaseModel):
+    uid: Annotated[str, Field()]
+    type: Annotated[str, Field(description="Type of the job, see `GET /jobs/types`")]
+    status: Annotated[jobs.JobStatus, Field()]
+    progress: Annotated[
+        float, Field(description="Progress of the job from 0 to 1", ge=0, le=1)
+    ]
+    message: Annotated[
+        str | None,
+        Field(
+            description="Last progress message of the job",
+            json_schema_extra={"nullable": True},
+        ),
+    ] = None
+    error: Annotated[
+        str | None,
+        Field(description="Why the job failed", json_schema_extra={"nullable": True}),
+    ] = None
+    cancel_requested: Annotated[bool, Field()] = False
+    submitted_at: Annotated[datetime, Field()]
+    started_at: Annotated[
+        datetime | None, Field(json_schema_extra={"nullable": True})
+    ] = None
+    finished_at: Annotated[
+        datetime | None, Field(json_schema_extra={"nullable": True})
+    ] = None
+    result_media_type: Annotated[
+        str | None, Field(json_schema_extra={"nullable": True})
+    ] = None
+    result_filename: Annotated[
+        str | None, Field(json_schema_extra={"nullable": True})
+    ] = None
+    result_size: Annotated[
+        int | None,
+        Field(
+            description="Size of the result in bytes",
+            json_schema_extra={"nullable": True},
+        ),
+    ] = None
+
+    @classmethod
+    def from_job(cls, job: jobs.Job) -> Self:
+        return cls(
+            uid=job.uid,
+            type=job.type,
+            status=job.status,
+            progress=job.progress,
+            message=job.message,
+            error=job.error,
+            cancel_requested=job.cancel_requested,
+            submitted_at=_to_datetime(job.submitted_at),
+            started_at=_to_datetime(job.started_at),
+            finished_at=_to_datetime(job.finished_at),
+            result_media_type=job.result_media_type,
+            result_filename=job.result_filename,
+            result_size=job.result_size,
+        )
+
+
+class JobType(BaseModel):
+    name: Annotated[str, Field()]
+    description: Annotated[str, Field()]
+    roles: Annotated[
+        list[str],
+        Field(description="Roles of which the submitting user needs at least one"),
+    ]
+    max_concurrency: Annotated[
+        int, Field(description="Number of jobs of this type running at once")
+    ]
+    cancellable: Annotated[
+        bool,
+        Field(
+            description="Whether a running job of this type can be cancelled, otherwise only while queued"
+        ),
+    ] = True
+    parameters_schema: Annotated[
+        dict[str, Any] | None,
+        Field(
+            description="JSON schema of the parameters of the job",
+            json_schema_extra={"nullable": True},
+        ),
+    ] = None
+
+
+class JobInput(PostInputModel):
+    type: Annotated[str, Field(min_length=1)]
+    parameters: Annotated[dict[str, Any], Field()] = {}
+
+
+class StudyLockJobParameters(PostInputModel):
+    study_uid: Annotated[str, Field(min_length=1)]
+    change_description: Annotated[str, Field(min_length=1)]
+
+
+class StudyCloneJobParameters(StudyCloneInput):
+    study_uid: Annotated[str, Field(min_length=1)]
+
+
+class StudySoAJobParameters(PostInputModel):
+    study_uid: Annotated[str, Field(min_length=1)]
+    study_value_version: Annotated[str | None, Field()] = None
+    time_unit: Annotated[str | None, Field()] = None
+
+
+class StudyJobParameters(PostInputModel):
+    study_uid: Annotated[str, Field(min_length=1)]
+
+
+class OdmDocumentJobParameters(PostInputModel):
+    target_uids: Annotated[list[str], Field(min_length=1)]
+    target_type: Annotated[TargetType, Field()]
+    allowed_namespaces: Annotated[list[str], Field()] = []
+    version: Annotated[str | None, Field(pattern="^\\d+\\.\\d+$")] = None
+    pdf: Annotated[bool, Field()] = False
+    stylesheet: Annotated[str | None, Field(pattern="^[a-zA-Z0-9-]+$")] = None
+
+
+class CTPackageChangesJobParameters(PostInputModel):
+    catalogue_name: Annotated[str, Field(min_length=1)]
+    old_package_date: Annotated[date, Field()]
+    new_package_date: Annotated[date, Field()]
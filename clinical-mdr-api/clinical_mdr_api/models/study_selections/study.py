@@ -1595,6 +1595,39 @@ class CompactStudy(BaseModel):
 
         return study
 
+    @classmethod
+    def from_projection(
+        cls,
+        projection: dict[str, Any],
+        find_study_parent_part_by_uid: Callable[[str], StudyDefinitionAR | None],
+        find_term_by_uids: Callable[..., list[CTTermNameAR] | None],
+    ) -> Self:
+        """Creates a CompactStudy from a row returned by `StudyDefinitionRepositoryImpl.find_compact_studies`"""
+        return cls(
+            uid=projection["uid"],
+            study_parent_part=StudyParentPart.from_study_uid(
+                projection["study_parent_part_uid"],
+                find_study_parent_part_by_uid,
+                find_term_by_uids,
+            ),
+            study_subpart_uids=projection["study_subpart_uids"],
+            possible_actions=sorted(
+                _.value
+                for _ in StudyDefinitionAR.possible_actions_for(
+                    study_status=StudyStatus(
+                        projection["current_metadata"]["version_metadata"][
+                            "study_status"
+                        ]
+                    ),
+                    has_locked_version=projection["has_locked_version"],
+                    is_subpart=bool(projection["study_parent_part_uid"]),
+                )
+            ),
+            current_metadata=CompactStudyMetadataJsonModel(
+                **projection["current_metadata"]
+            ),
+        )
+
 
 class StudyMinimal(BaseModel):
     uid: Annotated[str, Field(description="UID of the study, e.g. 'Study_000001'")]
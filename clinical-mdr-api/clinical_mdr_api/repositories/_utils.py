@@ -1,9 +1,12 @@
+import contextlib
+import contextvars
 import functools
+import inspect
 import logging
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Any, Callable, Generic
+from typing import Annotated, Any, Callable, Generic, Iterator, Mapping
 
 from dateutil.parser import isoparse
 from neo4j.exceptions import CypherSyntaxError
@@ -27,6 +30,7 @@ from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     SimpleTermModel,
 )
 from clinical_mdr_api.models.standard_data_models.sponsor_model import SponsorModelBase
+from common.cache import SbTTLCache, referenced_uids
 from common.exceptions import ValidationException
 from common.utils import (
     filter_sort_valid_keys_re,
@@ -1225,23 +1229,82 @@ class CypherQueryBuilder:
         return result_array, attributes_names
 
 
+def get_affected_uids(signature: inspect.Signature, *args, **kwargs) -> set[str] | None:
+    """
+    Returns the uids of the aggregates affected by a repository write method call, derived from its arguments:
+        * `uid` and `*_uid` string arguments, `*_uids` lists of strings,
+        * the `uid` of aggregate or node arguments, and the uids referenced by aggregates (see `referenced_uids`).
+
+    Returns None if any other object argument can't be attributed to an uid,
+    in which case the affected cache stores must be cleared entirely.
+    """
+    bound = signature.bind(*args, **kwargs)
+    uids: set[str] = set()
+    for name, value in list(bound.arguments.items())[1:]:
+        if value is None or isinstance(value, (bool, int, float, Enum, Mapping)):
+            continue
+        if isinstance(value, str):
+            if name == "uid" or name.endswith("_uid"):
+                uids.add(value)
+            continue
+        if name.endswith("_uids") and isinstance(value, (list, tuple, set)):
+            uids.update(uid for uid in value if isinstance(uid, str))
+            continue
+        uid = getattr(value, "uid", None)
+        if not isinstance(uid, str):
+            return None
+        uids.add(uid)
+        uids |= referenced_uids(value)
+    return uids or None
+
+
 def sb_clear_cache(caches: list[str] | None = None):
     """
-    Decorator that will clear the specified caches after the wrapped function execution.
+    Decorator that will invalidate the specified caches after the wrapped function execution.
+
+    Only the entries of the aggregates affected by the call (see `get_affected_uids`) and their dependents are evicted.
+    If the affected aggregates can't be determined, the caches are cleared entirely.
+
+    Invalidating a cache store also invalidates it in all other API workers sharing the same cache backend,
+    so it must happen even if the local copy of the store is empty.
     """
     if caches is None:
         caches = []
 
     def decorator(function):
+        signature = inspect.signature(function)
+
         @functools.wraps(function)
         def wrapper(self, *args, **kwargs):
             try:
                 result = function(self, *args, **kwargs)
                 return result
             finally:
+                try:
+                    uids = get_affected_uids(signature, self, *args, **kwargs)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # e.g. arguments not matching the signature, which the call itself has already raised for,
+                    # clear the caches entirely without replacing the error of the call
+                    log.exception(
+                        "Failed to get the uids affected by %s", function.__qualname__
+                    )
+                    uids = None
+                recorded = _recorded_cache_invalidations.get()
                 for cache_name in caches:
                     cache = getattr(self, cache_name, None)
-                    if cache:
+                    if cache is None:
+                        continue
+                    if recorded is not None:
+                        recorded.append((cache, uids))
+                    if uids is not None and isinstance(cache, SbTTLCache):
+                        log.info(
+                            "Invalidate cache '%s.%s' for uids: %s",
+                            type(self).__name__,
+                            cache_name,
+                            sorted(uids),
+                        )
+                        cache.invalidate(uids)
+                    else:
                         log.info(
                             "Clear cache '%s.%s' of size: %s",
                             type(self).__name__,
@@ -1253,3 +1316,44 @@ def sb_clear_cache(caches: list[str] | None = None):
         return wrapper
 
     return decorator
+
+
+CacheInvalidation = tuple[Any, set[str] | None]
+"""A cache store and the uids invalidated in it, or `None` if it was cleared."""
+
+_recorded_cache_invalidations: contextvars.ContextVar[
+    list[CacheInvalidation] | None
+] = contextvars.ContextVar("recorded_cache_invalidations", default=None)
+
+
+@contextlib.contextmanager
+def record_cache_invalidations() -> Iterator[list[CacheInvalidation]]:
+    """
+    Records the cache invalidations made by `sb_clear_cache` in the block.
+
+    Entries read within a transaction after its writes hold uncommitted data,
+    pass the recorded invalidations to `repeat_cache_invalidations` after rolling it back.
+    """
+    invalidations: list[CacheInvalidation] = []
+    token = _recorded_cache_invalidations.set(invalidations)
+    try:
+        yield invalidations
+    finally:
+        _recorded_cache_invalidations.reset(token)
+
+
+def repeat_cache_invalidations(invalidations: list[CacheInvalidation]) -> None:
+    """Makes the given cache invalidations again, merged per cache store."""
+
+    uids_by_cache: dict[int, tuple[Any, set[str] | None]] = {}
+    for cache, uids in invalidations:
+        _, merged = uids_by_cache.setdefault(id(cache), (cache, set()))
+        if merged is None or uids is None or not isinstance(cache, SbTTLCache):
+            uids_by_cache[id(cache)] = (cache, None)
+        else:
+            merged |= uids
+    for cache, uids in uids_by_cache.values():
+        if uids is None:
+            cache.clear()
+        else:
+            cache.invalidate(uids)
@@ -116,6 +116,7 @@ from clinical_mdr_api.routers.dictionaries.dictionary_terms import (
     router as dictionary_terms_router,
 )
 from clinical_mdr_api.routers.feature_flags import router as feature_flags_router
+from clinical_mdr_api.routers.jobs import router as jobs_router
 from clinical_mdr_api.routers.libraries.libraries import router as libraries_router
 from clinical_mdr_api.routers.libraries.time_points import router as time_points_router
 from clinical_mdr_api.routers.listings.listings import metadata_router
@@ -266,6 +267,7 @@ from clinical_mdr_api.routers.template_parameters import (
 __all__ = [
     "feature_flags_router",
     "notifications_router",
+    "jobs_router",
     "activities_router",
     "active_substances_router",
     "pharmaceutical_products_router",
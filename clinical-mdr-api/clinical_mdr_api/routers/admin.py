@@ -1,3 +1,4 @@
+import dataclasses
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Query
@@ -17,6 +18,7 @@ from clinical_mdr_api.services.studies.complexity_score import ComplexityScoreSe
 from common import exceptions
 from common.auth import rbac
 from common.auth.dependencies import security
+from common.cache import SbTTLCache
 
 # Prefixed with "/admin"
 router = APIRouter()
@@ -25,6 +27,7 @@ CACHE_STORE_NAMES = [
     "cache_store_item_by_uid",
     "cache_store_item_by_study_uid",
     "cache_store_item_by_project_number",
+    "cache_store_term_by_uid_and_submval",
     "cache_get_user",
 ]
 
@@ -118,6 +121,7 @@ def _get_cache_info(repo: Any, show_items: bool = False) -> dict[str, Any]:
     }
 
     for store_name in CACHE_STORE_NAMES:
+        cache_store = getattr(repo, store_name, None)
         store_details = {
             "store_name": store_name,
             "size": (
@@ -130,6 +134,11 @@ def _get_cache_info(repo: Any, show_items: bool = False) -> dict[str, Any]:
                 if getattr(repo, store_name, None) is not None and show_items
                 else None
             ),
+            "stats": (
+                dataclasses.asdict(cache_store.stats)
+                if isinstance(cache_store, SbTTLCache)
+                else None
+            ),
         }
         ret["cache_stores"].append(store_details)
 
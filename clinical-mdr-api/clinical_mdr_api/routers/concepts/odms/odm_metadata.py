@@ -200,11 +200,9 @@ def get_odm_document(
         stylesheet,
         mapper_file,
     )
-    content = odm_xml_export_service.get_odm_document()
-
     if pdf:
         return Response(
-            content,
+            odm_xml_export_service.get_odm_document(),
             headers={
                 "Content-Disposition": f'attachment; filename="{datetime.now().strftime('CRF %Y%m%d %H%M%S.pdf')}"',
                 "X-Content-Type-Options": "nosniff",
@@ -213,8 +211,8 @@ def get_odm_document(
             media_type="application/pdf",
         )
 
-    return Response(
-        content=content,
+    return StreamingResponse(
+        odm_xml_export_service.stream_odm_document(),
         media_type="application/xml",
         headers={
             "Content-Disposition": f'attachment; filename="{datetime.now().strftime('odm_export_%Y%m%d_%H%M%S.xml')}"',
@@ -271,13 +269,20 @@ def store_odm_xml(
     mapper_file: Annotated[
         UploadFile | None, File(description=MAPPER_DESCRIPTION)
     ] = None,
+    validate_only: Annotated[
+        bool,
+        Query(
+            description="Indicates whether the import should only be validated, without storing anything. "
+            "The response lists the ODM elements that would be created."
+        ),
+    ] = False,
 ):
     if exporter == ExporterType.OSB:
         odm_xml_importer_service = OdmXmlImporterService(xml_file, mapper_file)
     else:
         odm_xml_importer_service = OdmClinicalXmlImporterService(xml_file, mapper_file)
 
-    return odm_xml_importer_service.store_odm_xml()
+    return odm_xml_importer_service.store_odm_xml(validate_only=validate_only)
 
 
 @router.get(
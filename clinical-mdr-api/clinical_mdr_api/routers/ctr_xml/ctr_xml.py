@@ -7,7 +7,6 @@ from fastapi.responses import Response
 
 from clinical_mdr_api.routers import _generic_descriptions
 from clinical_mdr_api.routers.studies.study import router
-from clinical_mdr_api.services.ctr_xml.ctr_xml_service import CTRXMLService
 from common.auth import rbac
 from common.auth.dependencies import security
 
@@ -32,4 +31,7 @@ class XMLResponse(Response):
 def get_odm_xml(
     study_uid: Annotated[str, StudyUID],
 ) -> XMLResponse:
+    # the generated ctrxml bindings are large, load them on first use
+    from clinical_mdr_api.services.ctr_xml.ctr_xml_service import CTRXMLService
+
     return XMLResponse(content=CTRXMLService().get_ctr_odm(study_uid))
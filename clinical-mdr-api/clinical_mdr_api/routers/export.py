@@ -8,7 +8,6 @@ from typing import Any
 import yaml
 from dict2xml import dict2xml
 from fastapi.responses import StreamingResponse
-from openpyxl import Workbook
 
 from clinical_mdr_api.models import utils
 from clinical_mdr_api.models.utils import BaseModel
@@ -156,10 +155,12 @@ def _export_to_xslx(data: dict[Any, Any], headers: list[Any]):
 
     The generated content will only contain items listed in headers.
     """
+    from openpyxl import Workbook
+
     stream = io.BytesIO()
-    workbook = Workbook()
-    # grab the active worksheet
-    worksheet = workbook.active
+    # rows are written out as they are appended, the worksheet is never held in memory as a whole
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
     for row in _convert_data_to_rows(data, headers):
         worksheet.append(row)
     workbook.save(stream)
@@ -0,0 +1,140 @@
+import re
+from typing import Annotated
+from urllib.parse import quote
+
+from fastapi import APIRouter, Body, Path
+from fastapi.responses import Response
+
+from clinical_mdr_api.models.job import Job, JobInput, JobType
+from clinical_mdr_api.routers import _generic_descriptions
+from clinical_mdr_api.services.jobs import JobService
+from common.auth import rbac
+from common.auth.dependencies import security
+
+# Prefixed with "/jobs"
+router = APIRouter()
+
+JobUID = Path(description="The unique id of the job.")
+
+
+def _content_disposition(filename: str) -> str:
+    """
+    Returns the Content-Disposition header of a download.
+
+    Job result filenames are built from the job parameters, so the plain `filename` only keeps
+    printable ASCII characters besides quotes and backslashes,
+    the full name is URL-encoded into `filename*` (RFC 5987).
+    """
+
+    fallback = re.sub(r'[^\x20-\x7e]|["\\]', "_", filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+@router.get(
+    "",
+    dependencies=[security, rbac.ANY],
+    summary="Returns the jobs submitted by the current user, newest first.",
+    status_code=200,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def get_all_jobs() -> list[Job]:
+    return JobService().get_all_jobs()
+
+
+@router.get(
+    "/types",
+    dependencies=[security, rbac.ANY],
+    summary="Returns the types of jobs which can be submitted, with the JSON schema of their parameters.",
+    status_code=200,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def get_job_types() -> list[JobType]:
+    return JobService().get_job_types()
+
+
+@router.post(
+    "",
+    dependencies=[security, rbac.ANY],
+    summary="Submits a job which runs in the background.",
+    description="""
+Long-running operations (study lock and clone, SoA and ODM exports, USDM mapping, CT package comparison)
+are submitted as jobs, which run in the background instead of in the request.
+
+The response holds the id of the queued job. Poll `GET /jobs/{job_uid}` for its status and progress,
+and download its result from `GET /jobs/{job_uid}/result` once its status is `succeeded`.
+
+Jobs run on behalf of the submitting user, who needs one of the roles of the job type (see `GET /jobs/types`).
+Finished jobs and their results are deleted after some time.
+""",
+    status_code=202,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+        400: {
+            "description": "The job type doesn't exist or its parameters are invalid"
+        },
+    },
+)
+def submit_job(job_input: Annotated[JobInput, Body()]) -> Job:
+    return JobService().submit_job(job_input)
+
+
+@router.get(
+    "/{job_uid}",
+    dependencies=[security, rbac.ANY],
+    summary="Returns the status and progress of a job.",
+    status_code=200,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+        404: _generic_descriptions.ERROR_404,
+    },
+)
+def get_job(job_uid: Annotated[str, JobUID]) -> Job:
+    return JobService().get_job(job_uid)
+
+
+@router.get(
+    "/{job_uid}/result",
+    dependencies=[security, rbac.ANY],
+    summary="Downloads the result of a succeeded job.",
+    status_code=200,
+    responses={
+        200: {"description": "The result, in the media type of the job type"},
+        400: {"description": "The job didn't succeed (yet)"},
+        403: _generic_descriptions.ERROR_403,
+        404: _generic_descriptions.ERROR_404,
+    },
+    response_class=Response,
+)
+def get_job_result(job_uid: Annotated[str, JobUID]) -> Response:
+    job, content = JobService().get_job_result(job_uid)
+    return Response(
+        content=content,
+        media_type=job.result_media_type,
+        headers={
+            "Content-Disposition": _content_disposition(
+                job.result_filename or "result"
+            ),
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
+
+
+@router.delete(
+    "/{job_uid}",
+    dependencies=[security, rbac.ANY],
+    summary="Cancels a job.",
+    description="A queued job is cancelled right away, a running job stops at its next progress report. "
+    "Running jobs of types which aren't `cancellable` can't be cancelled.",
+    status_code=200,
+    responses={
+        400: _generic_descriptions.ERROR_400,
+        403: _generic_descriptions.ERROR_403,
+        404: _generic_descriptions.ERROR_404,
+    },
+)
+def cancel_job(job_uid: Annotated[str, JobUID]) -> Job:
+    return JobService().cancel_job(job_uid)
@@ -209,7 +209,13 @@ def get_specific_schedule_audit_trail(
 @router.post(
     "/studies/{study_uid}/study-design-cells/batch",
     dependencies=[security, rbac.STUDY_WRITE],
-    summary="Batch operations (create, delete) for study design cells",
+    summary="Batch operations (create, edit, delete) for study design cells",
+    description="""
+The operations are applied in the given order and saved together.
+
+Each operation gets its own result: a failed operation returns its error
+and is skipped, the other operations are saved.
+    """,
     status_code=207,
     responses={
         403: _generic_descriptions.ERROR_403,
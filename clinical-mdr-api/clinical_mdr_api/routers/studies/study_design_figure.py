@@ -8,6 +8,7 @@ from fastapi.responses import Response
 from clinical_mdr_api.routers import _generic_descriptions
 from clinical_mdr_api.routers import studies_router as router
 from clinical_mdr_api.services.studies.study import StudyService
+from clinical_mdr_api.services.studies.study_artifacts import StudyArtifactService
 from clinical_mdr_api.services.studies.study_design_figure import (
     StudyDesignFigureService,
 )
@@ -51,6 +52,14 @@ def get_study_flowchart_html(
     response.headers["Content-Disposition"] = (
         f'inline; filename="{study_uid} design.svg"'
     )
+    if not debug and (
+        svg := StudyArtifactService().get_locked_version_artifact(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            name="design.svg",
+        )
+    ):
+        return SVGResponse(svg)
     return SVGResponse(
         StudyDesignFigureService(debug=debug).get_svg_document(
             study_uid, study_value_version=study_value_version
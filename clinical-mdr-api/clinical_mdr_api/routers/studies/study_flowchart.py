@@ -2,7 +2,8 @@
 
 import io
 import os
-from typing import Annotated, Any
+import tempfile
+from typing import IO, TYPE_CHECKING, Annotated, Any, Iterator
 
 from fastapi import Path, Query
 from fastapi.responses import HTMLResponse, StreamingResponse
@@ -19,12 +20,16 @@ from clinical_mdr_api.services.studies.study import StudyService
 from clinical_mdr_api.services.studies.study_activity_selection import (
     StudyActivitySelectionService,
 )
+from clinical_mdr_api.services.studies.study_artifacts import StudyArtifactService
 from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
 from clinical_mdr_api.services.utils.table_f import TableWithFootnotes
 from common.auth import rbac
 from common.auth.dependencies import security
 from common.config import settings
 
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
 LAYOUT_QUERY = Query(
     description="The requested layout or detail level of Schedule of Activities"
 )
@@ -37,6 +42,12 @@ MIME_TYPE_DOCX = (
 
 STUDY_UID_PATH = Path(description="The unique id of the study.")
 
+# Spreadsheets larger than this are saved into a temporary file on disk instead of memory
+XLSX_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# Size of chunks of documents sent to the client
+STREAM_CHUNK_SIZE = 64 * 1024
+
 TIME_UNIT_QUERY = Query(
     pattern="^(week|day)$", description="The preferred time unit, either day or week."
 )
@@ -95,7 +106,7 @@ def get_study_flowchart(
         force_build=force_build,
     )
 
-    return table
+    return TableWithFootnotes.from_table(table)
 
 
 @router.get(
@@ -156,7 +167,13 @@ def get_study_flowchart_docx(
     time_unit: Annotated[str | None, TIME_UNIT_QUERY] = None,
     layout: Annotated[SoALayout, LAYOUT_QUERY] = SoALayout.PROTOCOL,
 ) -> StreamingResponse:
-    stream = (
+    stream = _locked_version_artifact_stream(
+        study_uid,
+        study_value_version,
+        "flowchart.docx",
+        layout=layout.value,
+        time_unit=time_unit,
+    ) or (
         StudyFlowchartService()
         .get_study_flowchart_docx(
             study_uid=study_uid,
@@ -192,17 +209,21 @@ def get_study_flowchart_xlsx(
     time_unit: Annotated[str | None, TIME_UNIT_QUERY] = None,
     layout: Annotated[SoALayout, LAYOUT_QUERY] = SoALayout.PROTOCOL,
 ) -> StreamingResponse:
-    workbook = StudyFlowchartService().get_study_flowchart_xlsx(
-        study_uid=study_uid,
-        study_value_version=study_value_version,
-        layout=layout,
+    stream = _locked_version_artifact_stream(
+        study_uid,
+        study_value_version,
+        "flowchart.xlsx",
+        layout=layout.value,
         time_unit=time_unit,
+    ) or _save_workbook(
+        StudyFlowchartService().get_study_flowchart_xlsx(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            layout=layout,
+            time_unit=time_unit,
+        )
     )
 
-    # render document into Bytes stream
-    stream = io.BytesIO()
-    workbook.save(stream)
-
     study_id = _get_study_id(study_uid, study_value_version)
     filename = f"{study_id or study_uid} {layout.value} SoA.xlsx"
     mime_type = MIME_TYPE_XLSX
@@ -228,16 +249,15 @@ def get_operational_soa_xlsx(
     time_unit: Annotated[str | None, TIME_UNIT_QUERY] = None,
 ) -> StreamingResponse:
     layout = SoALayout.OPERATIONAL
-    xlsx = StudyFlowchartService().get_operational_soa_xlsx(
-        study_uid=study_uid,
-        time_unit=time_unit,
-        study_value_version=study_value_version,
+    # not served from the artifact store, the header has the time and the user of the download
+    stream = _save_workbook(
+        StudyFlowchartService().get_operational_soa_xlsx(
+            study_uid=study_uid,
+            time_unit=time_unit,
+            study_value_version=study_value_version,
+        )
     )
 
-    # render document into Bytes stream
-    stream = io.BytesIO()
-    xlsx.save(stream)
-
     study_id = _get_study_id(study_uid, study_value_version)
     filename = f"{study_id or study_uid} {layout.value} SoA.xlsx"
     mime_type = MIME_TYPE_XLSX
@@ -289,16 +309,16 @@ def get_detailed_soa_xlsx(
     time_unit: Annotated[str | None, TIME_UNIT_QUERY] = None,
 ) -> StreamingResponse:
     layout = SoALayout.DETAILED
-    xlsx = StudyFlowchartService().get_detailed_soa_xlsx(
-        study_uid=study_uid,
-        time_unit=time_unit,
-        study_value_version=study_value_version,
+    stream = _locked_version_artifact_stream(
+        study_uid, study_value_version, "detailed-soa.xlsx", time_unit=time_unit
+    ) or _save_workbook(
+        StudyFlowchartService().get_detailed_soa_xlsx(
+            study_uid=study_uid,
+            time_unit=time_unit,
+            study_value_version=study_value_version,
+        )
     )
 
-    # render document into Bytes stream
-    stream = io.BytesIO()
-    xlsx.save(stream)
-
     study_id = _get_study_id(study_uid, study_value_version)
     filename = f"{study_id or study_uid} {layout.value} SoA.xlsx"
     mime_type = MIME_TYPE_XLSX
@@ -542,8 +562,40 @@ def _get_study_id(study_uid, study_value_version):
     return study.current_metadata.identification_metadata.study_id
 
 
+def _locked_version_artifact_stream(
+    study_uid: str, study_value_version: str | None, name: str, **params
+) -> IO[bytes] | None:
+    """Returns the stored document of a locked study version, or `None` if the version isn't locked"""
+
+    content = StudyArtifactService().get_locked_version_artifact(
+        study_uid=study_uid,
+        study_value_version=study_value_version,
+        name=name,
+        **params,
+    )
+    return None if content is None else io.BytesIO(content)
+
+
+def _save_workbook(workbook: "Workbook") -> IO[bytes]:
+    """Saves a workbook into a temporary file, which is spooled to disk when large"""
+
+    stream = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=XLSX_SPOOL_MAX_SIZE
+    )
+    workbook.save(stream)
+    return stream
+
+
+def _iter_stream(stream: IO[bytes]) -> Iterator[bytes]:
+    """Yields the contents of a stream in chunks and closes the stream"""
+
+    with stream:
+        while chunk := stream.read(STREAM_CHUNK_SIZE):
+            yield chunk
+
+
 def _streaming_response(
-    stream: io.BytesIO, filename: str, mime_type: str
+    stream: IO[bytes], filename: str, mime_type: str
 ) -> StreamingResponse:
     """Returns StreamingResponse from a stream, with filename, size, and mime-type HTTP headers."""
 
@@ -553,7 +605,7 @@ def _streaming_response(
 
     # response with document info HTTP headers
     response = StreamingResponse(
-        stream,
+        _iter_stream(stream),
         media_type=mime_type,
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
@@ -4,10 +4,13 @@ import json
 from collections.abc import Hashable
 from dataclasses import dataclass
 from enum import Enum
+from threading import Lock
 from time import time
 from typing import AbstractSet, Any, Callable, Mapping, MutableMapping, Self, TypeVar
 
 import neomodel.sync_.core
+from cachetools import LRUCache, cached
+from cachetools.keys import hashkey
 from pydantic import BaseModel
 
 from clinical_mdr_api.domain_repositories.libraries.library_repository import (
@@ -31,6 +34,8 @@ from common.exceptions import ValidationException
 from common.telemetry import trace_block, trace_calls
 from common.utils import get_field_type
 
+FILTER_PLAN_CACHE_SIZE = 256
+
 
 def is_library_editable(name: str) -> bool:
     """
@@ -544,80 +549,11 @@ def generic_item_filtering(
         validate_is_dict("sort_by", sort_by)
         validate_is_dict("filter_by", filter_by)
 
-        filters = FilterDict.model_validate({"elements": filter_by})
-        if filter_operator == FilterOperator.AND:
-            # Start from full list, then only keep items that match filter elements, one by one
-            filtered_items = items
-            # The list will decrease after each step (aka filtering out)
-            for key in filters.elements:
-                _values = filters.elements[key].v
-                _operator = filters.elements[key].op
-                filtered_items = [
-                    item
-                    for item in filtered_items
-                    if filter_aggregated_items(item, key, _values, _operator)
-                ]
-        elif filter_operator == FilterOperator.OR:
-            # Start from empty list then add element one by one
-            _filtered_items = []
-            # The list will increase after each step
-            for key in filters.elements:
-                _values = filters.elements[key].v
-                _operator = filters.elements[key].op
-                matching_items: list[Any] = [
-                    item
-                    for item in items
-                    if filter_aggregated_items(item, key, _values, _operator)
-                ]
-                _filtered_items += matching_items
-            # if passed filter dict is empty we should return all elements without any filtering
-            if not filters.elements:
-                filtered_items = items
-            else:
-                # Finally, deduplicate list
-                uids = set()
-                filtered_items = []
-                for item in _filtered_items:
-                    if item.uid not in uids:
-                        filtered_items.append(item)
-                        uids.add(item.uid)
-        else:
-            raise ValidationException(msg=f"Invalid filter_operator: {filter_operator}")
-
-        # Do sorting
-        distinct_sort_orders = set(list(sort_by.values()))
-        # If all orders for SortKeys are the same we can order the list in a single sort function call
-        if len(distinct_sort_orders) == 1:
-            filtered_items.sort(
-                key=lambda x: [
-                    (
-                        elm
-                        if (elm := extract_nested_key_value(x, sort_key)) is not None
-                        else (
-                            "-1"
-                            if issubclass(extract_nested_key_type(x, sort_key), str)
-                            else -1
-                        )
-                    )
-                    for sort_key in sort_by.keys()
-                ],
-                reverse=not distinct_sort_orders.pop(),
-            )
-        # If orders for SortKeys are different we have to order list calling sort function a few times, once per each SortKey
-        elif len(distinct_sort_orders) > 1:
-            for sort_key, sort_order in sort_by.items():
-                filtered_items.sort(
-                    key=lambda x, y=sort_key: (  # type: ignore[misc]
-                        elm
-                        if (elm := extract_nested_key_value(x, y)) is not None
-                        else (
-                            "-1"
-                            if issubclass(extract_nested_key_type(x, y), str)
-                            else -1
-                        )
-                    ),
-                    reverse=not sort_order,
-                )
+        plan = compile_filter_plan(
+            filter_by=filter_by, filter_operator=filter_operator, sort_by=sort_by
+        )
+        filtered_items = plan.filter(items)
+        plan.sort(filtered_items)
 
         span.add_attribute("call.num_output", len(filtered_items))
 
@@ -742,32 +678,17 @@ def service_level_generic_header_filtering(
                 "v": [search_string],
                 "op": ComparisonOperator.CONTAINS,
             }
-        filters = FilterDict.model_validate({"elements": filter_by})
+        plan = compile_filter_plan(
+            filter_by=filter_by, filter_operator=filter_operator, sort_by={}
+        )
         if filter_operator == FilterOperator.AND:
-            # Start from full list, then only keep items that match filter elements, one by one
-            filtered_items = items
-            # The list will decrease after each step (aka filtering out)
-            for key in filters.elements:
-                _values = filters.elements[key].v
-                _operator = filters.elements[key].op
-                filtered_items = [
-                    item
-                    for item in filtered_items
-                    if filter_aggregated_items(item, key, _values, _operator)
-                ]
+            filtered_items = plan.filter(items)
         else:
             # Start from full list, then add items that match filter elements, one by one
             _filtered_items = []
             # The list will increase after each step
-            for key in filters.elements:
-                _values = filters.elements[key].v
-                _operator = filters.elements[key].op
-                matching_items: list[Any] = [
-                    item
-                    for item in items
-                    if filter_aggregated_items(item, key, _values, _operator)
-                ]
-                _filtered_items += matching_items
+            for _, predicate in plan.predicates:
+                _filtered_items += [item for item in items if predicate(item)]
             filtered_items = _filtered_items
 
         # Return values for field_name
@@ -902,25 +823,33 @@ def filter_aggregated_items(item, filter_key, filter_values, filter_operator):
             _item_value_for_key.value, filter_operator, filter_values
         )
     if isinstance(_item_value_for_key, SimpleNumericValueWithUnit) and filter_values:
-        # When filtering on a SimpleNumericValueWithUnit we expect the filter value to be in the format "<number> <unit>", e.g., "5 mg"
-        # We split the filter value into a numeric part and a unit part and apply the filter operator to both parts
-        numeric_values = [
-            float(filter_value.split(" ")[0]) for filter_value in filter_values
-        ]
-        unit_values = [
-            filter_value.split(" ")[1]
-            for filter_value in filter_values
-            if " " in filter_value
-        ]
-
-        return apply_filter_operator(
-            float(_item_value_for_key.value), filter_operator, numeric_values
-        ) and apply_filter_operator(
-            _item_value_for_key.unit_label, filter_operator, unit_values
+        return filter_numeric_value_with_unit(
+            _item_value_for_key, filter_operator, filter_values
         )
     return apply_filter_operator(_item_value_for_key, filter_operator, filter_values)
 
 
+def filter_numeric_value_with_unit(
+    value: SimpleNumericValueWithUnit,
+    filter_operator: ComparisonOperator,
+    filter_values: list[Any],
+) -> bool:
+    # When filtering on a SimpleNumericValueWithUnit we expect the filter value to be in the format "<number> <unit>", e.g., "5 mg"
+    # We split the filter value into a numeric part and a unit part and apply the filter operator to both parts
+    numeric_values = [
+        float(filter_value.split(" ")[0]) for filter_value in filter_values
+    ]
+    unit_values = [
+        filter_value.split(" ")[1]
+        for filter_value in filter_values
+        if " " in filter_value
+    ]
+
+    return apply_filter_operator(
+        float(value.value), filter_operator, numeric_values
+    ) and apply_filter_operator(value.unit_label, filter_operator, unit_values)
+
+
 def apply_filter_operator(
     value, operator: ComparisonOperator, filter_values: list[Any]
 ) -> bool:
@@ -1026,6 +955,375 @@ def rgetattr_type(obj, attr):
     return functools.reduce(_getattr, attr.split("."), obj)
 
 
+def _rgetattr_step(obj, attr):
+    if isinstance(obj, list):
+        return [_rgetattr_step(element, attr) for element in obj]
+    if isinstance(obj, dict):
+        return [_rgetattr_step(element, attr) for element in obj.values()]
+    return getattr(obj, attr, None)
+
+
+def compile_getter(key: str) -> Callable[[Any], Any]:
+    """
+    Compiles a dotted attribute key into a getter, equivalent to `rgetattr(obj, key)`
+    but without parsing the key on every call.
+    """
+    attrs = tuple(key.split("."))
+
+    def _get(obj):
+        for attr in attrs:
+            if isinstance(obj, (list, dict)):
+                obj = _rgetattr_step(obj, attr)
+            else:
+                obj = getattr(obj, attr, None)
+        return obj
+
+    return _get
+
+
+def _compile_equals(
+    filter_values: list[Any], negate: bool = False
+) -> Callable[[Any], bool]:
+    try:
+        hashed_values = frozenset(filter_values)
+    except TypeError:
+        hashed_values = None
+
+    def _equals(value) -> bool:
+        if hashed_values is not None:
+            try:
+                return (value in hashed_values) != negate
+            except TypeError:
+                pass
+        return (value in filter_values) != negate
+
+    return _equals
+
+
+def _compile_contains(filter_values: list[Any]) -> Callable[[Any], bool]:
+    needles = [str(filter_value).lower() for filter_value in filter_values]
+
+    def _contains(value) -> bool:
+        haystack = str(value).lower()
+        return any(needle in haystack for needle in needles)
+
+    return _contains
+
+
+def _compile_between(filter_values: list[Any]) -> Callable[[Any], bool] | None:
+    if len(filter_values) < 2 or not all(
+        isinstance(filter_value, str) for filter_value in filter_values
+    ):
+        return None
+    lower, upper = (filter_value.lower() for filter_value in sorted(filter_values)[:2])
+    return lambda value: lower <= str(value).lower() <= upper
+
+
+# Compiles the filter values of an operator into a predicate,
+# or returns None when the values need the generic `apply_filter_operator`
+_OPERATOR_COMPILERS: dict[
+    ComparisonOperator, Callable[[list[Any]], Callable[[Any], bool] | None]
+] = {
+    ComparisonOperator.EQUALS: _compile_equals,
+    ComparisonOperator.NOT_EQUALS: functools.partial(_compile_equals, negate=True),
+    ComparisonOperator.CONTAINS: _compile_contains,
+    ComparisonOperator.GREATER_THAN: lambda filter_values: (
+        lambda value, bound=filter_values[0]: str(value) > bound
+    ),
+    ComparisonOperator.GREATER_THAN_OR_EQUAL_TO: lambda filter_values: (
+        lambda value, bound=filter_values[0]: str(value) >= bound
+    ),
+    ComparisonOperator.LESS_THAN: lambda filter_values: (
+        lambda value, bound=filter_values[0]: str(value) < bound
+    ),
+    ComparisonOperator.LESS_THAN_OR_EQUAL_TO: lambda filter_values: (
+        lambda value, bound=filter_values[0]: str(value) <= bound
+    ),
+    ComparisonOperator.BETWEEN: _compile_between,
+}
+
+
+def _compile_operator(
+    operator: ComparisonOperator, filter_values: list[Any]
+) -> Callable[[Any], bool]:
+    """Compiled equivalent of `apply_filter_operator(value, operator, filter_values)`."""
+
+    def _apply(value) -> bool:
+        return apply_filter_operator(value, operator, filter_values)
+
+    if not filter_values:
+        if operator == ComparisonOperator.EQUALS:
+            return lambda value: value is None
+        # Raises the same validation error as apply_filter_operator, once an item is filtered
+        return _apply
+
+    compiler = _OPERATOR_COMPILERS.get(operator)
+    return (compiler and compiler(filter_values)) or _apply
+
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _compile_value_matcher(
+    operator: ComparisonOperator, filter_values: list[Any]
+) -> Callable[[Any], bool]:
+    """Compiled equivalent of `filter_aggregated_items`, once the item value is extracted."""
+    apply = _compile_operator(operator, filter_values)
+
+    def _match(value) -> bool:
+        if type(value) in _SCALAR_TYPES:
+            return apply(value)
+        # The property can be inside a list, filtering then becomes "if any of the values matches"
+        if isinstance(value, list):
+            if not filter_values:
+                return not value
+            return any(apply(_val) for _val in value)
+        if isinstance(value, Enum):
+            return apply(value.value)
+        if isinstance(value, SimpleNumericValueWithUnit) and filter_values:
+            return filter_numeric_value_with_unit(value, operator, filter_values)
+        return apply(value)
+
+    return _match
+
+
+@functools.cache
+def _wildcard_fields(model: type[BaseModel]) -> tuple[tuple[str, bool], ...]:
+    """
+    Returns the (attribute, is nested model) pairs of a model
+    that `extract_properties_for_wildcard` considers for wildcard filtering.
+    """
+    fields = []
+    for attribute, attr_desc in model.model_fields.items():
+        jse = attr_desc.json_schema_extra or {}
+        if jse.get("remove_from_wildcard", False):
+            continue
+        field_type = get_field_type(attr_desc.annotation)
+        fields.append(
+            (
+                attribute,
+                isinstance(field_type, type) and issubclass(field_type, BaseModel),
+            )
+        )
+    return tuple(fields)
+
+
+def _is_flat_model_list(value) -> bool:
+    """Checks if value is a non-empty list of models without nested models or dictionaries."""
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and isinstance(value[0], BaseModel)
+        and not any(
+            is_model or isinstance(getattr(value[0], attribute), dict)
+            for attribute, is_model in _wildcard_fields(type(value[0]))
+        )
+    )
+
+
+def _wildcard_model_values(root: BaseModel, obj: BaseModel, prefix: str):
+    for attribute, is_model in _wildcard_fields(type(obj)):
+        value = getattr(obj, attribute)
+        if isinstance(value, dict) and len(value) > 0:
+            # Same paths as extract_properties_for_wildcard, resolved from the root item
+            for path in extract_properties_for_wildcard(
+                list(value.values())[0], attribute
+            ):
+                yield rgetattr(root, path)
+        elif is_model:
+            if isinstance(value, BaseModel):
+                yield from _wildcard_model_values(root, value, prefix + attribute + ".")
+            elif _is_flat_model_list(value):
+                # Paths are taken from the first item and resolved on all items of the list
+                for sub_attribute, _ in _wildcard_fields(type(value[0])):
+                    yield _rgetattr_step(value, sub_attribute)
+            else:
+                for path in extract_properties_for_wildcard(value, prefix + attribute):
+                    yield rgetattr(root, path)
+        else:
+            yield value
+
+
+def wildcard_values(item):
+    """
+    Yields the values a wildcard filter is matched against, i.e. `rgetattr(item, path)`
+    for each path returned by `extract_properties_for_wildcard(item)`,
+    in a single traversal of the item.
+    """
+    if not isinstance(item, BaseModel):
+        for path in extract_properties_for_wildcard(item):
+            yield rgetattr(item, path)
+        return
+    yield from _wildcard_model_values(item, item, "")
+
+
+def _compile_predicate(
+    key: str, operator: ComparisonOperator, filter_values: list[Any]
+) -> Callable[[Any], bool]:
+    """Compiled equivalent of `filter_aggregated_items(item, key, filter_values, operator)`."""
+    if key == "*":
+        if operator not in (ComparisonOperator.EQUALS, ComparisonOperator.CONTAINS):
+
+            def _unsupported(_item) -> bool:
+                raise ValidationException(
+                    msg="Only the default 'contains' operator is supported for wildcard filtering."
+                )
+
+            return _unsupported
+
+        match_wildcard = _compile_value_matcher(
+            ComparisonOperator.CONTAINS, filter_values
+        )
+        return lambda item: any(
+            match_wildcard(value) for value in wildcard_values(item)
+        )
+
+    get_value = compile_getter(key)
+    match_value = _compile_value_matcher(operator, filter_values)
+    return lambda item: match_value(get_value(item))
+
+
+class _Descending:
+    """Sort key wrapper inverting the order of the wrapped value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _compile_sort_value(sort_key: str) -> Callable[[Any], Any]:
+    get_value = compile_getter(sort_key)
+    # Placeholder used for None values, depends on the type of the sorted field
+    none_values: dict[type, Any] = {}
+
+    def _sort_value(item):
+        value = get_value(item)
+        if value is not None:
+            return value
+        item_type = type(item)
+        if item_type not in none_values:
+            none_values[item_type] = (
+                "-1" if issubclass(extract_nested_key_type(item, sort_key), str) else -1
+            )
+        return none_values[item_type]
+
+    return _sort_value
+
+
+class FilterPlan:
+    """
+    Filtering and sorting of in-memory items, compiled once from `filter_by`,
+    `filter_operator` and `sort_by` and reusable across requests (see `compile_filter_plan`).
+
+    Attributes:
+        predicates (list[tuple[str, Callable]]): One predicate per filter key, returning True for matching items.
+        sort_key (Callable | None): Combined key function for a single sort call, None if no sorting is requested.
+        reverse (bool): Sort direction to use along with `sort_key`.
+    """
+
+    def __init__(
+        self,
+        filter_by: dict[str, dict[str, Any]],
+        filter_operator: FilterOperator,
+        sort_by: dict[str, bool],
+    ):
+        filters = FilterDict.model_validate({"elements": filter_by})
+        self.filter_operator = filter_operator
+        self.predicates = [
+            (key, _compile_predicate(key, element.op, element.v))
+            for key, element in filters.elements.items()
+        ]
+
+        sort_values = [_compile_sort_value(sort_key) for sort_key in sort_by]
+        self.sort_key: Callable[[Any], Any] | None = None
+        self.reverse = False
+        distinct_sort_orders = set(sort_by.values())
+        if len(sort_values) == 1:
+            self.sort_key = sort_values[0]
+            self.reverse = not distinct_sort_orders.pop()
+        elif len(distinct_sort_orders) == 1:
+            self.sort_key = lambda item: tuple(
+                sort_value(item) for sort_value in sort_values
+            )
+            self.reverse = not distinct_sort_orders.pop()
+        elif len(distinct_sort_orders) > 1:
+            # Equivalent to one stable sort per sort key, in the given order:
+            # the last sort key is the most significant one
+            directed_sort_values = list(zip(sort_values, sort_by.values()))[::-1]
+            self.sort_key = lambda item: tuple(
+                (sort_value(item) if ascending else _Descending(sort_value(item)))
+                for sort_value, ascending in directed_sort_values
+            )
+
+    def filter(self, items: list[Any]) -> list[Any]:
+        ValidationException.raise_if(
+            self.filter_operator not in (FilterOperator.AND, FilterOperator.OR),
+            msg=f"Invalid filter_operator: {self.filter_operator}",
+        )
+        if not self.predicates:
+            return items
+        if self.filter_operator == FilterOperator.AND:
+            # Keep items that match all filter elements
+            filtered_items = items
+            for _, predicate in self.predicates:
+                filtered_items = [item for item in filtered_items if predicate(item)]
+            return filtered_items
+        # Add items matching any filter element, in filter elements order, without duplicates
+        uids = set()
+        filtered_items = []
+        for _, predicate in self.predicates:
+            for item in items:
+                if item.uid not in uids and predicate(item):
+                    filtered_items.append(item)
+                    uids.add(item.uid)
+        return filtered_items
+
+    def sort(self, items: list[Any]) -> None:
+        if self.sort_key is not None:
+            items.sort(key=self.sort_key, reverse=self.reverse)
+
+
+@cached(
+    cache=LRUCache(maxsize=FILTER_PLAN_CACHE_SIZE),
+    key=lambda filter_by, filter_operator, sort_by: hashkey(
+        json.dumps([filter_by, str(filter_operator), sort_by], default=str)
+    ),
+    lock=Lock(),
+)
+def compile_filter_plan(
+    filter_by: dict[str, dict[str, Any]],
+    filter_operator: FilterOperator,
+    sort_by: dict[str, bool],
+) -> FilterPlan:
+    """
+    Returns the compiled FilterPlan for the given filtering and sorting criteria.
+    Plans are kept in an LRU cache, so repeated requests with the same criteria reuse them.
+
+    Args:
+        filter_by (dict): A dictionary of filter criteria.
+        filter_operator (FilterOperator): The operator to use when filtering elements.
+        sort_by (dict): A dictionary of sort criteria.
+
+    Returns:
+        FilterPlan: The compiled filtering and sorting plan.
+
+    Example:
+        >>> plan = compile_filter_plan({"age": {"op": "gt", "v": ["27"]}}, FilterOperator.AND, {"name": True})
+        >>> items = plan.filter(items)
+        >>> plan.sort(items)
+    """
+    return FilterPlan(
+        filter_by=filter_by, filter_operator=filter_operator, sort_by=sort_by
+    )
+
+
 @trace_calls
 def process_parameters(parameters):
     return_parameters = []
@@ -1141,6 +1439,40 @@ def build_simple_filters(
     return None
 
 
+def is_database_filterable(
+    db_fields: AbstractSet[str],
+    filter_by: dict[str, dict[str, Any]] | None,
+    sort_by: dict[str, bool] | None,
+) -> bool:
+    """
+    Checks if filtering and sorting can be delegated to the database (CypherQueryBuilder)
+    instead of `service_level_generic_filtering`.
+
+    Args:
+        db_fields (AbstractSet[str]): Model fields exposed as aliases by the repository query.
+            Nested fields can be given with their dotted path, which makes all fields below them database fields.
+        filter_by (dict | None): A dictionary of filter criteria.
+        sort_by (dict | None): A dictionary of sort criteria.
+
+    Returns:
+        bool: True if all filter and sort keys (or one of their parent paths) are database fields,
+        False if any of them refers to a field derived at service level, or if a wildcard filter is requested.
+
+    Example:
+        >>> is_database_filterable({"uid", "footnote"}, {"footnote.name": {"v": ["a"]}}, None)
+        True
+        >>> is_database_filterable({"uid", "footnote"}, {"*": {"v": ["a"]}}, None)
+        False
+        >>> is_database_filterable({"metadata.description"}, None, {"metadata.description.title": True})
+        True
+    """
+    keys = list(filter_by or {}) + list(sort_by or {})
+    return all(
+        any(".".join(path[:depth]) in db_fields for depth in range(1, len(path) + 1))
+        for path in (key.split(".") for key in keys)
+    )
+
+
 class AggregatedTransactionProxy(neomodel.sync_.core.TransactionProxy):
     """context manager to manage database transaction if there is no active transaction in progress, else do nothing"""
 
@@ -64,13 +64,13 @@ class OdmClinicalXmlImporterService(OdmXmlImporterService):
 
         super().__init__(xml_file, mapper_file)
 
-    def store_odm_xml(self):
+    def _store_odm_xml(self):
         self._set_unit_definitions()
         self._set_unit_definition_uids_by()
         self._set_measurement_unit_names_by_oid()
         self._set_codelists()
 
-        return super().store_odm_xml()
+        return super()._store_odm_xml()
 
     def _set_unit_definitions(self):
         measurement_unit_names = {
@@ -342,18 +342,7 @@ class OdmClinicalXmlImporterService(OdmXmlImporterService):
 
         item_unit_definitions = self._get_item_unit_definition_inputs(item_def)
 
-        codelist = next(
-            (
-                codelist
-                for codelist in self.codelists
-                if item_def.getElementsByTagName("CodeListRef")
-                and codelist.getAttribute("OID")
-                == item_def.getElementsByTagName("CodeListRef")[0].getAttribute(
-                    "CodeListOID"
-                )
-            ),
-            None,
-        )
+        codelist = self._get_codelist_of_item(item_def)
 
         codelist_uid = next(
             (
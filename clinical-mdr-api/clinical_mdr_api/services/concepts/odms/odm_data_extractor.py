@@ -1,51 +1,74 @@
+import json
+from typing import Any
+
+from clinical_mdr_api.domain_repositories.concepts.odms.data_extractor_repository import (
+    DataExtractorRepository,
+)
 from clinical_mdr_api.domains.concepts.utils import TargetType
+from clinical_mdr_api.models.concepts.odms.odm_common_models import (
+    OdmAliasModel,
+    OdmDescriptionModel,
+    OdmFormalExpressionModel,
+    OdmRefVendor,
+    OdmRefVendorAttributeModel,
+)
 from clinical_mdr_api.models.concepts.odms.odm_condition import OdmCondition
-from clinical_mdr_api.models.concepts.odms.odm_form import OdmForm
-from clinical_mdr_api.models.concepts.odms.odm_item import OdmItem
-from clinical_mdr_api.models.concepts.odms.odm_item_group import OdmItemGroup
+from clinical_mdr_api.models.concepts.odms.odm_form import OdmForm, OdmFormRefModel
+from clinical_mdr_api.models.concepts.odms.odm_item import (
+    OdmItem,
+    OdmItemRefModel,
+    OdmItemTermRelationshipModel,
+    OdmItemUnitDefinitionWithRelationship,
+)
+from clinical_mdr_api.models.concepts.odms.odm_item_group import (
+    OdmItemGroup,
+    OdmItemGroupRefModel,
+)
 from clinical_mdr_api.models.concepts.odms.odm_method import OdmMethod
 from clinical_mdr_api.models.concepts.odms.odm_study_event import OdmStudyEvent
+from clinical_mdr_api.models.concepts.odms.odm_vendor_attribute import (
+    OdmVendorAttributeRelationModel,
+    OdmVendorElementAttributeRelationModel,
+)
+from clinical_mdr_api.models.concepts.odms.odm_vendor_element import (
+    OdmVendorElementRelationModel,
+)
 from clinical_mdr_api.models.concepts.unit_definitions.unit_definition import (
     UnitDefinitionModel,
 )
 from clinical_mdr_api.models.controlled_terminologies.ct_codelist_attributes import (
     CTCodelistAttributes,
+    CTCodelistAttributesSimpleModel,
 )
-from clinical_mdr_api.services.concepts.odms.odm_conditions import OdmConditionService
-from clinical_mdr_api.services.concepts.odms.odm_forms import OdmFormService
-from clinical_mdr_api.services.concepts.odms.odm_item_groups import OdmItemGroupService
-from clinical_mdr_api.services.concepts.odms.odm_items import OdmItemService
-from clinical_mdr_api.services.concepts.odms.odm_methods import OdmMethodService
-from clinical_mdr_api.services.concepts.odms.odm_study_events import (
-    OdmStudyEventService,
-)
-from clinical_mdr_api.services.concepts.odms.odm_vendor_attributes import (
-    OdmVendorAttributeService,
-)
-from clinical_mdr_api.services.concepts.odms.odm_vendor_elements import (
-    OdmVendorElementService,
-)
-from clinical_mdr_api.services.concepts.odms.odm_vendor_namespaces import (
-    OdmVendorNamespaceService,
-)
-from clinical_mdr_api.services.concepts.unit_definitions.unit_definition import (
-    UnitDefinitionService,
-)
-from clinical_mdr_api.services.controlled_terminologies.ct_codelist_attributes import (
-    CTCodelistAttributesService,
-)
-from clinical_mdr_api.services.controlled_terminologies.ct_term_attributes import (
-    CTTermAttributesService,
+from clinical_mdr_api.models.controlled_terminologies.ct_term import (
+    SimpleCodelistTermModel,
 )
 from common.exceptions import BusinessLogicException, NotFoundException
+from common.utils import booltostr
+
+TARGETS = {
+    TargetType.STUDY_EVENT: ("OdmStudyEvent", "Study Event"),
+    TargetType.FORM: ("OdmForm", "Form"),
+    TargetType.ITEM_GROUP: ("OdmItemGroup", "Item Group"),
+    TargetType.ITEM: ("OdmItem", "Item"),
+}
 
 
 class OdmDataExtractor:
+    """
+    Fetches the ODM elements to export with everything they reference.
+
+    The subtree below the targets is read with one traversal query and the conditions, methods
+    and vendor definitions it refers to with a second one. Both return plain dicts, the models
+    the exporter reads are built from them without validation.
+    """
+
     target_uids: list[str]
     target_name: str
 
     odm_vendor_namespaces: dict[str, dict[str, str]]
     odm_vendor_elements: dict[str, dict[str, dict[str, str]]]
+    ref_odm_vendor_attributes: dict[str, dict[str, dict[str, str]]]
     odm_study_event: list[OdmStudyEvent]
     odm_forms: list[OdmForm]
     odm_item_groups: list[OdmItemGroup]
@@ -56,18 +79,7 @@ class OdmDataExtractor:
     ct_terms: list[dict[str, str]]
     unit_definitions: list[UnitDefinitionModel]
 
-    vendor_namespace_service: OdmVendorNamespaceService
-    vendor_element_service: OdmVendorElementService
-    vendor_attribute_service: OdmVendorAttributeService
-    study_event_service: OdmStudyEventService
-    form_service: OdmFormService
-    item_group_service: OdmItemGroupService
-    item_service: OdmItemService
-    condition_service: OdmConditionService
-    method_service: OdmMethodService
-    ct_codelist_attributes_service: CTCodelistAttributesService
-    ct_term_attributes_service: CTTermAttributesService
-    unit_definition_service: UnitDefinitionService
+    repository: DataExtractorRepository
 
     def __init__(
         self,
@@ -75,305 +87,440 @@ class OdmDataExtractor:
         target_type: TargetType,
         version: str | None = None,
     ):
-        self.unit_definition_service = UnitDefinitionService()
-        self.vendor_namespace_service = OdmVendorNamespaceService()
-        self.vendor_element_service = OdmVendorElementService()
-        self.vendor_attribute_service = OdmVendorAttributeService()
-        self.study_event_service = OdmStudyEventService()
-        self.form_service = OdmFormService()
-        self.item_group_service = OdmItemGroupService()
-        self.item_service = OdmItemService()
-        self.condition_service = OdmConditionService()
-        self.method_service = OdmMethodService()
-        self.ct_codelist_attributes_service = CTCodelistAttributesService()
-        self.ct_term_attributes_service = CTTermAttributesService()
-
-        self.odm_vendor_namespaces = {}
-        self.odm_vendor_elements = {}
-        self.ref_odm_vendor_attributes: dict[str, dict[str, dict[str, str]]] = {}
-        self.odm_forms = []
-        self.odm_item_groups = []
-        self.odm_items = []
-        self.odm_conditions = []
-        self.odm_methods = []
-        self.codelists = []
-        self.ct_terms = []
-        self.unit_definitions = []
+        if target_type not in TARGETS:
+            raise BusinessLogicException(msg="Requested target type not supported.")
 
+        self.repository = DataExtractorRepository()
         self.target_uids = target_uids
 
-        if target_type == TargetType.STUDY_EVENT:
-            self.odm_study_event = self.study_event_service.get_all_concepts(
-                filter_by={"uid": {"v": target_uids, "op": "eq"}}, version=version
-            ).items
+        target_label, target_type_name = TARGETS[target_type]
+        elements = self.repository.find_elements(target_label, target_uids, version)
 
-            if not self.odm_study_event:
-                raise NotFoundException(
-                    msg=f"No ODM Study Event found for the given target UID(s): {target_uids}."
-                )
+        targets = sorted(
+            elements[target_label],
+            key=lambda elm: (
+                target_uids.index(elm["uid"])
+                if elm["uid"] in target_uids
+                else len(target_uids)
+            ),
+        )
+        if not targets:
+            raise NotFoundException(
+                msg=f"No ODM {target_type_name} found for the given target UID(s): {target_uids}."
+            )
+        self.target_name = targets[0]["name"]
+        elements[target_label] = targets
 
-            self.target_name = self.odm_study_event[0].name
-            self.set_forms_of_study_event(self.odm_study_event)
-        elif target_type == TargetType.FORM:
-            self.odm_forms = self.form_service.get_all_concepts(
-                filter_by={"uid": {"v": target_uids, "op": "eq"}}, version=version
-            ).items
+        self.odm_study_event = [
+            self._build_study_event(element) for element in elements["OdmStudyEvent"]
+        ]
+        self.odm_forms = self._sort_children(
+            [self._build_form(element) for element in elements["OdmForm"]],
+            target_label != "OdmForm",
+        )
+        self.odm_item_groups = self._sort_children(
+            [self._build_item_group(element) for element in elements["OdmItemGroup"]],
+            target_label != "OdmItemGroup",
+        )
+        self.odm_items = self._sort_children(
+            [self._build_item(element) for element in elements["OdmItem"]],
+            target_label != "OdmItem",
+        )
 
-            if not self.odm_forms:
-                raise NotFoundException(
-                    msg=f"No ODM Form found for the given target UID(s): {target_uids}."
-                )
+        self.set_vendor_elements(
+            elements["OdmForm"] + elements["OdmItemGroup"] + elements["OdmItem"]
+        )
+        self.set_unit_definitions_of_items(elements["OdmItem"])
+        self.set_codelists_of_items(elements["OdmItem"])
+        self.set_references()
+
+    @staticmethod
+    def _sort_children(elements: list, is_child: bool) -> list:
+        return sorted(elements, key=lambda elm: elm.name) if is_child else elements
+
+    @staticmethod
+    def _unique(
+        elements: list[dict[str, Any]], key: str = "uid"
+    ) -> list[dict[str, Any]]:
+        """Drops the repeated rows a ref matches once per version of the referenced value."""
+        unique: dict[str, dict[str, Any]] = {}
+        for element in elements:
+            unique.setdefault(element[key], element)
+        return list(unique.values())
+
+    def _build_concept_fields(self, element: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "uid": element["uid"],
+            "oid": element.get("oid"),
+            "name": element.get("name"),
+            "version": element.get("version"),
+            "descriptions": sorted(
+                [
+                    OdmDescriptionModel.model_construct(**description)
+                    for description in element["descriptions"]
+                ],
+                key=lambda item: item.name,
+            ),
+            "aliases": sorted(
+                [
+                    OdmAliasModel.model_construct(**alias)
+                    for alias in element["aliases"]
+                ],
+                key=lambda item: item.name,
+            ),
+        }
 
-            self.target_name = self.odm_forms[0].name
-            self.set_item_groups_of_forms(self.odm_forms)
-        elif target_type == TargetType.ITEM_GROUP:
-            self.odm_item_groups = self.item_group_service.get_all_concepts(
-                filter_by={"uid": {"v": target_uids, "op": "eq"}}, version=version
-            ).items
+    def _build_vendor_fields(self, element: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "vendor_elements": sorted(
+                [
+                    OdmVendorElementRelationModel.model_construct(
+                        uid=vendor_element["uid"],
+                        name=vendor_element["name"],
+                        value=vendor_element["value"],
+                    )
+                    for vendor_element in self._unique(element["vendor_elements"])
+                ],
+                key=lambda item: item.name or "",
+            ),
+            "vendor_attributes": sorted(
+                [
+                    OdmVendorAttributeRelationModel.model_construct(
+                        data_type=None, value_regex=None, **vendor_attribute
+                    )
+                    for vendor_attribute in self._unique(element["vendor_attributes"])
+                ],
+                key=lambda item: item.name or "",
+            ),
+            "vendor_element_attributes": sorted(
+                [
+                    OdmVendorElementAttributeRelationModel.model_construct(
+                        data_type=None, value_regex=None, **vendor_element_attribute
+                    )
+                    for vendor_element_attribute in self._unique(
+                        element["vendor_element_attributes"]
+                    )
+                ],
+                key=lambda item: item.name or "",
+            ),
+        }
 
-            if not self.odm_item_groups:
-                raise NotFoundException(
-                    msg=f"No ODM Item Group found for the given target UID(s): {target_uids}."
+    def _build_ref_vendor(self, vendor: str | None) -> OdmRefVendor:
+        return OdmRefVendor.model_construct(
+            attributes=[
+                OdmRefVendorAttributeModel.model_construct(
+                    uid=attribute["uid"], value=attribute["value"]
                 )
-
-            self.target_name = self.odm_item_groups[0].name
-            self.set_items_of_item_groups(self.odm_item_groups)
-        elif target_type == TargetType.ITEM:
-            self.odm_items = self.item_service.get_all_concepts(
-                filter_by={"uid": {"v": target_uids, "op": "eq"}}, version=version
-            ).items
-
-            if not self.odm_items:
-                raise NotFoundException(
-                    msg=f"No ODM Item found for the given target UID(s): {target_uids}."
+                for attribute in (json.loads(vendor) if vendor else {}).get(
+                    "attributes", []
                 )
+            ]
+        )
 
-            self.target_name = self.odm_items[0].name
-            self.set_unit_definitions_of_items(self.odm_items)
-            self.set_codelists_of_items(self.odm_items)
-        else:
-            raise BusinessLogicException(msg="Requested target type not supported.")
+    def _build_study_event(self, element: dict[str, Any]) -> OdmStudyEvent:
+        return OdmStudyEvent.model_construct(
+            uid=element["uid"],
+            oid=element.get("oid"),
+            name=element.get("name"),
+            version=element.get("version"),
+            effective_date=element.get("effective_date"),
+            retired_date=element.get("retired_date"),
+            description=element.get("description"),
+            display_in_tree=element.get("display_in_tree", True),
+            forms=sorted(
+                [
+                    OdmFormRefModel.model_construct(
+                        uid=ref["uid"],
+                        oid=ref["oid"],
+                        name=ref["name"],
+                        version=ref["version"],
+                        order_number=ref["order_number"],
+                        mandatory=booltostr(ref["mandatory"]),
+                        locked=booltostr(ref["locked"]),
+                        collection_exception_condition_oid=ref[
+                            "collection_exception_condition_oid"
+                        ],
+                    )
+                    for ref in self._unique(element["forms"])
+                ],
+                key=lambda item: item.order_number or 0,
+            ),
+        )
 
-        self.set_conditions(self.odm_forms, self.odm_item_groups)
-        self.set_methods(self.odm_item_groups)
-        self.set_vendor_namespaces()
-        self.set_vendor_elements()
-        self.set_ref_vendor_attributes()
-
-    def set_ref_vendor_attributes(self):
-        vendor_attributes = self.vendor_attribute_service.get_all_concepts(
-            filter_by={
-                "uid": {
-                    "v": (
-                        {
-                            attribute.uid
-                            for form in self.odm_forms
-                            for item_group in form.item_groups
-                            if item_group.vendor
-                            for attribute in item_group.vendor.attributes
-                        }
-                        | {
-                            attribute.uid
-                            for item_group in self.odm_item_groups
-                            for item in item_group.items
-                            if item.vendor
-                            for attribute in item.vendor.attributes
-                        }
-                    ),
-                    "op": "eq",
-                }
-            },
-        ).items
+    def _build_form(self, element: dict[str, Any]) -> OdmForm:
+        return OdmForm.model_construct(
+            **self._build_concept_fields(element),
+            **self._build_vendor_fields(element),
+            repeating=booltostr(element.get("repeating")),
+            sdtm_version=element.get("sdtm_version"),
+            item_groups=sorted(
+                [
+                    OdmItemGroupRefModel.model_construct(
+                        uid=ref["uid"],
+                        oid=ref["oid"],
+                        name=ref["name"],
+                        version=ref["version"],
+                        order_number=ref["order_number"],
+                        mandatory=booltostr(ref["mandatory"]),
+                        collection_exception_condition_oid=ref[
+                            "collection_exception_condition_oid"
+                        ],
+                        vendor=self._build_ref_vendor(ref["vendor"]),
+                    )
+                    for ref in self._unique(element["item_groups"])
+                ],
+                key=lambda item: item.order_number or 0,
+            ),
+        )
 
-        self.ref_odm_vendor_attributes = {
-            vendor_attribute.uid: {
-                "name": vendor_attribute.name,
-                "vendor_namespace": vars(vendor_attribute.vendor_namespace),
-            }
-            for vendor_attribute in vendor_attributes
-            if vendor_attribute.vendor_namespace
-        }
+    def _build_item_group(self, element: dict[str, Any]) -> OdmItemGroup:
+        return OdmItemGroup.model_construct(
+            **self._build_concept_fields(element),
+            **self._build_vendor_fields(element),
+            repeating=booltostr(element.get("repeating")),
+            is_reference_data=booltostr(element.get("is_reference_data")),
+            sas_dataset_name=element.get("sas_dataset_name"),
+            origin=element.get("origin"),
+            purpose=element.get("purpose"),
+            comment=element.get("comment"),
+            sdtm_domains=sorted(
+                [
+                    SimpleCodelistTermModel.model_construct(**sdtm_domain)
+                    for sdtm_domain in self._unique(
+                        element["sdtm_domains"], key="term_uid"
+                    )
+                ],
+                key=lambda item: item.submission_value or "",
+            ),
+            items=sorted(
+                [
+                    OdmItemRefModel.model_construct(
+                        uid=ref["uid"],
+                        oid=ref["oid"],
+                        name=ref["name"],
+                        version=ref["version"],
+                        order_number=ref["order_number"],
+                        mandatory=booltostr(ref["mandatory"]),
+                        key_sequence=ref["key_sequence"],
+                        method_oid=ref["method_oid"],
+                        imputation_method_oid=ref["imputation_method_oid"],
+                        role=ref["role"],
+                        role_codelist_oid=ref["role_codelist_oid"],
+                        collection_exception_condition_oid=ref[
+                            "collection_exception_condition_oid"
+                        ],
+                        vendor=self._build_ref_vendor(ref["vendor"]),
+                    )
+                    for ref in self._unique(element["items"])
+                ],
+                key=lambda item: item.order_number or 0,
+            ),
+        )
 
-    def set_vendor_elements(self):
-        vendor_elements = self.vendor_element_service.get_all_concepts(
-            filter_by={
-                "uid": {
-                    "v": (
-                        {
-                            element.uid
-                            for form in self.odm_forms
-                            for element in form.vendor_elements
-                        }
-                        | {
-                            element.uid
-                            for item_group in self.odm_item_groups
-                            for element in item_group.vendor_elements
-                        }
-                        | {
-                            element.uid
-                            for item in self.odm_items
-                            for element in item.vendor_elements
-                        }
-                    ),
-                    "op": "eq",
-                }
-            },
-        ).items
+    def _build_item(self, element: dict[str, Any]) -> OdmItem:
+        codelist = element.get("codelist")
+
+        return OdmItem.model_construct(
+            **self._build_concept_fields(element),
+            **self._build_vendor_fields(element),
+            prompt=element.get("prompt"),
+            datatype=element.get("datatype"),
+            length=element.get("length"),
+            significant_digits=element.get("significant_digits"),
+            sas_field_name=element.get("sas_field_name"),
+            sds_var_name=element.get("sds_var_name"),
+            origin=element.get("origin"),
+            comment=element.get("comment"),
+            unit_definitions=sorted(
+                [
+                    OdmItemUnitDefinitionWithRelationship.model_construct(
+                        uid=unit_definition["uid"],
+                        name=unit_definition["name"],
+                        mandatory=unit_definition["mandatory"],
+                        order=unit_definition["order"],
+                        ucum=None,
+                        ct_units=[],
+                    )
+                    for unit_definition in element["unit_definitions"]
+                ],
+                key=lambda item: item.uid,
+            ),
+            codelist=(
+                CTCodelistAttributesSimpleModel.model_construct(
+                    uid=codelist["uid"],
+                    name=codelist["name"],
+                    submission_value=codelist["submission_value"],
+                    preferred_term=codelist["preferred_term"],
+                )
+                if codelist
+                else None
+            ),
+            terms=sorted(
+                [
+                    OdmItemTermRelationshipModel.model_construct(
+                        term_uid=term["term_uid"],
+                        name=term["name"],
+                        mandatory=term["mandatory"],
+                        order=term["order"],
+                        display_text=term["display_text"],
+                        version=term["version"],
+                        submission_value=term["submission_value"],
+                    )
+                    for term in element["terms"]
+                ],
+                key=lambda item: (item.order is not None, item.order),
+            ),
+        )
 
+    def set_vendor_elements(self, elements: list[dict[str, Any]]):
         self.odm_vendor_elements = {
-            vendor_element.uid: {
-                "name": vendor_element.name,
-                "vendor_namespace": vars(vendor_element.vendor_namespace),
+            vendor_element["uid"]: {
+                "name": vendor_element["name"],
+                "vendor_namespace": vendor_element["vendor_namespace"],
             }
-            for vendor_element in vendor_elements
+            for element in elements
+            for vendor_element in element["vendor_elements"]
         }
 
-    def set_vendor_namespaces(self):
-        vendor_namespaces = self.vendor_namespace_service.get_all_concepts().items
-
-        self.odm_vendor_namespaces = {
-            vendor_namespace.uid: {
-                "name": vendor_namespace.name,
-                "prefix": vendor_namespace.prefix,
-                "url": vendor_namespace.url,
-            }
-            for vendor_namespace in vendor_namespaces
+    def set_unit_definitions_of_items(self, items: list[dict[str, Any]]):
+        unit_definitions = {
+            unit_definition["uid"]: unit_definition
+            for item in items
+            for unit_definition in item["unit_definitions"]
         }
 
-    def set_forms_of_study_event(self, study_events: list[OdmStudyEvent]):
-        self.odm_forms = sorted(
-            self.form_service.get_all_concepts(
-                filter_by={
-                    "uid": {
-                        "v": [
-                            form.uid
-                            for study_event in study_events
-                            for form in study_event.forms
-                        ],
-                        "op": "eq",
-                    }
-                },
-            ).items,
+        self.unit_definitions = sorted(
+            [
+                UnitDefinitionModel.model_construct(
+                    uid=unit_definition["uid"],
+                    name=unit_definition["name"],
+                    version=unit_definition["version"],
+                )
+                for unit_definition in unit_definitions.values()
+            ],
             key=lambda elm: elm.name,
         )
 
-        self.set_item_groups_of_forms(self.odm_forms)
-
-    def set_item_groups_of_forms(self, forms: list[OdmForm]):
-        self.odm_item_groups = sorted(
-            self.item_group_service.get_all_concepts(
-                filter_by={
-                    "uid": {
-                        "v": [
-                            item_group.uid
-                            for form in forms
-                            for item_group in form.item_groups
-                        ],
-                        "op": "eq",
-                    }
-                },
-            ).items,
-            key=lambda elm: elm.name,
-        )
+    def set_codelists_of_items(self, items: list[dict[str, Any]]):
+        codelists = {
+            item["codelist"]["uid"]: item for item in items if item["codelist"]
+        }
 
-        self.set_items_of_item_groups(self.odm_item_groups)
-
-    def set_items_of_item_groups(self, item_groups: list[OdmItemGroup]):
-        self.odm_items = sorted(
-            self.item_service.get_all_concepts(
-                filter_by={
-                    "uid": {
-                        "v": [
-                            item.uid
-                            for item_group in item_groups
-                            for item in item_group.items
-                        ],
-                        "op": "eq",
-                    }
-                },
-            ).items,
+        self.codelists = sorted(
+            [
+                CTCodelistAttributes.model_construct(
+                    codelist_uid=codelist_uid,
+                    name=item["codelist"]["name"],
+                    submission_value=item["codelist"]["submission_value"],
+                    nci_preferred_name=item["codelist"]["preferred_term"],
+                    version=item["codelist"]["version"],
+                )
+                for codelist_uid, item in codelists.items()
+            ],
             key=lambda elm: elm.name,
         )
 
-        self.set_unit_definitions_of_items(self.odm_items)
-        self.set_codelists_of_items(self.odm_items)
-        self.set_conditions(self.odm_forms, self.odm_item_groups)
-
-    def set_conditions(self, forms, item_groups):
-        oids = [
-            item_group.collection_exception_condition_oid
-            for form in forms
-            for item_group in form.item_groups
-        ] + [
-            item.collection_exception_condition_oid
-            for item_group in item_groups
-            for item in item_group.items
-        ]
-
-        if oids:
-            self.odm_conditions = sorted(
-                self.condition_service.get_all_concepts(
-                    filter_by={"oid": {"v": oids, "op": "eq"}},
-                ).items,
-                key=lambda elm: elm.name,
-            )
+        ct_terms = {
+            (item["codelist"]["uid"], term["term_uid"]): {
+                "name": term["name"],
+                "term_uid": term["term_uid"],
+                "codelist_uid": item["codelist"]["uid"],
+                "submission_value": term["submission_value"],
+                "nci_preferred_name": term["nci_preferred_name"],
+            }
+            for item in items
+            if item["codelist"]
+            for term in item["terms"]
+            if term["submission_value"] is not None
+        }
 
-    def set_methods(self, item_groups):
-        oids = [
-            item.method_oid for item_group in item_groups for item in item_group.items
-        ]
+        self.ct_terms = sorted(
+            ct_terms.values(), key=lambda elm: elm["nci_preferred_name"] or ""
+        )
 
-        if oids:
-            self.odm_methods = sorted(
-                self.method_service.get_all_concepts(
-                    filter_by={"oid": {"v": oids, "op": "eq"}},
-                ).items,
-                key=lambda elm: elm.name,
-            )
+    def set_references(self):
+        references = self.repository.find_references(
+            condition_oids=[
+                oid
+                for oid in [
+                    item_group.collection_exception_condition_oid
+                    for form in self.odm_forms
+                    for item_group in form.item_groups
+                ]
+                + [
+                    item.collection_exception_condition_oid
+                    for item_group in self.odm_item_groups
+                    for item in item_group.items
+                ]
+                if oid is not None
+            ],
+            method_oids=[
+                item.method_oid
+                for item_group in self.odm_item_groups
+                for item in item_group.items
+                if item.method_oid is not None
+            ],
+            vendor_attribute_uids=list(
+                {
+                    attribute.uid
+                    for form in self.odm_forms
+                    for item_group in form.item_groups
+                    for attribute in item_group.vendor.attributes
+                }
+                | {
+                    attribute.uid
+                    for item_group in self.odm_item_groups
+                    for item in item_group.items
+                    for attribute in item.vendor.attributes
+                }
+            ),
+        )
 
-    def set_unit_definitions_of_items(self, items: list[OdmItem]):
-        self.unit_definitions = sorted(
-            self.unit_definition_service.get_all(
-                library_name=None,
-                filter_by={
-                    "uid": {
-                        "v": [
-                            unit_definition.uid
-                            for item in items
-                            for unit_definition in item.unit_definitions
-                        ],
-                        "op": "eq",
-                    }
-                },
-            ).items,
+        self.odm_conditions = sorted(
+            [
+                OdmCondition.model_construct(
+                    **self._build_concept_fields(condition),
+                    formal_expressions=self._build_formal_expressions(condition),
+                )
+                for condition in references["OdmCondition"]
+            ],
             key=lambda elm: elm.name,
         )
-
-    def set_codelists_of_items(self, items: list[OdmItem]):
-        self.codelists = sorted(
-            self.ct_codelist_attributes_service.get_all_ct_codelists(
-                catalogue_name=None,
-                library=None,
-                package=None,
-                filter_by={
-                    "codelist_uid": {
-                        "v": [item.codelist.uid for item in items if item.codelist],
-                        "op": "eq",
-                    }
-                },
-            ).items,
+        self.odm_methods = sorted(
+            [
+                OdmMethod.model_construct(
+                    **self._build_concept_fields(method),
+                    method_type=method.get("method_type"),
+                    formal_expressions=self._build_formal_expressions(method),
+                )
+                for method in references["OdmMethod"]
+            ],
             key=lambda elm: elm.name,
         )
+        self.ref_odm_vendor_attributes = {
+            vendor_attribute["uid"]: {
+                "name": vendor_attribute["name"],
+                "vendor_namespace": vendor_attribute["vendor_namespace"],
+            }
+            for vendor_attribute in references["OdmVendorAttribute"]
+        }
+        self.odm_vendor_namespaces = {
+            vendor_namespace["uid"]: {
+                "name": vendor_namespace["name"],
+                "prefix": vendor_namespace["prefix"],
+                "url": vendor_namespace["url"],
+            }
+            for vendor_namespace in references["OdmVendorNamespace"]
+        }
 
-        self.set_terms_of_codelists(self.codelists)
-
-    def set_terms_of_codelists(self, codelists: list[CTCodelistAttributes]):
-        self.ct_terms = sorted(
-            self.ct_term_attributes_service.get_term_name_and_attributes_by_codelist_uids(
-                [codelist.codelist_uid for codelist in codelists]
-            ),
-            key=lambda elm: elm["nci_preferred_name"],
-        )
+    @staticmethod
+    def _build_formal_expressions(
+        element: dict[str, Any],
+    ) -> list[OdmFormalExpressionModel]:
+        return [
+            OdmFormalExpressionModel.model_construct(**formal_expression)
+            for formal_expression in element["formal_expressions"]
+        ]
 
     def get_items_by_codelist_uid(self, codelist_uid: str):
         return sorted(
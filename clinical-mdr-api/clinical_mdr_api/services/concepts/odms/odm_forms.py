@@ -144,6 +144,7 @@ class OdmFormService(OdmGenericService[OdmFormAR]):
             VendorAttributeCompatibleType.ITEM_GROUP_REF,
         )
 
+        parameters_by_uid = {}
         for item_group in odm_form_item_group_post_input:
             if item_group.vendor:
                 self.can_connect_vendor_attributes(item_group.vendor.attributes)
@@ -152,17 +153,18 @@ class OdmFormService(OdmGenericService[OdmFormAR]):
                     vendor_attribute_patterns,
                 )
 
-            self._repos.odm_form_repository.add_relation(
-                uid=uid,
-                relation_uid=item_group.uid,
-                relationship_type=RelationType.ITEM_GROUP,
-                parameters={
-                    "order_number": item_group.order_number,
-                    "mandatory": strtobool(item_group.mandatory),
-                    "collection_exception_condition_oid": item_group.collection_exception_condition_oid,
-                    "vendor": to_dict(item_group.vendor),
-                },
-            )
+            parameters_by_uid[item_group.uid] = {
+                "order_number": item_group.order_number,
+                "mandatory": strtobool(item_group.mandatory),
+                "collection_exception_condition_oid": item_group.collection_exception_condition_oid,
+                "vendor": to_dict(item_group.vendor),
+            }
+
+        self._repos.odm_form_repository.add_relations(
+            uid=uid,
+            relationship_type=RelationType.ITEM_GROUP,
+            parameters_by_uid=parameters_by_uid,
+        )
 
         odm_form_ar = self._find_by_uid_or_raise_not_found(normalize_string(uid))
 
@@ -159,6 +159,7 @@ class OdmItemGroupService(OdmGenericService[OdmItemGroupAR]):
             VendorAttributeCompatibleType.ITEM_REF,
         )
 
+        parameters_by_uid = {}
         for item in odm_item_group_item_post_input:
             if item.vendor:
                 self.can_connect_vendor_attributes(item.vendor.attributes)
@@ -167,22 +168,23 @@ class OdmItemGroupService(OdmGenericService[OdmItemGroupAR]):
                     vendor_attribute_patterns,
                 )
 
-            self._repos.odm_item_group_repository.add_relation(
-                uid=uid,
-                relation_uid=item.uid,
-                relationship_type=RelationType.ITEM,
-                parameters={
-                    "order_number": item.order_number,
-                    "mandatory": strtobool(item.mandatory),
-                    "key_sequence": item.key_sequence,
-                    "method_oid": item.method_oid,
-                    "imputation_method_oid": item.imputation_method_oid,
-                    "role": item.role,
-                    "role_codelist_oid": item.role_codelist_oid,
-                    "collection_exception_condition_oid": item.collection_exception_condition_oid,
-                    "vendor": to_dict(item.vendor),
-                },
-            )
+            parameters_by_uid[item.uid] = {
+                "order_number": item.order_number,
+                "mandatory": strtobool(item.mandatory),
+                "key_sequence": item.key_sequence,
+                "method_oid": item.method_oid,
+                "imputation_method_oid": item.imputation_method_oid,
+                "role": item.role,
+                "role_codelist_oid": item.role_codelist_oid,
+                "collection_exception_condition_oid": item.collection_exception_condition_oid,
+                "vendor": to_dict(item.vendor),
+            }
+
+        self._repos.odm_item_group_repository.add_relations(
+            uid=uid,
+            relationship_type=RelationType.ITEM,
+            parameters_by_uid=parameters_by_uid,
+        )
 
         odm_item_group_ar = self._find_by_uid_or_raise_not_found(normalize_string(uid))
 
@@ -387,16 +387,17 @@ class OdmItemService(OdmGenericService[OdmItemAR]):
                 disconnect_all=True,
             )
 
-        for unit_definition in unit_definitions:
-            self._repos.odm_item_repository.add_relation(
-                uid=item_uid,
-                relation_uid=unit_definition.uid,
-                relationship_type=RelationType.UNIT_DEFINITION,
-                parameters={
+        self._repos.odm_item_repository.add_relations(
+            uid=item_uid,
+            relationship_type=RelationType.UNIT_DEFINITION,
+            parameters_by_uid={
+                unit_definition.uid: {
                     "mandatory": unit_definition.mandatory,
                     "order": unit_definition.order,
-                },
-            )
+                }
+                for unit_definition in unit_definitions
+            },
+        )
 
     def calculate_item_length_value(
         self,
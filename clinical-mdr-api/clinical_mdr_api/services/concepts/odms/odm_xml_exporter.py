@@ -1,12 +1,14 @@
 from datetime import datetime, timezone
+from hashlib import sha256
+from io import StringIO
+from os import stat
 from time import time
-from typing import Any
-from xml.dom.minidom import Document
+from typing import Any, Iterator
+from xml.dom import minidom
 from xml.sax.saxutils import quoteattr
 
 from fastapi import UploadFile
 from lxml import etree
-from weasyprint import HTML
 
 from clinical_mdr_api.domains._utils import get_iso_lang_data
 from clinical_mdr_api.domains.concepts.odms.odm_xml_definition import (
@@ -52,13 +54,17 @@ from clinical_mdr_api.services.concepts.odms.odm_data_extractor import OdmDataEx
 from clinical_mdr_api.services.concepts.odms.odm_xml_stylesheets import (
     OdmXmlStylesheetService,
 )
-from clinical_mdr_api.services.utils.odm_xml_mapper import map_xml
+from clinical_mdr_api.services.utils.odm_xml_mapper import (
+    apply_mapping_rules,
+    read_mapping_rules,
+)
+from common.cache import create_cache
+from common.config import settings
 from common.exceptions import BusinessLogicException
 
 
 class OdmXmlExporterService:
     odm_data_extractor: OdmDataExtractor
-    xml_document: Document
     odm: ODM
     allowed_namespaces: list[str] | dict[str, str]
     pdf: bool
@@ -66,12 +72,24 @@ class OdmXmlExporterService:
 
     mapper_file: UploadFile | None = None
 
+    # Rendered PDFs by digest of the stylesheet and the exported document, see `_get_pdf_cache_key`.
+    # PDFs are several MB each, they are kept in the process instead of being written to the shared cache backend.
+    _pdf_cache = create_cache(
+        "OdmXmlExporterService.pdf",
+        maxsize=settings.odm_pdf_cache_max_size,
+        shared=False,
+    )
+
     XML_LANG = "xml:lang"
     OSB_VERSION = "osb:version"
     OSB_INSTRUCTION = "osb:instruction"
     OSB_SPONSOR_INSTRUCTION = "osb:sponsorInstruction"
     SDTM_MSG_COLOURS = ["#bfffff", "#ffff96", "#96ff96", "#ffbf9c", "#ffffff"]
 
+    # Elements written as separate start and end tags around their streamed children,
+    # all other elements are built and written as one subtree
+    STREAMED_ELEMENTS = (ODM, Study, MetaDataVersion)
+
     def __init__(
         self,
         target_uids: list[str],
@@ -121,14 +139,6 @@ class OdmXmlExporterService:
             self.allowed_namespaces = {}
 
         self.odm = self._create_odm_object()
-        self.xml_document = Document()
-        if self.stylesheet:
-            self.xml_document.appendChild(
-                self.xml_document.createProcessingInstruction(
-                    "xml-stylesheet",
-                    f'type="text/xsl" href={quoteattr(self.stylesheet)}',
-                )
-            )
 
     def get_odm_document(self) -> bytes:
         """
@@ -140,57 +150,237 @@ class OdmXmlExporterService:
         Raises:
             BusinessLogicException: If an error occurs while generating the PDF.
         """
-        doc = self._generate_odm_xml(self.odm, self.xml_document)
+        if not self.pdf:
+            return b"".join(self.stream_odm_document())
 
-        map_xml(self.xml_document, self.mapper_file)
+        try:
+            if self.stylesheet is None:
+                raise BusinessLogicException(
+                    msg="Stylesheet is required for PDF generation."
+                )
 
-        rs = doc.toprettyxml(encoding="utf-8")
+            transform = OdmXmlStylesheetService.get_compiled_stylesheet(self.stylesheet)
+            chunks = list(self.stream_odm_document())
+            cache_key = self._get_pdf_cache_key(chunks)
+            if (cached_pdf := self._pdf_cache.get(cache_key)) is not None:
+                return cached_pdf
 
-        if self.pdf:
-            try:
-                if self.stylesheet is None:
-                    raise BusinessLogicException(
-                        msg="Stylesheet is required for PDF generation."
-                    )
+            parser = etree.XMLParser(resolve_entities=False)
+            for chunk in chunks:
+                parser.feed(chunk)
+            dom = parser.close()
 
-                stylesheet_filename = OdmXmlStylesheetService.get_xml_filename_by_name(
-                    self.stylesheet
-                )
+            # WeasyPrint loads Pango and its fonts on import, only do it when a PDF is rendered
+            from weasyprint import HTML
 
-                parser = etree.XMLParser(resolve_entities=False)
-                dom = etree.fromstring(rs, parser=parser)
-                xslt = etree.parse(stylesheet_filename, parser=parser)
-                transform = etree.XSLT(
-                    xslt, access_control=etree.XSLTAccessControl.DENY_ALL
-                )
+            rs = HTML(string=etree.tostring(transform(dom))).write_pdf()
+            if settings.odm_pdf_cache_max_size > 0:
+                self._pdf_cache[cache_key] = rs
+            return rs
+        except Exception as exc:
+            raise BusinessLogicException(msg=exc.args[0]) from exc
 
-                rs = HTML(string=etree.tostring(transform(dom))).write_pdf()
-            except Exception as exc:
-                raise BusinessLogicException(msg=exc.args[0]) from exc
+    def _get_pdf_cache_key(self, chunks: list[bytes]) -> str:
+        """
+        Returns the key of the rendered PDF of an ODM XML document in `_pdf_cache`.
 
-        return rs
+        The key is the digest of the stylesheet (name and last modification) and of the document itself,
+        so it changes with any change of the exported elements, the vendor namespaces or the mapper file.
+        The file OID and creation time, which are different for every export, are left out.
+        """
+        stylesheet_filename = OdmXmlStylesheetService.get_xml_filename_by_name(
+            self.stylesheet
+        )
+        digest = sha256(
+            f"{self.stylesheet}:{stat(stylesheet_filename).st_mtime_ns}".encode()
+        )
+        volatile_values = [
+            str(self.odm.file_oid.value).encode(),
+            str(self.odm.creation_date_time.value).encode(),
+        ]
+        for chunk in chunks:
+            for volatile_value in volatile_values:
+                chunk = chunk.replace(volatile_value, b"")
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def stream_odm_document(self) -> Iterator[bytes]:
+        """
+        Gets an ODM XML document with the mapper file applied to it, as chunks of the pretty-printed XML.
 
-    def _generate_odm_xml(self, odm_element, current_xml_element):
+        The mapper file is read and validated before the first chunk is produced.
+        Then the document is written element by element instead of building it as a whole,
+        see `_write_odm_xml`.
+
+        Returns:
+            Iterator[bytes]: The UTF-8 encoded chunks of the XML document.
+
+        Raises:
+            BusinessLogicException: If the mapper file is invalid.
         """
-        Generates an ODM XML document from an ODM element.
+        mapping_rules = read_mapping_rules(self.mapper_file)
+        return self._write_odm_xml(mapping_rules)
+
+    def _write_odm_xml(self, mapping_rules: list[dict[str, str]]) -> Iterator[bytes]:
+        yield b'<?xml version="1.0" encoding="utf-8"?>\n'
+        if self.stylesheet:
+            yield f'<?xml-stylesheet type="text/xsl" href={quoteattr(self.stylesheet)}?>\n'.encode()
+        yield from self._write_odm_element(
+            self.odm, None, [frozenset()] * len(mapping_rules), 0, mapping_rules
+        )
+
+    def _write_odm_element(
+        self,
+        odm_element,
+        xml_parent: minidom.Element | None,
+        ancestor_tag_names: list[frozenset[str]],
+        depth: int,
+        mapping_rules: list[dict[str, str]],
+    ) -> Iterator[bytes]:
+        """
+        Writes an ODM element as pretty-printed XML.
+
+        Every element is mapped in a small document, under a shallow copy of its parent element.
+        The mapping rules matching on further ancestors get the tag names these ancestors have in the whole document
+        when each rule is applied, which are traced once for the children of each streamed container.
+        Containers in `STREAMED_ELEMENTS` are mapped without their children, which are written one by one,
+        any other element is mapped and written with its whole subtree.
 
         Args:
-            odm_element: The ODM element to generate the XML document from.
-            current_xml_element: The current XML element in the document.
+            odm_element: The ODM element to write.
+            xml_parent (minidom.Element | None): The XML element of the parent of `odm_element`, before mapping.
+            ancestor_tag_names (list[frozenset[str]]): The tag names of the ancestors above `xml_parent`
+                when each mapping rule is applied, see `apply_mapping_rules`.
+            depth (int): The number of ancestors of `odm_element`.
+            mapping_rules (list[dict[str, str]]): The mapping rules of the mapper file.
 
         Returns:
-            Document: The generated XML document.
+            Iterator[bytes]: The UTF-8 encoded chunks of the element.
+        """
+        streamed = isinstance(odm_element, self.STREAMED_ELEMENTS)
+        xml_document = minidom.Document()
+        parent: minidom.Document | minidom.Element = xml_document
+        if xml_parent is not None:
+            parent = xml_document.appendChild(
+                xml_document.importNode(xml_parent, False)
+            )
+        xml_element = self._generate_odm_xml(
+            odm_element, parent, xml_document, with_children=not streamed
+        )
+        if streamed:
+            yield from self._write_streamed_odm_element(
+                odm_element,
+                xml_element,
+                ancestor_tag_names,
+                depth,
+                mapping_rules,
+            )
+            return
+
+        apply_mapping_rules(xml_document, mapping_rules, ancestor_tag_names)
+        if xml_element.parentNode is None:
+            # folded into an attribute of its parent by the mapping rules
+            return
+
+        writer = StringIO()
+        xml_element.writexml(writer, "\t" * depth, "\t", "\n")
+        yield writer.getvalue().encode("utf-8")
+
+    def _write_streamed_odm_element(
+        self,
+        odm_element,
+        xml_element: minidom.Element,
+        ancestor_tag_names: list[frozenset[str]],
+        depth: int,
+        mapping_rules: list[dict[str, str]],
+    ) -> Iterator[bytes]:
+        """
+        Writes a container of `STREAMED_ELEMENTS` as separate start and end tags around its children.
+
+        The element is mapped rule by rule, to trace the tag names its parent has when each rule is applied.
+        Its children are then written by `_write_odm_element`, under a copy of the element as it is before mapping.
+
+        Args:
+            odm_element: The ODM element to write.
+            xml_element (minidom.Element): The XML element of `odm_element`, without children and before mapping.
+            ancestor_tag_names (list[frozenset[str]]): The tag names of the ancestors above the parent of `xml_element`
+                when each mapping rule is applied, see `apply_mapping_rules`.
+            depth (int): The number of ancestors of `odm_element`.
+            mapping_rules (list[dict[str, str]]): The mapping rules of the mapper file.
+
+        Returns:
+            Iterator[bytes]: The UTF-8 encoded chunks of the element.
+        """
+        xml_document = xml_element.ownerDocument
+        xml_parent = xml_element.parentNode
+        xml_element_before_mapping = xml_element.cloneNode(False)
+        child_ancestor_tag_names = []
+        for mapping_rule, tag_names in zip(mapping_rules, ancestor_tag_names):
+            if xml_parent is not xml_document:
+                tag_names_with_parent = tag_names | {xml_parent.tagName}
+            else:
+                tag_names_with_parent = tag_names
+            child_ancestor_tag_names.append(tag_names_with_parent)
+            apply_mapping_rules(xml_document, [mapping_rule], [tag_names])
+        if xml_element.parentNode is None:
+            # folded into an attribute of its parent by the mapping rules
+            return
+
+        indent = "\t" * depth
+        writer = StringIO()
+        xml_element.cloneNode(False).writexml(writer)
+        # the element has no children yet, turn its empty-element tag into a start tag
+        yield f"{indent}{writer.getvalue()[:-2]}>\n".encode("utf-8")
+        for odm_child_element in self._iter_odm_child_elements(odm_element):
+            yield from self._write_odm_element(
+                odm_child_element,
+                xml_element_before_mapping,
+                child_ancestor_tag_names,
+                depth + 1,
+                mapping_rules,
+            )
+        # Alias elements added by the mapping rules come after the generated children
+        for xml_child_element in xml_element.childNodes:
+            writer = StringIO()
+            xml_child_element.writexml(writer, indent + "\t", "\t", "\n")
+            yield writer.getvalue().encode("utf-8")
+        yield f"{indent}</{xml_element.tagName}>\n".encode("utf-8")
+
+    @staticmethod
+    def _iter_odm_child_elements(odm_element):
+        for attribute_value in vars(odm_element).values():
+            if isinstance(attribute_value, list):
+                yield from attribute_value
+            elif not isinstance(attribute_value, Attribute | str):
+                yield attribute_value
+
+    def _generate_odm_xml(
+        self,
+        odm_element,
+        current_xml_element: minidom.Document | minidom.Element,
+        xml_document: minidom.Document,
+        with_children: bool = True,
+    ) -> minidom.Element:
+        """
+        Generates the XML element of an ODM element.
+
+        Args:
+            odm_element: The ODM element to generate the XML element from.
+            current_xml_element: The XML element to append the generated element to.
+            xml_document (minidom.Document): The XML document the generated element belongs to.
+            with_children (bool): Whether to generate the child elements too, or only the attributes and text.
+
+        Returns:
+            minidom.Element: The generated XML element.
         """
         if hasattr(odm_element, "_custom_element_name") and isinstance(
             odm_element._custom_element_name, str
         ):
-            new_xml_element = self.xml_document.createElement(
+            new_xml_element = xml_document.createElement(
                 odm_element._custom_element_name
             )
         else:
-            new_xml_element = self.xml_document.createElement(
-                odm_element.__class__.__name__
-            )
+            new_xml_element = xml_document.createElement(odm_element.__class__.__name__)
 
         attributes = vars(odm_element).items()
 
@@ -210,17 +400,21 @@ class OdmXmlExporterService:
                 if attribute_name == "_custom_element_name":
                     continue
                 new_xml_element.appendChild(
-                    self.xml_document.createTextNode(attribute_value)
+                    xml_document.createTextNode(attribute_value)
                 )
+            elif not with_children:
+                continue
             elif isinstance(attribute_value, list):
                 for odm_element_from_list in attribute_value:
-                    self._generate_odm_xml(odm_element_from_list, new_xml_element)
+                    self._generate_odm_xml(
+                        odm_element_from_list, new_xml_element, xml_document
+                    )
             else:
-                self._generate_odm_xml(attribute_value, new_xml_element)
+                self._generate_odm_xml(attribute_value, new_xml_element, xml_document)
 
         current_xml_element.appendChild(new_xml_element)
 
-        return self.xml_document
+        return new_xml_element
 
     def _get_vendor_attributes_or_empty_dict(
         self, elements: dict[str, Attribute] | Any
@@ -80,6 +80,10 @@ from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     CTTermCodelistInput,
     CTTermCreateInput,
 )
+from clinical_mdr_api.repositories._utils import (
+    record_cache_invalidations,
+    repeat_cache_invalidations,
+)
 from clinical_mdr_api.services._meta_repository import MetaRepository
 from clinical_mdr_api.services._utils import is_library_editable
 from clinical_mdr_api.services.concepts.odms.odm_conditions import OdmConditionService
@@ -141,6 +145,8 @@ class OdmXmlImporterService:
     method_defs: minicompat.NodeList
     codelists: minicompat.NodeList
     measurement_units: minicompat.NodeList
+    codelists_by_oid: dict[str, minidom.Element]
+    measurement_units_by_oid: dict[str, minidom.Element]
 
     namespace_prefixes: dict[str, str]
 
@@ -159,6 +165,13 @@ class OdmXmlImporterService:
     db_unit_definitions: list[UnitDefinitionModel]
     measurement_unit_names_by_oid: dict[str, str]
 
+    # uids of the vendor namespaces by prefix and of the vendor elements and attributes by (prefix, name)
+    vendor_namespace_uids_by: dict[str, str]
+    vendor_element_uids_by: dict[tuple[str, str], str]
+    vendor_attribute_uids_by: dict[tuple[str, str], str]
+    vendor_element_attribute_uids_by: dict[tuple[str, str], str]
+    vendor_attribute_patterns: dict[str, str | None]
+
     mapper_file: UploadFile | None = None
 
     OSB_PREFIX = "osb"
@@ -207,20 +220,50 @@ class OdmXmlImporterService:
         self.db_ct_codelists = []
         self.db_unit_definitions = []
 
+        self.vendor_namespace_uids_by = {}
+        self.vendor_element_uids_by = {}
+        self.vendor_attribute_uids_by = {}
+        self.vendor_element_attribute_uids_by = {}
+        self.vendor_attribute_patterns = {}
+
         self.mapper_file = mapper_file
 
-        self.xml_document = minidom.parseString(xml_file.file.read())
+        self.xml_document = minidom.parse(xml_file.file)
 
         map_xml(self.xml_document, mapper_file)
 
         self._set_def_elements()
 
-    @db.transaction
-    def store_odm_xml(self):
+    def store_odm_xml(self, validate_only: bool = False):
+        """
+        Stores the ODM elements of the XML document in one transaction and returns them.
+
+        With `validate_only`, the transaction is rolled back after the import,
+        so that the returned elements are the ones that would be stored.
+        Repository cache entries of the elements written by a rolled back import are invalidated.
+        """
+        with record_cache_invalidations() as invalidations:
+            db.begin()
+            try:
+                rs = self._store_odm_xml()
+            except BaseException:
+                db.rollback()
+                repeat_cache_invalidations(invalidations)
+                raise
+
+            if validate_only:
+                db.rollback()
+                repeat_cache_invalidations(invalidations)
+            else:
+                db.commit()
+
+        return rs
+
+    def _store_odm_xml(self):
         self._set_vendor_namespaces()
         self._create_missing_vendor_namespaces()
-        self._set_vendor_attributes()
         self._set_vendor_elements()
+        self._set_vendor_attributes()
         if not self.db_unit_definitions:
             self._set_unit_definitions()
         self._set_ct_term_attributes()
@@ -256,6 +299,16 @@ class OdmXmlImporterService:
         self.method_defs = self.xml_document.getElementsByTagName("MethodDef")
         self.codelists = self.xml_document.getElementsByTagName("CodeList")
 
+        # the first definition of a duplicated OID wins
+        self.codelists_by_oid = {
+            codelist.getAttribute("OID"): codelist
+            for codelist in reversed(self.codelists)
+        }
+        self.measurement_units_by_oid = {
+            measurement_unit.getAttribute("OID"): measurement_unit
+            for measurement_unit in reversed(self.measurement_units)
+        }
+
     def _set_vendor_namespaces(self):
         odm_element = self.xml_document.getElementsByTagName("ODM")[0]
         for attribute in odm_element.attributes.values():
@@ -270,12 +323,14 @@ class OdmXmlImporterService:
 
         rs.sort(key=lambda elm: elm.name)
 
-        self.db_vendor_namespaces = [
-            self.odm_vendor_namespace_service._transform_aggregate_root_to_pydantic_model(
-                concept_ar
-            )
-            for concept_ar in rs
-        ]
+        self._add_vendor_namespaces(
+            [
+                self.odm_vendor_namespace_service._transform_aggregate_root_to_pydantic_model(
+                    concept_ar
+                )
+                for concept_ar in rs
+            ]
+        )
 
     def _set_vendor_attributes(self):
         vendor_attribute_uids = [
@@ -290,12 +345,14 @@ class OdmXmlImporterService:
 
         rs.sort(key=lambda elm: elm.name)
 
-        self.db_vendor_attributes = [
-            self.odm_vendor_attribute_service._transform_aggregate_root_to_pydantic_model(
-                concept_ar
-            )
-            for concept_ar in rs
-        ]
+        self._add_vendor_attributes(
+            [
+                self.odm_vendor_attribute_service._transform_aggregate_root_to_pydantic_model(
+                    concept_ar
+                )
+                for concept_ar in rs
+            ]
+        )
 
     def _set_vendor_elements(self):
         vendor_element_uids = [
@@ -310,12 +367,58 @@ class OdmXmlImporterService:
 
         rs.sort(key=lambda elm: elm.name)
 
-        self.db_vendor_elements = [
-            self.odm_vendor_element_service._transform_aggregate_root_to_pydantic_model(
-                concept_ar
+        self._add_vendor_elements(
+            [
+                self.odm_vendor_element_service._transform_aggregate_root_to_pydantic_model(
+                    concept_ar
+                )
+                for concept_ar in rs
+            ]
+        )
+
+    def _add_vendor_namespaces(self, vendor_namespaces: list[OdmVendorNamespace]):
+        self.db_vendor_namespaces.extend(vendor_namespaces)
+
+        for vendor_namespace in vendor_namespaces:
+            self.vendor_namespace_uids_by.setdefault(
+                vendor_namespace.prefix, vendor_namespace.uid
             )
-            for concept_ar in rs
-        ]
+
+    def _add_vendor_elements(self, vendor_elements: list[OdmVendorElement]):
+        self.db_vendor_elements.extend(vendor_elements)
+
+        for vendor_element in vendor_elements:
+            if vendor_element.vendor_namespace:
+                self.vendor_element_uids_by.setdefault(
+                    (vendor_element.vendor_namespace.prefix, vendor_element.name),
+                    vendor_element.uid,
+                )
+
+    def _add_vendor_attributes(self, vendor_attributes: list[OdmVendorAttribute]):
+        self.db_vendor_attributes.extend(vendor_attributes)
+
+        vendor_element_prefixes_by_uid = {
+            db_vendor_element.uid: db_vendor_element.vendor_namespace.prefix
+            for db_vendor_element in self.db_vendor_elements
+            if db_vendor_element.vendor_namespace
+        }
+        for vendor_attribute in vendor_attributes:
+            self.vendor_attribute_patterns[vendor_attribute.uid] = (
+                vendor_attribute.value_regex
+            )
+            if vendor_attribute.vendor_namespace:
+                self.vendor_attribute_uids_by.setdefault(
+                    (vendor_attribute.vendor_namespace.prefix, vendor_attribute.name),
+                    vendor_attribute.uid,
+                )
+            if vendor_attribute.vendor_element and (
+                prefix := vendor_element_prefixes_by_uid.get(
+                    vendor_attribute.vendor_element.uid
+                )
+            ):
+                self.vendor_element_attribute_uids_by.setdefault(
+                    (prefix, vendor_attribute.name), vendor_attribute.uid
+                )
 
     def _create_missing_vendor_namespaces(self):
         missing_prefixes = sorted(
@@ -345,7 +448,7 @@ class OdmXmlImporterService:
                 rs,
             )
 
-        self.db_vendor_namespaces.extend(new_vendor_namespaces)
+        self._add_vendor_namespaces(new_vendor_namespaces)
 
     def _create_missing_vendors(self, def_element: minidom.Element):
         self._create_missing_vendor_attributes(def_element.attributes.values())
@@ -373,11 +476,9 @@ class OdmXmlImporterService:
                                 elm_attribute.ownerElement.localName
                             )
                         ],
-                        vendor_namespace_uid=next(
-                            db_vendor_namespace.uid
-                            for db_vendor_namespace in self.db_vendor_namespaces
-                            if db_vendor_namespace.prefix == elm_attribute.prefix
-                        ),
+                        vendor_namespace_uid=self.vendor_namespace_uids_by[
+                            elm_attribute.prefix
+                        ],
                     ),
                 )
 
@@ -387,7 +488,7 @@ class OdmXmlImporterService:
                     rs,
                 )
 
-        self.db_vendor_attributes.extend(new_vendor_attributes)
+        self._add_vendor_attributes(new_vendor_attributes)
 
     def _create_missing_vendor_elements(self, elements: minicompat.NodeList):
         new_vendor_elements: list[OdmVendorElement] = []
@@ -406,11 +507,9 @@ class OdmXmlImporterService:
                         compatible_types=[
                             VendorElementCompatibleType(element.parentNode.localName)
                         ],
-                        vendor_namespace_uid=next(
-                            db_vendor_namespace.uid
-                            for db_vendor_namespace in self.db_vendor_namespaces
-                            if db_vendor_namespace.prefix == element.prefix
-                        ),
+                        vendor_namespace_uid=self.vendor_namespace_uids_by[
+                            element.prefix
+                        ],
                     ),
                 )
 
@@ -420,7 +519,7 @@ class OdmXmlImporterService:
                     rs,
                 )
 
-        self.db_vendor_elements.extend(new_vendor_elements)
+        self._add_vendor_elements(new_vendor_elements)
 
     def _create_missing_vendor_element_attributes(self, elements: minicompat.NodeList):
         for element in elements:
@@ -444,13 +543,9 @@ class OdmXmlImporterService:
                         new_vendor_element_attributes,
                         OdmVendorAttributePostInput(
                             name=element_attribute.localName or "TBD",
-                            vendor_element_uid=next(
-                                db_vendor_element.uid
-                                for db_vendor_element in self.db_vendor_elements
-                                if db_vendor_element.vendor_namespace.prefix
-                                == element_attribute.prefix
-                                and db_vendor_element.name == element.localName
-                            ),
+                            vendor_element_uid=self.vendor_element_uids_by[
+                                (element_attribute.prefix, element.localName)
+                            ],
                         ),
                     )
 
@@ -460,7 +555,7 @@ class OdmXmlImporterService:
                         rs,
                     )
 
-            self.db_vendor_attributes.extend(new_vendor_element_attributes)
+            self._add_vendor_attributes(new_vendor_element_attributes)
 
     def _create_relationships_with_vendors(
         self,
@@ -499,45 +594,31 @@ class OdmXmlImporterService:
             ):
                 continue
 
-            vendor_attribute_uid = next(
-                db_vendor_attribute.uid
-                for db_vendor_attribute in self.db_vendor_attributes
-                if elm_attribute.localName == db_vendor_attribute.name
-                and (
-                    db_vendor_attribute.vendor_namespace
-                    and elm_attribute.prefix
-                    == db_vendor_attribute.vendor_namespace.prefix
-                )
-            )
-
             odm_vendor_relations.append(
                 OdmVendorRelationPostInput(
-                    uid=vendor_attribute_uid, value=elm_attribute.nodeValue
+                    uid=self.vendor_attribute_uids_by[
+                        (elm_attribute.prefix, elm_attribute.localName)
+                    ],
+                    value=elm_attribute.nodeValue,
                 )
             )
 
-            vendor_attribute_patterns = (
-                self.odm_vendor_attribute_service.get_regex_patterns_of_attributes(
-                    [
-                        odm_vendor_relation.uid
-                        for odm_vendor_relation in odm_vendor_relations
-                    ]
-                )
-            )
+        if odm_vendor_relations:
             self.odm_vendor_attribute_service.attribute_values_matches_their_regex(
-                odm_vendor_relations, vendor_attribute_patterns
+                odm_vendor_relations, self.vendor_attribute_patterns
             )
             self.odm_vendor_attribute_service.are_attributes_vendor_compatible(
                 odm_vendor_relations, compatible_type
             )
 
-        for odm_vendor_relation in odm_vendor_relations:
-            repository.add_relation(
-                uid=uid,
-                relation_uid=odm_vendor_relation.uid,
-                relationship_type=RelationType.VENDOR_ATTRIBUTE,
-                parameters={"value": odm_vendor_relation.value},
-            )
+        repository.add_vendor_relations(
+            uid,
+            RelationType.VENDOR_ATTRIBUTE,
+            {
+                odm_vendor_relation.uid: odm_vendor_relation.value
+                for odm_vendor_relation in odm_vendor_relations
+            },
+        )
 
     def _create_relationship_with_vendor_elements(
         self,
@@ -558,20 +639,11 @@ class OdmXmlImporterService:
             ):
                 continue
 
-            vendor_element_uid = next(
-                db_vendor_element.uid
-                for db_vendor_element in self.db_vendor_elements
-                if child_element.localName == db_vendor_element.name
-                and (
-                    db_vendor_element.vendor_namespace
-                    and child_element.prefix
-                    == db_vendor_element.vendor_namespace.prefix
-                )
-            )
-
             odm_vendor_relations.append(
                 OdmVendorElementRelationPostInput(
-                    uid=vendor_element_uid,
+                    uid=self.vendor_element_uids_by[
+                        (child_element.prefix, child_element.localName)
+                    ],
                     value=(
                         child_element.firstChild.nodeValue
                         if child_element.firstChild
@@ -580,17 +652,19 @@ class OdmXmlImporterService:
                 )
             )
 
+        if odm_vendor_relations:
             self.odm_vendor_element_service.are_elements_vendor_compatible(
                 odm_vendor_relations, compatible_type
             )
 
-        for odm_vendor_relation in odm_vendor_relations:
-            repository.add_relation(
-                uid=uid,
-                relation_uid=odm_vendor_relation.uid,
-                relationship_type=RelationType.VENDOR_ELEMENT,
-                parameters={"value": odm_vendor_relation.value},
-            )
+        repository.add_vendor_relations(
+            uid,
+            RelationType.VENDOR_ELEMENT,
+            {
+                odm_vendor_relation.uid: odm_vendor_relation.value
+                for odm_vendor_relation in odm_vendor_relations
+            },
+        )
 
     def _create_relationship_with_vendor_element_attributes(
         self,
@@ -622,39 +696,26 @@ class OdmXmlImporterService:
                 ):
                     continue
 
-                vendor_element_attribute_uid = next(
-                    db_vendor_attribute.uid
-                    for db_vendor_attribute in self.db_vendor_attributes
-                    if child_element_attribute.localName == db_vendor_attribute.name
-                    and (
-                        db_vendor_attribute.vendor_element
-                        and child_element_attribute.prefix
-                        == next(
-                            (
-                                db_vendor_element.vendor_namespace.prefix
-                                for db_vendor_element in self.db_vendor_elements
-                                if db_vendor_element.uid
-                                == db_vendor_attribute.vendor_element.uid
-                            ),
-                            None,
-                        )
-                    )
-                )
-
                 odm_vendor_relations.append(
                     OdmVendorRelationPostInput(
-                        uid=vendor_element_attribute_uid,
+                        uid=self.vendor_element_attribute_uids_by[
+                            (
+                                child_element_attribute.prefix,
+                                child_element_attribute.localName,
+                            )
+                        ],
                         value=child_element_attribute.nodeValue,
                     )
                 )
 
-            for odm_vendor_relation in odm_vendor_relations:
-                repository.add_relation(
-                    uid=uid,
-                    relation_uid=odm_vendor_relation.uid,
-                    relationship_type=RelationType.VENDOR_ELEMENT_ATTRIBUTE,
-                    parameters={"value": odm_vendor_relation.value},
-                )
+            repository.add_vendor_relations(
+                uid,
+                RelationType.VENDOR_ELEMENT_ATTRIBUTE,
+                {
+                    odm_vendor_relation.uid: odm_vendor_relation.value
+                    for odm_vendor_relation in odm_vendor_relations
+                },
+            )
 
     def _vendor_attribute_exists(self, prefix, vendor_attribute_name):
         if (
@@ -663,13 +724,7 @@ class OdmXmlImporterService:
         ):
             return True
 
-        for db_vendor_attribute in self.db_vendor_attributes:
-            if vendor_attribute_name == db_vendor_attribute.name and (
-                db_vendor_attribute.vendor_namespace
-                and prefix == db_vendor_attribute.vendor_namespace.prefix
-            ):
-                return True
-        return False
+        return (prefix, vendor_attribute_name) in self.vendor_attribute_uids_by
 
     def vendor_element_exists(self, prefix, vendor_element_name):
         if (
@@ -678,13 +733,7 @@ class OdmXmlImporterService:
         ):
             return True
 
-        for db_vendor_element in self.db_vendor_elements:
-            if vendor_element_name == db_vendor_element.name and (
-                db_vendor_element.vendor_namespace
-                and prefix == db_vendor_element.vendor_namespace.prefix
-            ):
-                return True
-        return False
+        return (prefix, vendor_element_name) in self.vendor_element_uids_by
 
     def _vendor_element_attribute_exists(self, prefix, vendor_attribute_name):
         if (
@@ -693,22 +742,7 @@ class OdmXmlImporterService:
         ):
             return True
 
-        for db_vendor_attribute in self.db_vendor_attributes:
-            if vendor_attribute_name == db_vendor_attribute.name and (
-                db_vendor_attribute.vendor_element
-                and prefix
-                == next(
-                    (
-                        db_vendor_element.vendor_namespace.prefix
-                        for db_vendor_element in self.db_vendor_elements
-                        if db_vendor_element.uid
-                        == db_vendor_attribute.vendor_element.uid
-                    ),
-                    None,
-                )
-            ):
-                return True
-        return False
+        return (prefix, vendor_attribute_name) in self.vendor_element_attribute_uids_by
 
     def _set_unit_definitions(self):
         measurement_unit_names = {
@@ -871,6 +905,10 @@ class OdmXmlImporterService:
             self._approve(self._repos.odm_item_repository, self.odm_item_service, rs)
 
     def _create_item_groups_with_relations(self):
+        item_uids_by_oid = {
+            db_item.oid: db_item.uid for db_item in reversed(self.db_items)
+        }
+
         for item_group_def in self.item_group_defs:
             self._create_missing_vendors(item_group_def)
 
@@ -893,14 +931,7 @@ class OdmXmlImporterService:
             for item_ref in item_group_def.getElementsByTagName("ItemRef"):
                 self._create_missing_vendor_attributes(item_ref.attributes.values())
 
-                item_uid = next(
-                    (
-                        db_item.uid
-                        for db_item in self.db_items
-                        if db_item.oid == item_ref.getAttribute("ItemOID")
-                    ),
-                    None,
-                )
+                item_uid = item_uids_by_oid.get(item_ref.getAttribute("ItemOID"))
 
                 if not item_uid:
                     raise exceptions.BusinessLogicException(
@@ -937,6 +968,11 @@ class OdmXmlImporterService:
             )
 
     def _create_forms_with_relations(self):
+        item_group_uids_by_oid = {
+            db_item_group.oid: db_item_group.uid
+            for db_item_group in reversed(self.db_item_groups)
+        }
+
         for form_def in self.form_defs:
             self._create_missing_vendors(form_def)
 
@@ -960,14 +996,8 @@ class OdmXmlImporterService:
                     item_group_ref.attributes.values()
                 )
 
-                item_group_uid = next(
-                    (
-                        db_item_group.uid
-                        for db_item_group in self.db_item_groups
-                        if db_item_group.oid
-                        == item_group_ref.getAttribute("ItemGroupOID")
-                    ),
-                    None,
+                item_group_uid = item_group_uids_by_oid.get(
+                    item_group_ref.getAttribute("ItemGroupOID")
                 )
 
                 if not item_group_uid:
@@ -1027,18 +1057,19 @@ class OdmXmlImporterService:
                 )
             )
 
-        for odm_study_event_form in odm_study_event_forms:
-            self._repos.odm_study_event_repository.add_relation(
-                uid=rs.uid,
-                relation_uid=odm_study_event_form.uid,
-                relationship_type=RelationType.FORM,
-                parameters={
+        self._repos.odm_study_event_repository.add_relations(
+            uid=rs.uid,
+            relationship_type=RelationType.FORM,
+            parameters_by_uid={
+                odm_study_event_form.uid: {
                     "order_number": odm_study_event_form.order_number,
                     "mandatory": strtobool(odm_study_event_form.mandatory),
                     "locked": strtobool(odm_study_event_form.locked),
                     "collection_exception_condition_oid": odm_study_event_form.collection_exception_condition_oid,
-                },
-            )
+                }
+                for odm_study_event_form in odm_study_event_forms
+            },
+        )
 
         self._approve(
             self._repos.odm_study_event_repository, self.odm_study_event_service, rs
@@ -1337,8 +1368,6 @@ class OdmXmlImporterService:
         )[0]
 
         rs.sort(key=lambda elm: elm[0].uid)
-        print("ååååå")
-        print(rs)
         return [
             CTTerm.from_ct_term_ars(
                 ct_term_name_ar, ct_term_attributes_ar, ct_term_codelists
@@ -1377,18 +1406,7 @@ class OdmXmlImporterService:
 
         item_unit_definitions = self._get_item_unit_definition_inputs(item_def)
 
-        codelist = next(
-            (
-                codelist
-                for codelist in self.codelists
-                if item_def.getElementsByTagName("CodeListRef")
-                and codelist.getAttribute("OID")
-                == item_def.getElementsByTagName("CodeListRef")[0].getAttribute(
-                    "CodeListOID"
-                )
-            ),
-            None,
-        )
+        codelist = self._get_codelist_of_item(item_def)
 
         input_terms = []
         codelist_uid = None
@@ -1615,9 +1633,14 @@ class OdmXmlImporterService:
             ],
         )
 
-    def _get_item_unit_definition_inputs(self, item_def):
-        mu_oid_map = {mu.getAttribute("OID"): mu for mu in self.measurement_units}
+    def _get_codelist_of_item(self, item_def) -> minidom.Element | None:
+        codelist_refs = item_def.getElementsByTagName("CodeListRef")
+        if not codelist_refs:
+            return None
 
+        return self.codelists_by_oid.get(codelist_refs[0].getAttribute("CodeListOID"))
+
+    def _get_item_unit_definition_inputs(self, item_def):
         unit_name_to_uid = {ud.name: ud.uid for ud in self.db_unit_definitions}
 
         measurement_unit_oids = [
@@ -1627,7 +1650,7 @@ class OdmXmlImporterService:
 
         uids = []
         for mu_oid in measurement_unit_oids:
-            mu = mu_oid_map.get(mu_oid)
+            mu = self.measurement_units_by_oid.get(mu_oid)
             if not mu:
                 raise exceptions.BusinessLogicException(
                     msg=f"MeasurementUnit with OID '{mu_oid}' was not provided."
@@ -1648,17 +1671,11 @@ class OdmXmlImporterService:
             if ":" in name:
                 prefix, local_name = name.split(":")
 
-                vendor_attribute_uid = next(
-                    db_vendor_attribute.uid
-                    for db_vendor_attribute in self.db_vendor_attributes
-                    if local_name == db_vendor_attribute.name
-                    and (
-                        db_vendor_attribute.vendor_namespace
-                        and prefix == db_vendor_attribute.vendor_namespace.prefix
-                    )
-                )
                 rs.append(
-                    OdmVendorRelationPostInput(uid=vendor_attribute_uid, value=value)
+                    OdmVendorRelationPostInput(
+                        uid=self.vendor_attribute_uids_by[(prefix, local_name)],
+                        value=value,
+                    )
                 )
         return rs
 
@@ -1,10 +1,21 @@
 import re
-from os import listdir, path
+from functools import lru_cache
+from os import listdir, path, stat
+
+from lxml import etree
 
 from common.config import settings
 from common.exceptions import NotFoundException, ValidationException
 
 
+@lru_cache(maxsize=32)
+def _compile_stylesheet(filename: str, _modified_at: int) -> etree.XSLT:
+    # `_modified_at` is part of the cache key only, so an edited stylesheet file is compiled again
+    parser = etree.XMLParser(resolve_entities=False)
+    xslt = etree.parse(filename, parser=parser)
+    return etree.XSLT(xslt, access_control=etree.XSLTAccessControl.DENY_ALL)
+
+
 class OdmXmlStylesheetService:
     @staticmethod
     def get_available_stylesheet_names():
@@ -73,3 +84,23 @@ class OdmXmlStylesheetService:
             encoding="utf-8",
         ) as file:
             return file.read()
+
+    @staticmethod
+    def get_compiled_stylesheet(stylesheet: str) -> etree.XSLT:
+        """
+        Returns the compiled XSLT transformation of the XML stylesheet with the given name.
+
+        Stylesheets are compiled once per process, and again when their file is modified.
+
+        Args:
+            stylesheet (str): The name of the XML stylesheet.
+
+        Returns:
+            etree.XSLT: The XSLT transformation, which can be shared between threads.
+
+        Raises:
+            ValidationException: If the stylesheet name contains characters other than letters, numbers, and hyphens.
+            NotFoundException: If the stylesheet with the given name is not found.
+        """
+        filename = OdmXmlStylesheetService.get_xml_filename_by_name(stylesheet)
+        return _compile_stylesheet(filename, stat(filename).st_mtime_ns)
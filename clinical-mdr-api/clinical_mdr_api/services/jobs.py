@@ -0,0 +1,349 @@
+"""Long-running operations run as background jobs, see `common.jobs`"""
+
+import contextlib
+import io
+import json
+import os
+from typing import Iterator
+
+from fastapi.encoders import jsonable_encoder
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.domain_repositories.user_repository import UserRepository
+from clinical_mdr_api.models.job import CTPackageChangesJobParameters
+from clinical_mdr_api.models.job import Job as JobModel
+from clinical_mdr_api.models.job import JobInput
+from clinical_mdr_api.models.job import JobType as JobTypeModel
+from clinical_mdr_api.models.job import (
+    OdmDocumentJobParameters,
+    StudyCloneJobParameters,
+    StudyJobParameters,
+    StudyLockJobParameters,
+    StudySoAJobParameters,
+)
+from clinical_mdr_api.models.study_selections.study import StudyCloneInput
+from clinical_mdr_api.services.concepts.odms.odm_xml_exporter import (
+    OdmXmlExporterService,
+)
+from clinical_mdr_api.services.controlled_terminologies.ct_package import (
+    CTPackageService,
+)
+from clinical_mdr_api.services.ddf.usdm_service import USDMService
+from clinical_mdr_api.services.studies.study import StudyService
+from clinical_mdr_api.services.studies.study_artifacts import StudyArtifactService
+from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
+from common.auth.models import Auth, User
+from common.auth.user import user
+from common.config import settings
+from common.exceptions import NotFoundException, ValidationException
+from common.jobs import Job, JobContext, JobResult, JobRunner, JobStatus, JobType
+from common.jobs import start_job_runner as _start_job_runner
+
+MIME_TYPE_JSON = "application/json"
+MIME_TYPE_XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def _json_result(content, filename: str) -> JobResult:
+    return JobResult(
+        content=json.dumps(jsonable_encoder(content)).encode("utf-8"),
+        media_type=MIME_TYPE_JSON,
+        filename=filename,
+    )
+
+
+def _lock_study(context: JobContext) -> JobResult:
+    # locking runs in a single transaction, the job can't be cancelled once started
+    params: StudyLockJobParameters = context.parameters
+    context.report_progress(0, "Locking the study")
+    study = StudyService().lock(
+        uid=params.study_uid, change_description=params.change_description
+    )
+    context.report_progress(0.9, "Study locked")
+    return _json_result(study, f"{params.study_uid} locked.json")
+
+
+def _clone_study(context: JobContext) -> JobResult:
+    # cloning runs in a single transaction, the job can't be cancelled once started
+    params: StudyCloneJobParameters = context.parameters
+    context.report_progress(0, "Cloning the study")
+    study = StudyService().clone_study(
+        study_src_uid=params.study_uid,
+        study_clone_input=StudyCloneInput(
+            **params.model_dump(exclude={"study_uid"}, exclude_unset=True)
+        ),
+    )
+    context.report_progress(0.9, f"Study cloned as {study.uid}")
+    return _json_result(study, f"{params.study_uid} clone.json")
+
+
+def _soa_xlsx(name: str | None, layout: str, render_method: str):
+    # `name` is the artifact of locked study versions, `None` if the document is rendered for every download
+    def _run(context: JobContext) -> JobResult:
+        params: StudySoAJobParameters = context.parameters
+        context.report_progress(0, f"Building the {layout} SoA")
+        content = (
+            StudyArtifactService().get_locked_version_artifact(
+                params.study_uid,
+                params.study_value_version,
+                name,
+                time_unit=params.time_unit,
+            )
+            if name
+            else None
+        )
+        if content is None:
+            stream = io.BytesIO()
+            getattr(StudyFlowchartService(), render_method)(
+                study_uid=params.study_uid,
+                study_value_version=params.study_value_version,
+                time_unit=params.time_unit,
+            ).save(stream)
+            content = stream.getvalue()
+        return JobResult(
+            content=content,
+            media_type=MIME_TYPE_XLSX,
+            filename=f"{params.study_uid} {layout} SoA.xlsx",
+        )
+
+    return _run
+
+
+def _odm_document(context: JobContext) -> JobResult:
+    params: OdmDocumentJobParameters = context.parameters
+    context.report_progress(0, "Collecting the ODM elements")
+    exporter = OdmXmlExporterService(
+        params.target_uids,
+        params.target_type,
+        params.version,
+        params.allowed_namespaces,
+        params.pdf,
+        params.stylesheet,
+        None,
+    )
+    context.report_progress(0.5, "Rendering the ODM document")
+    if params.pdf:
+        return JobResult(
+            content=exporter.get_odm_document(),
+            media_type="application/pdf",
+            filename="CRF.pdf",
+        )
+    return JobResult(
+        content=b"".join(exporter.stream_odm_document()),
+        media_type="application/xml",
+        filename="odm_export.xml",
+    )
+
+
+def _usdm(context: JobContext) -> JobResult:
+    params: StudyJobParameters = context.parameters
+    context.report_progress(0, "Mapping the study to USDM")
+    return _json_result(
+        USDMService().get_by_uid(params.study_uid), f"{params.study_uid} USDM.json"
+    )
+
+
+def _ct_package_changes(context: JobContext) -> JobResult:
+    params: CTPackageChangesJobParameters = context.parameters
+    context.report_progress(0, "Comparing the packages")
+    changes = CTPackageService().get_ct_packages_changes(
+        catalogue_name=params.catalogue_name,
+        old_package_date=params.old_package_date,
+        new_package_date=params.new_package_date,
+    )
+    return _json_result(
+        changes,
+        f"{params.catalogue_name} {params.old_package_date} {params.new_package_date} changes.json",
+    )
+
+
+JOB_TYPES: dict[str, JobType] = {
+    job_type.name: job_type
+    for job_type in [
+        JobType(
+            name="study-lock",
+            run=_lock_study,
+            parameters_model=StudyLockJobParameters,
+            roles=frozenset({"Study.Write"}),
+            cancellable=False,
+            description="Locks a study, the result is the locked study",
+        ),
+        JobType(
+            name="study-clone",
+            run=_clone_study,
+            parameters_model=StudyCloneJobParameters,
+            roles=frozenset({"Study.Write"}),
+            cancellable=False,
+            description="Clones a study, the result is the new study",
+        ),
+        JobType(
+            name="operational-soa-xlsx",
+            # the header has the time and the user of the download
+            run=_soa_xlsx(None, "operational", "get_operational_soa_xlsx"),
+            parameters_model=StudySoAJobParameters,
+            roles=frozenset({"Study.Read"}),
+            max_concurrency=2,
+            description="Builds the Operational SoA of a study as an XLSX document",
+        ),
+        JobType(
+            name="detailed-soa-xlsx",
+            run=_soa_xlsx("detailed-soa.xlsx", "detailed", "get_detailed_soa_xlsx"),
+            parameters_model=StudySoAJobParameters,
+            roles=frozenset({"Study.Read"}),
+            max_concurrency=2,
+            description="Builds the Detailed SoA of a study as an XLSX document",
+        ),
+        JobType(
+            name="odm-document",
+            run=_odm_document,
+            parameters_model=OdmDocumentJobParameters,
+            roles=frozenset({"Library.Read"}),
+            description="Exports ODM elements as an ODM XML or PDF document",
+        ),
+        JobType(
+            name="usdm",
+            run=_usdm,
+            parameters_model=StudyJobParameters,
+            roles=frozenset({"Study.Read"}),
+            max_concurrency=2,
+            description="Maps a study to the USDM model",
+        ),
+        JobType(
+            name="ct-package-changes",
+            run=_ct_package_changes,
+            parameters_model=CTPackageChangesJobParameters,
+            roles=frozenset({"Library.Read"}),
+            description="Compares two CT packages of a catalogue",
+        ),
+    ]
+}
+
+
+class _JobAuth(Auth):
+    """Authentication of a job: the user who submitted it, without their tokens"""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, job_user: User):
+        self.user = job_user
+
+
+@contextlib.contextmanager
+def run_as(job: Job) -> Iterator[None]:
+    """
+    Runs a job on behalf of the user who submitted it, as if in their request.
+
+    The roles of the user are looked up when the job starts, not taken from the job,
+    so a queued job can't use roles which were revoked meanwhile.
+    """
+
+    owner = UserRepository().get_user(job.owner["id"])
+    if owner is None:
+        # fails the job, there is no user whose roles it could run with
+        raise NotFoundException(
+            msg=f"User '{job.owner['id']}' who submitted the job doesn't exist anymore."
+        )
+    job_user = User(
+        sub=job.owner.get("sub"),
+        azp=owner.azp,
+        oid=owner.oid,
+        name=owner.name,
+        username=owner.username,
+        email=owner.email,
+        roles=set(owner.roles),
+    )
+    job_type = JOB_TYPES.get(job.type)
+    if settings.oauth_rbac_enabled and job_type is not None and job_type.roles:
+        job_user.authorize(*job_type.roles)
+    with request_cycle_context({"auth": _JobAuth(job_user)}):
+        yield
+
+
+def start_job_runner() -> JobRunner:
+    return _start_job_runner(JOB_TYPES, run_as=run_as)
+
+
+class JobService:
+    def __init__(self) -> None:
+        self.runner = start_job_runner()
+
+    def get_job_types(self) -> list[JobTypeModel]:
+        return [
+            JobTypeModel(
+                name=job_type.name,
+                description=job_type.description,
+                roles=sorted(job_type.roles),
+                max_concurrency=self.runner.max_concurrency[job_type.name],
+                cancellable=job_type.cancellable,
+                parameters_schema=(
+                    job_type.parameters_model.model_json_schema()
+                    if job_type.parameters_model
+                    else None
+                ),
+            )
+            for job_type in JOB_TYPES.values()
+        ]
+
+    def _get_job(self, uid: str) -> Job:
+        job = self.runner.queue.get(uid)
+        # jobs of other users are not disclosed
+        if job is None or job.owner.get("id") != user().id():
+            raise NotFoundException("Job", uid)
+        return job
+
+    def get_all_jobs(self) -> list[JobModel]:
+        return [JobModel.from_job(job) for job in self.runner.queue.find(user().id())]
+
+    def get_job(self, uid: str) -> JobModel:
+        return JobModel.from_job(self._get_job(uid))
+
+    def submit_job(self, job_input: JobInput) -> JobModel:
+        job_type = JOB_TYPES.get(job_input.type)
+        ValidationException.raise_if(
+            job_type is None,
+            msg=f"Job type '{job_input.type}' doesn't exist, possible types are: {sorted(JOB_TYPES)}.",
+        )
+        if settings.oauth_rbac_enabled and job_type.roles:
+            user().authorize(*job_type.roles)
+        # fail early on invalid parameters, the job validates them again when it runs
+        job_type.validate_parameters(job_input.parameters)
+
+        current_user = user()
+        job = Job(
+            uid=f"Job_{os.urandom(12).hex()}",
+            type=job_type.name,
+            parameters=job_input.parameters,
+            owner={
+                "id": current_user.id(),
+                "sub": current_user.sub,
+                "azp": current_user.azp,
+                "oid": current_user.oid,
+                "name": current_user.name,
+                "username": current_user.username,
+                "email": current_user.email,
+            },
+        )
+        self.runner.queue.add(job)
+        self.runner.wake()
+        return JobModel.from_job(job)
+
+    def cancel_job(self, uid: str) -> JobModel:
+        job_type = JOB_TYPES.get(self._get_job(uid).type)
+        cancellable = job_type is None or job_type.cancellable
+        job = self.runner.queue.request_cancel(uid, cancel_running=cancellable)
+        ValidationException.raise_if(
+            job is not None and job.status == JobStatus.RUNNING and not cancellable,
+            msg=f"Job '{uid}' of type '{job_type.name}' can't be cancelled once started.",
+        )
+        return JobModel.from_job(job)
+
+    def get_job_result(self, uid: str) -> tuple[JobModel, bytes]:
+        """Returns a succeeded job and its result"""
+
+        job = self._get_job(uid)
+        ValidationException.raise_if(
+            job.status != JobStatus.SUCCEEDED,
+            msg=f"Job '{uid}' has no result, its status is '{job.status.value}'.",
+        )
+        content = self.runner.queue.get_result(uid)
+        if content is None:
+            raise NotFoundException(msg=f"The result of job '{uid}' was deleted.")
+        return JobModel.from_job(job), content
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable
 
 from neomodel import db
 
@@ -11,15 +11,63 @@ from clinical_mdr_api.models.listings.listings_sdtm import (
     StudySummaryListing,
     StudyVisitListing,
 )
-from clinical_mdr_api.models.utils import GenericFilteringReturn
+from clinical_mdr_api.models.utils import BaseModel, GenericFilteringReturn
 from clinical_mdr_api.repositories._utils import FilterOperator
-from clinical_mdr_api.services._utils import service_level_generic_filtering
+from clinical_mdr_api.services._utils import (
+    is_database_filterable,
+    service_level_generic_filtering,
+)
 
 
 class SDTMListingsService:
+    # Listing columns that are converted to strings by `from_query`,
+    # they can't be filtered or sorted on in the database
+    CONVERTED_FIELDS = frozenset({"TAETORD", "ETCD", "TSVAL"})
+
     def __init__(self):
         self._query_service = QueryService()
 
+    def _list(
+        self,
+        get_listing: Callable[..., GenericFilteringReturn],
+        model: type[BaseModel],
+        study_uid: str,
+        sort_by: dict[str, bool] | None,
+        page_number: int,
+        page_size: int,
+        filter_by: dict[str, dict[str, Any]] | None,
+        filter_operator: FilterOperator,
+        total_count: bool,
+        study_value_version: str | None,
+    ) -> GenericFilteringReturn:
+        db_fields = frozenset(model.model_fields) - self.CONVERTED_FIELDS
+        if is_database_filterable(db_fields, filter_by, sort_by):
+            data = get_listing(
+                study_uid=study_uid,
+                study_value_version=study_value_version,
+                sort_by=sort_by,
+                page_number=page_number,
+                page_size=page_size,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
+            data.items = list(map(model.from_query, data.items))
+            return data
+
+        data = get_listing(study_uid=study_uid, study_value_version=study_value_version)
+        result = list(map(model.from_query, data.items))
+
+        return service_level_generic_filtering(
+            items=result,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            sort_by=sort_by,
+            total_count=total_count,
+            page_number=page_number,
+            page_size=page_size,
+        )
+
     @db.transaction
     def list_tv(
         self,
@@ -32,19 +80,17 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyVisitListing]:
-        data = self._query_service.get_tv(
-            study_uid=study_uid, study_value_version=study_value_version
-        )
-        result = list(map(StudyVisitListing.from_query, data))
-
-        return service_level_generic_filtering(
-            items=result,
-            filter_by=filter_by,
-            filter_operator=filter_operator,
+        return self._list(
+            self._query_service.get_tv,
+            StudyVisitListing,
+            study_uid=study_uid,
             sort_by=sort_by,
-            total_count=total_count,
             page_number=page_number,
             page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
+            study_value_version=study_value_version,
         )
 
     @db.transaction
@@ -59,19 +105,17 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyArmListing]:
-        data = self._query_service.get_ta(
-            study_uid=study_uid, study_value_version=study_value_version
-        )
-        result = list(map(StudyArmListing.from_query, data))
-
-        return service_level_generic_filtering(
-            items=result,
-            filter_by=filter_by,
-            filter_operator=filter_operator,
+        return self._list(
+            self._query_service.get_ta,
+            StudyArmListing,
+            study_uid=study_uid,
             sort_by=sort_by,
-            total_count=total_count,
             page_number=page_number,
             page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
+            study_value_version=study_value_version,
         )
 
     @db.transaction
@@ -86,19 +130,17 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyCriterionListing]:
-        data = self._query_service.get_ti(
-            study_uid=study_uid, study_value_version=study_value_version
-        )
-        result = list(map(StudyCriterionListing.from_query, data))
-
-        return service_level_generic_filtering(
-            items=result,
-            filter_by=filter_by,
-            filter_operator=filter_operator,
+        return self._list(
+            self._query_service.get_ti,
+            StudyCriterionListing,
+            study_uid=study_uid,
             sort_by=sort_by,
-            total_count=total_count,
             page_number=page_number,
             page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
+            study_value_version=study_value_version,
         )
 
     @db.transaction
@@ -113,19 +155,17 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudySummaryListing]:
-        data = self._query_service.get_ts(
-            study_uid=study_uid, study_value_version=study_value_version
-        )
-        result = list(map(StudySummaryListing.from_query, data))
-
-        return service_level_generic_filtering(
-            items=result,
-            filter_by=filter_by,
-            filter_operator=filter_operator,
+        return self._list(
+            self._query_service.get_ts,
+            StudySummaryListing,
+            study_uid=study_uid,
             sort_by=sort_by,
-            total_count=total_count,
             page_number=page_number,
             page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
+            study_value_version=study_value_version,
         )
 
     @db.transaction
@@ -140,19 +180,17 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyElementListing]:
-        data = self._query_service.get_te(
-            study_uid=study_uid, study_value_version=study_value_version
-        )
-        result = list(map(StudyElementListing.from_query, data))
-
-        return service_level_generic_filtering(
-            items=result,
-            filter_by=filter_by,
-            filter_operator=filter_operator,
+        return self._list(
+            self._query_service.get_te,
+            StudyElementListing,
+            study_uid=study_uid,
             sort_by=sort_by,
-            total_count=total_count,
             page_number=page_number,
             page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
+            study_value_version=study_value_version,
         )
 
     @db.transaction
@@ -167,17 +205,15 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyDiseaseMilestoneListing]:
-        data = self._query_service.get_tdm(
-            study_uid=study_uid, study_value_version=study_value_version
-        )
-        result = list(map(StudyDiseaseMilestoneListing.from_query, data))
-
-        return service_level_generic_filtering(
-            items=result,
-            filter_by=filter_by,
-            filter_operator=filter_operator,
+        return self._list(
+            self._query_service.get_tdm,
+            StudyDiseaseMilestoneListing,
+            study_uid=study_uid,
             sort_by=sort_by,
-            total_count=total_count,
             page_number=page_number,
             page_size=page_size,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            total_count=total_count,
+            study_value_version=study_value_version,
         )
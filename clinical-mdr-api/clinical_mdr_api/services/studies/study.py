@@ -81,6 +81,7 @@ from clinical_mdr_api.services._utils import (  # type: ignore
     filter_base_model_using_fields_directive,
     get_term_uid_or_none,
     get_unit_def_uid_or_none,
+    is_database_filterable,
     service_level_generic_filtering,
     service_level_generic_header_filtering,
 )
@@ -126,6 +127,19 @@ def validate_if_study_is_not_locked(
 class StudyService:
     _repos: MetaRepository
 
+    # CompactStudy fields that can be filtered and sorted on in the database,
+    # the remaining ones are derived here and fall back to service level filtering
+    COMPACT_STUDY_DB_FIELDS = frozenset(
+        {
+            "uid",
+            "study_subpart_uids",
+            "current_metadata.identification_metadata",
+            "current_metadata.study_description",
+            "current_metadata.version_metadata.study_status",
+            "current_metadata.version_metadata.version_author",
+        }
+    )
+
     def __init__(self):
         self.author_id = user().id()
         self._repos = MetaRepository(self.author_id)
@@ -468,8 +482,21 @@ class StudyService:
 
         return dt
 
-    @db.transaction
     def lock(self, uid: str, change_description: str) -> Study:
+        # avoid circular imports
+        from clinical_mdr_api.services.studies.study_artifacts import (
+            StudyArtifactService,
+        )
+
+        study = self._lock(uid=uid, change_description=change_description)
+        # the locked version is committed, render its documents ahead of the first download
+        StudyArtifactService.schedule_prerender(
+            uid, str(study.current_metadata.version_metadata.version_number)
+        )
+        return study
+
+    @db.transaction
+    def _lock(self, uid: str, change_description: str) -> Study:
         # avoid circular imports
         from clinical_mdr_api.services.studies.study_flowchart import (
             StudyFlowchartService,
@@ -866,39 +893,52 @@ class StudyService:
         deleted: bool = False,
     ) -> GenericFilteringReturn[CompactStudy]:
         try:
-            # Note that for this endpoint, we have to override the generic filtering
-            # Some transformation logic is happening from an aggregated object to the pydantic return model
-            # This logic prevents us from doing the filtering, sorting, and pagination on the Cypher side
-            # Consequently, this has to be done here in the service layer
-            all_items = self._repos.study_definition_repository.find_all(
+            if not sort_by:
+                sort_by = {"uid": True}
+
+            # The study list is read in the shape of CompactStudy so that filtering, sorting and
+            # pagination are done in the database, unless they refer to fields derived here
+            database_filterable = is_database_filterable(
+                self.COMPACT_STUDY_DB_FIELDS, filter_by, sort_by
+            )
+            projections = self._repos.study_definition_repository.find_compact_studies(
                 has_study_footnote=has_study_footnote,
                 has_study_objective=has_study_objective,
                 has_study_endpoint=has_study_endpoint,
                 has_study_criteria=has_study_criteria,
                 has_study_activity=has_study_activity,
                 has_study_activity_instruction=has_study_activity_instruction,
-                sort_by={},
-                total_count=False,
-                filter_by={},
+                sort_by=sort_by if database_filterable else None,
+                page_number=page_number if database_filterable else 1,
+                page_size=page_size if database_filterable else 0,
+                filter_by=filter_by if database_filterable else None,
+                filter_operator=filter_operator,
+                total_count=total_count and database_filterable,
                 deleted=deleted,
             )
 
-            if not sort_by:
-                sort_by = {"uid": True}
-
-            # then prepare and return response of our service
+            # a parent part is shared by all of its subparts
+            find_study_parent_part_by_uid = functools.cache(
+                self._repos.study_definition_repository.find_by_uid
+            )
             parsed_items = [
-                self._models_compact_study_from_study_definition_ar(
-                    study_definition_ar=item,
-                    find_project_by_project_number=self._repos.project_repository.find_by_project_number,
-                    find_clinical_programme_by_uid=self._repos.clinical_programme_repository.find_by_uid,
-                    find_study_parent_part_by_uid=self._repos.study_definition_repository.find_by_uid,
+                self.filter_result_by_requested_fields(
+                    CompactStudy.from_projection(
+                        projection=item,
+                        find_study_parent_part_by_uid=find_study_parent_part_by_uid,
+                        find_term_by_uids=lambda _: None,
+                    ),
                     include_sections=include_sections,
                     exclude_sections=exclude_sections,
                 )
-                for item in all_items.items
+                for item in projections.items
             ]
 
+            if database_filterable:
+                return GenericFilteringReturn(
+                    items=parsed_items, total=projections.total
+                )
+
             # Do filtering, sorting, pagination and count
             filtered_items = service_level_generic_filtering(
                 items=parsed_items,
@@ -28,10 +28,7 @@ from clinical_mdr_api.models.study_selections.study_selection import (
 from clinical_mdr_api.models.utils import GenericFilteringReturn
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.services._meta_repository import MetaRepository
-from clinical_mdr_api.services._utils import (
-    ensure_transaction,
-    service_level_generic_filtering,
-)
+from clinical_mdr_api.services._utils import ensure_transaction
 from clinical_mdr_api.services.studies.study_selection_base import StudySelectionMixin
 from clinical_mdr_api.services.syntax_instances.activity_instructions import (
     ActivityInstructionService,
@@ -58,27 +55,18 @@ class StudyActivityInstructionService(StudySelectionMixin):
         filter_operator: FilterOperator = FilterOperator.AND,
         total_count: bool = False,
     ) -> GenericFilteringReturn[StudyActivityInstruction]:
-        query = StudyActivityInstructionNeoModel.nodes.fetch_relations(
-            "study_value__latest_value",
-            "study_activity",
-            "activity_instruction_value__activity_instruction_root",
-            "has_after__audit_trail",
-        )
-        items = [
-            StudyActivityInstruction.model_validate(sai_node)
-            for sai_node in ListDistinct(query.resolve_subgraph()).distinct()
-        ]
-
-        # Do filtering, sorting, pagination and count
-        return service_level_generic_filtering(
-            items=items,
-            filter_by=filter_by,
-            filter_operator=filter_operator,
-            sort_by=sort_by,
-            total_count=total_count,
-            page_number=page_number,
-            page_size=page_size,
+        # Filtering, sorting, pagination and count are done in the database
+        items, total = (
+            self._repos.study_activity_instruction_repository.find_all_for_all_studies(
+                sort_by=sort_by,
+                page_number=page_number,
+                page_size=page_size,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
         )
+        return GenericFilteringReturn(items=items, total=total)
 
     @db.transaction
     def get_all_instructions(
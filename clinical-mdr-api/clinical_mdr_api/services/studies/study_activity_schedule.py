@@ -7,6 +7,7 @@ from clinical_mdr_api.domain_repositories._utils.helpers import (
     acquire_write_lock_study_value,
 )
 from clinical_mdr_api.domain_repositories.models._utils import ListDistinct
+from clinical_mdr_api.domain_repositories.models.study import StudyRoot
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivitySchedule as StudyActivityScheduleNeoModel,
 )
@@ -22,6 +23,7 @@ from clinical_mdr_api.models.study_selections.study_selection import (
     StudyActivityScheduleBatchInput,
     StudyActivityScheduleBatchOutput,
     StudyActivityScheduleCreateInput,
+    StudyActivityScheduleDeleteInput,
     StudyActivityScheduleHistory,
     StudySelectionActivityInstanceEditInput,
 )
@@ -235,40 +237,161 @@ class StudyActivityScheduleService(StudySelectionMixin):
         finally:
             repos.close()
 
+    @staticmethod
+    def _batch_error(
+        error: exceptions.MDRApiBaseException,
+    ) -> StudyActivityScheduleBatchOutput:
+        return StudyActivityScheduleBatchOutput.model_construct(
+            response_code=error.status_code,
+            content=BatchErrorResponse(message=str(error)),
+        )
+
     @ensure_transaction(db)
     def handle_batch_operations(
         self,
         study_uid: str,
         operations: list[StudyActivityScheduleBatchInput],
     ) -> list[StudyActivityScheduleBatchOutput]:
-        results = []
-        for operation in operations:
-            item = None
+        """
+        Creates and deletes study activity schedules in bulk, returning one result per operation.
+
+        All operations are validated up front, with the same outcome as running them one by one in the given order.
+        Valid schedules and their audit trail are then written with one query for all deletions and one for all creations.
+        Deleting a schedule whose visit is a baseline visit of a study activity instance goes through `delete`,
+        which also updates the study activity instance.
+        """
+        results: list[StudyActivityScheduleBatchOutput | None] = [None] * len(
+            operations
+        )
+        creates: dict[int, tuple[str, str]] = {}
+        deletes: dict[int, str] = {}
+        for index, operation in enumerate(operations):
             try:
                 if operation.method == "POST":
-                    if isinstance(operation.content, StudyActivityScheduleCreateInput):
-                        item = self.create(study_uid, operation.content)
-                        response_code = status.HTTP_201_CREATED
-                    else:
+                    if not isinstance(
+                        operation.content, StudyActivityScheduleCreateInput
+                    ):
                         raise exceptions.ValidationException(
                             msg="POST operation requires StudyActivityScheduleCreateInput as request payload."
                         )
-
+                    creates[index] = (
+                        operation.content.study_activity_uid,
+                        operation.content.study_visit_uid,
+                    )
                 elif operation.method == "DELETE":
-                    self.delete(study_uid, operation.content.uid)
-                    response_code = status.HTTP_204_NO_CONTENT
+                    if not isinstance(
+                        operation.content, StudyActivityScheduleDeleteInput
+                    ):
+                        raise exceptions.ValidationException(
+                            msg="DELETE operation requires StudyActivityScheduleDeleteInput as request payload."
+                        )
+                    deletes[index] = operation.content.uid
                 else:
                     raise exceptions.MethodNotAllowedException(method=operation.method)
-                results.append(
-                    StudyActivityScheduleBatchOutput(
-                        response_code=response_code, content=item
-                    )
+            except exceptions.MDRApiBaseException as error:
+                results[index] = self._batch_error(error)
+
+        if not creates and not deletes:
+            return results  # type: ignore[return-value]
+
+        acquire_write_lock_study_value(study_uid)
+        if StudyRoot.nodes.get_or_none(uid=study_uid) is None:
+            error = exceptions.NotFoundException("Study", study_uid)
+            for index in [*creates, *deletes]:
+                results[index] = self._batch_error(error)
+            return results  # type: ignore[return-value]
+
+        repository = self._repos.study_activity_schedule_repository
+
+        # Validate deletions, in order
+        schedules = repository.get_schedules_for_bulk_delete(
+            study_uid, list(deletes.values())
+        )
+        deleted_at: dict[str, int] = {}
+        bulk_deletes: list[str] = []
+        baseline_deletes: list[tuple[int, str]] = []
+        for index, schedule_uid in deletes.items():
+            schedule = schedules.get(schedule_uid)
+            try:
+                exceptions.NotFoundException.raise_if(
+                    schedule is None or schedule_uid in deleted_at,
+                    "Study Activity Schedule",
+                    schedule_uid,
+                )
+                exceptions.NotFoundException.raise_if_not(
+                    schedule["activity_exists"],  # type: ignore[index]
+                    "Study Activity",
+                    schedule["study_activity_uid"],  # type: ignore[index]
+                )
+                exceptions.NotFoundException.raise_if_not(
+                    schedule["visit_exists"],  # type: ignore[index]
+                    "Study Visit",
+                    schedule["study_visit_uid"],  # type: ignore[index]
                 )
             except exceptions.MDRApiBaseException as error:
-                results.append(
-                    StudyActivityScheduleBatchOutput.model_construct(
-                        response_code=error.status_code,
-                        content=BatchErrorResponse(message=str(error)),
-                    )
+                results[index] = self._batch_error(error)
+                continue
+
+            deleted_at[schedule_uid] = index
+            if schedule["is_baseline"]:  # type: ignore[index]
+                baseline_deletes.append((index, schedule_uid))
+            else:
+                bulk_deletes.append(schedule_uid)
+                results[index] = StudyActivityScheduleBatchOutput(
+                    response_code=status.HTTP_204_NO_CONTENT, content=None
+                )
+
+        # Validate creations, in order
+        pairs = repository.get_schedule_pairs_for_bulk_create(
+            study_uid, list(creates.values())
+        )
+        created_pairs: set[tuple[str, str]] = set()
+        bulk_creates: list[tuple[int, tuple[str, str]]] = []
+        for index, pair in creates.items():
+            activity_exists, visit_exists, schedule_uids = pairs.get(
+                pair, (False, False, [])
+            )
+            try:
+                exceptions.BusinessLogicException.raise_if(
+                    pair in created_pairs
+                    or any(
+                        deleted_at.get(schedule_uid, index) >= index
+                        for schedule_uid in schedule_uids
+                    ),
+                    msg=f"There already exist a schedule for the same Activity and Visit in the Study with UID '{study_uid}'",
+                )
+                exceptions.NotFoundException.raise_if_not(
+                    activity_exists, "Study Activity", pair[0]
+                )
+                exceptions.NotFoundException.raise_if_not(
+                    visit_exists, "Study Visit", pair[1]
+                )
+            except exceptions.MDRApiBaseException as error:
+                results[index] = self._batch_error(error)
+                continue
+
+            created_pairs.add(pair)
+            bulk_creates.append((index, pair))
+
+        # Write
+        for index, schedule_uid in baseline_deletes:
+            try:
+                self.delete(study_uid, schedule_uid)
+                results[index] = StudyActivityScheduleBatchOutput(
+                    response_code=status.HTTP_204_NO_CONTENT, content=None
                 )
-        return results
+            except exceptions.MDRApiBaseException as error:
+                results[index] = self._batch_error(error)
+
+        repository.bulk_delete(study_uid, bulk_deletes, self.author)
+
+        schedule_vos = repository.bulk_create(
+            study_uid, [pair for _, pair in bulk_creates], self.author
+        )
+        for (index, _), schedule_vo in zip(bulk_creates, schedule_vos):
+            results[index] = StudyActivityScheduleBatchOutput(
+                response_code=status.HTTP_201_CREATED,
+                content=StudyActivitySchedule.from_vo(schedule_vo),
+            )
+
+        return results  # type: ignore[return-value]
@@ -52,7 +52,7 @@ from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_selection import (
     DetailedSoAHistory,
     StudyActivityReplaceActivityInput,
-    StudyActivityScheduleCreateInput,
+    StudyActivityScheduleBatchInput,
     StudyActivitySyncLatestVersionInput,
     StudySelectionActivity,
     StudySelectionActivityBatchInput,
@@ -1799,15 +1799,42 @@ class StudyActivitySelectionService(
         study_uid: str,
         operations: list[StudySoAEditBatchInput],
     ) -> list[StudySoAEditBatchOutput]:
+        """
+        Applies a batch of SoA edits, returning one result per operation.
+
+        Consecutive study activity schedule operations are written together by the bulk path of
+        `StudyActivityScheduleService.handle_batch_operations`, study activity operations run one by one
+        in between, so the operations still take effect in the given order.
+        """
         study_activity_schedules_service = StudyActivityScheduleService()
-        results = []
+        results: list[StudySoAEditBatchOutput] = []
+        schedule_operations: list[StudyActivityScheduleBatchInput] = []
+
+        def _write_schedules():
+            if not schedule_operations:
+                return
+            results.extend(
+                StudySoAEditBatchOutput.model_construct(
+                    response_code=result.response_code, content=result.content
+                )
+                for result in study_activity_schedules_service.handle_batch_operations(
+                    study_uid, list(schedule_operations)
+                )
+            )
+            schedule_operations.clear()
+
         for operation in operations:
+            if operation.object == SoAItemType.STUDY_ACTIVITY_SCHEDULE.value:
+                schedule_operations.append(
+                    StudyActivityScheduleBatchInput.model_construct(
+                        method=operation.method, content=operation.content
+                    )
+                )
+                continue
+            _write_schedules()
             item = None
             try:
-                if (
-                    operation.method == "PATCH"
-                    and operation.object == SoAItemType.STUDY_ACTIVITY.value
-                ):
+                if operation.method == "PATCH":
                     item = self.patch_selection(
                         study_uid,
                         operation.content.study_activity_uid,
@@ -1815,37 +1842,17 @@ class StudyActivitySelectionService(
                     )
                     response_code = status.HTTP_200_OK
                 elif operation.method == "POST":
-                    if operation.object == SoAItemType.STUDY_ACTIVITY.value:
-                        if isinstance(
-                            operation.content, StudySelectionActivityCreateInput
-                        ):
-                            item = self.make_selection(study_uid, operation.content)
-                        else:
-                            raise ValidationException(
-                                msg="POST operation requires StudySelectionActivityCreateInput as request payload."
-                            )
-                    elif operation.object == SoAItemType.STUDY_ACTIVITY_SCHEDULE.value:
-                        if isinstance(
-                            operation.content, StudyActivityScheduleCreateInput
-                        ):
-                            item = study_activity_schedules_service.create(
-                                study_uid, operation.content
-                            )
-                        else:
-                            raise ValidationException(
-                                msg="POST operation requires StudyActivityScheduleCreateInput as request payload."
-                            )
-
+                    if isinstance(operation.content, StudySelectionActivityCreateInput):
+                        item = self.make_selection(study_uid, operation.content)
+                    else:
+                        raise ValidationException(
+                            msg="POST operation requires StudySelectionActivityCreateInput as request payload."
+                        )
                     response_code = status.HTTP_201_CREATED
                 elif operation.method == "DELETE":
-                    if operation.object == SoAItemType.STUDY_ACTIVITY.value:
-                        self.delete_selection(
-                            study_uid, operation.content.study_activity_uid
-                        )
-                    elif operation.object == SoAItemType.STUDY_ACTIVITY_SCHEDULE.value:
-                        item = study_activity_schedules_service.delete(
-                            study_uid, operation.content.uid
-                        )
+                    self.delete_selection(
+                        study_uid, operation.content.study_activity_uid
+                    )
                     response_code = status.HTTP_204_NO_CONTENT
                 else:
                     raise MethodNotAllowedException(method=operation.method)
@@ -1859,6 +1866,7 @@ class StudyActivitySelectionService(
                         content=BatchErrorResponse(message=str(error)),
                     )
                 )
+        _write_schedules()
         return results
 
     @ensure_transaction(db)
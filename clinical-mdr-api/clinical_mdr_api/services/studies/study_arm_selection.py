@@ -12,7 +12,6 @@ from clinical_mdr_api.domains.study_selections.study_selection_arm import (
     StudySelectionArmVO,
 )
 from clinical_mdr_api.models.controlled_terminologies.ct_term import SimpleTermModel
-from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_selection import (
     CompactStudyArm,
     StudySelectionArm,
@@ -31,10 +30,14 @@ from clinical_mdr_api.services._utils import (
     calculate_diffs,
     ensure_transaction,
     fill_missing_values_in_base_model_from_reference_base_model,
+    is_database_filterable,
     service_level_generic_filtering,
     service_level_generic_header_filtering,
 )
-from clinical_mdr_api.services.studies.study_selection_base import StudySelectionMixin
+from clinical_mdr_api.services.studies.study_selection_base import (
+    StudySelectionBatchOperation,
+    StudySelectionMixin,
+)
 from common import exceptions
 from common.auth.user import user
 
@@ -42,6 +45,26 @@ from common.auth.user import user
 class StudyArmSelectionService(StudySelectionMixin):
     _repos: MetaRepository
 
+    # StudySelectionArm fields that can be filtered and sorted on in the database,
+    # the remaining ones are derived here and fall back to service level filtering
+    DB_FIELDS = frozenset(
+        {
+            "study_uid",
+            "arm_uid",
+            "name",
+            "short_name",
+            "code",
+            "description",
+            "order",
+            "randomization_group",
+            "number_of_subjects",
+            "start_date",
+            "author_username",
+            "accepted_version",
+            "merge_branch_for_this_arm_for_sdtm_adam",
+        }
+    )
+
     def __init__(self):
         self._repos = MetaRepository()
         self.author = user().id()
@@ -92,6 +115,28 @@ class StudyArmSelectionService(StudySelectionMixin):
             terms_at_specific_datetime=terms_at_specific_datetime,
         )
 
+    def _transform_page_to_response_model(
+        self,
+        page: list[tuple[StudySelectionArmVO, int]],
+        study_value_version: str | None = None,
+    ) -> list[StudySelectionArmWithConnectedBranchArms]:
+        terms_at_specific_datetimes = self._extract_studies_standards_effective_dates(
+            study_uids={selection.study_uid for selection, _ in page},
+            study_value_version=study_value_version,
+        )
+        return [
+            self._transform_single_to_response_model(
+                selection,
+                order=order,
+                study_uid=selection.study_uid,
+                study_value_version=study_value_version,
+                terms_at_specific_datetime=terms_at_specific_datetimes[
+                    selection.study_uid
+                ],
+            )
+            for selection, order in page
+        ]
+
     def get_all_selections_for_all_studies(
         self,
         project_name: str | None = None,
@@ -104,6 +149,21 @@ class StudyArmSelectionService(StudySelectionMixin):
         total_count: bool = False,
     ) -> GenericFilteringReturn[StudySelectionArmWithConnectedBranchArms]:
         repos = self._repos
+        if is_database_filterable(self.DB_FIELDS, filter_by, sort_by):
+            page, total = repos.study_arm_repository.find_selections_page(
+                project_name=project_name,
+                project_number=project_number,
+                sort_by=sort_by,
+                page_number=page_number,
+                page_size=page_size,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
+            return GenericFilteringReturn(
+                items=self._transform_page_to_response_model(page), total=total
+            )
+
         arm_selection_ars = repos.study_arm_repository.find_all(
             project_name=project_name,
             project_number=project_number,
@@ -194,6 +254,24 @@ class StudyArmSelectionService(StudySelectionMixin):
     ) -> GenericFilteringReturn[StudySelectionArmWithConnectedBranchArms]:
         repos = MetaRepository()
         try:
+            if is_database_filterable(self.DB_FIELDS, filter_by, sort_by):
+                page, total = repos.study_arm_repository.find_selections_page(
+                    study_uid=study_uid,
+                    study_value_version=study_value_version,
+                    sort_by=sort_by,
+                    page_number=page_number,
+                    page_size=page_size,
+                    filter_by=filter_by,
+                    filter_operator=filter_operator,
+                    total_count=total_count,
+                )
+                return GenericFilteringReturn(
+                    items=self._transform_page_to_response_model(
+                        page, study_value_version=study_value_version
+                    ),
+                    total=total,
+                )
+
             arm_selection_ar = repos.study_arm_repository.find_by_study(
                 study_uid, study_value_version=study_value_version
             )
@@ -502,6 +580,54 @@ class StudyArmSelectionService(StudySelectionMixin):
             uid, self._repos.ct_term_name_repository.find_by_uid
         )
 
+    def _add_arm_to_aggregate(
+        self,
+        selection_aggregate: StudySelectionArmAR,
+        selection_create_input: StudySelectionArmCreateInput,
+        validate: bool = True,
+    ) -> str:
+        # create new VO to add
+        new_selection = StudySelectionArmVO.from_input_values(
+            study_uid=selection_aggregate.study_uid,
+            author_id=self.author,
+            name=selection_create_input.name,
+            short_name=selection_create_input.short_name,
+            code=selection_create_input.code,
+            description=selection_create_input.description,
+            randomization_group=selection_create_input.randomization_group,
+            number_of_subjects=selection_create_input.number_of_subjects,
+            arm_type_uid=selection_create_input.arm_type_uid,
+            merge_branch_for_this_arm_for_sdtm_adam=selection_create_input.merge_branch_for_this_arm_for_sdtm_adam,
+            generate_uid_callback=self._repos.study_arm_repository.generate_uid,
+        )
+        # add VO to aggregate
+        selection_aggregate.add_arm_selection(
+            new_selection,
+            self._repos.ct_term_name_repository.term_specific_exists_by_uid,
+            arm_exists_callback_by=self._repos.study_arm_repository.arm_exists_by,
+            validate=validate,
+        )
+        return new_selection.study_selection_uid
+
+    def _transform_created_arm(
+        self,
+        selection_aggregate: StudySelectionArmAR,
+        study_selection_uid: str,
+        terms_at_specific_datetime: datetime | None,
+    ) -> StudySelectionArm:
+        # Fetch the new selection which was just added
+        new_selection, order = selection_aggregate.get_specific_arm_selection(
+            study_selection_uid
+        )
+        # StudyArm without connected BranchArms not make sense that has BranchArms yet
+        return StudySelectionArm.from_study_selection_arm_ar_and_order(
+            study_uid=selection_aggregate.study_uid,
+            selection=new_selection,
+            order=order,
+            find_codelist_term_arm_type=self._repos.ct_codelist_name_repository.get_codelist_term_by_uid_and_submval,
+            terms_at_specific_datetime=terms_at_specific_datetime,
+        )
+
     @ensure_transaction(db)
     def make_selection(
         self,
@@ -512,20 +638,6 @@ class StudyArmSelectionService(StudySelectionMixin):
         repos = self._repos
 
         try:
-            # create new VO to add
-            new_selection = StudySelectionArmVO.from_input_values(
-                study_uid=study_uid,
-                author_id=self.author,
-                name=selection_create_input.name,
-                short_name=selection_create_input.short_name,
-                code=selection_create_input.code,
-                description=selection_create_input.description,
-                randomization_group=selection_create_input.randomization_group,
-                number_of_subjects=selection_create_input.number_of_subjects,
-                arm_type_uid=selection_create_input.arm_type_uid,
-                merge_branch_for_this_arm_for_sdtm_adam=selection_create_input.merge_branch_for_this_arm_for_sdtm_adam,
-                generate_uid_callback=repos.study_arm_repository.generate_uid,
-            )
             # Load aggregate
             selection_aggregate: StudySelectionArmAR = (
                 repos.study_arm_repository.find_by_study(
@@ -533,32 +645,19 @@ class StudyArmSelectionService(StudySelectionMixin):
                 )
             )
             assert selection_aggregate is not None
-            # add VO to aggregate
-            selection_aggregate.add_arm_selection(
-                new_selection,
-                self._repos.ct_term_name_repository.term_specific_exists_by_uid,
-                arm_exists_callback_by=repos.study_arm_repository.arm_exists_by,
-                validate=validate,
+            study_selection_uid = self._add_arm_to_aggregate(
+                selection_aggregate, selection_create_input, validate=validate
             )
 
             # sync with DB and save the update
             repos.study_arm_repository.save(selection_aggregate, self.author)
 
-            # Fetch the new selection which was just added
-            new_selection, order = selection_aggregate.get_specific_arm_selection(
-                new_selection.study_selection_uid
-            )
             terms_at_specific_datetime = self._extract_study_standards_effective_date(
                 study_uid=study_uid
             )
             # add the arm and return
-            # StudyArm without connected BranchArms not make sense that has BranchArms yet
-            return StudySelectionArm.from_study_selection_arm_ar_and_order(
-                study_uid=study_uid,
-                selection=new_selection,
-                order=order,
-                find_codelist_term_arm_type=self._repos.ct_codelist_name_repository.get_codelist_term_by_uid_and_submval,
-                terms_at_specific_datetime=terms_at_specific_datetime,
+            return self._transform_created_arm(
+                selection_aggregate, study_selection_uid, terms_at_specific_datetime
             )
         finally:
             repos.close()
@@ -601,6 +700,54 @@ class StudyArmSelectionService(StudySelectionMixin):
             author_id=self.author,
         )
 
+    def _patch_arm_in_aggregate(
+        self,
+        selection_aggregate: StudySelectionArmAR,
+        study_selection_uid: str,
+        selection_update_input: StudySelectionArmInput,
+        validate: bool = True,
+    ) -> bool:
+        # Load the current VO for updates
+        current_vo, _ = selection_aggregate.get_specific_object_selection(
+            study_selection_uid=study_selection_uid
+        )
+
+        # merge current with updates
+        updated_selection = self._patch_prepare_new_study_arm(
+            request_study_arm=selection_update_input, current_study_arm=current_vo
+        )
+
+        if updated_selection == current_vo:
+            return False
+
+        # let the aggregate update the value object
+        selection_aggregate.update_selection(
+            updated_study_arm_selection=updated_selection,
+            ct_term_exists_callback=self._repos.ct_term_name_repository.term_specific_exists_by_uid,
+            arm_exists_callback_by=self._repos.study_arm_repository.arm_exists_by,
+            validate=validate,
+        )
+        return True
+
+    def _transform_patched_arm(
+        self,
+        selection_aggregate: StudySelectionArmAR,
+        study_selection_uid: str,
+        terms_at_specific_datetime: datetime | None,
+    ) -> StudySelectionArmWithConnectedBranchArms:
+        selection_vo, order = selection_aggregate.get_specific_object_selection(
+            study_selection_uid
+        )
+        # With Connected BranchArms because can carry out the connected BranchARms
+        return StudySelectionArmWithConnectedBranchArms.from_study_selection_arm_ar__order__connected_branch_arms(
+            study_uid=selection_aggregate.study_uid,
+            selection=selection_vo,
+            order=order,
+            find_codelist_term_arm_type=self._repos.ct_codelist_name_repository.get_codelist_term_by_uid_and_submval,
+            find_multiple_connected_branch_arm=self._find_branch_arms_connected_to_arm_uid,
+            terms_at_specific_datetime=terms_at_specific_datetime,
+        )
+
     @ensure_transaction(db)
     def patch_selection(
         self,
@@ -620,51 +767,20 @@ class StudyArmSelectionService(StudySelectionMixin):
 
             assert selection_aggregate is not None
 
-            # Load the current VO for updates
-            current_vo, order = selection_aggregate.get_specific_object_selection(
-                study_selection_uid=study_selection_uid
-            )
-
-            # merge current with updates
-            updated_selection = self._patch_prepare_new_study_arm(
-                request_study_arm=selection_update_input, current_study_arm=current_vo
-            )
-
-            selection_vo: StudySelectionArmVO
-            if updated_selection != current_vo:
-                # let the aggregate update the value object
-                selection_aggregate.update_selection(
-                    updated_study_arm_selection=updated_selection,
-                    ct_term_exists_callback=self._repos.ct_term_name_repository.term_specific_exists_by_uid,
-                    arm_exists_callback_by=repos.study_arm_repository.arm_exists_by,
-                    validate=validate,
-                )
-
+            if self._patch_arm_in_aggregate(
+                selection_aggregate,
+                study_selection_uid,
+                selection_update_input,
+                validate=validate,
+            ):
                 # sync with DB and save the update
                 repos.study_arm_repository.save(selection_aggregate, self.author)
 
-                # Fetch the new selection which was just updated
-                new_selection, order = (
-                    selection_aggregate.get_specific_object_selection(
-                        study_selection_uid
-                    )
-                )
-                selection_vo = new_selection
-            else:
-                selection_vo = current_vo
-
             terms_at_specific_datetime = self._extract_study_standards_effective_date(
                 study_uid=study_uid
             )
-
-            # With Connected BranchArms because can carry out the connected BranchARms
-            return StudySelectionArmWithConnectedBranchArms.from_study_selection_arm_ar__order__connected_branch_arms(
-                study_uid=study_uid,
-                selection=selection_vo,
-                order=order,
-                find_codelist_term_arm_type=self._repos.ct_codelist_name_repository.get_codelist_term_by_uid_and_submval,
-                find_multiple_connected_branch_arm=self._find_branch_arms_connected_to_arm_uid,
-                terms_at_specific_datetime=terms_at_specific_datetime,
+            return self._transform_patched_arm(
+                selection_aggregate, study_selection_uid, terms_at_specific_datetime
             )
         finally:
             repos.close()
@@ -705,63 +821,44 @@ class StudyArmSelectionService(StudySelectionMixin):
         study_uid: str,
         operations: list[StudySelectionArmBatchInput],
     ) -> list[StudySelectionArmBatchOutput]:
-        results = []
-        try:
-            for operation in operations:
-                item: (
-                    StudySelectionArm | StudySelectionArmWithConnectedBranchArms | None
-                ) = None
-                if operation.method == "PATCH":
-                    if isinstance(operation.content, StudySelectionArmBatchUpdateInput):
-                        item = self.patch_selection(
-                            study_uid=study_uid,
-                            study_selection_uid=operation.content.arm_uid,
-                            selection_update_input=operation.content,
-                            validate=False,
-                        )
-                        response_code = status.HTTP_200_OK
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="POST operation requires StudySelectionArmBatchUpdateInput as request payload."
-                        )
-                elif operation.method == "POST":
-                    if isinstance(operation.content, StudySelectionArmCreateInput):
-                        item = self.make_selection(
-                            study_uid=study_uid,
-                            selection_create_input=operation.content,
-                            validate=False,
-                        )
-                        response_code = status.HTTP_201_CREATED
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="POST operation requires StudySelectionArmCreateInput as request payload."
-                        )
-                else:
-                    raise exceptions.MethodNotAllowedException(method=operation.method)
-                results.append(
-                    StudySelectionArmBatchOutput(
-                        response_code=response_code,
-                        content=item,
-                    )
-                )
+        repos = self._repos
 
-            # For batch operations we need to perform validation/uniqueness checks after all requests are handled
-            study_arm_ar: StudySelectionArmAR = (
-                self._repos.study_arm_repository.find_by_study(study_uid=study_uid)
+        def patch_arm(
+            selection_aggregate: StudySelectionArmAR,
+            content: StudySelectionArmBatchUpdateInput,
+        ) -> str:
+            self._patch_arm_in_aggregate(
+                selection_aggregate, content.arm_uid, content, validate=False
             )
-            modified_study_arms = {study_arm.content.arm_uid for study_arm in results}
-            for study_arm_vo in study_arm_ar.study_arms_selection:
-                if study_arm_vo.study_selection_uid in modified_study_arms:
-                    study_arm_vo.validate(
-                        self._repos.ct_term_name_repository.term_specific_exists_by_uid,
-                        arm_exists_callback_by=self._repos.study_arm_repository.arm_exists_by,
-                    )
-        except exceptions.MDRApiBaseException as error:
-            results.append(
-                StudySelectionArmBatchOutput.model_construct(
-                    response_code=error.status_code,
-                    content=BatchErrorResponse(message=str(error)),
-                )
+            return content.arm_uid
+
+        try:
+            return self._handle_selection_batch_operations(
+                study_uid=study_uid,
+                operations=operations,
+                operation_kinds={
+                    "PATCH": StudySelectionBatchOperation(
+                        input_type=StudySelectionArmBatchUpdateInput,
+                        response_code=status.HTTP_200_OK,
+                        apply=patch_arm,
+                        transform=self._transform_patched_arm,
+                    ),
+                    "POST": StudySelectionBatchOperation(
+                        input_type=StudySelectionArmCreateInput,
+                        response_code=status.HTTP_201_CREATED,
+                        apply=lambda aggregate, content: self._add_arm_to_aggregate(
+                            aggregate, content, validate=False
+                        ),
+                        transform=self._transform_created_arm,
+                    ),
+                },
+                find_by_study=repos.study_arm_repository.find_by_study,
+                save=repos.study_arm_repository.save,
+                validate_selection=lambda study_arm_vo: study_arm_vo.validate(
+                    repos.ct_term_name_repository.term_specific_exists_by_uid,
+                    arm_exists_callback_by=repos.study_arm_repository.arm_exists_by,
+                ),
+                output_model=StudySelectionArmBatchOutput,
             )
-            raise error
-        return results
+        finally:
+            repos.close()
@@ -0,0 +1,256 @@
+"""Documents of locked study versions, rendered once and served from the artifact store"""
+
+import contextvars
+import io
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable
+
+from clinical_mdr_api.domain_repositories._utils.helpers import (
+    get_library_change_marker,
+)
+from clinical_mdr_api.domain_repositories.study_definitions.study_definition_repository_impl import (
+    StudyDefinitionRepositoryImpl,
+)
+from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
+    SoALayout,
+)
+from clinical_mdr_api.services.studies.study_design_figure import (
+    StudyDesignFigureService,
+)
+from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
+from clinical_mdr_api.utils.api_version import get_api_version
+from common.artifact_store import ArtifactStore, get_artifact_store
+from common.config import settings
+from common.telemetry import trace_calls
+
+log = logging.getLogger(__name__)
+
+
+def _render_flowchart_docx(
+    study_uid: str, study_value_version: str, layout: str, time_unit: str | None
+) -> bytes:
+    return (
+        StudyFlowchartService()
+        .get_study_flowchart_docx(
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            layout=SoALayout(layout),
+            time_unit=time_unit,
+        )
+        .get_document_stream()
+        .getvalue()
+    )
+
+
+def _render_flowchart_xlsx(
+    study_uid: str, study_value_version: str, layout: str, time_unit: str | None
+) -> bytes:
+    stream = io.BytesIO()
+    StudyFlowchartService().get_study_flowchart_xlsx(
+        study_uid=study_uid,
+        study_value_version=study_value_version,
+        layout=SoALayout(layout),
+        time_unit=time_unit,
+    ).save(stream)
+    return stream.getvalue()
+
+
+def _render_detailed_soa_xlsx(
+    study_uid: str, study_value_version: str, time_unit: str | None
+) -> bytes:
+    stream = io.BytesIO()
+    StudyFlowchartService().get_detailed_soa_xlsx(
+        study_uid=study_uid,
+        study_value_version=study_value_version,
+        time_unit=time_unit,
+    ).save(stream)
+    return stream.getvalue()
+
+
+def _render_design_svg(study_uid: str, study_value_version: str) -> bytes:
+    return (
+        StudyDesignFigureService(debug=False)
+        .get_svg_document(study_uid, study_value_version=study_value_version)
+        .encode("utf-8")
+    )
+
+
+# Renderers of the artifacts by name, called with study uid, version and the parameters of the artifact.
+# The Operational SoA spreadsheet isn't one of them: its header has the time and the user of the download.
+RENDERERS: dict[str, Callable[..., bytes]] = {
+    "flowchart.docx": _render_flowchart_docx,
+    "flowchart.xlsx": _render_flowchart_xlsx,
+    "detailed-soa.xlsx": _render_detailed_soa_xlsx,
+    "design.svg": _render_design_svg,
+}
+
+# Artifacts rendered in the background when a study version gets locked, as served with default query parameters
+PRERENDERED_ARTIFACTS: list[tuple[str, dict[str, Any]]] = [
+    *(
+        (name, {"layout": layout.value, "time_unit": None})
+        for name in ("flowchart.docx", "flowchart.xlsx")
+        for layout in (SoALayout.PROTOCOL, SoALayout.DETAILED, SoALayout.OPERATIONAL)
+    ),
+    ("detailed-soa.xlsx", {"time_unit": None}),
+    ("design.svg", {}),
+]
+
+
+def artifact_key(
+    study_uid: str, study_value_version: str, name: str, params: dict[str, Any]
+) -> tuple[str, ...]:
+    """
+    Returns the store key of an artifact: API version, study, version, library change marker
+    and the name with the rendering parameters.
+
+    Documents of locked versions show the current names of library items and terms, so a change of the library
+    gives them a new key, as it gives the locked version a new change token (see `get_study_change_token`).
+    """
+
+    args = ";".join(
+        f"{key}={value}" for key, value in sorted(params.items()) if value is not None
+    )
+    return (
+        _api_version(),
+        study_uid,
+        study_value_version,
+        ":".join(str(value) for value in get_library_change_marker()),
+        f"{name};{args}" if args else name,
+    )
+
+
+@lru_cache(maxsize=1)
+def _api_version() -> str:
+    # stored documents are only valid for the code that rendered them
+    try:
+        return get_api_version()
+    except OSError:
+        return "unknown"
+
+
+class StudyArtifactService:
+    """
+    Serves the documents of locked study versions from the artifact store.
+
+    Locked versions are immutable, so their documents are rendered once per state of the library
+    (see `artifact_key`): in the background after the study is locked, or on the first download of a document
+    which wasn't pre-rendered (e.g. with a non-default time unit) or after a change of the library.
+    Documents of draft and released versions, and of all versions without a configured store, are rendered
+    by the caller.
+    """
+
+    def __init__(self, store: ArtifactStore | None = None):
+        self.store = store or get_artifact_store()
+
+    @staticmethod
+    def is_locked_version(study_uid: str, study_value_version: str | None) -> bool:
+        return bool(
+            study_value_version
+            and StudyDefinitionRepositoryImpl.check_if_study_version_is_locked(
+                study_uid=study_uid, study_value_version=study_value_version
+            )
+        )
+
+    def _get_or_render(
+        self, study_uid: str, study_value_version: str, name: str, **params
+    ) -> bytes:
+        key = artifact_key(study_uid, study_value_version, name, params)
+        if (content := self.store.get(key)) is None:
+            content = RENDERERS[name](study_uid, study_value_version, **params)
+            self.store.put(key, content)
+        return content
+
+    @trace_calls(args=[1, 2, 3], kwargs=["study_uid", "study_value_version", "name"])
+    def get_locked_version_artifact(
+        self, study_uid: str, study_value_version: str | None, name: str, **params
+    ) -> bytes | None:
+        """
+        Returns an artifact of a locked study version, rendering and storing it if needed.
+
+        Returns `None` if `study_value_version` isn't a locked version of the study or no store is configured,
+        the caller renders the document then.
+        """
+
+        if self.store is None or not self.is_locked_version(
+            study_uid, study_value_version
+        ):
+            return None
+        return self._get_or_render(study_uid, study_value_version, name, **params)
+
+    def prerender(self, study_uid: str, study_value_version: str) -> list[str]:
+        """Renders and stores all `PRERENDERED_ARTIFACTS` of a locked study version, returns the names of the failed ones"""
+
+        if self.store is None:
+            return []
+        failed = []
+        for name, params in PRERENDERED_ARTIFACTS:
+            try:
+                self._get_or_render(study_uid, study_value_version, name, **params)
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception(
+                    "Failed to pre-render %s %s of study %s version %s",
+                    name,
+                    params,
+                    study_uid,
+                    study_value_version,
+                )
+                failed.append(name)
+        log.info(
+            "Pre-rendered %d artifacts of study %s version %s",
+            len(PRERENDERED_ARTIFACTS) - len(failed),
+            study_uid,
+            study_value_version,
+        )
+        return failed
+
+    @classmethod
+    def schedule_prerender(
+        cls, study_uid: str, study_value_version: str
+    ) -> Future[list[str]] | None:
+        """
+        Pre-renders the artifacts of a newly locked study version in the background.
+
+        Call it once the lock is committed. The task runs with the context (user, tracing) of the calling request.
+        """
+
+        if (
+            get_artifact_store() is None
+            or (executor := get_prerender_executor()) is None
+        ):
+            return None
+        context = contextvars.copy_context()
+        return executor.submit(
+            context.run, lambda: cls().prerender(study_uid, study_value_version)
+        )
+
+
+_prerender_executor: ThreadPoolExecutor | None = None
+_prerender_executor_lock = threading.Lock()
+
+
+def get_prerender_executor() -> ThreadPoolExecutor | None:
+    """Returns the background executor pre-rendering artifacts, starting it if needed, `None` if pre-rendering is disabled"""
+
+    global _prerender_executor  # pylint: disable=global-statement
+    if settings.artifact_prerender_max_workers <= 0:
+        return None
+    with _prerender_executor_lock:
+        if _prerender_executor is None:
+            _prerender_executor = ThreadPoolExecutor(
+                max_workers=settings.artifact_prerender_max_workers,
+                thread_name_prefix="prerender",
+            )
+        return _prerender_executor
+
+
+def shutdown_prerender_executor() -> None:
+    """Drops queued pre-rendering, waits for running tasks and shuts the background executor down"""
+
+    global _prerender_executor  # pylint: disable=global-statement
+    with _prerender_executor_lock:
+        executor, _prerender_executor = _prerender_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
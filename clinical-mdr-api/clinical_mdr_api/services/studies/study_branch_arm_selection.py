@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 
 from fastapi import status
 from neomodel import db
@@ -12,15 +12,13 @@ from clinical_mdr_api.domains.study_selections.study_selection_branch_arm import
     StudySelectionBranchArmAR,
     StudySelectionBranchArmVO,
 )
-from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_selection import (
-    StudyDesignCellBatchInput,
-    StudyDesignCellBatchOutput,
-    StudyDesignCellEditInput,
     StudySelectionArm,
     StudySelectionBranchArm,
+    StudySelectionBranchArmBatchDeleteInput,
     StudySelectionBranchArmBatchInput,
     StudySelectionBranchArmBatchOutput,
+    StudySelectionBranchArmBatchUpdateInput,
     StudySelectionBranchArmCreateInput,
     StudySelectionBranchArmEditInput,
     StudySelectionBranchArmHistory,
@@ -35,8 +33,10 @@ from clinical_mdr_api.services._utils import (
     fill_missing_values_in_base_model_from_reference_base_model,
     service_level_generic_filtering,
 )
-from clinical_mdr_api.services.studies.study_design_cell import StudyDesignCellService
-from clinical_mdr_api.services.studies.study_selection_base import StudySelectionMixin
+from clinical_mdr_api.services.studies.study_selection_base import (
+    StudySelectionBatchOperation,
+    StudySelectionMixin,
+)
 from common import exceptions
 from common.auth.user import user
 
@@ -146,6 +146,67 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
         finally:
             repos.close()
 
+    def _remove_branch_arm_from_aggregate(
+        self,
+        selection_aggregate: StudySelectionBranchArmAR,
+        study_selection_uid: str,
+    ) -> Callable[[], None]:
+        selection_to_delete, _ = selection_aggregate.get_specific_object_selection(
+            study_selection_uid
+        )
+        # if the study_branch_arm is the last StudyBranchArm of its StudyArm root
+        last_on_arm_root = all(
+            selection.arm_root_uid != selection_to_delete.arm_root_uid
+            for selection in selection_aggregate.study_branch_arms_selection
+            if selection.study_selection_uid != study_selection_uid
+        )
+        design_cell_uids = [
+            design_cell.uid
+            for design_cell in self._repos.study_design_cell_repository.get_design_cells_connected_to_branch_arm(
+                study_uid=selection_aggregate.study_uid,
+                study_branch_arm_uid=study_selection_uid,
+            )
+        ]
+
+        # remove the connection
+        selection_aggregate.remove_branch_arm_selection(study_selection_uid)
+
+        # the connected design cells can only be moved once the branch arm is saved as removed
+        return lambda: self._cascade_deletion(
+            study_uid=selection_aggregate.study_uid,
+            arm_root_uid=selection_to_delete.arm_root_uid,
+            last_on_arm_root=last_on_arm_root,
+            design_cell_uids=design_cell_uids,
+        )
+
+    def _cascade_deletion(
+        self,
+        study_uid: str,
+        arm_root_uid: str,
+        last_on_arm_root: bool,
+        design_cell_uids: list[str],
+    ) -> None:
+        if not design_cell_uids:
+            return
+        repos = self._repos
+        design_cells_aggregate = repos.study_design_cell_repository.find_by_study(
+            study_uid, for_update=True
+        )
+        for design_cell_uid in design_cell_uids:
+            if last_on_arm_root:
+                # switch all the study designcells to the study arm root
+                design_cell, _ = design_cells_aggregate.get_specific_object_selection(
+                    design_cell_uid
+                )
+                design_cell.study_arm_uid = arm_root_uid
+                design_cell.study_branch_arm_uid = None
+            else:
+                # else the study_branch_arm is not last StudyBranchArm of its StudyArm root and we have to delete them
+                design_cells_aggregate.remove_design_cell(design_cell_uid)
+        repos.study_design_cell_repository.save_all(
+            design_cells_aggregate, self.author, allow_none_arm_branch_arm=True
+        )
+
     @ensure_transaction(db)
     def delete_selection(self, study_uid: str, study_selection_uid: str):
         repos = self._repos
@@ -154,67 +215,14 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
             branch_arm_aggregate = repos.study_branch_arm_repository.find_by_study(
                 study_uid=study_uid, for_update=True
             )
-            for selection in branch_arm_aggregate.study_branch_arms_selection:
-                if selection.study_selection_uid == study_selection_uid:
-                    selection_to_delete = selection
-
-            cascade_deletion_last_branch = False
-            # if the branch_arm has connected design cells
-            if repos.study_branch_arm_repository.branch_arm_specific_has_connected_cell(
-                study_uid=study_uid,
-                branch_arm_uid=study_selection_uid,
-            ):
-                design_cells_on_branch_arm = self._repos.study_design_cell_repository.get_design_cells_connected_to_branch_arm(
-                    study_uid=study_uid, study_branch_arm_uid=study_selection_uid
-                )
-                # if the study_branch_arm is the last StudyBranchArm of its StudyArm root
-                if repos.study_branch_arm_repository.branch_arm_specific_is_last_on_arm_root(
-                    study_uid=study_uid,
-                    # pylint: disable=possibly-used-before-assignment
-                    arm_root_uid=selection_to_delete.arm_root_uid,
-                    branch_arm_uid=study_selection_uid,
-                ):
-                    # switch all the study designcells to the study branch arm
-                    cascade_deletion_last_branch = True
-
-                # else the study_branch_arm is not last StudyBranchArm of its StudyArm root and we have to delete them
-                else:
-                    for i_design_cell in design_cells_on_branch_arm:
-                        study_design_cell = (
-                            self._repos.study_design_cell_repository.find_by_uid(
-                                study_uid=study_uid, uid=i_design_cell.uid
-                            )
-                        )
-                        self._repos.study_design_cell_repository.delete(
-                            study_uid, i_design_cell.uid, self.author
-                        )
-                        all_design_cells = self._repos.study_design_cell_repository.find_all_design_cells_by_study(
-                            study_uid
-                        )
-                        # shift one order more to fit the modified
-                        for design_cell in all_design_cells[
-                            study_design_cell.order - 1 :
-                        ]:
-                            design_cell.order -= 1
-                            self._repos.study_design_cell_repository.save(
-                                design_cell, author_id=self.author, create=False
-                            )
-
-            # remove the connection
-            branch_arm_aggregate.remove_branch_arm_selection(study_selection_uid)
+            cascade_deletion = self._remove_branch_arm_from_aggregate(
+                branch_arm_aggregate, study_selection_uid
+            )
 
             # sync with DB and save the update
             repos.study_branch_arm_repository.save(branch_arm_aggregate, self.author)
 
-            if cascade_deletion_last_branch:
-                for i_design_cell in design_cells_on_branch_arm:
-                    self._repos.study_design_cell_repository.patch_study_arm(
-                        study_uid=study_uid,
-                        design_cell_uid=i_design_cell.uid,
-                        study_arm_uid=selection_to_delete.arm_root_uid,
-                        author_id=self.author,
-                        allow_none_arm_branch_arm=True,
-                    )
+            cascade_deletion()
         finally:
             repos.close()
 
@@ -346,32 +354,90 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
         )
 
     def _cascade_creation(
-        self, study_uid: str, study_branch_arm_uid: str, study_arm_uid: str
-    ) -> list[StudyDesignCellBatchOutput]:
+        self,
+        selection_aggregate: StudySelectionBranchArmAR,
+        study_selection_uid: str,
+    ) -> None:
         repos = self._repos
-        design_cells_on_arm = (
-            repos.study_design_cell_repository.get_design_cells_connected_to_arm(
-                study_uid=study_uid, study_arm_uid=study_arm_uid
-            )
+        study_branch_arm, _ = selection_aggregate.get_specific_object_selection(
+            study_selection_uid
+        )
+        # if the studyarm has studydesigncells connected
+        # switch all the study designcells to the study branch arm
+        design_cells_aggregate = repos.study_design_cell_repository.find_by_study(
+            selection_aggregate.study_uid, for_update=True
         )
+        for design_cell in design_cells_aggregate.design_cells:
+            if (
+                design_cell.study_arm_uid == study_branch_arm.arm_root_uid
+                and design_cell.study_branch_arm_uid is None
+            ):
+                design_cell.study_arm_uid = None
+                design_cell.study_branch_arm_uid = study_selection_uid
+        repos.study_design_cell_repository.save_all(design_cells_aggregate, self.author)
 
-        inputs = [
-            StudyDesignCellBatchInput(
-                method="PATCH",
-                content=StudyDesignCellEditInput(
-                    study_design_cell_uid=i_design_cell.uid,
-                    study_branch_arm_uid=study_branch_arm_uid,
-                ),
-            )
-            for i_design_cell in design_cells_on_arm
-        ]
+    def _add_branch_arm_to_aggregate(
+        self,
+        selection_aggregate: StudySelectionBranchArmAR,
+        selection_create_input: StudySelectionBranchArmCreateInput,
+        validate: bool = True,
+    ) -> str:
+        repos = self._repos
+        # create new VO to add
+        new_selection = StudySelectionBranchArmVO.from_input_values(
+            study_uid=selection_aggregate.study_uid,
+            author_id=self.author,
+            name=selection_create_input.name,
+            short_name=selection_create_input.short_name,
+            code=selection_create_input.code,
+            description=selection_create_input.description,
+            randomization_group=selection_create_input.randomization_group,
+            number_of_subjects=selection_create_input.number_of_subjects,
+            arm_root_uid=selection_create_input.arm_uid,
+            study_cohorts=(
+                [
+                    CompactStudyCohortVO(
+                        study_cohort_uid=selection_create_input.study_cohort_uid,
+                        study_cohort_code=None,
+                        study_cohort_name=None,
+                    )
+                ]
+                if selection_create_input.study_cohort_uid
+                else []
+            ),
+            generate_uid_callback=repos.study_branch_arm_repository.generate_uid,
+        )
+        # add VO to aggregate
+        selection_aggregate.add_branch_arm_selection(
+            study_branch_arm_selection=new_selection,
+            study_branch_arm_study_arm_update_conflict_callback=(
+                repos.study_branch_arm_repository.branch_arm_arm_update_conflict
+            ),
+            study_arm_exists_callback=repos.study_arm_repository.arm_specific_exists_by_uid,
+            branch_arm_exists_callback_by=repos.study_branch_arm_repository.branch_arm_exists_by,
+            validate=validate,
+        )
+        return new_selection.study_selection_uid
 
-        design_cell_service = StudyDesignCellService()
-        design_cells_updated = design_cell_service.handle_batch_operations(
-            study_uid=study_uid, operations=inputs
+    def _transform_created_branch_arm(
+        self,
+        selection_aggregate: StudySelectionBranchArmAR,
+        study_selection_uid: str,
+        terms_at_specific_datetime: datetime | None,
+    ) -> StudySelectionBranchArm:
+        # Fetch the new selection which was just added
+        (
+            new_selection,
+            order,
+        ) = selection_aggregate.get_specific_branch_arm_selection(study_selection_uid)
+        # add the Brancharm and return
+        return StudySelectionBranchArm.from_study_selection_branch_arm_ar_and_order(
+            study_uid=selection_aggregate.study_uid,
+            selection=new_selection,
+            order=order,
+            find_simple_term_branch_arm_root_by_term_uid=self._get_specific_arm_selection,
+            terms_at_specific_datetime=terms_at_specific_datetime,
         )
-        assert len(design_cells_updated) > 0
-        return design_cells_updated
 
     @ensure_transaction(db)
     def make_selection(
@@ -383,30 +449,6 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
         repos = self._repos
 
         try:
-            # create new VO to add
-            new_selection = StudySelectionBranchArmVO.from_input_values(
-                study_uid=study_uid,
-                author_id=self.author,
-                name=selection_create_input.name,
-                short_name=selection_create_input.short_name,
-                code=selection_create_input.code,
-                description=selection_create_input.description,
-                randomization_group=selection_create_input.randomization_group,
-                number_of_subjects=selection_create_input.number_of_subjects,
-                arm_root_uid=selection_create_input.arm_uid,
-                study_cohorts=(
-                    [
-                        CompactStudyCohortVO(
-                            study_cohort_uid=selection_create_input.study_cohort_uid,
-                            study_cohort_code=None,
-                            study_cohort_name=None,
-                        )
-                    ]
-                    if selection_create_input.study_cohort_uid
-                    else []
-                ),
-                generate_uid_callback=repos.study_branch_arm_repository.generate_uid,
-            )
             # Load aggregate
             selection_aggregate: StudySelectionBranchArmAR = (
                 repos.study_branch_arm_repository.find_by_study(
@@ -414,51 +456,22 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
                 )
             )
             assert selection_aggregate is not None
-            # add VO to aggregate
-            selection_aggregate.add_branch_arm_selection(
-                study_branch_arm_selection=new_selection,
-                study_branch_arm_study_arm_update_conflict_callback=(
-                    repos.study_branch_arm_repository.branch_arm_arm_update_conflict
-                ),
-                study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
-                branch_arm_exists_callback_by=repos.study_branch_arm_repository.branch_arm_exists_by,
-                validate=validate,
+            study_selection_uid = self._add_branch_arm_to_aggregate(
+                selection_aggregate, selection_create_input, validate=validate
             )
 
             # sync with DB and save the update
             repos.study_branch_arm_repository.save(selection_aggregate, self.author)
+            self._cascade_creation(selection_aggregate, study_selection_uid)
 
-            # Fetch the new selection which was just added
-            (
-                new_selection,
-                order,
-            ) = selection_aggregate.get_specific_branch_arm_selection(
-                new_selection.study_selection_uid
-            )
             terms_at_specific_datetime = self._extract_study_standards_effective_date(
                 study_uid=study_uid
             )
-            # add the Brancharm and return
-            return StudySelectionBranchArm.from_study_selection_branch_arm_ar_and_order(
-                study_uid=study_uid,
-                selection=new_selection,
-                order=order,
-                find_simple_term_branch_arm_root_by_term_uid=self._get_specific_arm_selection,
-                terms_at_specific_datetime=terms_at_specific_datetime,
+            return self._transform_created_branch_arm(
+                selection_aggregate, study_selection_uid, terms_at_specific_datetime
             )
         finally:
             repos.close()
-            # if the studyarm has studydesigncells connected?
-            if repos.study_arm_repository.arm_specific_has_connected_cell(
-                study_uid=study_uid, arm_uid=new_selection.arm_root_uid
-            ):
-                # if it is the first study branch to be added
-                # switch all the study designcells to the study branch arm
-                self._cascade_creation(
-                    study_uid=study_uid,
-                    study_arm_uid=new_selection.arm_root_uid,
-                    study_branch_arm_uid=new_selection.study_selection_uid,
-                )
 
     def _patch_prepare_new_study_branch_arm(
         self,
@@ -515,6 +528,55 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
             author_id=self.author,
         )
 
+    def _patch_branch_arm_in_aggregate(
+        self,
+        selection_aggregate: StudySelectionBranchArmAR,
+        selection_update_input: StudySelectionBranchArmEditInput,
+        validate: bool = True,
+    ) -> bool:
+        repos = self._repos
+        # Load the current VO for updates
+        current_vo, _ = selection_aggregate.get_specific_object_selection(
+            study_selection_uid=selection_update_input.branch_arm_uid
+        )
+
+        # merge current with updates
+        updated_selection = self._patch_prepare_new_study_branch_arm(
+            request_study_branch_arm=selection_update_input,
+            current_study_branch_arm=current_vo,
+        )
+
+        if updated_selection == current_vo:
+            return False
+
+        # let the aggregate update the value object
+        selection_aggregate.update_selection(
+            updated_study_branch_arm_selection=updated_selection,
+            study_branch_arm_study_arm_update_conflict_callback=repos.study_branch_arm_repository.branch_arm_arm_update_conflict,
+            study_arm_exists_callback=repos.study_arm_repository.arm_specific_exists_by_uid,
+            branch_arm_exists_callback_by=repos.study_branch_arm_repository.branch_arm_exists_by,
+            validate=validate,
+        )
+        return True
+
+    def _transform_patched_branch_arm(
+        self,
+        selection_aggregate: StudySelectionBranchArmAR,
+        study_selection_uid: str,
+        terms_at_specific_datetime: datetime | None,
+    ) -> StudySelectionBranchArm:
+        selection_vo, order = selection_aggregate.get_specific_object_selection(
+            study_selection_uid
+        )
+        # add the branch arm and return
+        return StudySelectionBranchArm.from_study_selection_branch_arm_ar_and_order(
+            study_uid=selection_aggregate.study_uid,
+            selection=selection_vo,
+            order=order,
+            find_simple_term_branch_arm_root_by_term_uid=self._get_specific_arm_selection,
+            terms_at_specific_datetime=terms_at_specific_datetime,
+        )
+
     @ensure_transaction(db)
     def patch_selection(
         self,
@@ -540,49 +602,17 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
 
             assert selection_aggregate is not None
 
-            # Load the current VO for updates
-            current_vo, order = selection_aggregate.get_specific_object_selection(
-                study_selection_uid=selection_update_input.branch_arm_uid
-            )
-
-            # merge current with updates
-            updated_selection = self._patch_prepare_new_study_branch_arm(
-                request_study_branch_arm=selection_update_input,
-                current_study_branch_arm=current_vo,
-            )
-            selection_vo: StudySelectionBranchArmVO
-
-            if updated_selection != current_vo:
-                # let the aggregate update the value object
-                selection_aggregate.update_selection(
-                    updated_study_branch_arm_selection=updated_selection,
-                    study_branch_arm_study_arm_update_conflict_callback=repos.study_branch_arm_repository.branch_arm_arm_update_conflict,
-                    study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
-                    branch_arm_exists_callback_by=repos.study_branch_arm_repository.branch_arm_exists_by,
-                    validate=validate,
-                )
+            if self._patch_branch_arm_in_aggregate(
+                selection_aggregate, selection_update_input, validate=validate
+            ):
                 # sync with DB and save the update
                 repos.study_branch_arm_repository.save(selection_aggregate, self.author)
 
-                # Fetch the new selection which was just updated
-                new_selection, order = (
-                    selection_aggregate.get_specific_object_selection(
-                        study_selection_uid
-                    )
-                )
-                selection_vo = new_selection
-            else:
-                selection_vo = current_vo
             terms_at_specific_datetime = self._extract_study_standards_effective_date(
                 study_uid=study_uid
             )
-            # add the branch arm and return
-            return StudySelectionBranchArm.from_study_selection_branch_arm_ar_and_order(
-                study_uid=study_uid,
-                selection=selection_vo,
-                order=order,
-                find_simple_term_branch_arm_root_by_term_uid=self._get_specific_arm_selection,
-                terms_at_specific_datetime=terms_at_specific_datetime,
+            return self._transform_patched_branch_arm(
+                selection_aggregate, study_selection_uid, terms_at_specific_datetime
             )
         finally:
             repos.close()
@@ -619,79 +649,70 @@ class StudyBranchArmSelectionService(StudySelectionMixin):
         study_uid: str,
         operations: list[StudySelectionBranchArmBatchInput],
     ) -> list[StudySelectionBranchArmBatchOutput]:
-        results = []
-        try:
-            for operation in operations:
-                item = None
-                if operation.method == "PATCH":
-                    if isinstance(operation.content, StudySelectionBranchArmEditInput):
-                        item = self.patch_selection(
-                            study_uid=study_uid,
-                            study_selection_uid=operation.content.branch_arm_uid,
-                            selection_update_input=operation.content,
-                            validate=False,
-                        )
-                        response_code = status.HTTP_200_OK
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="POST operation requires StudySelectionBranchArmEditInput as request payload."
-                        )
-                elif operation.method == "POST":
-                    if isinstance(
-                        operation.content, StudySelectionBranchArmCreateInput
-                    ):
-                        item = self.make_selection(
-                            study_uid=study_uid,
-                            selection_create_input=operation.content,
-                            validate=False,
-                        )
-                        response_code = status.HTTP_201_CREATED
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="POST operation requires StudySelectionBranchArmCreateInput as request payload."
-                        )
-                elif operation.method == "DELETE":
-                    self.delete_selection(
-                        study_uid=study_uid,
-                        study_selection_uid=operation.content.branch_arm_uid,
-                    )
-                    response_code = status.HTTP_204_NO_CONTENT
-                else:
-                    raise exceptions.MethodNotAllowedException(method=operation.method)
-                results.append(
-                    StudySelectionBranchArmBatchOutput(
-                        response_code=response_code,
-                        content=item,
-                    )
-                )
-
-            # For batch operations we need to perform validation/uniqueness checks after all requests are handled
-            study_branch_arm_ar: StudySelectionBranchArmAR = (
-                self._repos.study_branch_arm_repository.find_by_study(
-                    study_uid=study_uid
-                )
+        repos = self._repos
+        cascade_deletions: dict[str, Callable[[], None]] = {}
+
+        def patch_branch_arm(
+            selection_aggregate: StudySelectionBranchArmAR,
+            content: StudySelectionBranchArmEditInput,
+        ) -> str:
+            self._patch_branch_arm_in_aggregate(
+                selection_aggregate, content, validate=False
             )
-            modified_study_branch_arms = {
-                study_branch_arm.content.branch_arm_uid
-                for study_branch_arm in results
-                if study_branch_arm.content
-            }
-            for study_branch_arm_vo in study_branch_arm_ar.study_branch_arms_selection:
-                if (
-                    study_branch_arm_vo.study_selection_uid
-                    in modified_study_branch_arms
-                ):
-                    study_branch_arm_vo.validate(
-                        study_branch_arm_study_arm_update_conflict_callback=self._repos.study_branch_arm_repository.branch_arm_arm_update_conflict,
-                        study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
-                        branch_arm_exists_callback_by=self._repos.study_branch_arm_repository.branch_arm_exists_by,
-                    )
-        except exceptions.MDRApiBaseException as error:
-            results.append(
-                StudySelectionBranchArmBatchOutput.model_construct(
-                    response_code=error.status_code,
-                    content=BatchErrorResponse(message=str(error)),
+            return content.branch_arm_uid
+
+        def delete_branch_arm(
+            selection_aggregate: StudySelectionBranchArmAR,
+            content: StudySelectionBranchArmBatchDeleteInput,
+        ) -> str:
+            cascade_deletions[content.branch_arm_uid] = (
+                self._remove_branch_arm_from_aggregate(
+                    selection_aggregate, content.branch_arm_uid
                 )
             )
-            raise error
-        return results
+            return content.branch_arm_uid
+
+        try:
+            return self._handle_selection_batch_operations(
+                study_uid=study_uid,
+                operations=operations,
+                operation_kinds={
+                    "PATCH": StudySelectionBatchOperation(
+                        input_type=StudySelectionBranchArmEditInput,
+                        response_code=status.HTTP_200_OK,
+                        apply=patch_branch_arm,
+                        transform=self._transform_patched_branch_arm,
+                    ),
+                    "POST": StudySelectionBatchOperation(
+                        input_type=StudySelectionBranchArmCreateInput,
+                        response_code=status.HTTP_201_CREATED,
+                        apply=lambda aggregate, content: self._add_branch_arm_to_aggregate(
+                            aggregate, content, validate=False
+                        ),
+                        transform=self._transform_created_branch_arm,
+                        after_save=self._cascade_creation,
+                    ),
+                    # a payload with only branch_arm_uid is parsed as the update input
+                    "DELETE": StudySelectionBatchOperation(
+                        input_type=(
+                            StudySelectionBranchArmBatchDeleteInput,
+                            StudySelectionBranchArmBatchUpdateInput,
+                        ),
+                        response_code=status.HTTP_204_NO_CONTENT,
+                        apply=delete_branch_arm,
+                        after_save=lambda _, study_selection_uid: cascade_deletions.pop(
+                            study_selection_uid
+                        )(),
+                    ),
+                },
+                find_by_study=repos.study_branch_arm_repository.find_by_study,
+                save=repos.study_branch_arm_repository.save,
+                validate_selection=lambda study_branch_arm_vo: study_branch_arm_vo.validate(
+                    study_branch_arm_study_arm_update_conflict_callback=repos.study_branch_arm_repository.branch_arm_arm_update_conflict,
+                    study_arm_exists_callback=repos.study_arm_repository.arm_specific_exists_by_uid,
+                    branch_arm_exists_callback_by=repos.study_branch_arm_repository.branch_arm_exists_by,
+                ),
+                output_model=StudySelectionBranchArmBatchOutput,
+            )
+        finally:
+            repos.close()
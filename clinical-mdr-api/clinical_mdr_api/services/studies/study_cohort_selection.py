@@ -11,7 +11,6 @@ from clinical_mdr_api.domains.study_selections.study_selection_cohort import (
     StudySelectionCohortAR,
     StudySelectionCohortVO,
 )
-from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_selection import (
     StudySelectionArm,
     StudySelectionBranchArm,
@@ -33,7 +32,10 @@ from clinical_mdr_api.services._utils import (
     fill_missing_values_in_base_model_from_reference_base_model,
     service_level_generic_filtering,
 )
-from clinical_mdr_api.services.studies.study_selection_base import StudySelectionMixin
+from clinical_mdr_api.services.studies.study_selection_base import (
+    StudySelectionBatchOperation,
+    StudySelectionMixin,
+)
 from common import exceptions
 from common.auth.user import user
 
@@ -370,6 +372,53 @@ class StudyCohortSelectionService(StudySelectionMixin):
             terms_at_specific_datetime=terms_at_specific_datetime,
         )
 
+    def _add_cohort_to_aggregate(
+        self,
+        selection_aggregate: StudySelectionCohortAR,
+        selection_create_input: StudySelectionCohortCreateInput,
+        validate: bool = True,
+    ) -> str:
+        # create new VO to add
+        new_selection = StudySelectionCohortVO.from_input_values(
+            study_uid=selection_aggregate.study_uid,
+            author_id=self.author,
+            name=selection_create_input.name or "",
+            short_name=selection_create_input.short_name or "",
+            code=selection_create_input.code,
+            description=selection_create_input.description,
+            number_of_subjects=selection_create_input.number_of_subjects,
+            branch_arm_root_uids=selection_create_input.branch_arm_uids,
+            arm_root_uids=selection_create_input.arm_uids,
+            generate_uid_callback=self._repos.study_cohort_repository.generate_uid,
+        )
+        # add VO to aggregate
+        selection_aggregate.add_cohort_selection(
+            study_cohort_selection=new_selection,
+            study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
+            study_branch_arm_exists_callback=self._repos.study_branch_arm_repository.branch_arm_specific_exists_by_uid,
+            cohort_exists_callback_by=self._repos.study_cohort_repository.cohort_exists_by,
+            validate=validate,
+        )
+        return new_selection.study_selection_uid
+
+    def _transform_cohort(
+        self,
+        selection_aggregate: StudySelectionCohortAR,
+        study_selection_uid: str,
+        terms_at_specific_datetime: datetime | None,
+    ) -> StudySelectionCohort:
+        selection_vo, order = selection_aggregate.get_specific_object_selection(
+            study_selection_uid
+        )
+        return StudySelectionCohort.from_study_selection_cohort_ar_and_order(
+            study_uid=selection_aggregate.study_uid,
+            selection=selection_vo,
+            order=order,
+            find_arm_root_by_uid=self._get_specific_arm_selection,
+            find_branch_arm_root_cohort_by_uid=self._get_specific_branch_arm_selection,
+            terms_at_specific_datetime=terms_at_specific_datetime,
+        )
+
     @ensure_transaction(db)
     def make_selection(
         self,
@@ -380,19 +429,6 @@ class StudyCohortSelectionService(StudySelectionMixin):
         repos = self._repos
 
         try:
-            # create new VO to add
-            new_selection = StudySelectionCohortVO.from_input_values(
-                study_uid=study_uid,
-                author_id=self.author,
-                name=selection_create_input.name or "",
-                short_name=selection_create_input.short_name or "",
-                code=selection_create_input.code,
-                description=selection_create_input.description,
-                number_of_subjects=selection_create_input.number_of_subjects,
-                branch_arm_root_uids=selection_create_input.branch_arm_uids,
-                arm_root_uids=selection_create_input.arm_uids,
-                generate_uid_callback=repos.study_cohort_repository.generate_uid,
-            )
             # Load aggregate
             selection_aggregate: StudySelectionCohortAR = (
                 repos.study_cohort_repository.find_by_study(
@@ -400,38 +436,20 @@ class StudyCohortSelectionService(StudySelectionMixin):
                 )
             )
             assert selection_aggregate is not None
-
-            # add VO to aggregate
-            selection_aggregate.add_cohort_selection(
-                study_cohort_selection=new_selection,
-                study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
-                study_branch_arm_exists_callback=self._repos.study_branch_arm_repository.branch_arm_specific_exists_by_uid,
-                cohort_exists_callback_by=repos.study_cohort_repository.cohort_exists_by,
-                validate=validate,
+            study_selection_uid = self._add_cohort_to_aggregate(
+                selection_aggregate, selection_create_input, validate=validate
             )
 
             # sync with DB and save the update
             repos.study_cohort_repository.save(selection_aggregate, self.author)
 
-            # Fetch the new selection which was just added
-            (
-                new_selection,
-                order,
-            ) = selection_aggregate.get_specific_cohort_selection(
-                new_selection.study_selection_uid
-            )
             terms_at_specific_datetime = self._extract_study_standards_effective_date(
                 study_uid=study_uid,
             )
 
             # add the Cohort and return
-            return StudySelectionCohort.from_study_selection_cohort_ar_and_order(
-                study_uid=study_uid,
-                selection=new_selection,
-                order=order,
-                find_arm_root_by_uid=self._get_specific_arm_selection,
-                find_branch_arm_root_cohort_by_uid=self._get_specific_branch_arm_selection,
-                terms_at_specific_datetime=terms_at_specific_datetime,
+            return self._transform_cohort(
+                selection_aggregate, study_selection_uid, terms_at_specific_datetime
             )
         finally:
             repos.close()
@@ -472,6 +490,37 @@ class StudyCohortSelectionService(StudySelectionMixin):
             author_id=self.author,
         )
 
+    def _patch_cohort_in_aggregate(
+        self,
+        selection_aggregate: StudySelectionCohortAR,
+        study_selection_uid: str,
+        selection_update_input: StudySelectionCohortEditInput,
+        validate: bool = True,
+    ) -> bool:
+        # Load the current VO for updates
+        current_vo, _ = selection_aggregate.get_specific_object_selection(
+            study_selection_uid=study_selection_uid
+        )
+
+        # merge current with updates
+        updated_selection = self._patch_prepare_new_study_cohort(
+            request_study_cohort=selection_update_input,
+            current_study_cohort=current_vo,
+        )
+
+        if updated_selection == current_vo:
+            return False
+
+        # let the aggregate update the value object
+        selection_aggregate.update_selection(
+            updated_study_cohort_selection=updated_selection,
+            study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
+            study_branch_arm_exists_callback=self._repos.study_branch_arm_repository.branch_arm_specific_exists_by_uid,
+            cohort_exists_callback_by=self._repos.study_cohort_repository.cohort_exists_by,
+            validate=validate,
+        )
+        return True
+
     @ensure_transaction(db)
     def patch_selection(
         self,
@@ -491,52 +540,22 @@ class StudyCohortSelectionService(StudySelectionMixin):
 
             assert selection_aggregate is not None
 
-            # Load the current VO for updates
-            current_vo, order = selection_aggregate.get_specific_object_selection(
-                study_selection_uid=study_selection_uid
-            )
-
-            # merge current with updates
-            updated_selection = self._patch_prepare_new_study_cohort(
-                request_study_cohort=selection_update_input,
-                current_study_cohort=current_vo,
-            )
-
-            selection_vo: StudySelectionCohortVO
-            if updated_selection != current_vo:
-                # let the aggregate update the value object
-                selection_aggregate.update_selection(
-                    updated_study_cohort_selection=updated_selection,
-                    study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
-                    study_branch_arm_exists_callback=self._repos.study_branch_arm_repository.branch_arm_specific_exists_by_uid,
-                    cohort_exists_callback_by=repos.study_cohort_repository.cohort_exists_by,
-                    validate=validate,
-                )
+            if self._patch_cohort_in_aggregate(
+                selection_aggregate,
+                study_selection_uid,
+                selection_update_input,
+                validate=validate,
+            ):
                 # sync with DB and save the update
                 repos.study_cohort_repository.save(selection_aggregate, self.author)
 
-                # Fetch the new selection which was just updated
-                new_selection, order = (
-                    selection_aggregate.get_specific_object_selection(
-                        study_selection_uid
-                    )
-                )
-                selection_vo = new_selection
-            else:
-                selection_vo = current_vo
-
             terms_at_specific_datetime = self._extract_study_standards_effective_date(
                 study_uid=study_uid,
             )
 
             # add the cohort and return
-            return StudySelectionCohort.from_study_selection_cohort_ar_and_order(
-                study_uid=study_uid,
-                selection=selection_vo,
-                order=order,
-                find_arm_root_by_uid=self._get_specific_arm_selection,
-                find_branch_arm_root_cohort_by_uid=self._get_specific_branch_arm_selection,
-                terms_at_specific_datetime=terms_at_specific_datetime,
+            return self._transform_cohort(
+                selection_aggregate, study_selection_uid, terms_at_specific_datetime
             )
         finally:
             repos.close()
@@ -574,66 +593,45 @@ class StudyCohortSelectionService(StudySelectionMixin):
         study_uid: str,
         operations: list[StudySelectionCohortBatchInput],
     ) -> list[StudySelectionCohortBatchOutput]:
-        results = []
-        try:
-            for operation in operations:
-                item = None
-                if operation.method == "PATCH":
-                    if isinstance(
-                        operation.content, StudySelectionCohortBatchUpdateInput
-                    ):
-                        item = self.patch_selection(
-                            study_uid=study_uid,
-                            study_selection_uid=operation.content.cohort_uid,
-                            selection_update_input=operation.content,
-                            validate=False,
-                        )
-                        response_code = status.HTTP_200_OK
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="PATCH operation requires StudySelectionCohortBatchUpdateInput as request payload."
-                        )
-                elif operation.method == "POST":
-                    if isinstance(operation.content, StudySelectionCohortCreateInput):
-                        item = self.make_selection(
-                            study_uid=study_uid,
-                            selection_create_input=operation.content,
-                            validate=False,
-                        )
-                        response_code = status.HTTP_201_CREATED
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="POST operation requires StudySelectionCohortCreateInput as request payload."
-                        )
-                else:
-                    raise exceptions.MethodNotAllowedException(method=operation.method)
-                results.append(
-                    StudySelectionCohortBatchOutput(
-                        response_code=response_code,
-                        content=item,
-                    )
-                )
+        repos = self._repos
 
-            # For batch operations we need to perform validation/uniqueness checks after all requests are handled
-            study_cohort_ar: StudySelectionCohortAR = (
-                self._repos.study_cohort_repository.find_by_study(study_uid=study_uid)
+        def patch_cohort(
+            selection_aggregate: StudySelectionCohortAR,
+            content: StudySelectionCohortBatchUpdateInput,
+        ) -> str:
+            self._patch_cohort_in_aggregate(
+                selection_aggregate, content.cohort_uid, content, validate=False
             )
-            modified_study_cohorts = {
-                study_cohort.content.cohort_uid for study_cohort in results
-            }
-            for study_cohort_vo in study_cohort_ar.study_cohorts_selection:
-                if study_cohort_vo.study_selection_uid in modified_study_cohorts:
-                    study_cohort_vo.validate(
-                        study_arm_exists_callback=self._repos.study_arm_repository.arm_specific_exists_by_uid,
-                        study_branch_arm_exists_callback=self._repos.study_branch_arm_repository.branch_arm_specific_exists_by_uid,
-                        cohort_exists_callback_by=self._repos.study_cohort_repository.cohort_exists_by,
-                    )
-        except exceptions.MDRApiBaseException as error:
-            results.append(
-                StudySelectionCohortBatchOutput.model_construct(
-                    response_code=error.status_code,
-                    content=BatchErrorResponse(message=str(error)),
-                )
+            return content.cohort_uid
+
+        try:
+            return self._handle_selection_batch_operations(
+                study_uid=study_uid,
+                operations=operations,
+                operation_kinds={
+                    "PATCH": StudySelectionBatchOperation(
+                        input_type=StudySelectionCohortBatchUpdateInput,
+                        response_code=status.HTTP_200_OK,
+                        apply=patch_cohort,
+                        transform=self._transform_cohort,
+                    ),
+                    "POST": StudySelectionBatchOperation(
+                        input_type=StudySelectionCohortCreateInput,
+                        response_code=status.HTTP_201_CREATED,
+                        apply=lambda aggregate, content: self._add_cohort_to_aggregate(
+                            aggregate, content, validate=False
+                        ),
+                        transform=self._transform_cohort,
+                    ),
+                },
+                find_by_study=repos.study_cohort_repository.find_by_study,
+                save=repos.study_cohort_repository.save,
+                validate_selection=lambda study_cohort_vo: study_cohort_vo.validate(
+                    study_arm_exists_callback=repos.study_arm_repository.arm_specific_exists_by_uid,
+                    study_branch_arm_exists_callback=repos.study_branch_arm_repository.branch_arm_specific_exists_by_uid,
+                    cohort_exists_callback_by=repos.study_cohort_repository.cohort_exists_by,
+                ),
+                output_model=StudySelectionCohortBatchOutput,
             )
-            raise error
-        return results
+        finally:
+            repos.close()
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any
 
 from neomodel import db
@@ -20,6 +21,7 @@ from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.services._meta_repository import MetaRepository
 from clinical_mdr_api.services._utils import (
     fill_missing_values_in_base_model_from_reference_base_model,
+    is_database_filterable,
     service_level_generic_filtering,
     service_level_generic_header_filtering,
 )
@@ -34,6 +36,23 @@ from common.exceptions import BusinessLogicException
 class StudyCompoundSelectionService(
     StudyCompoundDosingRelationMixin, StudySelectionMixin
 ):
+    # StudySelectionCompound fields that can be filtered and sorted on in the database,
+    # the remaining ones are derived here and fall back to service level filtering
+    DB_FIELDS = frozenset(
+        {
+            "study_uid",
+            "study_compound_uid",
+            "order",
+            "other_info",
+            "study_compound_dosing_count",
+            "start_date",
+            "author_username",
+            "compound.uid",
+            "compound_alias.uid",
+            "medicinal_product.uid",
+        }
+    )
+
     def __init__(self):
         self._repos = MetaRepository()
         self.author = user().id()
@@ -46,50 +65,86 @@ class StudyCompoundSelectionService(
         if study_selection is None:
             return []
 
-        result = []
         terms_at_specific_datetime = self._extract_study_standards_effective_date(
             study_uid=study_selection.study_uid,
             study_value_version=study_value_version,
         )
-        for order, selection in enumerate(
-            study_selection.study_compounds_selection, start=1
-        ):
-            if selection.compound_uid is None:
-                compound_model = None
-            else:
-                compound_model = self._transform_compound_model(
-                    compound_uid=selection.compound_uid
-                )
+        return [
+            self._transform_selection_to_response_model(
+                selection,
+                order=order,
+                study_uid=study_selection.study_uid,
+                terms_at_specific_datetime=terms_at_specific_datetime,
+                study_value_version=study_value_version,
+            )
+            for order, selection in enumerate(
+                study_selection.study_compounds_selection, start=1
+            )
+        ]
 
-            if selection.compound_alias_uid is None:
-                compound_alias_model = None
-            else:
-                compound_alias_model = self._transform_compound_alias_model(
-                    selection.compound_alias_uid
-                )
+    def _transform_page_to_response_model(
+        self,
+        page: list[tuple[StudySelectionCompoundVO, int]],
+        study_value_version: str | None = None,
+    ) -> list[StudySelectionCompound]:
+        terms_at_specific_datetimes = self._extract_studies_standards_effective_dates(
+            study_uids={selection.study_uid for selection, _ in page},
+            study_value_version=study_value_version,
+        )
+        return [
+            self._transform_selection_to_response_model(
+                selection,
+                order=order,
+                study_uid=selection.study_uid,
+                terms_at_specific_datetime=terms_at_specific_datetimes[
+                    selection.study_uid
+                ],
+                study_value_version=study_value_version,
+            )
+            for selection, order in page
+        ]
+
+    def _transform_selection_to_response_model(
+        self,
+        selection: StudySelectionCompoundVO,
+        order: int,
+        study_uid: str,
+        terms_at_specific_datetime: datetime | None,
+        study_value_version: str | None = None,
+    ) -> StudySelectionCompound:
+        if selection.compound_uid is None:
+            compound_model = None
+        else:
+            compound_model = self._transform_compound_model(
+                compound_uid=selection.compound_uid
+            )
 
-            if selection.medicinal_product_uid is None:
-                medicinal_product_model = None
-            else:
-                medicinal_product_model = self._transform_medicinal_product_model(
-                    selection.medicinal_product_uid
-                )
+        if selection.compound_alias_uid is None:
+            compound_alias_model = None
+        else:
+            compound_alias_model = self._transform_compound_alias_model(
+                selection.compound_alias_uid
+            )
 
-            result.append(
-                StudySelectionCompound.from_study_compound_ar(
-                    study_uid=study_selection.study_uid,
-                    selection=selection,
-                    order=order,
-                    compound_model=compound_model,
-                    compound_alias_model=compound_alias_model,
-                    medicinal_product_model=medicinal_product_model,
-                    find_codelist_term_by_uid_and_submval=self._repos.ct_codelist_name_repository.get_codelist_term_by_uid_and_submval,
-                    find_project_by_study_uid=self._repos.project_repository.find_by_study_uid,
-                    study_value_version=study_value_version,
-                    terms_at_specific_datetime=terms_at_specific_datetime,
-                )
+        if selection.medicinal_product_uid is None:
+            medicinal_product_model = None
+        else:
+            medicinal_product_model = self._transform_medicinal_product_model(
+                selection.medicinal_product_uid
             )
-        return result
+
+        return StudySelectionCompound.from_study_compound_ar(
+            study_uid=study_uid,
+            selection=selection,
+            order=order,
+            compound_model=compound_model,
+            compound_alias_model=compound_alias_model,
+            medicinal_product_model=medicinal_product_model,
+            find_codelist_term_by_uid_and_submval=self._repos.ct_codelist_name_repository.get_codelist_term_by_uid_and_submval,
+            find_project_by_study_uid=self._repos.project_repository.find_by_study_uid,
+            study_value_version=study_value_version,
+            terms_at_specific_datetime=terms_at_specific_datetime,
+        )
 
     def _transform_single_to_response_model(
         self, study_selection: StudySelectionCompoundVO, order: int, study_uid: str
@@ -215,6 +270,21 @@ class StudyCompoundSelectionService(
         total_count: bool = False,
     ) -> GenericFilteringReturn[StudySelectionCompound]:
         repos = self._repos
+        if is_database_filterable(self.DB_FIELDS, filter_by, sort_by):
+            page, total = repos.study_compound_repository.find_selections_page(
+                project_name=project_name,
+                project_number=project_number,
+                sort_by=sort_by,
+                page_number=page_number,
+                page_size=page_size,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
+            return GenericFilteringReturn(
+                items=self._transform_page_to_response_model(page), total=total
+            )
+
         compound_selection_ars = repos.study_compound_repository.find_all(
             project_name=project_name,
             project_number=project_number,
@@ -312,6 +382,23 @@ class StudyCompoundSelectionService(
     ) -> GenericFilteringReturn[StudySelectionCompound]:
         repos = MetaRepository()
         try:
+            if is_database_filterable(self.DB_FIELDS, filter_by, None):
+                page, total = repos.study_compound_repository.find_selections_page(
+                    study_uid=study_uid,
+                    study_value_version=study_value_version,
+                    page_number=page_number,
+                    page_size=page_size,
+                    filter_by=filter_by,
+                    filter_operator=filter_operator,
+                    total_count=total_count,
+                )
+                return GenericFilteringReturn(
+                    items=self._transform_page_to_response_model(
+                        page, study_value_version=study_value_version
+                    ),
+                    total=total,
+                )
+
             compound_selection_ar = repos.study_compound_repository.find_by_study(
                 study_uid,
                 study_value_version,
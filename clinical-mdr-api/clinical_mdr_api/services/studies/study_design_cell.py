@@ -11,14 +11,15 @@ from clinical_mdr_api.domain_repositories.study_selections.study_design_cell_rep
     StudyDesignCellHistory,
 )
 from clinical_mdr_api.domains.study_selections.study_design_cell import (
+    StudyDesignCellsAR,
     StudyDesignCellVO,
 )
-from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_selection import (
     StudyDesignCell,
     StudyDesignCellBatchInput,
     StudyDesignCellBatchOutput,
     StudyDesignCellCreateInput,
+    StudyDesignCellDeleteInput,
     StudyDesignCellEditInput,
 )
 from clinical_mdr_api.models.study_selections.study_selection import (
@@ -33,7 +34,8 @@ from clinical_mdr_api.services._utils import (
     ensure_transaction,
     fill_missing_values_in_base_model_from_reference_base_model,
 )
-from clinical_mdr_api.services.studies.study_endpoint_selection import (
+from clinical_mdr_api.services.studies.study_selection_base import (
+    StudySelectionBatchOperation,
     StudySelectionMixin,
 )
 from common import exceptions
@@ -177,44 +179,48 @@ class StudyDesignCellService(StudySelectionMixin):
             start_date=datetime.now(timezone.utc),
         )
 
+    def _add_design_cell_to_aggregate(
+        self,
+        design_cells_aggregate: StudyDesignCellsAR,
+        design_cell_input: StudyDesignCellCreateInput,
+    ) -> str:
+        # created_design_cell: StudyDesignVO, from the input
+        created_design_cell = self._from_input_values(
+            design_cells_aggregate.study_uid, design_cell_input
+        )
+        created_design_cell.uid = (
+            self._repos.study_design_cell_repository.generate_uid()
+        )
+        design_cells_aggregate.add_design_cell(created_design_cell)
+        return created_design_cell.uid
+
+    def _transform_design_cell(
+        self,
+        design_cells_aggregate: StudyDesignCellsAR,
+        design_cell_uid: str,
+        _terms_at_specific_datetime: datetime | None = None,
+    ) -> StudyDesignCell:
+        design_cell, _ = design_cells_aggregate.get_specific_object_selection(
+            design_cell_uid
+        )
+        # return json response model
+        return StudyDesignCell.from_vo(design_cell)
+
     @trace_calls
     @ensure_transaction(db)
     def create(
         self, study_uid: str, design_cell_input: StudyDesignCellCreateInput
     ) -> StudyDesignCell:
-        # all_design_cells: list[StudyDesignCellVO]
-        all_design_cells = (
-            self._repos.study_design_cell_repository.find_all_design_cells_by_study(
-                study_uid
-            )
+        design_cells_aggregate = self._repos.study_design_cell_repository.find_by_study(
+            study_uid, for_update=True
         )
-
-        # created_design_cell: StudyDesignVO, from the input
-        created_design_cell = self._from_input_values(study_uid, design_cell_input)
-
-        # if the order want an specific order
-        if design_cell_input.order:
-            exceptions.BusinessLogicException.raise_if(
-                len(all_design_cells) + 1 < created_design_cell.order,
-                msg="Order is too big.",
-            )
-            # shift one order more to fit the modified
-            for design_cell in all_design_cells[created_design_cell.order - 1 :]:
-                design_cell.order += 1
-                self._repos.study_design_cell_repository.save(
-                    design_cell, self.author, create=False
-                )
-        # if not just add one to the order
-        else:
-            created_design_cell.order = len(all_design_cells) + 1
-
-        # created_item: StudyDesignCellVO
-        created_item = self._repos.study_design_cell_repository.save(
-            created_design_cell, self.author, create=True
+        design_cell_uid = self._add_design_cell_to_aggregate(
+            design_cells_aggregate, design_cell_input
         )
-
-        # return json response model
-        return StudyDesignCell.from_vo(created_item)
+        self._repos.study_design_cell_repository.save_all(
+            design_cells_aggregate, self.author
+        )
+        return self._transform_design_cell(design_cells_aggregate, design_cell_uid)
 
     def _edit_study_design_cell_vo(
         self,
@@ -230,13 +236,14 @@ class StudyDesignCellService(StudySelectionMixin):
             order=study_design_cell_edit_input.order,  # type: ignore[arg-type]
         )
 
-    @ensure_transaction(db)
-    def patch(
-        self, study_uid: str, design_cell_update_input: StudyDesignCellEditInput
-    ) -> StudyDesignCell:
+    def _patch_design_cell_in_aggregate(
+        self,
+        design_cells_aggregate: StudyDesignCellsAR,
+        design_cell_update_input: StudyDesignCellEditInput,
+    ) -> str:
         # study_design_cell: StudyDesignCellVO
-        study_design_cell = self._repos.study_design_cell_repository.find_by_uid(
-            study_uid=study_uid, uid=design_cell_update_input.study_design_cell_uid
+        study_design_cell, _ = design_cells_aggregate.get_specific_object_selection(
+            design_cell_update_input.study_design_cell_uid
         )
         if design_cell_update_input.study_branch_arm_uid is not None:
             design_cell_update_input.study_arm_uid = None
@@ -253,32 +260,44 @@ class StudyDesignCellService(StudySelectionMixin):
             study_design_cell_to_edit=study_design_cell,
             study_design_cell_edit_input=design_cell_update_input,
         )
-        # updated_item: StudyDesignCellVO
-        updated_item = self._repos.study_design_cell_repository.save(
-            study_design_cell, self.author, create=False
+        # keep the list position in line with the order for the following operations of a batch
+        design_cells_aggregate.move_design_cell(
+            study_design_cell.uid, study_design_cell.order  # type: ignore[arg-type]
         )
-        # return json response model
-        return StudyDesignCell.from_vo(updated_item)
+        return design_cell_update_input.study_design_cell_uid
 
     @ensure_transaction(db)
-    def delete(self, study_uid: str, design_cell_uid: str):
-        study_design_cell = self._repos.study_design_cell_repository.find_by_uid(
-            study_uid=study_uid, uid=design_cell_uid
+    def patch(
+        self, study_uid: str, design_cell_update_input: StudyDesignCellEditInput
+    ) -> StudyDesignCell:
+        design_cells_aggregate = self._repos.study_design_cell_repository.find_by_study(
+            study_uid, for_update=True
         )
-        self._repos.study_design_cell_repository.delete(
-            study_uid, design_cell_uid, self.author
+        design_cell_uid = self._patch_design_cell_in_aggregate(
+            design_cells_aggregate, design_cell_update_input
         )
-        all_design_cells = (
-            self._repos.study_design_cell_repository.find_all_design_cells_by_study(
-                study_uid
-            )
+        self._repos.study_design_cell_repository.save_all(
+            design_cells_aggregate, self.author
+        )
+        return self._transform_design_cell(design_cells_aggregate, design_cell_uid)
+
+    def _remove_design_cell_from_aggregate(
+        self,
+        design_cells_aggregate: StudyDesignCellsAR,
+        design_cell_delete_input: StudyDesignCellDeleteInput,
+    ) -> str:
+        design_cells_aggregate.remove_design_cell(design_cell_delete_input.uid)
+        return design_cell_delete_input.uid
+
+    @ensure_transaction(db)
+    def delete(self, study_uid: str, design_cell_uid: str):
+        design_cells_aggregate = self._repos.study_design_cell_repository.find_by_study(
+            study_uid, for_update=True
+        )
+        design_cells_aggregate.remove_design_cell(design_cell_uid)
+        self._repos.study_design_cell_repository.save_all(
+            design_cells_aggregate, self.author
         )
-        # shift one order more to fit the modified
-        for design_cell in all_design_cells[study_design_cell.order - 1 :]:
-            design_cell.order -= 1
-            self._repos.study_design_cell_repository.save(
-                design_cell, author_id=self.author, create=False
-            )
 
     def _transform_each_history_to_response_model(
         self, study_selection_history: StudyDesignCellHistory, study_uid: str
@@ -363,41 +382,32 @@ class StudyDesignCellService(StudySelectionMixin):
     def handle_batch_operations(
         self, study_uid: str, operations: list[StudyDesignCellBatchInput]
     ) -> list[StudyDesignCellBatchOutput]:
-        results = []
-        for operation in operations:
-            item = None
-            try:
-                if operation.method == "POST":
-                    if isinstance(operation.content, StudyDesignCellCreateInput):
-                        item = self.create(study_uid, operation.content)
-                        response_code = status.HTTP_201_CREATED
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="POST operation requires StudyDesignCellCreateInput as request payload."
-                        )
-                elif operation.method == "PATCH":
-                    if isinstance(operation.content, StudyDesignCellEditInput):
-                        item = self.patch(study_uid, operation.content)
-                        response_code = status.HTTP_200_OK
-                    else:
-                        raise exceptions.ValidationException(
-                            msg="PATCH operation requires StudyDesignCellEditInput as request payload."
-                        )
-                elif operation.method == "DELETE":
-                    self.delete(study_uid, operation.content.uid)
-                    response_code = status.HTTP_204_NO_CONTENT
-                else:
-                    raise exceptions.MethodNotAllowedException(method=operation.method)
-                results.append(
-                    StudyDesignCellBatchOutput(
-                        response_code=response_code, content=item
-                    )
-                )
-            except exceptions.MDRApiBaseException as error:
-                results.append(
-                    StudyDesignCellBatchOutput.model_construct(
-                        response_code=error.status_code,
-                        content=BatchErrorResponse(message=str(error)),
-                    )
-                )
-        return results
+        return self._handle_selection_batch_operations(
+            study_uid=study_uid,
+            operations=operations,
+            operation_kinds={
+                "POST": StudySelectionBatchOperation(
+                    input_type=StudyDesignCellCreateInput,
+                    response_code=status.HTTP_201_CREATED,
+                    apply=self._add_design_cell_to_aggregate,
+                    transform=self._transform_design_cell,
+                ),
+                "PATCH": StudySelectionBatchOperation(
+                    input_type=StudyDesignCellEditInput,
+                    response_code=status.HTTP_200_OK,
+                    apply=self._patch_design_cell_in_aggregate,
+                    transform=self._transform_design_cell,
+                ),
+                "DELETE": StudySelectionBatchOperation(
+                    input_type=StudyDesignCellDeleteInput,
+                    response_code=status.HTTP_204_NO_CONTENT,
+                    apply=self._remove_design_cell_from_aggregate,
+                ),
+            },
+            find_by_study=self._repos.study_design_cell_repository.find_by_study,
+            save=self._repos.study_design_cell_repository.save_all,
+            # the repository checks the design cells while saving them
+            validate_selection=lambda _: None,
+            output_model=StudyDesignCellBatchOutput,
+            report_item_errors=True,
+        )
@@ -1,12 +1,16 @@
 import logging
 import os
+import threading
 from collections import OrderedDict
-from typing import Any, Mapping, MutableMapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping, MutableMapping
 
 import yattag
 from colour import Color
-from PIL import ImageFont
 
+from clinical_mdr_api.domain_repositories.study_definitions.study_definition_repository_impl import (
+    StudyDefinitionRepositoryImpl,
+)
 from clinical_mdr_api.models.study_selections.study import StudySoaPreferences
 from clinical_mdr_api.models.study_selections.study_epoch import StudyEpoch
 from clinical_mdr_api.models.study_selections.study_selection import (
@@ -27,9 +31,13 @@ from clinical_mdr_api.services.studies.study_epoch import StudyEpochService
 
 # Page and margin sizes (horizontal, vertical) in millimeters
 from clinical_mdr_api.services.studies.study_visit import StudyVisitService
+from common.cache import create_cache
 from common.config import settings
 from common.telemetry import trace_calls
 
+if TYPE_CHECKING:
+    from PIL.ImageFont import FreeTypeFont
+
 # A4 page size (width, height) in millimeters
 A4_PORTRAIT_SIZE = (210, 297)  # https://en.wikipedia.org/wiki/ISO_216#A_series
 A4_PORTRAIT_MARGINS = (25 + 15, 35 + 15)  # from NN Authoring master template
@@ -89,6 +97,11 @@ TIMELINE_ROW_MARGINS = (
 VISIT_ARROW_COLOR = "#000"
 VISIT_ARROW_HEIGHT = FONT_SIZE
 
+# measured texts (labels and their words) kept across requests
+TEXT_SIZE_CACHE_SIZE = 4096
+# rendered figures kept across requests
+SVG_CACHE_SIZE = 100
+
 STYLES = {
     "text": {
         "font-family": f'"{FONT_NAME}"',
@@ -136,6 +149,26 @@ STYLES = {
 log = logging.getLogger(__name__)
 
 
+_thread_fonts = threading.local()
+
+
+def _load_font(font_path: str, font_size: int) -> "FreeTypeFont":
+    """Returns the font loaded by the current thread, a FreeType font can't be used by several threads at once"""
+    fonts = _thread_fonts.__dict__.setdefault("fonts", {})
+    font = fonts.get((font_path, font_size))
+    if font is None:
+        from PIL import ImageFont
+
+        font = fonts[font_path, font_size] = ImageFont.truetype(font_path, font_size)
+    return font
+
+
+@lru_cache(maxsize=TEXT_SIZE_CACHE_SIZE)
+def _measure_text(font_path: str, font_size: int, text: str) -> tuple[int, int]:
+    """Returns width and height (in pixels) of given text if rendered with font and size"""
+    return _load_font(font_path, font_size).getbbox(text)[2:4]
+
+
 class StudyDesignFigureService:
     """Draws an SVG image of Study Design Figure
 
@@ -147,15 +180,41 @@ class StudyDesignFigureService:
 
     debug = False
 
+    # Drawings by study, version, debug flag and change token of the study (version)
+    _svg_cache = create_cache("StudyDesignFigureService.svg", maxsize=SVG_CACHE_SIZE)
+
     def __init__(self, debug: bool = False):
         self.debug = debug
-        font_path = os.path.join(settings.app_root_dir, FONT_FILE_NAME)
+        self.font_path = os.path.join(settings.app_root_dir, FONT_FILE_NAME)
         # Although ImageFont.truetype() expects point size, it seems we need to scale it up for calculations in pixels
         self.font_size = int(round(FONT_SIZE * FONT_SIZE_POINT_TO_PIXELS_RATIO))
-        self.font = ImageFont.truetype(font_path, self.font_size)
+        self.font = _load_font(self.font_path, self.font_size)
 
     @trace_calls
     def get_svg_document(self, study_uid: str, study_value_version: str | None = None):
+        """Returns the SVG drawing as text
+
+        Drawings are cached until the next change of the study (any StudyAction) or of the library.
+        """
+
+        change_token = StudyDefinitionRepositoryImpl.get_study_change_token(
+            study_uid, study_value_version
+        )
+        if change_token is None:
+            return self._build_svg_document(study_uid, study_value_version)
+
+        # a drawing cached under an older token is no longer requested, and expires from the cache
+        cache_key = (study_uid, study_value_version, self.debug, change_token)
+        svg = self._svg_cache.get(cache_key)
+        if svg is None:
+            svg = self._build_svg_document(study_uid, study_value_version)
+            self._svg_cache[cache_key] = svg
+        return svg
+
+    @trace_calls
+    def _build_svg_document(
+        self, study_uid: str, study_value_version: str | None = None
+    ) -> str:
         """Fetches necessary data and returns the SVG drawing as text"""
 
         # fetch data
@@ -801,7 +860,7 @@ class StudyDesignFigureService:
 
     def _get_text_size_px(self, text: str) -> tuple[int, int]:
         """Returns width and height (in pixels) of given text if rendered with font and size"""
-        return self.font.getbbox(text)[2:4]
+        return _measure_text(self.font_path, self.font_size, text)
 
     def _get_words_size_px(self, text: str) -> tuple[tuple[str, int, int]]:
         """Returns a tuple of (word, width, height) in pixels of each word of a text if rendered with font and size"""
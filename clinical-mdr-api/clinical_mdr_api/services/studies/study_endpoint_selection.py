@@ -33,6 +33,7 @@ from clinical_mdr_api.services._utils import (
     fill_missing_values_in_base_model_from_reference_base_model,
     generic_item_filtering,
     generic_pagination,
+    is_database_filterable,
     service_level_generic_filtering,
     service_level_generic_header_filtering,
     validate_is_dict,
@@ -53,6 +54,25 @@ class StudyEndpointSelectionService(StudySelectionMixin):
         "author_id": "author_id",
     }
 
+    # StudySelectionEndpoint fields that can be filtered and sorted on in the database,
+    # the remaining ones are derived here and fall back to service level filtering
+    DB_FIELDS = frozenset(
+        {
+            "study_uid",
+            "study_endpoint_uid",
+            "order",
+            "accepted_version",
+            "start_date",
+            "author_username",
+            "endpoint.uid",
+            "template.uid",
+            "timeframe.uid",
+            "study_objective.study_objective_uid",
+            "endpoint_level.term_uid",
+            "endpoint_sublevel.term_uid",
+        }
+    )
+
     def __init__(self):
         self._repos = MetaRepository()
         self.author = user().id()
@@ -116,6 +136,30 @@ class StudyEndpointSelectionService(StudySelectionMixin):
             )
         return result
 
+    def _transform_page_to_response_model(
+        self,
+        page: list[tuple[StudySelectionEndpointVO, int]],
+        no_brackets: bool = False,
+        study_value_version: str | None = None,
+    ) -> list[StudySelectionEndpoint]:
+        terms_at_specific_datetimes = self._extract_studies_standards_effective_dates(
+            study_uids={selection.study_uid for selection, _ in page},
+            study_value_version=study_value_version,
+        )
+        return [
+            self._transform_single_to_response_model(
+                selection,
+                order=order,
+                study_uid=selection.study_uid,
+                no_brackets=no_brackets,
+                study_value_version=study_value_version,
+                terms_at_specific_datetime=terms_at_specific_datetimes[
+                    selection.study_uid
+                ],
+            )
+            for selection, order in page
+        ]
+
     def _transform_single_to_response_model(
         self,
         study_selection: StudySelectionEndpointVO,
@@ -668,6 +712,24 @@ class StudyEndpointSelectionService(StudySelectionMixin):
         filter_operator: FilterOperator = FilterOperator.AND,
         total_count: bool = False,
     ) -> GenericFilteringReturn[StudySelectionEndpoint]:
+        if is_database_filterable(self.DB_FIELDS, filter_by, sort_by):
+            page, total = self._repos.study_endpoint_repository.find_selections_page(
+                project_name=project_name,
+                project_number=project_number,
+                sort_by=sort_by,
+                page_number=page_number,
+                page_size=page_size,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
+            return GenericFilteringReturn(
+                items=self._transform_page_to_response_model(
+                    page, no_brackets=no_brackets
+                ),
+                total=total,
+            )
+
         # Extract the study uids to use database level filtering for these
         # instead of service level filtering
         if filter_operator is None or filter_operator == FilterOperator.AND:
@@ -865,6 +927,26 @@ class StudyEndpointSelectionService(StudySelectionMixin):
                 )
                 return GenericFilteringReturn(items=filtered_items, total=count)
 
+            if is_database_filterable(self.DB_FIELDS, filter_by, sort_by):
+                page, total = repos.study_endpoint_repository.find_selections_page(
+                    study_uids=study_uid,
+                    study_value_version=study_value_version,
+                    sort_by=sort_by,
+                    page_number=page_number,
+                    page_size=page_size,
+                    filter_by=filter_by,
+                    filter_operator=filter_operator,
+                    total_count=total_count,
+                )
+                return GenericFilteringReturn(
+                    items=self._transform_page_to_response_model(
+                        page,
+                        no_brackets=no_brackets,
+                        study_value_version=study_value_version,
+                    ),
+                    total=total,
+                )
+
             # Fall back to full generic filtering
             selection = self._transform_all_to_response_model(
                 endpoint_selection_ar,
@@ -1,14 +1,13 @@
 import logging
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Iterable, Mapping, Sequence, TypeVar
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence, TypeVar
 
-from docx.enum.style import WD_STYLE_TYPE
 from neomodel import db
-from opencensus.common.runtime_context import RuntimeContext
-from openpyxl.workbook import Workbook
 
+from clinical_mdr_api.domain_repositories.study_definitions.study_definition_repository_impl import (
+    StudyDefinitionRepositoryImpl,
+)
 from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
     SoALayout,
     StudySoARepository,
@@ -60,25 +59,32 @@ from clinical_mdr_api.services.studies.study_activity_subgroup import (
 from clinical_mdr_api.services.studies.study_soa_footnote import StudySoAFootnoteService
 from clinical_mdr_api.services.studies.study_soa_group import StudySoAGroupService
 from clinical_mdr_api.services.studies.study_visit import StudyVisitService
-from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
 from clinical_mdr_api.services.utils.table_f import (
-    Ref,
+    Cell,
+    CellRef,
+    Row,
     SimpleFootnote,
-    TableCell,
-    TableRow,
-    TableWithFootnotes,
+    Table,
     table_to_docx,
     table_to_html,
     table_to_xlsx,
 )
 from clinical_mdr_api.utils import enumerate_letters
 from common.auth.user import user
+from common.cache import create_cache
 from common.config import settings
 from common.exceptions import BusinessLogicException, NotFoundException
+from common.executor import get_fetch_executor
 from common.telemetry import trace_calls
 from common.utils import VisitClass
 
+if TYPE_CHECKING:
+    from openpyxl.workbook import Workbook
+
+    from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+
 NUM_OPERATIONAL_CODE_COLS = 2
+FLOWCHART_TABLE_CACHE_SIZE = 100
 SOA_CHECK_MARK = "X"
 
 # Strings prepared for localization
@@ -106,45 +112,44 @@ _T = {
 
 log = logging.getLogger(__name__)
 
-# pylint: disable=no-member
 DOCX_STYLES = {
-    "table": ("SB Table Condensed", WD_STYLE_TYPE.TABLE),
-    "header1": ("Table Header lvl1", WD_STYLE_TYPE.PARAGRAPH),
-    "header2": ("Table Header lvl2", WD_STYLE_TYPE.PARAGRAPH),
-    "header3": ("Table Header lvl2", WD_STYLE_TYPE.PARAGRAPH),
-    "header4": ("Table Header lvl2", WD_STYLE_TYPE.PARAGRAPH),
-    "soaGroup": ("Table lvl 1", WD_STYLE_TYPE.PARAGRAPH),
-    "group": ("Table lvl 2", WD_STYLE_TYPE.PARAGRAPH),
-    "subGroup": ("Table lvl 3", WD_STYLE_TYPE.PARAGRAPH),
-    "activity": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "activityRequest": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "activityRequestFinal": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "activityPlaceholder": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "activityPlaceholderSubmitted": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "activityInstance": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "cell": ("Table Text", WD_STYLE_TYPE.PARAGRAPH),
-    "footnote": ("Table Text", WD_STYLE_TYPE.PARAGRAPH),
+    "table": ("SB Table Condensed", "TABLE"),
+    "header1": ("Table Header lvl1", "PARAGRAPH"),
+    "header2": ("Table Header lvl2", "PARAGRAPH"),
+    "header3": ("Table Header lvl2", "PARAGRAPH"),
+    "header4": ("Table Header lvl2", "PARAGRAPH"),
+    "soaGroup": ("Table lvl 1", "PARAGRAPH"),
+    "group": ("Table lvl 2", "PARAGRAPH"),
+    "subGroup": ("Table lvl 3", "PARAGRAPH"),
+    "activity": ("Table lvl 4", "PARAGRAPH"),
+    "activityRequest": ("Table lvl 4", "PARAGRAPH"),
+    "activityRequestFinal": ("Table lvl 4", "PARAGRAPH"),
+    "activityPlaceholder": ("Table lvl 4", "PARAGRAPH"),
+    "activityPlaceholderSubmitted": ("Table lvl 4", "PARAGRAPH"),
+    "activityInstance": ("Table lvl 4", "PARAGRAPH"),
+    "cell": ("Table Text", "PARAGRAPH"),
+    "footnote": ("Table Text", "PARAGRAPH"),
 }
 
 OPERATIONAL_DOCX_STYLES = {
-    "table": ("SB Table Condensed", WD_STYLE_TYPE.TABLE),
-    "header1": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "header2": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "header3": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "header4": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "soaGroup": ("SoAGroup", WD_STYLE_TYPE.PARAGRAPH),
-    "group": ("ActivityGroup", WD_STYLE_TYPE.PARAGRAPH),
-    "subGroup": ("ActivitySubGroup", WD_STYLE_TYPE.PARAGRAPH),
-    "activity": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "activityRequest": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "activityRequestFinal": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "activityPlaceholder": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "activityPlaceholderSubmitted": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "activityInstance": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "cell": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "activitySchedule": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    None: ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
-    "footnote": ("Table cell", WD_STYLE_TYPE.PARAGRAPH),
+    "table": ("SB Table Condensed", "TABLE"),
+    "header1": ("Table cell", "PARAGRAPH"),
+    "header2": ("Table cell", "PARAGRAPH"),
+    "header3": ("Table cell", "PARAGRAPH"),
+    "header4": ("Table cell", "PARAGRAPH"),
+    "soaGroup": ("SoAGroup", "PARAGRAPH"),
+    "group": ("ActivityGroup", "PARAGRAPH"),
+    "subGroup": ("ActivitySubGroup", "PARAGRAPH"),
+    "activity": ("Table cell", "PARAGRAPH"),
+    "activityRequest": ("Table cell", "PARAGRAPH"),
+    "activityRequestFinal": ("Table cell", "PARAGRAPH"),
+    "activityPlaceholder": ("Table cell", "PARAGRAPH"),
+    "activityPlaceholderSubmitted": ("Table cell", "PARAGRAPH"),
+    "activityInstance": ("Table cell", "PARAGRAPH"),
+    "cell": ("Table cell", "PARAGRAPH"),
+    "activitySchedule": ("Table cell", "PARAGRAPH"),
+    None: ("Table cell", "PARAGRAPH"),
+    "footnote": ("Table cell", "PARAGRAPH"),
 }
 
 OPERATIONAL_XLSX_STYLES = {
@@ -188,6 +193,15 @@ class StudyFlowchartService:
 
     _repository = None
 
+    # Built SoA tables by study, version, layout, time unit and latest change marker of the study.
+    # Tables of large studies take several MB, they are kept in the process instead of being written to the shared
+    # cache backend; the change token in the key keeps the tables of every worker up to date.
+    _flowchart_table_cache = create_cache(
+        "StudyFlowchartService.flowchart_table",
+        maxsize=FLOWCHART_TABLE_CACHE_SIZE,
+        shared=False,
+    )
+
     @property
     def repository(self):
         if self._repository is None:
@@ -591,8 +605,8 @@ class StudyFlowchartService:
         layout: SoALayout,
         time_unit: str | None = None,
         force_build: bool = False,
-    ) -> TableWithFootnotes:
-        """Returns internal TableWithFootnotes representation of SoA, either from snapshot or freshly built"""
+    ) -> Table:
+        """Returns internal Table representation of SoA, either from snapshot or freshly built"""
 
         if study_value_version and layout == SoALayout.PROTOCOL and not force_build:
             # Return protocol SoA from snapshot for a locked study version
@@ -628,10 +642,14 @@ class StudyFlowchartService:
         study_value_version: str | None,
         layout: SoALayout,
         time_unit: str | None = None,
-    ) -> TableWithFootnotes:
+    ) -> Table:
         """
         Builds SoA flowchart table
 
+        Tables are cached until the next change of the study (any StudyAction) or of the library,
+        so the same SoA is built only once for all the formats it is requested in.
+        A copy of the cached table is returned.
+
         Args:
             study_uid (str): The unique identifier of the study.
             study_value_version (str | None): The version of the study to check. Defaults to None.
@@ -639,7 +657,7 @@ class StudyFlowchartService:
             time_unit (str): The preferred time unit, either "day" or "week".
 
         Returns:
-            TableWithFootnotes: SoA flowchart table with footnotes.
+            Table: SoA flowchart table with footnotes.
         """
 
         if not time_unit:
@@ -651,45 +669,75 @@ class StudyFlowchartService:
             study_uid, study_value_version=study_value_version, time_unit=time_unit
         )
 
-        # Fetch database objects in parallel
-        with ThreadPoolExecutor() as executor:
-            soa_preferences_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_soa_preferences),
-                study_uid,
-                study_value_version=study_value_version,
+        change_token = StudyDefinitionRepositoryImpl.get_study_change_token(
+            study_uid, study_value_version
+        )
+        if change_token is None:
+            return self._build_flowchart_table(
+                study_uid, study_value_version, layout, time_unit
             )
 
-            selection_activities_future = executor.submit(
-                RuntimeContext.with_current_context(
-                    self._get_study_selection_activities_sorted
-                ),
-                study_uid=study_uid,
-                study_value_version=study_value_version,
-                layout=layout,
+        # the token changes with the study and the library, tables built before a change are left to expire
+        cache_key = (
+            study_uid,
+            study_value_version,
+            layout.value,
+            time_unit,
+            change_token,
+        )
+        table = self._flowchart_table_cache.get(cache_key)
+        if table is None:
+            table = self._build_flowchart_table(
+                study_uid, study_value_version, layout, time_unit
             )
+            self._flowchart_table_cache[cache_key] = table
 
-            activity_schedules_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_study_activity_schedules),
-                study_uid,
-                study_value_version=study_value_version,
-                operational=(layout == SoALayout.OPERATIONAL),
-            )
+        # callers alter the returned table in place
+        return table.copy()
 
-            visits_future = executor.submit(
-                RuntimeContext.with_current_context(
-                    self._get_study_visits_dict_filtered
-                ),
+    @trace_calls
+    def _build_flowchart_table(
+        self,
+        study_uid: str,
+        study_value_version: str | None,
+        layout: SoALayout,
+        time_unit: str,
+    ) -> Table:
+        # Fetch database objects in parallel
+        executor = get_fetch_executor()
+        soa_preferences_future = executor.submit(
+            self._get_soa_preferences,
+            study_uid,
+            study_value_version=study_value_version,
+        )
+
+        selection_activities_future = executor.submit(
+            self._get_study_selection_activities_sorted,
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            layout=layout,
+        )
+
+        activity_schedules_future = executor.submit(
+            self._get_study_activity_schedules,
+            study_uid,
+            study_value_version=study_value_version,
+            operational=(layout == SoALayout.OPERATIONAL),
+        )
+
+        visits_future = executor.submit(
+            self._get_study_visits_dict_filtered,
+            study_uid,
+            study_value_version,
+        )
+
+        if layout != SoALayout.OPERATIONAL:
+            footnotes_future = executor.submit(
+                self._get_study_footnotes,
                 study_uid,
-                study_value_version,
+                study_value_version=study_value_version,
             )
 
-            if layout != SoALayout.OPERATIONAL:
-                footnotes_future = executor.submit(
-                    RuntimeContext.with_current_context(self._get_study_footnotes),
-                    study_uid,
-                    study_value_version=study_value_version,
-                )
-
         soa_preferences: StudySoaPreferences = soa_preferences_future.result()
 
         selection_activities: list[
@@ -720,7 +768,7 @@ class StudyFlowchartService:
             layout=layout,
         )
 
-        table = TableWithFootnotes(
+        table = Table(
             rows=header_rows + activity_rows,
             num_header_rows=len(header_rows),
             num_header_cols=1,
@@ -826,7 +874,7 @@ class StudyFlowchartService:
         study_value_version: str | None,
         layout: SoALayout,
         time_unit: str | None,
-    ) -> DocxBuilder:
+    ) -> "DocxBuilder":
         """Returns a DOCX document with SoA table and footnotes"""
 
         # build internal representation of flowchart
@@ -867,7 +915,7 @@ class StudyFlowchartService:
         study_value_version: str | None,
         layout: SoALayout,
         time_unit: str | None,
-    ) -> Workbook:
+    ) -> "Workbook":
         # build internal representation of flowchart
         table = self.get_flowchart_table(
             study_uid=study_uid,
@@ -888,7 +936,7 @@ class StudyFlowchartService:
         study_uid: str,
         study_value_version: str | None,
         time_unit: str | None,
-    ) -> Workbook:
+    ) -> "Workbook":
         # build internal representation of flowchart
         table = self.get_operational_spreadsheet(
             study_uid=study_uid,
@@ -924,7 +972,7 @@ class StudyFlowchartService:
         study_uid: str,
         study_value_version: str | None,
         time_unit: str | None,
-    ) -> Workbook:
+    ) -> "Workbook":
         # build internal representation of flowchart
         table = self.get_operational_spreadsheet(
             study_uid=study_uid,
@@ -961,7 +1009,7 @@ class StudyFlowchartService:
         study_value_version: str | None = None,
         layout: SoALayout = SoALayout.OPERATIONAL,
         time_unit: str | None = None,
-    ) -> TableWithFootnotes:
+    ) -> Table:
         """
         Builds operational SoA table in spreadsheet format
 
@@ -971,7 +1019,7 @@ class StudyFlowchartService:
             study_value_version (str | None): The version of the study to check. Defaults to None.
 
         Returns:
-            TableWithFootnotes: Operational SoA flowchart table.
+            Table: Operational SoA flowchart table.
         """
 
         study = self._get_study(study_uid, study_value_version=study_value_version)
@@ -1018,65 +1066,65 @@ class StudyFlowchartService:
         # header rows
         if layout == SoALayout.OPERATIONAL:
             rows = [
-                TableRow(
+                Row(
                     cells=[
-                        TableCell(
+                        Cell(
                             f"study_version: {get_study_version(study)}",
                             span=3,
                             style="studyVersion",
                         )
                     ]
-                    + [TableCell(span=0, style="studyVersion")] * 2
+                    + [Cell(span=0, style="studyVersion")] * 2
                 ),
-                TableRow(
+                Row(
                     cells=[
-                        TableCell(
+                        Cell(
                             f"study_number: {study.current_metadata.identification_metadata.study_id}",
                             span=3,
                             style="studyNumber",
                         )
                     ]
-                    + [TableCell(span=0, style="studyNumber")] * 2
+                    + [Cell(span=0, style="studyNumber")] * 2
                 ),
-                TableRow(
+                Row(
                     cells=[
-                        TableCell(
+                        Cell(
                             f"Date/time of extraction: {datetime.now().strftime('%Y-%m-%d %H:%M:%S Z')}",
                             span=3,
                             style="dateTime",
                         ),
-                        TableCell(span=0, style="dateTime"),
-                        TableCell(span=0, style="dateTime"),
-                        TableCell(f"By: {user().id()}", span=2, style="extractedBy"),
-                        TableCell(span=0, style="extractedBy"),
-                        TableCell(),
-                        TableCell(),
-                        TableCell("Epochs", style="header1"),
+                        Cell(span=0, style="dateTime"),
+                        Cell(span=0, style="dateTime"),
+                        Cell(f"By: {user().id()}", span=2, style="extractedBy"),
+                        Cell(span=0, style="extractedBy"),
+                        Cell(),
+                        Cell(),
+                        Cell("Epochs", style="header1"),
                     ]
                 ),
-                TableRow(
+                Row(
                     cells=[
-                        TableCell("lowest visibility layer", style="header3"),
-                        TableCell("SoA group", style="header3"),
-                        TableCell("Group", style="header3"),
-                        TableCell("Subgroup", style="header3"),
-                        TableCell("Activity", style="header3"),
-                        TableCell("Topic Code", style="header3"),
-                        TableCell("ADaM Param Code", style="header3"),
-                        TableCell("Visits", style="header1"),
+                        Cell("lowest visibility layer", style="header3"),
+                        Cell("SoA group", style="header3"),
+                        Cell("Group", style="header3"),
+                        Cell("Subgroup", style="header3"),
+                        Cell("Activity", style="header3"),
+                        Cell("Topic Code", style="header3"),
+                        Cell("ADaM Param Code", style="header3"),
+                        Cell("Visits", style="header1"),
                     ]
                 ),
             ]
 
         elif layout == SoALayout.DETAILED:
             rows = [
-                TableRow(
+                Row(
                     cells=[
-                        TableCell("SoA group", style="header3"),
-                        TableCell("Group", style="header3"),
-                        TableCell("Subgroup", style="header3"),
-                        TableCell("Activity", style="header3"),
-                        TableCell("Visibility", style="header3"),
+                        Cell("SoA group", style="header3"),
+                        Cell("Group", style="header3"),
+                        Cell("Subgroup", style="header3"),
+                        Cell("Activity", style="header3"),
+                        Cell("Visibility", style="header3"),
                     ]
                 ),
             ]
@@ -1096,7 +1144,7 @@ class StudyFlowchartService:
                         perv_study_epoch_uid = study_epoch_uid
 
                         rows[-2].cells.append(
-                            TableCell(
+                            Cell(
                                 text=visit.study_epoch.sponsor_preferred_name,
                                 span=len(_visit_groups),
                                 style="header2",
@@ -1104,11 +1152,11 @@ class StudyFlowchartService:
                         )
 
                     else:
-                        rows[-2].cells.append(TableCell(span=0, style="header2"))
+                        rows[-2].cells.append(Cell(span=0, style="header2"))
 
                 # Visit
                 rows[-1].cells.append(
-                    TableCell(
+                    Cell(
                         (
                             visit.consecutive_visit_group
                             if len(group) > 1
@@ -1132,7 +1180,7 @@ class StudyFlowchartService:
             ):
                 continue
 
-            rows.append(row := TableRow())
+            rows.append(row := Row())
 
             # Visibility
             if getattr(
@@ -1159,11 +1207,11 @@ class StudyFlowchartService:
                 visibility = None
 
             if layout == SoALayout.OPERATIONAL:
-                row.cells.append(TableCell(visibility, style="visibility"))
+                row.cells.append(Cell(visibility, style="visibility"))
 
             # SoA Group
             row.cells.append(
-                TableCell(
+                Cell(
                     study_selection_activity.study_soa_group.soa_group_term_name,
                     style="soaGroup",
                 )
@@ -1171,7 +1219,7 @@ class StudyFlowchartService:
 
             # Activity Group
             row.cells.append(
-                TableCell(
+                Cell(
                     (
                         study_selection_activity.study_activity_group.activity_group_name
                         if study_selection_activity.study_activity_group.activity_group_uid
@@ -1183,7 +1231,7 @@ class StudyFlowchartService:
 
             # Activity Sub-Group
             row.cells.append(
-                TableCell(
+                Cell(
                     (
                         study_selection_activity.study_activity_subgroup.activity_subgroup_name
                         if study_selection_activity.study_activity_subgroup.activity_subgroup_uid
@@ -1195,13 +1243,13 @@ class StudyFlowchartService:
 
             # Activity
             row.cells.append(
-                TableCell(study_selection_activity.activity.name, style="activity")
+                Cell(study_selection_activity.activity.name, style="activity")
             )
 
             if layout == SoALayout.OPERATIONAL:
                 # Topic Code
                 row.cells.append(
-                    TableCell(
+                    Cell(
                         (
                             study_selection_activity.activity_instance.topic_code
                             if study_selection_activity.activity_instance
@@ -1213,7 +1261,7 @@ class StudyFlowchartService:
 
                 # ADaM Param Code
                 row.cells.append(
-                    TableCell(
+                    Cell(
                         (
                             study_selection_activity.activity_instance.adam_param_code
                             if study_selection_activity.activity_instance
@@ -1224,11 +1272,11 @@ class StudyFlowchartService:
                 )
 
                 # Empty header column
-                row.cells.append(TableCell())
+                row.cells.append(Cell())
 
             # Visibility
             if layout == SoALayout.DETAILED:
-                row.cells.append(TableCell(visibility, style="visibility"))
+                row.cells.append(Cell(visibility, style="visibility"))
 
             # Scheduling crosses
             self._append_activity_crosses(
@@ -1242,7 +1290,7 @@ class StudyFlowchartService:
                 ),
             )
 
-        table = TableWithFootnotes(
+        table = Table(
             rows=rows,
             num_header_rows=4 if layout == SoALayout.OPERATIONAL else 1,
             num_header_cols=4 if layout == SoALayout.OPERATIONAL else 5,
@@ -1259,7 +1307,7 @@ class StudyFlowchartService:
         time_unit: str,
         soa_preferences: StudySoaPreferencesInput,
         layout: SoALayout,
-    ) -> list[TableRow]:
+    ) -> list[Row]:
         """Builds the 4 header rows of protocol SoA flowchart"""
 
         visit_timing_prop = cls._get_visit_timing_property(time_unit, soa_preferences)
@@ -1267,8 +1315,8 @@ class StudyFlowchartService:
         rows = []
 
         # Header line 1: Epoch names
-        rows.append(epochs_row := TableRow())
-        epochs_row.cells.append(TableCell(text=_T("study_epoch"), style="header1"))
+        rows.append(epochs_row := Row())
+        epochs_row.cells.append(Cell(text=_T("study_epoch"), style="header1"))
         epochs_row.hide = not (
             layout == SoALayout.OPERATIONAL or soa_preferences.show_epochs
         )
@@ -1276,25 +1324,25 @@ class StudyFlowchartService:
         # Header line 2 (optional): Milestones
         milestones_row = None
         if layout != SoALayout.OPERATIONAL and soa_preferences.show_milestones:
-            rows.append(milestones_row := TableRow())
+            rows.append(milestones_row := Row())
             milestones_row.cells.append(
-                TableCell(text=_T("study_milestone"), style="header1")
+                Cell(text=_T("study_milestone"), style="header1")
             )
             milestones_row.hide = not soa_preferences.show_milestones
 
         # Header line 2/3: Visit names
-        rows.append(visits_row := TableRow())
-        visits_row.cells.append(TableCell(text=_T("visit_short_name"), style="header2"))
+        rows.append(visits_row := Row())
+        visits_row.cells.append(Cell(text=_T("visit_short_name"), style="header2"))
 
         # Header line 3/4: Visit timing day/week sequence
-        rows.append(timing_row := TableRow())
+        rows.append(timing_row := Row())
         if time_unit == "day":
-            timing_row.cells.append(TableCell(text=_T("study_day"), style="header3"))
+            timing_row.cells.append(Cell(text=_T("study_day"), style="header3"))
         else:
-            timing_row.cells.append(TableCell(text=_T("study_week"), style="header3"))
+            timing_row.cells.append(Cell(text=_T("study_week"), style="header3"))
 
         # Header line 4/5: Visit window
-        rows.append(window_row := TableRow())
+        rows.append(window_row := Row())
 
         visit_window_unit = next(
             (
@@ -1306,7 +1354,7 @@ class StudyFlowchartService:
         )
         # Append window unit used for all StudyVisits
         window_row.cells.append(
-            TableCell(
+            Cell(
                 text=_T("visit_window").format(unit_name=visit_window_unit),
                 style="header4",
             )
@@ -1314,17 +1362,15 @@ class StudyFlowchartService:
 
         # Add Operation SoA's extra columns
         if layout == SoALayout.OPERATIONAL:
-            epochs_row.cells.append(TableCell(text=_T("topic_code"), style="header2"))
-            epochs_row.cells.append(
-                TableCell(text=_T("adam_param_code"), style="header2")
-            )
+            epochs_row.cells.append(Cell(text=_T("topic_code"), style="header2"))
+            epochs_row.cells.append(Cell(text=_T("adam_param_code"), style="header2"))
             for row in rows[1:]:
                 for _j in range(NUM_OPERATIONAL_CODE_COLS):
-                    row.cells.append(TableCell())
+                    row.cells.append(Cell())
 
         perv_study_epoch_uid = None
         prev_visit_type_uid = None
-        prev_milestone_cell: TableCell | None = None
+        prev_milestone_cell: Cell | None = None
         for study_epoch_uid, visit_groups in grouped_visits.items():
             for group in visit_groups.values():
                 visit: StudyVisit = group[0]
@@ -1334,13 +1380,13 @@ class StudyFlowchartService:
                     perv_study_epoch_uid = study_epoch_uid
 
                     epochs_row.cells.append(
-                        TableCell(
+                        Cell(
                             text=visit.study_epoch.sponsor_preferred_name,
                             span=len(visit_groups),
                             style="header1",
                             refs=[
-                                Ref(
-                                    type_=SoAItemType.STUDY_EPOCH.value,
+                                CellRef(
+                                    type=SoAItemType.STUDY_EPOCH.value,
                                     uid=visit.study_epoch_uid,
                                 )
                             ],
@@ -1349,7 +1395,7 @@ class StudyFlowchartService:
 
                 else:
                     # Add empty cells after Epoch cell with span > 1
-                    epochs_row.cells.append(TableCell(span=0))
+                    epochs_row.cells.append(Cell(span=0))
 
                 # Milestones
                 if milestones_row:
@@ -1357,13 +1403,13 @@ class StudyFlowchartService:
                         if prev_visit_type_uid == visit.visit_type_uid:
                             # Same visit_type, then merge with the previous cell in Milestone row
                             prev_milestone_cell.span += 1
-                            milestones_row.cells.append(TableCell(span=0))
+                            milestones_row.cells.append(Cell(span=0))
 
                         else:
                             # Different visit_type, new label in Milestones row
                             prev_visit_type_uid = visit.visit_type_uid
                             milestones_row.cells.append(
-                                prev_milestone_cell := TableCell(
+                                prev_milestone_cell := Cell(
                                     visit.visit_type.sponsor_preferred_name,
                                     style="header1",
                                 )
@@ -1372,7 +1418,7 @@ class StudyFlowchartService:
                     else:
                         # Just an empty cell for non-milestones
                         prev_visit_type_uid = None
-                        milestones_row.cells.append(TableCell())
+                        milestones_row.cells.append(Cell())
 
                 visit_timing = ""
 
@@ -1405,24 +1451,24 @@ class StudyFlowchartService:
 
                 # Visit name cell
                 visits_row.cells.append(
-                    TableCell(
+                    Cell(
                         visit_name,
                         style="header2",
                         refs=[
-                            Ref(type_=SoAItemType.STUDY_VISIT.value, uid=vis.uid)
+                            CellRef(type=SoAItemType.STUDY_VISIT.value, uid=vis.uid)
                             for vis in group
                         ],
                     )
                 )
 
                 # Visit timing cell
-                timing_row.cells.append(TableCell(visit_timing, style="header3"))
+                timing_row.cells.append(Cell(visit_timing, style="header3"))
 
                 # Visit window
                 visit_window = cls._get_visit_window(visit)
 
                 # Visit window cell
-                window_row.cells.append(TableCell(visit_window, style="header4"))
+                window_row.cells.append(Cell(visit_window, style="header4"))
 
         if layout == SoALayout.PROTOCOL:
             # amend procedure label on protocol SoA
@@ -1514,7 +1560,7 @@ class StudyFlowchartService:
         study_activity_schedules: Sequence[StudyActivitySchedule],
         grouped_visits: dict[str, dict[str, list[StudyVisit]]],
         layout: SoALayout,
-    ) -> list[TableRow]:
+    ) -> list[Row]:
         """Builds activity rows also adding various group header rows when required"""
 
         # Ordered StudyVisit.uids of visits to show (showing only the first visit of a consecutive_visit_group)
@@ -1604,8 +1650,8 @@ class StudyFlowchartService:
                     )
                     activity_group_row.cells[0].refs.insert(
                         -1,
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_GROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_GROUP.value,
                             uid=study_selection_activity.study_activity_group.study_activity_group_uid,
                         ),
                     )
@@ -1651,8 +1697,8 @@ class StudyFlowchartService:
                     # Reference uids of merged StudyActivitySubGroups
                     activity_subgroup_row.cells[0].refs.insert(
                         -1,
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
                             uid=study_selection_activity.study_activity_subgroup.study_activity_subgroup_uid,
                         ),
                     )
@@ -1710,10 +1756,10 @@ class StudyFlowchartService:
             StudySelectionActivity | StudySelectionActivityInstance
         ),
         layout: SoALayout,
-    ) -> TableRow:
-        """returns TableRow for Activity"""
+    ) -> Row:
+        """returns Row for Activity"""
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.order,
             level=4,
             hide=not getattr(
@@ -1728,7 +1774,7 @@ class StudyFlowchartService:
 
         if layout == SoALayout.OPERATIONAL:
             for _ in range(NUM_OPERATIONAL_CODE_COLS):
-                row.cells.append(TableCell())
+                row.cells.append(Cell())
 
         return row
 
@@ -1737,7 +1783,7 @@ class StudyFlowchartService:
         study_selection_activity: (
             StudySelectionActivity | StudySelectionActivityInstance
         ),
-    ) -> TableCell:
+    ) -> Cell:
         is_placeholder = (
             study_selection_activity.activity.library_name
             == settings.requested_library_name
@@ -1753,16 +1799,16 @@ class StudyFlowchartService:
             )
         else:
             style = "activity"
-        return TableCell(
+        return Cell(
             study_selection_activity.activity.name,
             style=style,
             refs=[
-                Ref(
-                    type_=SoAItemType.STUDY_ACTIVITY.value,
+                CellRef(
+                    type=SoAItemType.STUDY_ACTIVITY.value,
                     uid=study_selection_activity.study_activity_uid,
                 ),
-                Ref(
-                    type_="Activity",
+                CellRef(
+                    type="Activity",
                     uid=study_selection_activity.activity.uid,
                 ),
             ],
@@ -1770,14 +1816,14 @@ class StudyFlowchartService:
 
     @staticmethod
     def _append_activity_crosses(
-        row: TableRow,
+        row: Row,
         visit_groups: Iterable[list[StudyVisit]],
         study_activity_schedules_mapping: Mapping[
             tuple[str, str], StudyActivitySchedule
         ],
         activity_id: str,
     ) -> None:
-        """appends TableCells to TableRow with crosses based on Activity Schedules to StudyVisit mapping"""
+        """appends TableCells to Row with crosses based on Activity Schedules to StudyVisit mapping"""
 
         # Iterate over visit groups to look up scheduled Activities
         for visit_group in visit_groups:
@@ -1800,12 +1846,12 @@ class StudyFlowchartService:
             # Append a cell with check-mark if Activities are scheduled
             if study_activity_schedule_uids:
                 row.cells.append(
-                    TableCell(
+                    Cell(
                         SOA_CHECK_MARK,
                         style="activitySchedule",
                         refs=[
-                            Ref(
-                                type_=SoAItemType.STUDY_ACTIVITY_SCHEDULE.value,
+                            CellRef(
+                                type=SoAItemType.STUDY_ACTIVITY_SCHEDULE.value,
                                 uid=uid,
                             )
                             for uid in study_activity_schedule_uids
@@ -1815,17 +1861,17 @@ class StudyFlowchartService:
 
             # Append an empty cell if no Activity is scheduled
             else:
-                row.cells.append(TableCell())
+                row.cells.append(Cell())
 
     @staticmethod
     def _get_activity_instance_row(
         study_selection_activity: (
             StudySelectionActivityInstance | StudySelectionActivity
         ),
-    ) -> TableRow:
-        """returns TableRow for Activity Instance row"""
+    ) -> Row:
+        """returns Row for Activity Instance row"""
 
-        row = TableRow(
+        row = Row(
             hide=not getattr(
                 study_selection_activity,
                 "show_activity_instance_in_protocol_flowchart",
@@ -1835,12 +1881,12 @@ class StudyFlowchartService:
 
         # Activity name cell (Activity row first column)
         row.cells.append(
-            TableCell(
+            Cell(
                 study_selection_activity.activity_instance.name,
                 style="activityInstance",
                 refs=[
-                    Ref(
-                        type_=SoAItemType.STUDY_ACTIVITY_INSTANCE.value,
+                    CellRef(
+                        type=SoAItemType.STUDY_ACTIVITY_INSTANCE.value,
                         uid=study_selection_activity.study_activity_instance_uid,
                     )
                 ],
@@ -1848,10 +1894,10 @@ class StudyFlowchartService:
         )
 
         row.cells.append(
-            TableCell(study_selection_activity.activity_instance.topic_code or "")
+            Cell(study_selection_activity.activity_instance.topic_code or "")
         )
         row.cells.append(
-            TableCell(study_selection_activity.activity_instance.adam_param_code or "")
+            Cell(study_selection_activity.activity_instance.adam_param_code or "")
         )
 
         return row
@@ -1863,10 +1909,10 @@ class StudyFlowchartService:
             StudySelectionActivity | StudySelectionActivityInstance
         ),
         num_cols: int,
-    ) -> TableRow:
-        """returns TableRow for SoA Group row"""
+    ) -> Row:
+        """returns Row for SoA Group row"""
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.study_soa_group.order,
             level=1,
             hide=not getattr(
@@ -1882,24 +1928,24 @@ class StudyFlowchartService:
         )
 
         # fill the row with empty cells for visits #
-        row.cells += [TableCell() for _ in range(num_cols - 1)]
+        row.cells += [Cell() for _ in range(num_cols - 1)]
 
         return row
 
     @staticmethod
     def _get_soa_group_cell(
         study_soa_group: StudySoAGroup | SimpleStudySoAGroup,
-    ) -> TableCell:
-        return TableCell(
+    ) -> Cell:
+        return Cell(
             study_soa_group.soa_group_term_name,
             style="soaGroup",
             refs=[
-                Ref(
-                    type_=SoAItemType.STUDY_SOA_GROUP.value,
+                CellRef(
+                    type=SoAItemType.STUDY_SOA_GROUP.value,
                     uid=study_soa_group.study_soa_group_uid,
                 ),
-                Ref(
-                    type_="CTTerm",
+                CellRef(
+                    type="CTTerm",
                     uid=study_soa_group.soa_group_term_uid,
                 ),
             ],
@@ -1911,8 +1957,8 @@ class StudyFlowchartService:
             StudySelectionActivity | StudySelectionActivityInstance
         ),
         num_cols: int,
-    ) -> TableRow:
-        """returns TableRow for Activity Group row"""
+    ) -> Row:
+        """returns Row for Activity Group row"""
 
         group_name = (
             study_selection_activity.study_activity_group.activity_group_name
@@ -1920,7 +1966,7 @@ class StudyFlowchartService:
             else _T("no_study_group")
         )
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.study_activity_group.order,
             level=2,
             hide=not getattr(
@@ -1931,17 +1977,17 @@ class StudyFlowchartService:
         )
 
         row.cells.append(
-            TableCell(
+            Cell(
                 group_name,
                 style="group",
                 refs=(
                     [
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_GROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_GROUP.value,
                             uid=study_selection_activity.study_activity_group.study_activity_group_uid,
                         ),
-                        Ref(
-                            type_="ActivityGroup",
+                        CellRef(
+                            type="ActivityGroup",
                             uid=study_selection_activity.study_activity_group.activity_group_uid,
                         ),
                     ]
@@ -1952,29 +1998,29 @@ class StudyFlowchartService:
         )
 
         # fill the row with empty cells for visits #
-        row.cells += [TableCell() for _ in range(num_cols - 1)]
+        row.cells += [Cell() for _ in range(num_cols - 1)]
 
         return row
 
     @staticmethod
-    def _get_activity_group_cell(study_activity_group: StudyActivityGroup) -> TableCell:
+    def _get_activity_group_cell(study_activity_group: StudyActivityGroup) -> Cell:
         name = (
             study_activity_group.activity_group_name
             if study_activity_group.activity_group_uid
             else _T("no_study_group")
         )
 
-        return TableCell(
+        return Cell(
             name,
             style="group",
             refs=(
                 [
-                    Ref(
-                        type_=SoAItemType.STUDY_ACTIVITY_GROUP.value,
+                    CellRef(
+                        type=SoAItemType.STUDY_ACTIVITY_GROUP.value,
                         uid=study_activity_group.study_activity_group_uid,
                     ),
-                    Ref(
-                        type_="ActivityGroup",
+                    CellRef(
+                        type="ActivityGroup",
                         uid=study_activity_group.activity_group_uid,
                     ),
                 ]
@@ -1989,8 +2035,8 @@ class StudyFlowchartService:
             StudySelectionActivity | StudySelectionActivityInstance
         ),
         num_cols: int,
-    ) -> TableRow:
-        """returns TableRow for Activity SubGroup row"""
+    ) -> Row:
+        """returns Row for Activity SubGroup row"""
 
         group_name = (
             study_selection_activity.study_activity_subgroup.activity_subgroup_name
@@ -1998,7 +2044,7 @@ class StudyFlowchartService:
             else _T("no_study_subgroup")
         )
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.study_activity_subgroup.order,
             level=3,
             hide=not getattr(
@@ -2009,17 +2055,17 @@ class StudyFlowchartService:
         )
 
         row.cells.append(
-            TableCell(
+            Cell(
                 group_name,
                 style="subGroup",
                 refs=(
                     [
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
                             uid=study_selection_activity.study_activity_subgroup.study_activity_subgroup_uid,
                         ),
-                        Ref(
-                            type_="ActivitySubGroup",
+                        CellRef(
+                            type="ActivitySubGroup",
                             uid=study_selection_activity.study_activity_subgroup.activity_subgroup_uid,
                         ),
                     ]
@@ -2030,31 +2076,31 @@ class StudyFlowchartService:
         )
 
         # fill the row with empty cells for visits #
-        row.cells += [TableCell() for _ in range(num_cols - 1)]
+        row.cells += [Cell() for _ in range(num_cols - 1)]
 
         return row
 
     @staticmethod
     def _get_activity_subgroup_cell(
         study_activity_subgroup: StudyActivitySubGroup,
-    ) -> TableCell:
+    ) -> Cell:
         name = (
             study_activity_subgroup.activity_subgroup_name
             if study_activity_subgroup.activity_subgroup_uid
             else _T("no_study_subgroup")
         )
 
-        return TableCell(
+        return Cell(
             name,
             style="subGroup",
             refs=(
                 [
-                    Ref(
-                        type_=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
+                    CellRef(
+                        type=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
                         uid=study_activity_subgroup.study_activity_subgroup_uid,
                     ),
-                    Ref(
-                        type_="ActivitySubGroup",
+                    CellRef(
+                        type="ActivitySubGroup",
                         uid=study_activity_subgroup.activity_subgroup_uid,
                     ),
                 ]
@@ -2067,7 +2113,7 @@ class StudyFlowchartService:
     @trace_calls
     def add_footnotes(
         cls,
-        table: TableWithFootnotes,
+        table: Table,
         footnotes: list[StudySoAFootnote],
     ):
         """Adds footnote symbols to table rows based on the referenced uids"""
@@ -2091,17 +2137,17 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def show_hidden_rows(rows: Iterable[TableRow]):
+    def show_hidden_rows(rows: Iterable[Row]):
         """Unhides all rows in-place"""
 
-        row: TableRow
+        row: Row
         for row in rows:
             # unhide all rows
             row.hide = False
 
     @staticmethod
     @trace_calls
-    def remove_hidden_rows(table: TableWithFootnotes):
+    def remove_hidden_rows(table: Table):
         """Removes hidden rows from table"""
 
         hidden_header_rows_count = sum(
@@ -2112,7 +2158,7 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def propagate_hidden_rows(rows: Iterable[TableRow], propagate_refs: bool = False):
+    def propagate_hidden_rows(rows: Iterable[Row], propagate_refs: bool = False):
         """
         Modify table in place to for Protocol SoA
 
@@ -2123,7 +2169,7 @@ class StudyFlowchartService:
         activity_group_row = None
         activity_subgroup_row = None
 
-        row: TableRow
+        row: Row
         for row in rows:
             if not (row.cells and row.cells[0].refs):
                 continue
@@ -2154,9 +2200,9 @@ class StudyFlowchartService:
                     update_row = soa_group_term_row
 
                 if update_row and len(update_row.cells) == len(row.cells):
-                    cell: TableCell
+                    cell: Cell
                     for i, cell in enumerate(row.cells):
-                        update_cell: TableCell = update_row.cells[i]
+                        update_cell: Cell = update_row.cells[i]
 
                         if i > 0:
                             update_cell.text = update_cell.text or cell.text
@@ -2171,21 +2217,21 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def add_protocol_section_column(table: TableWithFootnotes):
+    def add_protocol_section_column(table: Table):
         """Add Protocol Section column to table, updates table in place"""
 
         table.rows[0].cells.insert(
             table.num_header_cols,
-            TableCell(text=_T("protocol_section"), style="header1"),
+            Cell(text=_T("protocol_section"), style="header1"),
         )
 
-        row: TableRow
+        row: Row
         for row in table.rows[1:]:
-            row.cells.insert(table.num_header_cols, TableCell())
+            row.cells.insert(table.num_header_cols, Cell())
 
     @staticmethod
     @trace_calls
-    def amend_procedure_label(rows: Sequence[TableRow]):
+    def amend_procedure_label(rows: Sequence[Row]):
         """Overwrite text in the first column of the first visible row (among the first two rows)"""
         for row in rows[: min(3, len(rows))]:
             if not row.hide:
@@ -2194,9 +2240,7 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def add_coordinates(
-        table: TableWithFootnotes, coordinates: Mapping[str, tuple[int, int]]
-    ):
+    def add_coordinates(table: Table, coordinates: Mapping[str, tuple[int, int]]):
         """Append coordinates as if they were footnote references to each table cell"""
         for row in table.rows:
             for cell in row.cells:
@@ -2209,7 +2253,7 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def add_uid_debug(table: TableWithFootnotes):
+    def add_uid_debug(table: Table):
         """Append coordinates as if they were footnote references to each table cell"""
         for row in table.rows:
             for cell in row.cells:
@@ -2445,55 +2489,55 @@ class StudyFlowchartService:
         )
 
         # Fetch database objects in parallel
-        with ThreadPoolExecutor() as executor:
-            soa_preferences_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_soa_preferences),
-                study_uid,
-                study_value_version=study_value_version,
-            )
+        executor = get_fetch_executor()
+        soa_preferences_future = executor.submit(
+            self._get_soa_preferences,
+            study_uid,
+            study_value_version=study_value_version,
+        )
 
-            soa_snapshot_future = executor.submit(
-                RuntimeContext.with_current_context(self.repository.load),
-                study_uid=study_uid,
-                study_value_version=study_value_version,
-                layout=layout,
-            )
+        soa_snapshot_future = executor.submit(
+            self.repository.load,
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+            layout=layout,
+        )
 
-            study_visits_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_study_visits),
-                study_uid=study_uid,
-                study_value_version=study_value_version,
-            )
+        study_visits_future = executor.submit(
+            self._get_study_visits,
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+        )
 
-            study_soa_groups_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_study_soa_groups),
-                study_uid=study_uid,
-                study_value_version=study_value_version,
-            )
+        study_soa_groups_future = executor.submit(
+            self._get_study_soa_groups,
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+        )
 
-            study_activity_groups_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_study_activity_groups),
-                study_uid=study_uid,
-                study_value_version=study_value_version,
-            )
+        study_activity_groups_future = executor.submit(
+            self._get_study_activity_groups,
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+        )
 
-            study_activity_subgroups_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_study_activity_subgroups),
-                study_uid=study_uid,
-                study_value_version=study_value_version,
-            )
+        study_activity_subgroups_future = executor.submit(
+            self._get_study_activity_subgroups,
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+        )
 
-            study_activities_future = executor.submit(
-                RuntimeContext.with_current_context(self.fetch_study_activities),
-                study_uid=study_uid,
-                study_value_version=study_value_version,
-            )
+        study_activities_future = executor.submit(
+            self.fetch_study_activities,
+            study_uid=study_uid,
+            study_value_version=study_value_version,
+        )
 
-            study_footnotes_future = executor.submit(
-                RuntimeContext.with_current_context(self._get_study_footnotes),
-                study_uid,
-                study_value_version=study_value_version,
-            )
+        study_footnotes_future = executor.submit(
+            self._get_study_footnotes,
+            study_uid,
+            study_value_version=study_value_version,
+        )
 
         soa_preferences: StudySoaPreferences = soa_preferences_future.result()
 
@@ -2554,7 +2598,7 @@ class StudyFlowchartService:
         study_value_version: str | None = None,
         layout: SoALayout = SoALayout.PROTOCOL,
         time_unit: str | None = None,
-    ) -> TableWithFootnotes:
+    ) -> Table:
         """Loads SoA snapshot from db, and reconstructs SoA table and footnotes"""
 
         (
@@ -2600,32 +2644,32 @@ class StudyFlowchartService:
             msg=f"Study with uid '{study_uid}' and version '{study_value_version}' has insufficient data in SoA snapshot",
         )
 
-        table = TableWithFootnotes(
+        table = Table(
             rows=[
-                TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
+                Row(cells=[Cell() for _ in range(num_cols)], hide=False)
                 for _ in range(num_rows)
             ],
             num_header_cols=1,
             title=_T("protocol_flowchart"),
         )
 
-        epoch_row = TableRow(
-            cells=[TableCell(span=0) for _ in range(num_cols)],
+        epoch_row = Row(
+            cells=[Cell(span=0) for _ in range(num_cols)],
             hide=not (layout == SoALayout.OPERATIONAL or soa_preferences.show_epochs),
         )
-        epoch_row.cells[0] = TableCell(text=_T("study_epoch"), style="header1")
+        epoch_row.cells[0] = Cell(text=_T("study_epoch"), style="header1")
 
         for col_idx, ref in epoch_references.items():
             study_epoch: StudyEpochTiny = study_epochs_by_uid[
                 ref.referenced_item.item_uid
             ]
-            epoch_row.cells[col_idx] = TableCell(
+            epoch_row.cells[col_idx] = Cell(
                 text=study_epoch.epoch_name,
                 span=ref.span,
                 style="header1",
                 refs=[
-                    Ref(
-                        type_=ref.referenced_item.item_type.value,
+                    CellRef(
+                        type=ref.referenced_item.item_type.value,
                         uid=study_epoch.uid,
                     )
                 ],
@@ -2635,25 +2679,25 @@ class StudyFlowchartService:
             for i in range(1, ref.span):
                 epoch_row.cells[col_idx + i].span = 0
 
-        milestone_row = TableRow(
-            cells=[TableCell() for _ in range(num_cols)],
+        milestone_row = Row(
+            cells=[Cell() for _ in range(num_cols)],
             hide=(
                 layout == SoALayout.OPERATIONAL or not soa_preferences.show_milestones
             ),
         )
-        milestone_row.cells[0] = TableCell(text=_T("study_milestone"), style="header1")
+        milestone_row.cells[0] = Cell(text=_T("study_milestone"), style="header1")
 
-        visit_row = TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
-        visit_row.cells[0] = TableCell(text=_T("visit_short_name"), style="header2")
+        visit_row = Row(cells=[Cell() for _ in range(num_cols)], hide=False)
+        visit_row.cells[0] = Cell(text=_T("visit_short_name"), style="header2")
 
-        timing_row = TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
+        timing_row = Row(cells=[Cell() for _ in range(num_cols)], hide=False)
         if time_unit == "day":
-            timing_row.cells[0] = TableCell(text=_T("study_day"), style="header3")
+            timing_row.cells[0] = Cell(text=_T("study_day"), style="header3")
         else:
-            timing_row.cells[0] = TableCell(text=_T("study_week"), style="header3")
+            timing_row.cells[0] = Cell(text=_T("study_week"), style="header3")
         visit_timing_prop = self._get_visit_timing_property(time_unit, soa_preferences)
 
-        window_row = TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
+        window_row = Row(cells=[Cell() for _ in range(num_cols)], hide=False)
         visit_window_unit = next(
             (
                 study_visits_by_uid[ref.referenced_item.item_uid].visit_window_unit_name
@@ -2663,12 +2707,12 @@ class StudyFlowchartService:
             "",
         )
         # Append window unit used by all StudyVisits
-        window_row.cells[0] = TableCell(
+        window_row.cells[0] = Cell(
             text=_T("visit_window").format(unit_name=visit_window_unit), style="header4"
         )
 
         prev_visit_type_uid = None
-        prev_milestone_cell: TableCell | None = None
+        prev_milestone_cell: Cell | None = None
         for col_idx, refs in visit_references.items():
             visits_in_group = [
                 study_visits_by_uid[ref.referenced_item.item_uid] for ref in refs
@@ -2684,17 +2728,17 @@ class StudyFlowchartService:
                 else:
                     # Different visit_type, new label in Milestones row
                     prev_visit_type_uid = visit.visit_type_uid
-                    milestone_row.cells[col_idx] = prev_milestone_cell = TableCell(
+                    milestone_row.cells[col_idx] = prev_milestone_cell = Cell(
                         visit.visit_type.sponsor_preferred_name,
                         style="header1",
                     )
 
-            visit_row.cells[col_idx] = TableCell(
+            visit_row.cells[col_idx] = Cell(
                 self._get_visit_name(visit, num_visits_in_group=len(visits_in_group)),
                 style="header2",
                 refs=[
-                    Ref(
-                        type_=ref.referenced_item.item_type.value,
+                    CellRef(
+                        type=ref.referenced_item.item_type.value,
                         uid=ref.referenced_item.item_uid,
                     )
                     for ref in refs
@@ -2703,12 +2747,12 @@ class StudyFlowchartService:
                 footnotes=[fr.symbol for fr in refs[0].footnote_references] or None,
             )
 
-            timing_row.cells[col_idx] = TableCell(
+            timing_row.cells[col_idx] = Cell(
                 self._get_visit_timing(visits_in_group, visit_timing_prop),
                 style="header3",
             )
 
-            window_row.cells[col_idx] = TableCell(
+            window_row.cells[col_idx] = Cell(
                 self._get_visit_window(visit), style="header4"
             )
 
@@ -2754,8 +2798,8 @@ class StudyFlowchartService:
                 # add refs only for non-propagated rows to avoid footnote propagation
                 if not ref.is_propagated:
                     cell.refs = [
-                        Ref(
-                            type_=ref.referenced_item.item_type.value,
+                        CellRef(
+                            type=ref.referenced_item.item_type.value,
                             uid=ref.referenced_item.item_uid,
                         )
                     ]
@@ -2766,8 +2810,8 @@ class StudyFlowchartService:
             if not ref.is_propagated:
                 # append remaining refs to cell to exactly match result of get_soa_flowchart()
                 add_refs = [
-                    Ref(
-                        type_=ref.referenced_item.item_type.value,
+                    CellRef(
+                        type=ref.referenced_item.item_type.value,
                         uid=ref.referenced_item.item_uid,
                     )
                     for ref in refs[1:]
@@ -2849,7 +2893,7 @@ class StudyFlowchartService:
     @staticmethod
     @trace_calls
     def _extract_soa_footnote_refs(
-        table: TableWithFootnotes,
+        table: Table,
     ) -> list[SoAFootnoteReference]:
         footnote_references = [
             SoAFootnoteReference(
@@ -2864,7 +2908,7 @@ class StudyFlowchartService:
         return footnote_references
 
     @staticmethod
-    def _get_visit_refs(header_rows: Iterable[TableRow]) -> dict[int, Ref]:
+    def _get_visit_refs(header_rows: Iterable[Row]) -> dict[int, CellRef]:
         """Extracts StudyVisit references from SoA table header rows, indexed by column index"""
 
         visit_refs: dict[int, ReferencedItem] = {}
@@ -2883,7 +2927,7 @@ class StudyFlowchartService:
     @staticmethod
     @trace_calls
     def _extract_soa_cell_refs(
-        table: TableWithFootnotes, layout: SoALayout
+        table: Table, layout: SoALayout
     ) -> list[SoACellReference]:
         """Extracts SoA cell references from SoA table
 
@@ -2897,7 +2941,7 @@ class StudyFlowchartService:
         def collect_cell_references(
             row_idx: int,
             col_idx: int,
-            cell: TableCell,
+            cell: Cell,
             accepted_ref_types: Iterable,
             is_propagated=False,
             order: int = 0,
@@ -2950,7 +2994,7 @@ class StudyFlowchartService:
                     (
                         layout == SoALayout.OPERATIONAL
                         and SoAItemType.STUDY_ACTIVITY_INSTANCE.value
-                        # No Ref.type will match with False as Ref.type cannot be bool by model definition
+                        # No CellRef.type will match with False as CellRef.type cannot be bool by model definition
                     ),
                 },
             )
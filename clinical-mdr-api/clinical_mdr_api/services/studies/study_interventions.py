@@ -3,8 +3,6 @@
 import logging
 from typing import Any, Mapping
 
-from docx.enum.style import WD_STYLE_TYPE
-
 from clinical_mdr_api.models.study_selections.study_selection import (
     StudyCompoundDosing,
     StudySelectionArm,
@@ -52,12 +50,11 @@ _gettext = {
 
 log = logging.getLogger(__name__)
 
-# pylint: disable=no-member
 DOCX_STYLES = {
-    "table": ("SB Table Condensed", WD_STYLE_TYPE.TABLE),
-    "header1": ("Table Header lvl1", WD_STYLE_TYPE.PARAGRAPH),
-    "header2": ("Table Header lvl2", WD_STYLE_TYPE.PARAGRAPH),
-    None: ("Table Text", WD_STYLE_TYPE.PARAGRAPH),
+    "table": ("SB Table Condensed", "TABLE"),
+    "header1": ("Table Header lvl1", "PARAGRAPH"),
+    "header2": ("Table Header lvl2", "PARAGRAPH"),
+    None: ("Table Text", "PARAGRAPH"),
 }
 
 
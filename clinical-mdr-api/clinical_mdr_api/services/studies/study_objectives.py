@@ -1,14 +1,15 @@
 from logging import getLogger
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from docx.enum.style import WD_STYLE_TYPE
 from yattag.doc import Doc
 
 from clinical_mdr_api.services.studies.study import StudyService
 from clinical_mdr_api.services.studies.study_endpoint_selection import (
     StudyEndpointSelectionService,
 )
-from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+
+if TYPE_CHECKING:
+    from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
 
 
 # TODO LOCALIZATION
@@ -18,19 +19,18 @@ def _gettext(x):
 
 log = getLogger(__name__)
 
-# pylint: disable=no-member
 STYLES = {
-    "table": ("SB Table Condensed", WD_STYLE_TYPE.TABLE),
-    "header1": ("Table Header lvl1", WD_STYLE_TYPE.PARAGRAPH),
-    "header2": ("Table Header lvl2", WD_STYLE_TYPE.PARAGRAPH),
-    "objective-level": ("Table Header lvl2", WD_STYLE_TYPE.PARAGRAPH),
-    "endpoint-level": ("Table lvl 1", WD_STYLE_TYPE.PARAGRAPH),
-    "objective": ("Table lvl 2", WD_STYLE_TYPE.PARAGRAPH),
-    "endpoint": ("Table lvl 3", WD_STYLE_TYPE.PARAGRAPH),
-    "timeframe": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "units": ("Table lvl 4", WD_STYLE_TYPE.PARAGRAPH),
-    "ul": ("Bullet List", WD_STYLE_TYPE.PARAGRAPH),
-    "ol": ("Bullet List Numbered", WD_STYLE_TYPE.PARAGRAPH),
+    "table": ("SB Table Condensed", "TABLE"),
+    "header1": ("Table Header lvl1", "PARAGRAPH"),
+    "header2": ("Table Header lvl2", "PARAGRAPH"),
+    "objective-level": ("Table Header lvl2", "PARAGRAPH"),
+    "endpoint-level": ("Table lvl 1", "PARAGRAPH"),
+    "objective": ("Table lvl 2", "PARAGRAPH"),
+    "endpoint": ("Table lvl 3", "PARAGRAPH"),
+    "timeframe": ("Table lvl 4", "PARAGRAPH"),
+    "units": ("Table lvl 4", "PARAGRAPH"),
+    "ul": ("Bullet List", "PARAGRAPH"),
+    "ol": ("Bullet List Numbered", "PARAGRAPH"),
 }
 
 
@@ -72,14 +72,14 @@ class StudyObjectivesService:
         return self._build_standard_html(tree)
 
     # Not used but kept for future layout
-    def get_condensed_docx(self, study_uid) -> DocxBuilder:
+    def get_condensed_docx(self, study_uid) -> "DocxBuilder":
         selection = self._get_all_selection(study_uid)
         root = self._build_condensed_tree(selection)
         return self._build_condensed_docx(root)
 
     def get_standard_docx(
         self, study_uid, study_value_version: str | None = None
-    ) -> DocxBuilder:
+    ) -> "DocxBuilder":
         selection = self._get_all_selection(
             study_uid, study_value_version=study_value_version
         )
@@ -294,7 +294,9 @@ class StudyObjectivesService:
         return doc.getvalue()
 
     @staticmethod
-    def _build_condensed_docx(tree) -> DocxBuilder:
+    def _build_condensed_docx(tree) -> "DocxBuilder":
+        from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+
         docx = DocxBuilder(STYLES)
         table = docx.create_table(num_rows=1, num_columns=2)
 
@@ -349,11 +351,13 @@ class StudyObjectivesService:
 
         return docx
 
-    def _build_standard_docx(self, tree) -> DocxBuilder:
-        num_rows, num_cols = 1, 4
+    def _build_standard_docx(self, tree) -> "DocxBuilder":
+        from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+
+        num_cols = 4
 
         docx = DocxBuilder(STYLES)
-        table = docx.create_table(num_rows=num_rows, num_columns=num_cols)
+        table = docx.create_table(num_rows=1, num_columns=num_cols)
 
         row = table.rows[0]
 
@@ -374,7 +378,6 @@ class StudyObjectivesService:
             key=lambda o: o[0].order if o[0].order else 0,
         ):
             row = table.add_row()
-            num_rows += 1
 
             docx.replace_content(
                 row.cells[0],
@@ -389,7 +392,6 @@ class StudyObjectivesService:
                 study_objectives.values(), key=lambda o: o[0].order
             ):
                 row = table.add_row()
-                num_rows += 1
 
                 docx.add_html(
                     row.cells[0],
@@ -411,12 +413,9 @@ class StudyObjectivesService:
 
                     if epl_idx:
                         # Start a new row expect for the first endpoint-level
-                        row = table.add_row()
-                        num_rows += 1
+                        previous_row, row = row, table.add_row()
                         # Merge first column to previous row
-                        docx.merge_cells(
-                            (table.rows[num_rows - 2].cells[0], row.cells[0])
-                        )
+                        docx.merge_cells((previous_row.cells[0], row.cells[0]))
 
                     docx.replace_content(
                         row.cells[1],
@@ -429,13 +428,10 @@ class StudyObjectivesService:
                     for study_endpoint in sorted(
                         study_endpoints.values(), key=lambda o: o.order
                     ):
-                        row = table.add_row()
-                        num_rows += 1
+                        previous_row, row = row, table.add_row()
 
                         # Merge first column to previous row
-                        docx.merge_cells(
-                            (table.rows[num_rows - 2].cells[0], row.cells[0])
-                        )
+                        docx.merge_cells((previous_row.cells[0], row.cells[0]))
 
                         docx.add_html(
                             row.cells[1],
@@ -1,7 +1,8 @@
 """Base classes/mixins related to study selection."""
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Sequence
+from typing import Any, Callable, Sequence
 
 from opencensus.trace import execution_context
 
@@ -21,6 +22,7 @@ from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     SimpleCTTermNameWithConflictFlag,
     SimpleTermModel,
 )
+from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_selection import (
     StudySelectionBranchArmWithoutStudyArm,
 )
@@ -36,11 +38,34 @@ from clinical_mdr_api.models.syntax_templates.endpoint_template import EndpointT
 from clinical_mdr_api.models.syntax_templates.objective_template import (
     ObjectiveTemplate,
 )
+from clinical_mdr_api.models.utils import BaseModel, BatchInputModel
 from common import exceptions
 from common.config import settings
 from common.telemetry import trace_calls
 
 
+@dataclass(frozen=True)
+class StudySelectionBatchOperation:
+    """
+    One kind (HTTP method) of operation accepted by a study selection batch endpoint.
+
+    `apply` changes the loaded selection aggregate in memory and returns the uid of the affected selection,
+    `transform` builds the response item from the saved aggregate, the selection uid
+    and the study standards effective date. Operations without `transform` remove the selection,
+    they aren't validated and their response has no content.
+    `after_save` writes what isn't part of the aggregate (e.g. connected design cells) once it is saved,
+    it gets the saved aggregate and the selection uid and runs in the order of the operations.
+    `input_type` can be a tuple when the payload union of the endpoint parses one method's content
+    into several models.
+    """
+
+    input_type: type[BaseModel] | tuple[type[BaseModel], ...]
+    response_code: int
+    apply: Callable[[Any, Any], str]
+    transform: Callable[[Any, str, datetime | None], Any] | None = None
+    after_save: Callable[[Any, str], None] | None = None
+
+
 class StudySelectionMixin:
 
     @trace_calls
@@ -833,6 +858,20 @@ class StudySelectionMixin:
             )
         return terms_at_specific_datetime
 
+    def _extract_studies_standards_effective_dates(
+        self, study_uids: set[str], study_value_version: str | None = None
+    ) -> dict[str, datetime | None]:
+        """
+        Returns the effective date of the study standards of each given study,
+        used when a page of selections can span several studies.
+        """
+        return {
+            study_uid: self._extract_study_standards_effective_date(
+                study_uid=study_uid, study_value_version=study_value_version
+            )
+            for study_uid in study_uids
+        }
+
     @trace_calls
     def _extract_multiple_version_study_standards_effective_date(
         self, study_uid: str, list_of_start_dates: Sequence[datetime]
@@ -893,3 +932,133 @@ class StudySelectionMixin:
                 effective_dates.append(None)
 
         return effective_dates
+
+    @trace_calls
+    def _handle_selection_batch_operations(
+        self,
+        study_uid: str,
+        operations: Sequence[BatchInputModel],
+        operation_kinds: dict[str, StudySelectionBatchOperation],
+        find_by_study: Callable[..., Any],
+        save: Callable[[Any, str], Any],
+        validate_selection: Callable[[Any], None],
+        output_model: type[BaseModel],
+        report_item_errors: bool = False,
+    ) -> list[Any]:
+        """
+        Applies a batch of operations to a study selection aggregate and persists it once.
+
+        All operations are checked against `operation_kinds` before the aggregate is loaded with
+        `find_by_study` (and the study locked). They are then applied in order to the in-memory aggregate,
+        which is written with a single `save` call, so the reordering and the checks of one item
+        aren't repeated for every other item of the batch. The selections created or changed by the batch
+        are validated after the save, in the same transaction, as uniqueness checks need to see the other
+        items of the batch. A selection removed by the batch can't be created or changed by another
+        operation of the same batch.
+
+        By default batches are all-or-nothing: the first error is raised, so that the endpoint answers
+        with its status code, and the whole batch is rolled back.
+        With `report_item_errors`, the errors of checking and applying an operation are returned
+        as the result of that operation instead, and the other operations are saved.
+        Errors of saving and validating the aggregate still fail the whole batch.
+
+        It is used by the selections loaded and saved as a whole: study arms, cohorts, branch arms and design cells.
+        The other batch endpoints keep their own paths:
+        - study activities cascade into SoA groups and schedules, which are written in bulk on their own
+        - SoA footnotes, activity instances and activity instructions are separate nodes without an aggregate,
+          and their repositories save one selection at a time
+        """
+        results: list[Any] = [None] * len(operations)
+
+        def report_error(index: int, error: exceptions.MDRApiBaseException) -> None:
+            if not report_item_errors:
+                raise error
+            results[index] = output_model.model_construct(
+                response_code=error.status_code,
+                content=BatchErrorResponse(message=str(error)),
+            )
+
+        for index, operation in enumerate(operations):
+            try:
+                operation_kind = operation_kinds.get(operation.method)
+                if operation_kind is None:
+                    raise exceptions.MethodNotAllowedException(method=operation.method)
+                input_types = (
+                    operation_kind.input_type
+                    if isinstance(operation_kind.input_type, tuple)
+                    else (operation_kind.input_type,)
+                )
+                exceptions.ValidationException.raise_if_not(
+                    isinstance(operation.content, input_types),
+                    msg=f"{operation.method} operation requires {' or '.join(input_type.__name__ for input_type in input_types)} as request payload.",
+                )
+            except exceptions.MDRApiBaseException as error:
+                report_error(index, error)
+
+        selection_aggregate = find_by_study(study_uid=study_uid, for_update=True)
+        exceptions.NotFoundException.raise_if(
+            selection_aggregate is None, "Study", study_uid
+        )
+
+        # index of each applied operation -> uid of its selection
+        selection_uids: dict[int, str] = {}
+        for index, operation in enumerate(operations):
+            if results[index] is not None:
+                continue
+            try:
+                selection_uids[index] = operation_kinds[operation.method].apply(
+                    selection_aggregate, operation.content
+                )
+            except exceptions.MDRApiBaseException as error:
+                report_error(index, error)
+
+        removed_uids = {
+            selection_uid
+            for index, selection_uid in selection_uids.items()
+            if operation_kinds[operations[index].method].transform is None
+        }
+        for index, selection_uid in list(selection_uids.items()):
+            if (
+                selection_uid in removed_uids
+                and operation_kinds[operations[index].method].transform
+            ):
+                del selection_uids[index]
+                report_error(
+                    index,
+                    exceptions.ValidationException(
+                        msg=f"Study selection with UID '{selection_uid}' is deleted by another operation of the batch."
+                    ),
+                )
+
+        save(selection_aggregate, self.author)
+
+        for index, selection_uid in selection_uids.items():
+            if after_save := operation_kinds[operations[index].method].after_save:
+                after_save(selection_aggregate, selection_uid)
+
+        for selection_uid in dict.fromkeys(selection_uids.values()):
+            if selection_uid in removed_uids:
+                continue
+            selection_vo, _ = selection_aggregate.get_specific_object_selection(
+                selection_uid
+            )
+            validate_selection(selection_vo)
+
+        terms_at_specific_datetime = self._extract_study_standards_effective_date(
+            study_uid=study_uid
+        )
+        for index, selection_uid in selection_uids.items():
+            operation_kind = operation_kinds[operations[index].method]
+            results[index] = output_model(
+                response_code=operation_kind.response_code,
+                content=(
+                    operation_kind.transform(
+                        selection_aggregate,
+                        selection_uid,
+                        terms_at_specific_datetime,
+                    )
+                    if operation_kind.transform
+                    else None
+                ),
+            )
+        return results
@@ -32,6 +32,7 @@ from clinical_mdr_api.services._utils import (
     calculate_diffs,
     calculate_diffs_history,
     extract_filtering_values,
+    is_database_filterable,
     service_level_generic_filtering,
     service_level_generic_header_filtering,
 )
@@ -49,6 +50,15 @@ from common.telemetry import trace_calls
 
 
 class StudySoAFootnoteService:
+    # StudySoAFootnote fields that can be filtered and sorted on in the database,
+    # the remaining ones are derived here and fall back to service level filtering
+    MINIMAL_RESPONSE_DB_FIELDS = frozenset({"uid", "study_uid", "footnote", "template"})
+    DB_FIELDS = MINIMAL_RESPONSE_DB_FIELDS | {
+        "modified",
+        "accepted_version",
+        "author_username",
+    }
+
     def __init__(self):
         self.author_id = user().id()
         self._repos = MetaRepository()
@@ -100,6 +110,25 @@ class StudySoAFootnoteService:
         else:
             study_uids = None
 
+        if is_database_filterable(self.DB_FIELDS, filter_by, sort_by):
+            page, total = self.repository.find_footnotes_page(
+                study_uids=study_uids,
+                study_value_version=study_value_version,
+                sort_by=sort_by,
+                page_number=page_number,
+                page_size=page_size,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
+            return GenericFilteringReturn(
+                items=[
+                    self._transform_vo_to_pydantic_model(study_soa_footnote_vo=item)
+                    for item, _ in page
+                ],
+                total=total,
+            )
+
         items = self.repository.find_all_footnotes(
             study_uids=study_uids,
             study_value_version=study_value_version,
@@ -135,6 +164,34 @@ class StudySoAFootnoteService:
         study_value_version: str | None = None,
         minimal_response: bool = False,
     ) -> GenericFilteringReturn[StudySoAFootnote]:
+        db_fields = (
+            self.MINIMAL_RESPONSE_DB_FIELDS if minimal_response else self.DB_FIELDS
+        )
+        if is_database_filterable(db_fields | {"order"}, filter_by, sort_by):
+            page, total = self.repository.find_footnotes_page(
+                study_uids=study_uid,
+                study_value_version=study_value_version,
+                full_query=not minimal_response,
+                sort_by=sort_by,
+                page_number=page_number,
+                page_size=page_size,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
+            return GenericFilteringReturn(
+                items=[
+                    self._transform_vo_to_pydantic_model(
+                        study_soa_footnote_vo=item,
+                        study_value_version=study_value_version,
+                        order=order,
+                        minimal_response=minimal_response,
+                    )
+                    for item, order in page
+                ],
+                total=total,
+            )
+
         items = self.repository.find_all_footnotes(
             study_uids=study_uid,
             study_value_version=study_value_version,
@@ -452,13 +509,6 @@ class StudySoAFootnoteService:
         soa_footnote = self.repository.find_by_uid(
             study_uid=study_uid, uid=study_soa_footnote_uid
         )
-        all_soa_footnotes = self.repository.find_all_footnotes(study_uids=study_uid)
-        # remove footnote that is being edited from calculations as it will be added in the end
-        all_soa_footnotes = [
-            soa_footnote
-            for soa_footnote in all_soa_footnotes
-            if soa_footnote.uid != study_soa_footnote_uid
-        ]
 
         if (
             footnote_edit_input.referenced_items == soa_footnote.referenced_items
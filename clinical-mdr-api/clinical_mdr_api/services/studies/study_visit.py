@@ -392,9 +392,7 @@ class StudyVisitService(StudySelectionMixin):
 
         # Find StudyVisitVO by uid in TimelineAR._generate_timeline() results, which sets properties on StudyVisitVOs
         timeline = TimelineAR(study_uid=study_uid, _visits=all_study_visits)
-        study_visit: StudyVisitVO | None = next(
-            (sv for sv in timeline.ordered_study_visits if sv.uid == uid), None
-        )
+        study_visit: StudyVisitVO | None = timeline.get_visit_by_uid(uid)
         if study_visit is None:
             raise exceptions.NotFoundException("Study Visit", uid)
 
@@ -681,11 +679,11 @@ class StudyVisitService(StudySelectionMixin):
                     )
                     visit_vo.week_in_study.value = visit.derive_week_in_study_number()
 
+                visit_vo_duration = timeline.get_absolute_duration(visit_vo)
                 for index, visit in enumerate(ordered_visits):
                     if visit_vo.visit_class != VisitClass.SPECIAL_VISIT:
                         if (
-                            visit.get_absolute_duration()
-                            == visit_vo.get_absolute_duration()
+                            timeline.get_absolute_duration(visit) == visit_vo_duration
                             and visit.uid != visit_vo.uid
                         ):
                             raise exceptions.AlreadyExistsException(
@@ -712,12 +710,12 @@ class StudyVisitService(StudySelectionMixin):
                 )
             else:
                 ordered_visits = timeline.ordered_study_visits
-                for index, visit in enumerate(ordered_visits):
+                visit_vo_duration = timeline.get_absolute_duration(visit_vo)
+                for visit in ordered_visits:
                     if (
                         VisitClass.SPECIAL_VISIT
                         not in (visit_vo.visit_class, visit.visit_class)
-                        and visit.get_absolute_duration()
-                        == visit_vo.get_absolute_duration()
+                        and timeline.get_absolute_duration(visit) == visit_vo_duration
                         and visit.uid != visit_vo.uid
                     ):
                         raise exceptions.AlreadyExistsException(
@@ -1249,10 +1247,7 @@ class StudyVisitService(StudySelectionMixin):
         study_visits = self.repo.find_all_visits_by_study_uid(study_uid)
         timeline = TimelineAR(study_uid=study_uid, _visits=study_visits)
         acquire_write_lock_study_value(uid=study_uid)
-        study_visit: StudyVisitVO | None = next(
-            (sv for sv in timeline.ordered_study_visits if sv.uid == study_visit_uid),
-            None,
-        )
+        study_visit: StudyVisitVO | None = timeline.get_visit_by_uid(study_visit_uid)
         if study_visit is None:
             raise exceptions.NotFoundException("Study Visit", study_visit_uid)
 
@@ -1313,17 +1308,11 @@ class StudyVisitService(StudySelectionMixin):
     def delete(self, study_uid: str, study_visit_uid: str):
         study_visits = self.repo.find_all_visits_by_study_uid(study_uid)
         timeline = TimelineAR(study_uid=study_uid, _visits=study_visits)
-        ordered_visits = timeline.ordered_study_visits
-        study_visit: StudyVisitVO | None = None
-        for visit in ordered_visits:
-            if visit.uid == study_visit_uid:
-                study_visit = visit
-                break
-        else:
-            if study_visit is None:
-                raise ValidationException(
-                    msg=f"StudyVisit with UID '{study_visit_uid}' doesn't exist in Study '{study_uid}'",
-                )
+        study_visit: StudyVisitVO | None = timeline.get_visit_by_uid(study_visit_uid)
+        if study_visit is None:
+            raise ValidationException(
+                msg=f"StudyVisit with UID '{study_visit_uid}' doesn't exist in Study '{study_uid}'",
+            )
         group_name = (
             study_visit.study_visit_group.group_name
             if study_visit.study_visit_group
@@ -1,31 +1,63 @@
 import io
 import logging
 import os
+import re
 from functools import reduce
 from itertools import zip_longest
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
+from xml.sax.saxutils import escape
 
 from bs4 import BeautifulSoup, NavigableString, Tag
 from docx import Document
 from docx.blkcntnr import BlockItemContainer
 from docx.document import Document as DocumentObject
 from docx.enum.section import WD_ORIENTATION
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_BREAK
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.section import Section
-from docx.shared import Inches
+from docx.shared import Emu, Inches, Length
 from docx.table import Table, _Cell, _Row
 from docx.text.paragraph import Paragraph
 
 from common.telemetry import trace_calls
 
+TEXT_SPECIAL_CHARS_RE = re.compile(r"([\t\n\r])")
+ATTR_ENTITIES = {'"': "&quot;"}
+# table properties set by Document.add_table() and create_table()
+TABLE_PROPERTIES_XML = (
+    '<w:tblW w:type="auto" w:w="0"/><w:tblLayout w:type="autofit"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+)
+RUN_SUPERSCRIPT_XML = '<w:rPr><w:b/><w:vertAlign w:val="superscript"/></w:rPr>'
 BLOCK_ELEMENTS_TO_PARAGRAPH = {"p", "div", "li", "dd", "dt"}
 INLINE_ELEMENTS_TO_FONT_PROPERTIES = {"b", "em", "i", "sub", "sup", "s", "strong", "u"}
 
 log = logging.getLogger(__name__)
 
 
+def run_xml(text: str, superscript: bool = False) -> str:
+    """
+    Returns WordprocessingML of a <w:r> run with text, as Paragraph.add_run(text) would create it
+
+    Tabs and line breaks are converted to <w:tab/> and <w:br/> elements,
+    superscript runs are also bold, as used for footnote symbols.
+    """
+    content = []
+    for part in TEXT_SPECIAL_CHARS_RE.split(text):
+        if part == "\t":
+            content.append("<w:tab/>")
+        elif part in ("\n", "\r"):
+            content.append("<w:br/>")
+        elif part:
+            space = ' xml:space="preserve"' if len(part.strip()) < len(part) else ""
+            content.append(f"<w:t{space}>{escape(part)}</w:t>")
+    props = RUN_SUPERSCRIPT_XML if superscript else ""
+    return f"<w:r>{props}{''.join(content)}</w:r>"
+
+
 class DocxBuilder:
     DEFAULT_TEMPLATE_FILENAME = "template.docx"
 
@@ -71,9 +103,11 @@ class DocxBuilder:
         return section
 
     def create_styles(self, styles: Mapping):
-        # Ensure styles are defined
+        # Ensure styles are defined, style types may also be given by name like "PARAGRAPH"
         for key, value in styles.items():
             name, typ = value
+            if isinstance(typ, str):
+                typ = WD_STYLE_TYPE[typ]
             if key not in self.styles:
                 self.styles[key] = value
             if name not in self.document.styles:
@@ -100,6 +134,50 @@ class DocxBuilder:
             table.style = self.document.styles[style[0]]
         return table
 
+    @property
+    def block_width(self) -> Length:
+        """The width between the margins of the last section"""
+        section = self.document.sections[-1]
+        return Emu(section.page_width - section.left_margin - section.right_margin)
+
+    def get_paragraph_style_id(self, name: str | None) -> str | None:
+        """Returns the style id of a paragraph style by name, None for the default paragraph style"""
+        if not name:
+            return None
+        return self.document.part.get_style_id(name, WD_STYLE_TYPE.PARAGRAPH)
+
+    def add_table_xml(
+        self, column_widths: list[Length], rows_xml: Iterable[str]
+    ) -> Table:
+        """
+        Appends a table given the WordprocessingML of its <w:tr> rows, with table properties like create_table()
+
+        Building the XML text and parsing it at once is much faster than populating python-docx _Cell objects.
+        """
+        tbl_props_xml = TABLE_PROPERTIES_XML
+        style = self.styles.get("table")
+        if style:
+            style_id = self.document.part.get_style_id(
+                self.document.styles[style[0]], WD_STYLE_TYPE.TABLE
+            )
+            if style_id:
+                tbl_props_xml = (
+                    f'<w:tblStyle w:val="{escape(style_id, ATTR_ENTITIES)}"/>'
+                    + tbl_props_xml
+                )
+
+        grid_xml = "".join(
+            f'<w:gridCol w:w="{width.twips}"/>' for width in column_widths
+        )
+        tbl = parse_xml(
+            f"<w:tbl {nsdecls('w')}><w:tblPr>{tbl_props_xml}</w:tblPr>"
+            f"<w:tblGrid>{grid_xml}</w:tblGrid>{''.join(rows_xml)}</w:tbl>"
+        )
+        # pylint: disable=protected-access
+        body = self.document._body
+        body._element._insert_tbl(tbl)
+        return Table(tbl, body)
+
     @staticmethod
     def add_row(table: Table, cell_text_content: list[str | None]) -> _Row:
         """Adds a row to the table and fills the cells text content"""
@@ -1,5 +1,7 @@
 from codecs import iterdecode
+from collections.abc import Sequence
 from csv import DictReader
+from typing import AbstractSet
 from xml.dom.minicompat import NodeList
 from xml.dom.minidom import Document
 
@@ -31,11 +33,27 @@ def map_xml(xml_document: Document, mapper: UploadFile | None):
     Returns:
         None
 
+    Raises:
+        BusinessLogicException: If the mapper is not in CSV format, or if the mandatory mapping fields are not present.
+    """
+    apply_mapping_rules(xml_document, read_mapping_rules(mapper))
+
+
+def read_mapping_rules(mapper: UploadFile | None) -> list[dict[str, str]]:
+    """
+    Reads the CSV mapping rules of a mapper file, so that they can be applied to several XML documents.
+
+    Args:
+        mapper (UploadFile | None): The CSV file containing the mapping rules.
+
+    Returns:
+        list[dict[str, str]]: The mapping rules, in the order of the file. Empty if there is no mapper file.
+
     Raises:
         BusinessLogicException: If the mapper is not in CSV format, or if the mandatory mapping fields are not present.
     """
     if not mapper:
-        return
+        return []
 
     BusinessLogicException.raise_if(
         mapper.content_type != "text/csv", msg="Only CSV format is supported."
@@ -48,7 +66,28 @@ def map_xml(xml_document: Document, mapper: UploadFile | None):
         msg=f"These headers must be present: {sorted(MANDATORY_MAPPER_FIELDS)}",
     )
 
-    for mapping in dict_reader:
+    return list(dict_reader)
+
+
+def apply_mapping_rules(
+    xml_document: Document,
+    mapping_rules: list[dict[str, str]],
+    ancestor_tag_names: Sequence[AbstractSet[str]] | None = None,
+):
+    """
+    Applies CSV mapping rules read by `read_mapping_rules` to an XML document, in the order of the rules.
+
+    Args:
+        xml_document (Document): The XML document to modify.
+        mapping_rules (list[dict[str, str]]): The mapping rules.
+        ancestor_tag_names (Sequence[AbstractSet[str]] | None): When the document holds a part of a larger document,
+            the tag names of the elements containing that part, as they are when each mapping rule is applied.
+            Element rules whose parent is one of these ancestors apply to all elements of the document.
+
+    Returns:
+        None
+    """
+    for index, mapping in enumerate(mapping_rules):
         parent = mapping["parent"] or "*"
 
         if mapping["type"] == "attribute":
@@ -60,6 +99,8 @@ def map_xml(xml_document: Document, mapper: UploadFile | None):
                 (mapping["to_alias"].casefold() == "true"),
             )
         elif mapping["type"] == "element":
+            if ancestor_tag_names and parent in ancestor_tag_names[index]:
+                parent = "*"
             _map_elements(
                 xml_document,
                 mapping["from_name"],
@@ -1,20 +1,17 @@
-import os
-from collections import defaultdict
-from typing import Annotated, Any, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Annotated, Any, Mapping, Self
 
 import yattag
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Inches
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import NamedStyle
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
-from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import BaseModel, ConfigDict, Field
 
-from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
 from common.telemetry import trace_calls
 
+if TYPE_CHECKING:
+    # python-docx and openpyxl are imported where documents are built, not to slow down the API startup
+    from openpyxl import Workbook
+
+    from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+
 CHAR_WIDTHS = {
     "i": 0.5,
     "l": 0.5,
@@ -201,13 +198,103 @@ class TableWithFootnotes(BaseModel):
         ),
     ] = None
 
+    @classmethod
+    def from_table(cls, table: "Table") -> Self:
+        """Converts the internal representation of a table into the API model"""
+        return cls.model_validate(table, from_attributes=True)
+
+
+# Internal representation of tables while they are built and rendered.
+# Large SoA tables have hundreds of thousands of cells, these slotted dataclasses are smaller and much cheaper
+# to create than the Pydantic models above, which are used only at the JSON API boundary.
+
+
+@dataclass(frozen=True, slots=True)
+class CellRef:
+    type: str | None
+    uid: str
+
+
+@dataclass(slots=True)
+class Cell:
+    text: str = ""
+    span: int = 1
+    style: str | None = None
+    refs: list[CellRef] | None = None
+    footnotes: list[str] | None = None
+    vertical: bool | None = None
+
+    def __post_init__(self):
+        if self.text is None:
+            self.text = ""
+
+
+@dataclass(slots=True)
+class Row:
+    cells: list[Cell] = field(default_factory=list)
+    hide: bool = False
+    order: int | None = None
+    level: int | None = None
+
+
+@dataclass(slots=True)
+class Table:
+    rows: list[Row] = field(default_factory=list)
+    footnotes: dict[str, SimpleFootnote] | None = None
+    num_header_rows: int = 0
+    num_header_cols: int = 0
+    title: str | None = None
+    id: str | None = None
+
+    def copy(self) -> Self:
+        """Returns a copy of the table which can be altered without affecting the original"""
+        return type(self)(
+            rows=[
+                Row(
+                    cells=[
+                        Cell(
+                            text=cell.text,
+                            span=cell.span,
+                            style=cell.style,
+                            # references are immutable
+                            refs=None if cell.refs is None else list(cell.refs),
+                            footnotes=(
+                                None if cell.footnotes is None else list(cell.footnotes)
+                            ),
+                            vertical=cell.vertical,
+                        )
+                        for cell in row.cells
+                    ],
+                    hide=row.hide,
+                    order=row.order,
+                    level=row.level,
+                )
+                for row in self.rows
+            ],
+            footnotes=None if self.footnotes is None else dict(self.footnotes),
+            num_header_rows=self.num_header_rows,
+            num_header_cols=self.num_header_cols,
+            title=self.title,
+            id=self.id,
+        )
+
 
 @trace_calls()
 def table_to_docx(
-    table: TableWithFootnotes,
+    table: Table | TableWithFootnotes,
     styles: Mapping[str, tuple[str, Any]] | None = None,
     template: str | None = None,
-) -> DocxBuilder:
+) -> "DocxBuilder":
+    from xml.sax.saxutils import escape
+
+    from docx.shared import Emu, Inches
+
+    from clinical_mdr_api.services.utils.docx_builder import (
+        ATTR_ENTITIES,
+        DocxBuilder,
+        run_xml,
+    )
+
     # assume horizontal table dimension from number of cells in first row
     num_cols = sum((c.span for c in table.rows[0].cells))
 
@@ -216,68 +303,84 @@ def table_to_docx(
         styles=styles, landscape=True, margins=[0.5, 0.5, 0.5, 0.5], template=template
     )
 
-    # adds a table to the document
-    x_table = docx.create_table(
-        num_rows=sum(1 for row in table.rows if not row.hide),
-        num_columns=num_cols,
-    )
-
-    # set width of first column
-    x_table.columns[0].width = Inches(4)
+    # columns share the page width evenly like in docx.create_table(), but the first column is wider
+    col_width = Emu(docx.block_width // num_cols)
+    column_widths = [Inches(4)] + [col_width] * (num_cols - 1)
 
-    # cache porperty for performance issues, see github.com/python-openxml/python-docx/issues/174
-    x_cells = x_table._cells
-    x_rows = x_table.rows
+    # paragraph properties by cell style and alignment, style names are resolved on first use
+    para_props: dict[tuple[str | None, bool], str] = {}
 
+    # The table is written as WordprocessingML text, because creating and merging python-docx _Cell objects
+    # is slow on large tables, see github.com/python-openxml/python-docx/issues/174
+    rows_xml = []
     for r, t_row in enumerate((row for row in table.rows if not row.hide)):
-        num_merge, merge_to = 0, None
+        row_xml = ["<w:tr>"]
 
         # set header row to repeat on each page
         if r < table.num_header_rows:
-            docx.repeat_table_header(x_rows[r])
-
-        for c, t_cell in enumerate(t_row.cells):
-            x_cell = x_cells[r * num_cols + c]
+            row_xml.append('<w:trPr><w:tblHeader w:val="true"/></w:trPr>')
 
-            # merge with previous spanning cell
-            if num_merge:
-                merge_to.merge(x_cell)
-                num_merge -= 1
+        c = 0
+        for t_cell in t_row.cells:
+            # skip cells merged into a previous spanning cell, and cells beyond the table width
+            if t_cell.span < 1 or c >= num_cols:
                 continue
 
-            # skip invisible cells (should not get here if spans are coherent)
-            if t_cell.span < 1:
-                continue
+            # when cell span > 1 the cell covers the following N grid columns
+            span = min(t_cell.span, num_cols - c)
+            row_xml.append(
+                f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width.twips * span}"/>'
+            )
+            if span > 1:
+                row_xml.append(f'<w:gridSpan w:val="{span}"/>')
 
-            # when cell span > 1 merge the following N cells into this one
-            num_merge = t_cell.span - 1
-            merge_to = x_cell
+            # set vertical text direction
+            if t_cell.vertical:
+                row_xml.append('<w:textDirection w:val="btLr"/>')
 
             # all docx cells host one or more paragraph for contents
-            x_para = x_cell.paragraphs[0]
+            row_xml.append("</w:tcPr><w:p>")
+
+            # resolve style name and center non-header columns
+            centered = c >= table.num_header_cols
+            key = (t_cell.style, centered)
+            if key not in para_props:
+                style_name = styles.get(t_cell.style, [None])[0] if styles else None  # type: ignore[arg-type]
+                style_id = docx.get_paragraph_style_id(style_name)
+                props = (
+                    f'<w:pStyle w:val="{escape(style_id, ATTR_ENTITIES)}"/>'
+                    if style_id
+                    else ""
+                )
+                if centered:
+                    props += '<w:jc w:val="center"/>'
+                para_props[key] = f"<w:pPr>{props}</w:pPr>" if props else ""
+            row_xml.append(para_props[key])
 
             # set cell text in the paragraph
             if t_cell.text:
-                x_para.text = t_cell.text
+                row_xml.append(run_xml(t_cell.text))
+
+            # add footnote symbols to a run within the paragraph
+            if t_cell.footnotes:
+                row_xml.append(
+                    run_xml("\u00A0".join(t_cell.footnotes), superscript=True)
+                )
 
-            # resolve style name and apply to paragraph
-            style_name = styles.get(t_cell.style, [None])[0] if styles else None  # type: ignore[arg-type]
-            if style_name:
-                x_para.style = style_name
+            row_xml.append("</w:p></w:tc>")
+            c += span
 
-            # center non-header columns
-            if c >= table.num_header_cols:
-                x_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        # fill up the row with empty cells, as each row must cover the table width
+        for _ in range(c, num_cols):
+            row_xml.append(
+                f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width.twips}"/></w:tcPr><w:p/></w:tc>'
+            )
 
-            # set vertical text direction
-            if t_cell.vertical:
-                docx.set_vertical_cell_direction(x_cell, "btLr")
+        row_xml.append("</w:tr>")
+        rows_xml.append("".join(row_xml))
 
-            # add footnote symbols to a run within the paragraph
-            if t_cell.footnotes:
-                run = x_para.add_run("\u00A0".join(t_cell.footnotes))
-                run.font.bold = True
-                run.font.superscript = True
+    # adds the table to the document
+    docx.add_table_xml(column_widths, rows_xml)
 
     # add footnotes
     if table.footnotes:
@@ -299,14 +402,16 @@ def table_to_docx(
 
 
 @trace_calls
-def table_to_html(table: TableWithFootnotes, css_style: str | None = None) -> str:
-    """Renders TableWithFootnotes into an HTML document
+def table_to_html(
+    table: Table | TableWithFootnotes, css_style: str | None = None
+) -> str:
+    """Renders a table into an HTML document
 
-    Renders TableWithFootnotes into an HTML document with a TABLE and footnotes into a DL (if they exist).
+    Renders a table into an HTML document with a TABLE and footnotes into a DL (if they exist).
     Optional CSS text can be provided in `css_style` added as <style> tag.
 
     :param table: The table data to be rendered into HTML, including rows, cells, headers, and footnotes.
-    :type table: TableWithFootnotes
+    :type table: Table | TableWithFootnotes
     :param css_style: CSS text to be added as <style type="text/css"> tag in the HTML head.
     :type css_style: str
     :return: The rendered HTML document as a string.
@@ -391,72 +496,75 @@ def _cell_to_attrs(cell):
 
 @trace_calls
 def table_to_xlsx(
-    table: TableWithFootnotes,
+    table: Table | TableWithFootnotes,
     styles: Mapping[str, str] | None = None,
-    template: str | None = None,
-) -> Workbook:
-    if template:
-        template = os.path.join(os.path.dirname(__file__), template)
-        workbook = load_workbook(template)
-
-    else:
-        workbook = Workbook()
-
-    worksheet: Worksheet = workbook.active
+) -> "Workbook":
+    """Renders a table into a write-only XLSX workbook
+
+    Rows are written out as they are rendered, so the worksheet is never held in memory as a whole.
+    A write-only workbook can be saved only once.
+
+    :param table: The table data to be rendered into a worksheet.
+    :type table: Table | TableWithFootnotes
+    :param styles: Mapping of cell styles to named styles of the workbook.
+    :type styles: Mapping[str, str] | None
+    :return: The rendered workbook.
+    :rtype: Workbook
+    """
 
-    if table.title:
-        worksheet.title = table.title
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import NamedStyle
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.cell_range import CellRange
 
-    column_widths = defaultdict(list)
-    for r, row in enumerate(table.rows, start=1):
-        worksheet.append([cell.text for cell in row.cells])
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(table.title)
 
+    # column widths and panes precede the rows in the worksheet XML, so they are set before writing any rows
+    column_widths: dict[int, float] = {}
+    for row in table.rows:
         for c, cell in enumerate(row.cells, start=1):
-            if cell.span > 1:
-                worksheet.merge_cells(
-                    start_row=r,
-                    start_column=c,
-                    end_row=r,
-                    end_column=(c + cell.span - 1),
-                )
-
             if cell.span == 1:
-                # take into account for column width calculations
-                column_widths[c].append(estimate_string_length(cell.text))
+                width = estimate_string_length(cell.text)
+                if width > column_widths.get(c, -1):
+                    column_widths[c] = width
 
-    # calculate and set column widths
-    for c, widths in column_widths.items():
+    for c, width in column_widths.items():
         worksheet.column_dimensions[get_column_letter(c)].width = max(
-            2, int(round(max(widths) * 1.05 + 1))
+            2, int(round(width * 1.05 + 1))
         )
 
-    # apply named styles on cells
+    # freeze header rows and columns
+    worksheet.freeze_panes = (
+        f"{get_column_letter(table.num_header_cols+1)}{table.num_header_rows+1}"
+    )
+
     if styles:
         for style_name in styles.values():
             if style_name not in workbook.named_styles:
                 workbook.add_named_style(NamedStyle(style_name))
 
-        for r, row in enumerate(worksheet.iter_rows()):
-            for c, rowcell in enumerate(row):
-                if (
-                    c < len(table.rows[r].cells)
-                    and table.rows[r].cells[c].style in styles
-                ):
-                    style_index = table.rows[r].cells[c].style
-                    if style_index is not None:
-                        rowcell.style = styles[style_index]
-
-    # define table
-    tab = Table(
-        displayName="Table1",
-        ref=f"A1:{get_column_letter(len(table.rows[-1].cells))}{len(table.rows)}",
-    )
-    tab.tableStyleInfo = TableStyleInfo(name="TableStyleMedium2")
+    for r, row in enumerate(table.rows, start=1):
+        values: list[Any] = []
 
-    # freeze header rows and columns
-    worksheet.freeze_panes = (
-        f"{get_column_letter(table.num_header_cols+1)}{table.num_header_rows+1}"
-    )
+        for c, cell in enumerate(row.cells, start=1):
+            if cell.span > 1:
+                worksheet.merged_cells.add(
+                    CellRange(
+                        min_col=c, min_row=r, max_col=c + cell.span - 1, max_row=r
+                    )
+                )
+
+            # apply named styles on cells
+            if styles and cell.style is not None and cell.style in styles:
+                xlsx_cell = WriteOnlyCell(worksheet, value=cell.text)
+                xlsx_cell.style = styles[cell.style]
+                values.append(xlsx_cell)
+            else:
+                values.append(cell.text)
+
+        worksheet.append(values)
 
     return workbook
 
@@ -12,6 +12,28 @@ ALL_ROUTES_METHODS_ROLES = (
     ("/notifications", "POST", {"Admin.Write"}),
     ("/notifications/{serial_number}", "PATCH", {"Admin.Write"}),
     ("/notifications/{serial_number}", "DELETE", {"Admin.Write"}),
+    ("/jobs", "GET", {"Library.Write", "Study.Write", "Library.Read", "Study.Read"}),
+    (
+        "/jobs/types",
+        "GET",
+        {"Library.Write", "Study.Write", "Library.Read", "Study.Read"},
+    ),
+    ("/jobs", "POST", {"Library.Write", "Study.Write", "Library.Read", "Study.Read"}),
+    (
+        "/jobs/{job_uid}",
+        "GET",
+        {"Library.Write", "Study.Write", "Library.Read", "Study.Read"},
+    ),
+    (
+        "/jobs/{job_uid}/result",
+        "GET",
+        {"Library.Write", "Study.Write", "Library.Read", "Study.Read"},
+    ),
+    (
+        "/jobs/{job_uid}",
+        "DELETE",
+        {"Library.Write", "Study.Write", "Library.Read", "Study.Read"},
+    ),
     ("/concepts/odms/forms", "GET", {"Library.Read"}),
     ("/concepts/odms/forms/headers", "GET", {"Library.Read"}),
     ("/concepts/odms/forms/{odm_form_uid}", "GET", {"Library.Read"}),
@@ -31,7 +31,7 @@ from clinical_mdr_api.services.studies.study_flowchart import (
     SOA_CHECK_MARK,
     StudyFlowchartService,
 )
-from clinical_mdr_api.services.utils.table_f import TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Table, TableWithFootnotes
 from clinical_mdr_api.tests.fixtures.database import TempDatabasePopulated
 
 # pylint: disable=unused-import
@@ -336,7 +336,7 @@ def test_flowchart_html(
     service = StudyFlowchartService()
 
     # SoA table for comparison base
-    soa_table: TableWithFootnotes = service.build_flowchart_table(
+    soa_table: Table = service.build_flowchart_table(
         study_uid=soa_test_data.study.uid,
         study_value_version=None,
         layout=layout,
@@ -423,7 +423,7 @@ def test_flowchart_docx(
     service = StudyFlowchartService()
 
     # SoA table for comparison base
-    soa_table: TableWithFootnotes = service.build_flowchart_table(
+    soa_table: Table = service.build_flowchart_table(
         study_uid=soa_test_data.study.uid,
         study_value_version=None,
         layout=layout,
@@ -508,7 +508,7 @@ def test_flowchart_xlsx(
     service = StudyFlowchartService()
 
     # SoA table for comparison base
-    soa_table: TableWithFootnotes = service.build_flowchart_table(
+    soa_table: Table = service.build_flowchart_table(
         study_uid=soa_test_data.study.uid,
         study_value_version=None,
         layout=layout,
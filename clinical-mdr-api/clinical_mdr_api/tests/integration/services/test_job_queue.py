@@ -0,0 +1,27 @@
+# pylint: disable=unused-import
+import pytest
+
+from clinical_mdr_api.tests.integration.utils.api import inject_and_clear_db
+from common.jobs import Neo4jJobQueue
+
+# the queue tests of the in-memory and SQLite queues, run against the database
+from common.tests.unit.test_jobs import (
+    test_cancel_queued_and_running_jobs,
+    test_claims_from_threads_are_exclusive,
+    test_queue_claims_oldest_job_of_types_once,
+    test_queue_stores_jobs,
+    test_queue_stores_results_until_job_is_removed,
+    test_stale_and_expired_jobs,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def test_database():
+    inject_and_clear_db("jobs.queue")
+
+
+@pytest.fixture
+def queue():
+    queue = Neo4jJobQueue()
+    yield queue
+    queue.remove(job.uid for job in queue.find())
@@ -45,7 +45,7 @@ from clinical_mdr_api.services.studies.study_flowchart import (
 )
 from clinical_mdr_api.services.studies.study_soa_footnote import StudySoAFootnoteService
 from clinical_mdr_api.services.studies.study_visit import StudyVisitService
-from clinical_mdr_api.services.utils.table_f import TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Table
 from clinical_mdr_api.tests.fixtures.database import TempDatabasePopulated
 from clinical_mdr_api.tests.integration.utils.factory_soa import (
     SoATestData,
@@ -144,7 +144,7 @@ def test_build_flowchart_table(
     hide_soa_groups: bool,
 ):
     service = StudyFlowchartService()
-    table: TableWithFootnotes = service.build_flowchart_table(
+    table: Table = service.build_flowchart_table(
         study_uid=soa_test_data.study.uid,
         study_value_version=None,
         layout=layout,
@@ -416,7 +416,7 @@ def test_propagate_hidden_rows(soa_test_data: SoATestData, time_unit):
     """Validates propagation of crosses and footnotes from hidden rows to the first visible parent row"""
 
     service = StudyFlowchartService()
-    soa_table: TableWithFootnotes = service.build_flowchart_table(
+    soa_table: Table = service.build_flowchart_table(
         study_uid=soa_test_data.study.uid,
         study_value_version=None,
         layout=SoALayout.PROTOCOL,
@@ -1278,7 +1278,7 @@ class TestSoASnapshot:
             time_unit=time_unit,
         )
 
-        assert table.model_dump() == expected_table.model_dump()
+        assert table == expected_table
 
 
 def test_soa_snapshot_versioning_with_footnote_linking(
@@ -1315,7 +1315,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
         layout=layout,
         force_build=True,
     )
-    assert soa.model_dump() == soa_v1.model_dump()
+    assert soa == soa_v1
 
     # check v1 SoA snapshot
     cell_references, footnote_references = service.repository.load(
@@ -1355,7 +1355,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
     )
 
     # ensure SoA changed between Study versions
-    assert soa_v1.model_dump() != soa_v2.model_dump()
+    assert soa_v1 != soa_v2
 
     # check v1 SoA after modifications to draft
     soa = service.get_flowchart_table(
@@ -1364,7 +1364,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
         layout=layout,
         force_build=True,
     )
-    assert soa.model_dump() == soa_v1.model_dump()
+    assert soa == soa_v1
 
     # check v1 SoA snapshot build after modifications to draft
     cell_references, footnote_references = service.build_soa_snapshot(
@@ -1396,7 +1396,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
         layout=layout,
         force_build=True,
     )
-    assert soa.model_dump() == soa_v1.model_dump()
+    assert soa == soa_v1
 
     # check v1 SoA snapshot build after modifications to draft
     cell_references, footnote_references = service.build_soa_snapshot(
@@ -1446,7 +1446,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
     soa = service.load_soa_snapshot(
         study_uid=soa_test_data.study.uid, study_value_version=v1_version, layout=layout
     )
-    assert soa.model_dump() == soa_v1.model_dump()
+    assert soa == soa_v1
 
     # check v2 SoA snapshot
     expected_cell_references, expected_footnote_references = service.repository.load(
@@ -1481,7 +1481,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
     soa = service.load_soa_snapshot(
         study_uid=soa_test_data.study.uid, study_value_version=v2_version, layout=layout
     )
-    assert soa.model_dump() == soa_v2.model_dump()
+    assert soa == soa_v2
 
 
 def test_operational_soa(soa_test_data: SoATestData):
@@ -1499,9 +1499,7 @@ def test_operational_soa(soa_test_data: SoATestData):
     check_operational_soa_table(soa_test_data, soa_table)
 
 
-def check_operational_soa_table(
-    soa_test_data: SoATestData, soa_table: TableWithFootnotes
-):
+def check_operational_soa_table(soa_test_data: SoATestData, soa_table: Table):
     # check number of columns
     num_cols = len(soa_table.rows[soa_table.num_header_rows - 1].cells)
     assert num_cols == soa_table.num_header_cols + NUM_OPERATIONAL_CODE_COLS + len(
@@ -65,7 +65,7 @@ from clinical_mdr_api.services.syntax_instances.footnotes import FootnoteService
 from clinical_mdr_api.services.syntax_templates.footnote_templates import (
     FootnoteTemplateService,
 )
-from clinical_mdr_api.services.utils.table_f import TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Table
 from clinical_mdr_api.tests.integration.utils.utils import LIBRARY_NAME, TestUtils
 from common import exceptions
 from common.config import settings
@@ -1358,7 +1358,7 @@ def test_soa_test_data_creation(temp_database_populated):
     test_data = SoATestData(project=temp_database_populated.project)
     study_flowchart_service = StudyFlowchartService()
 
-    soa_table: TableWithFootnotes = study_flowchart_service.build_flowchart_table(
+    soa_table: Table = study_flowchart_service.build_flowchart_table(
         study_uid=test_data.study.uid,
         study_value_version=None,
         layout=SoALayout.DETAILED,
@@ -0,0 +1,78 @@
+import datetime
+import unittest
+
+from clinical_mdr_api.domains.study_selections.study_design_cell import (
+    StudyDesignCellsAR,
+    StudyDesignCellVO,
+)
+from common import exceptions
+
+
+def create_design_cell(uid: str | None, order: int | None) -> StudyDesignCellVO:
+    return StudyDesignCellVO(
+        study_uid="study_uid",
+        study_epoch_uid="epoch_uid",
+        study_element_uid="element_uid",
+        study_arm_uid="arm_uid",
+        transition_rule=None,
+        order=order,  # type: ignore[arg-type]
+        start_date=datetime.datetime.now(datetime.timezone.utc),
+        author_id="author_id",
+        uid=uid,
+    )
+
+
+def create_aggregate(count: int) -> StudyDesignCellsAR:
+    return StudyDesignCellsAR(
+        study_uid="study_uid",
+        design_cells=[
+            create_design_cell(f"cell_{order}", order) for order in range(1, count + 1)
+        ],
+    )
+
+
+def orders(aggregate: StudyDesignCellsAR) -> list[tuple[str | None, int]]:
+    return [(cell.uid, cell.order) for cell in aggregate.design_cells]
+
+
+class TestStudyDesignCellsAR(unittest.TestCase):
+    def test_add_design_cell_without_order_is_appended(self):
+        aggregate = create_aggregate(2)
+        aggregate.add_design_cell(create_design_cell("new", None))
+        self.assertEqual(orders(aggregate), [("cell_1", 1), ("cell_2", 2), ("new", 3)])
+
+    def test_add_design_cell_with_order_shifts_the_following_cells(self):
+        aggregate = create_aggregate(3)
+        aggregate.add_design_cell(create_design_cell("new", 2))
+        self.assertEqual(
+            orders(aggregate),
+            [("cell_1", 1), ("new", 2), ("cell_2", 3), ("cell_3", 4)],
+        )
+
+    def test_add_design_cell_with_too_big_order(self):
+        aggregate = create_aggregate(2)
+        with self.assertRaises(exceptions.BusinessLogicException):
+            aggregate.add_design_cell(create_design_cell("new", 4))
+
+    def test_remove_design_cell_shifts_the_following_cells(self):
+        aggregate = create_aggregate(3)
+        aggregate.remove_design_cell("cell_1")
+        self.assertEqual(orders(aggregate), [("cell_2", 1), ("cell_3", 2)])
+
+    def test_get_specific_object_selection_not_found(self):
+        aggregate = create_aggregate(1)
+        with self.assertRaises(exceptions.NotFoundException):
+            aggregate.get_specific_object_selection("missing")
+
+    def test_move_design_cell_renumbers_the_design_cells(self):
+        aggregate = create_aggregate(4)
+        aggregate.move_design_cell("cell_4", 2)
+        self.assertEqual(
+            orders(aggregate),
+            [("cell_1", 1), ("cell_4", 2), ("cell_2", 3), ("cell_3", 4)],
+        )
+        aggregate.move_design_cell("cell_1", 9)
+        self.assertEqual(
+            orders(aggregate),
+            [("cell_4", 1), ("cell_2", 2), ("cell_3", 3), ("cell_1", 4)],
+        )
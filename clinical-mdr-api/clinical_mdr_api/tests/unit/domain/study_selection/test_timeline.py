@@ -0,0 +1,203 @@
+import datetime
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
+    StudyStatus,
+)
+from clinical_mdr_api.domains.study_selections.study_epoch import TimelineAR
+from clinical_mdr_api.domains.study_selections.study_visit import (
+    NumericValue,
+    SimpleStudyEpoch,
+    StudyVisitVO,
+    TimePoint,
+)
+from clinical_mdr_api.models.controlled_terminologies.ct_term import (
+    SimpleCTTermNameWithConflictFlag,
+)
+from common.config import settings
+from common.utils import TimeUnit, VisitClass, VisitSubclass
+
+DAY = TimeUnit("day", 86400)
+WEEK = TimeUnit("week", 604800)
+EPOCH = SimpleStudyEpoch(
+    uid="StudyEpoch_000001",
+    study_uid="Study_000001",
+    epoch=SimpleCTTermNameWithConflictFlag(
+        term_uid="epoch", sponsor_preferred_name="Treatment"
+    ),
+    order=1,
+)
+
+
+def term(name: str) -> SimpleCTTermNameWithConflictFlag:
+    return SimpleCTTermNameWithConflictFlag(term_uid=name, sponsor_preferred_name=name)
+
+
+def create_visit(
+    uid: str,
+    visit_value: int,
+    time_reference: str = settings.previous_visit_name,
+    visit_type: str = "Treatment",
+    visit_subclass: VisitSubclass = VisitSubclass.SINGLE_VISIT,
+    visit_sublabel_reference: str | None = None,
+    is_global_anchor_visit: bool = False,
+) -> StudyVisitVO:
+    return StudyVisitVO(
+        visit_window_min=-1,
+        visit_window_max=1,
+        window_unit_uid="day",
+        description=None,
+        start_rule=None,
+        end_rule=None,
+        visit_contact_mode=term("On Site Visit"),
+        visit_type=term(visit_type),
+        status=StudyStatus.DRAFT,
+        start_date=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        author_id="author",
+        author_username="author",
+        visit_class=VisitClass.SINGLE_VISIT,
+        visit_subclass=visit_subclass,
+        is_global_anchor_visit=is_global_anchor_visit,
+        visit_number=0,
+        visit_order=0,
+        show_visit=True,
+        timepoint=TimePoint(
+            uid=f"TimePoint_{uid}",
+            visit_timereference=term(time_reference),
+            time_unit_uid="day",
+            visit_value=visit_value,
+        ),
+        study_day=NumericValue("StudyDay", None),
+        study_week=NumericValue("StudyWeek", None),
+        time_unit_object=DAY,
+        window_unit_object=DAY,
+        day_unit_object=DAY,
+        week_unit_object=WEEK,
+        epoch_connector=EPOCH,
+        uid=uid,
+        visit_sublabel_reference=visit_sublabel_reference,
+    )
+
+
+def create_baseline() -> StudyVisitVO:
+    return create_visit(
+        "V1",
+        0,
+        time_reference=settings.global_anchor_visit_name,
+        visit_type="Baseline",
+        is_global_anchor_visit=True,
+    )
+
+
+class TestTimeline(unittest.TestCase):
+    def test_visits_are_ordered_by_their_timing(self):
+        visits = [
+            create_baseline(),
+            create_visit("V2", 7),
+            create_visit("V3", 7),
+            create_visit("V4", 10, time_reference="Baseline"),
+        ]
+        # visits anchored to the previous visit are anchored in the input order
+        timeline = TimelineAR(study_uid="Study_000001", _visits=visits)
+
+        ordered = timeline.ordered_study_visits
+
+        self.assertEqual([visit.uid for visit in ordered], ["V1", "V2", "V4", "V3"])
+        self.assertEqual([visit.visit_order for visit in ordered], [1, 2, 3, 4])
+        self.assertEqual(
+            [timeline.get_absolute_duration(visit) for visit in ordered],
+            [
+                0,
+                7 * DAY.conversion_factor_to_master,
+                10 * DAY.conversion_factor_to_master,
+                14 * DAY.conversion_factor_to_master,
+            ],
+        )
+
+    def test_subvisits_are_numbered_within_their_group(self):
+        anchor = create_visit(
+            "V2",
+            7,
+            visit_subclass=VisitSubclass.ANCHOR_VISIT_IN_GROUP_OF_SUBV,
+            visit_sublabel_reference="V2",
+        )
+        subvisits = [
+            create_visit(
+                f"V2_{i}",
+                1,
+                visit_subclass=VisitSubclass.ADDITIONAL_SUBVISIT_IN_A_GROUP_OF_SUBV,
+                visit_sublabel_reference="V2",
+            )
+            for i in range(1, 3)
+        ]
+        timeline = TimelineAR(
+            study_uid="Study_000001",
+            _visits=[create_baseline(), anchor, *subvisits, create_visit("V3", 7)],
+        )
+
+        ordered = timeline.ordered_study_visits
+
+        self.assertEqual(
+            [visit.uid for visit in ordered], ["V1", "V2", "V2_1", "V2_2", "V3"]
+        )
+        self.assertEqual(
+            [visit.visit_number for visit in ordered[1:4]],
+            [anchor.visit_number] * 3,
+        )
+        self.assertEqual(
+            [visit.subvisit_number for visit in ordered[1:4]],
+            [
+                anchor.subvisit_number,
+                anchor.subvisit_number + 10,
+                anchor.subvisit_number + 20,
+            ],
+        )
+
+    def test_timeline_is_generated_once_until_visits_change(self):
+        timeline = TimelineAR(
+            study_uid="Study_000001",
+            _visits=[create_baseline(), create_visit("V2", 7)],
+        )
+
+        with patch.object(
+            TimelineAR, "_generate_timeline", wraps=timeline._generate_timeline
+        ) as generate_timeline:
+            timeline.ordered_study_visits
+            timeline.ordered_study_visits
+            timeline.get_visit_by_uid("V2")
+            self.assertEqual(generate_timeline.call_count, 1)
+
+            timeline.add_visit(create_visit("V3", 7))
+            self.assertEqual(generate_timeline.call_count, 2)
+            timeline.ordered_study_visits
+            self.assertEqual(generate_timeline.call_count, 2)
+
+            timeline.remove_visit(timeline.get_visit_by_uid("V3"))
+            self.assertEqual(
+                [visit.uid for visit in timeline.ordered_study_visits], ["V1", "V2"]
+            )
+            self.assertEqual(generate_timeline.call_count, 3)
+
+    def test_get_visit_by_uid(self):
+        timeline = TimelineAR(
+            study_uid="Study_000001",
+            _visits=[create_baseline(), create_visit("V2", 7)],
+        )
+
+        self.assertEqual(timeline.get_visit_by_uid("V2").visit_order, 2)
+        self.assertIsNone(timeline.get_visit_by_uid("V3"))
+
+    def test_long_chain_of_visits_anchored_to_previous_visit(self):
+        visits = [create_baseline()] + [
+            create_visit(f"V{i}", 1) for i in range(2, 1202)
+        ]
+        timeline = TimelineAR(study_uid="Study_000001", _visits=visits)
+
+        ordered = timeline.ordered_study_visits
+
+        self.assertEqual([visit.uid for visit in ordered], [v.uid for v in visits])
+        self.assertEqual(
+            timeline.get_absolute_duration(ordered[-1]),
+            1200 * DAY.conversion_factor_to_master,
+        )
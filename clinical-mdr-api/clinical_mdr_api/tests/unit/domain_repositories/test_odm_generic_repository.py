@@ -0,0 +1,142 @@
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.concepts.odms.form_repository import (
+    FormRepository,
+)
+from clinical_mdr_api.domain_repositories.concepts.odms.item_group_repository import (
+    ItemGroupRepository,
+)
+from clinical_mdr_api.domain_repositories.concepts.odms.item_repository import (
+    ItemRepository,
+)
+from clinical_mdr_api.domains.concepts.utils import RelationType
+from common.exceptions import BusinessLogicException
+
+
+@patch("clinical_mdr_api.domain_repositories.concepts.odms.odm_generic_repository.db")
+class TestAddVendorRelations(unittest.TestCase):
+    def test_relations_are_written_when_all_vendors_exist(self, db):
+        db.cypher_query.return_value = ([[[]]], ["missing"])
+
+        FormRepository().add_vendor_relations(
+            "OdmForm_000001",
+            RelationType.VENDOR_ATTRIBUTE,
+            {"OdmVendorAttribute_000001": "value1"},
+        )
+
+        params = db.cypher_query.call_args.kwargs["params"]
+        self.assertEqual(
+            params["relations"],
+            [
+                {
+                    "uid": "OdmVendorAttribute_000001",
+                    "properties": {"value": "value1"},
+                }
+            ],
+        )
+
+    def test_unknown_vendor_raises(self, db):
+        db.cypher_query.return_value = ([[["OdmVendorAttribute_000002"]]], ["missing"])
+
+        with self.assertRaisesRegex(
+            BusinessLogicException,
+            "Object with UID 'OdmVendorAttribute_000002' doesn't exist.",
+        ):
+            FormRepository().add_vendor_relations(
+                "OdmForm_000001",
+                RelationType.VENDOR_ATTRIBUTE,
+                {
+                    "OdmVendorAttribute_000001": "value1",
+                    "OdmVendorAttribute_000002": "value2",
+                },
+            )
+
+    def test_unknown_node_raises(self, db):
+        db.cypher_query.return_value = ([], ["missing"])
+
+        with self.assertRaisesRegex(
+            BusinessLogicException, "Object with UID 'OdmForm_000001' doesn't exist."
+        ):
+            FormRepository().add_vendor_relations(
+                "OdmForm_000001",
+                RelationType.VENDOR_ELEMENT,
+                {"OdmVendorElement_000001": "text"},
+            )
+
+    def test_nothing_is_written_without_relations(self, db):
+        FormRepository().add_vendor_relations(
+            "OdmForm_000001", RelationType.VENDOR_ELEMENT, {}
+        )
+
+        db.cypher_query.assert_not_called()
+
+
+@patch("clinical_mdr_api.domain_repositories.concepts.odms.odm_generic_repository.db")
+class TestAddRelations(unittest.TestCase):
+    def test_relationship_properties_are_stored_like_the_relationship_model(self, db):
+        db.cypher_query.return_value = ([[[]]], ["missing"])
+
+        ItemGroupRepository().add_relations(
+            "OdmItemGroup_000001",
+            RelationType.ITEM,
+            {
+                "OdmItem_000001": {
+                    "order_number": "2",
+                    "mandatory": True,
+                    "vendor": {"attributes": []},
+                }
+            },
+        )
+
+        query = db.cypher_query.call_args.args[0]
+        params = db.cypher_query.call_args.kwargs["params"]
+        self.assertIn("CREATE (origin)-[new:ITEM_REF]->(relation_node)", query)
+        self.assertIn("-[:LATEST]->(relation_node:OdmItemValue)", query)
+        self.assertEqual(params["relations"][0]["uid"], "OdmItem_000001")
+        self.assertEqual(
+            {
+                key: value
+                for key, value in params["relations"][0]["properties"].items()
+                if value is not None
+            },
+            {"order_number": 2, "mandatory": True, "vendor": '{"attributes": []}'},
+        )
+
+    def test_relations_to_root_nodes(self, db):
+        db.cypher_query.return_value = ([[[]]], ["missing"])
+
+        ItemRepository().add_relations(
+            "OdmItem_000001",
+            RelationType.UNIT_DEFINITION,
+            {"UnitDefinition_000001": {"mandatory": True, "order": 1}},
+        )
+
+        query = db.cypher_query.call_args.args[0]
+        self.assertIn(
+            "OPTIONAL MATCH (relation_node:UnitDefinitionRoot {uid: relation.uid})",
+            query,
+        )
+        self.assertIn(
+            "CREATE (origin)-[new:HAS_UNIT_DEFINITION]->(relation_node)", query
+        )
+
+    def test_unknown_relation_raises(self, db):
+        db.cypher_query.return_value = ([[["OdmItem_000002"]]], ["missing"])
+
+        with self.assertRaisesRegex(
+            BusinessLogicException, "Object with UID 'OdmItem_000002' doesn't exist."
+        ):
+            ItemGroupRepository().add_relations(
+                "OdmItemGroup_000001",
+                RelationType.ITEM,
+                {"OdmItem_000001": {}, "OdmItem_000002": {}},
+            )
+
+    def test_term_relations_are_not_supported(self, db):
+        with self.assertRaisesRegex(BusinessLogicException, "Invalid relation type."):
+            ItemRepository().add_relations(
+                "OdmItem_000001", RelationType.TERM, {"CTTerm_000001": {}}
+            )
+
+        db.cypher_query.assert_not_called()
@@ -0,0 +1,82 @@
+import unittest
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+from clinical_mdr_api.repositories._utils import (
+    record_cache_invalidations,
+    repeat_cache_invalidations,
+    sb_clear_cache,
+)
+from common.cache import LocalCacheBackend, SbTTLCache
+
+
+@dataclass
+class TermAR:
+    uid: str
+    codelist_uid: str
+
+
+class TermRepository:
+    cache_store_item_by_uid = SbTTLCache(
+        "TermRepository.cache_store_item_by_uid",
+        maxsize=100,
+        ttl=60,
+        backend=LocalCacheBackend(),
+    )
+
+    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def save(self, item: TermAR) -> None:
+        pass
+
+    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def add_term(self, codelist_uid: str, term_uid: str, author_id: str) -> None:
+        pass
+
+    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def save_node(self, node: object) -> None:
+        pass
+
+
+class TestSbClearCache(unittest.TestCase):
+    def setUp(self):
+        self.repo = TermRepository()
+        self.cache = TermRepository.cache_store_item_by_uid
+        self.cache.clear()
+        self.cache["term_1"] = TermAR(uid="Term_1", codelist_uid="CL_1")
+        self.cache["term_2"] = TermAR(uid="Term_2", codelist_uid="CL_2")
+        self.cache["codelist_1"] = Mock(uid="CL_1")
+        self.cache["all_terms"] = ("Term_1", "Term_2")
+
+    def test_save_aggregate_evicts_aggregate_and_its_codelist(self):
+        self.repo.save(TermAR(uid="Term_1", codelist_uid="CL_1"))
+
+        self.assertEqual(set(self.cache.keys()), {"term_2"})
+
+    def test_uid_arguments_evict_related_entries(self):
+        self.repo.add_term(codelist_uid="CL_2", term_uid="Term_3", author_id="user")
+
+        self.assertEqual(set(self.cache.keys()), {"term_1", "codelist_1"})
+
+    def test_unidentified_argument_clears_cache(self):
+        self.repo.save_node(object())
+
+        self.assertEqual(self.cache.currsize, 0)
+
+    def test_error_of_the_call_is_kept_when_arguments_do_not_match(self):
+        with self.assertLogs("clinical_mdr_api.repositories._utils", "ERROR"):
+            with self.assertRaisesRegex(TypeError, "unexpected keyword argument"):
+                # pylint: disable=unexpected-keyword-arg
+                self.repo.save_node(node=object(), unknown=True)
+
+        self.assertEqual(self.cache.currsize, 0)
+
+    def test_recorded_invalidations_evict_entries_read_after_the_writes(self):
+        with record_cache_invalidations() as invalidations:
+            self.repo.add_term(codelist_uid="CL_1", term_uid="Term_3", author_id="user")
+            # read within the transaction, before it is rolled back
+            self.cache["term_3"] = TermAR(uid="Term_3", codelist_uid="CL_1")
+            self.cache["codelist_1"] = Mock(uid="CL_1")
+
+        repeat_cache_invalidations(invalidations)
+
+        self.assertEqual(set(self.cache.keys()), {"term_2"})
@@ -0,0 +1,77 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_activity_instruction_repository import (
+    StudyActivityInstructionRepository,
+)
+
+ROW = [
+    "StudyActivityInstruction_000001",
+    "Study_000001",
+    None,
+    "StudyActivity_000001",
+    "ActivityInstruction_000001",
+    "Instruction",
+    datetime(2024, 1, 1, tzinfo=timezone.utc),
+    "user",
+    None,
+]
+COLUMNS = [
+    "study_activity_instruction_uid",
+    "study_uid",
+    "study_version",
+    "study_activity_uid",
+    "activity_instruction_uid",
+    "activity_instruction_name",
+    "start_date",
+    "author_username",
+    "end_date",
+]
+
+
+class TestStudyActivityInstructionRepository(unittest.TestCase):
+    @patch(
+        "clinical_mdr_api.domain_repositories.study_selections.study_activity_instruction_repository.db"
+    )
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_find_all_for_all_studies_filters_sorts_and_paginates_in_database(
+        self, builder_db, repository_db
+    ):
+        builder_db.cypher_query.return_value = ([ROW], COLUMNS)
+        repository_db.cypher_query.return_value = ([[25]], ["total_count"])
+
+        items, total = StudyActivityInstructionRepository().find_all_for_all_studies(
+            sort_by={"activity_instruction_name": False},
+            page_number=3,
+            page_size=10,
+            filter_by={"study_uid": {"v": ["Study_000001"], "op": "eq"}},
+            total_count=True,
+        )
+
+        query, params = (
+            builder_db.cypher_query.call_args.kwargs["query"],
+            builder_db.cypher_query.call_args.kwargs["params"],
+        )
+        self.assertIn("WHERE study_uid=$study_uid_0", query)
+        self.assertIn(
+            "ORDER BY toLower(activity_instruction_name) DESC,study_activity_instruction_uid",
+            query,
+        )
+        self.assertTrue(
+            query.endswith("SKIP $page_number * $page_size LIMIT $page_size")
+        )
+        self.assertEqual(params["page_number"], 2)
+        self.assertEqual(params["study_uid_0"], "Study_000001")
+        self.assertIn(
+            "RETURN count(*) AS total_count",
+            repository_db.cypher_query.call_args.kwargs["query"],
+        )
+
+        self.assertEqual(total, 25)
+        self.assertEqual(len(items), 1)
+        self.assertEqual(
+            items[0].study_activity_instruction_uid, "StudyActivityInstruction_000001"
+        )
+        self.assertEqual(items[0].activity_instruction_name, "Instruction")
+        self.assertEqual(items[0].author_username, "user")
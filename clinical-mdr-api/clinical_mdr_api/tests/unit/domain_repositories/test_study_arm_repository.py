@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_arm_repository import (
+    StudySelectionArmRepository,
+)
+
+COLUMNS = [
+    "study_uid",
+    "study_selection_uid",
+    "arm_name",
+    "arm_short_name",
+    "arm_code",
+    "arm_description",
+    "order",
+    "accepted_version",
+    "number_of_subjects",
+    "randomization_group",
+    "merge_branch_for_this_arm_for_sdtm_adam",
+    "arm_type_uid",
+    "start_date",
+    "author_id",
+    "arm_uid",
+    "name",
+    "short_name",
+    "code",
+    "description",
+    "author_username",
+]
+ROW = [
+    "Study_000001",
+    "StudyArm_000002",
+    "Placebo",
+    "PBO",
+    "B",
+    None,
+    2,
+    False,
+    10,
+    "B",
+    False,
+    None,
+    None,
+    "unknown-user",
+    "StudyArm_000002",
+    "Placebo",
+    "PBO",
+    "B",
+    None,
+    "unknown-user",
+]
+
+
+class TestStudySelectionArmRepository(unittest.TestCase):
+    @patch(
+        "clinical_mdr_api.services.user_info.UserInfoService.get_author_username_from_id",
+        return_value="unknown-user",
+    )
+    @patch(
+        "clinical_mdr_api.domain_repositories.study_selections.study_arm_repository.db"
+    )
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_find_selections_page_filters_sorts_and_paginates_in_database(
+        self, builder_db, repository_db, _
+    ):
+        builder_db.cypher_query.return_value = ([ROW], COLUMNS)
+        repository_db.cypher_query.return_value = ([[3]], ["total_count"])
+
+        page, total = StudySelectionArmRepository().find_selections_page(
+            study_uid="Study_000001",
+            sort_by={"name": False},
+            page_number=2,
+            page_size=1,
+            filter_by={"randomization_group": {"v": ["B"], "op": "eq"}},
+            total_count=True,
+        )
+
+        query, params = (
+            builder_db.cypher_query.call_args.kwargs["query"],
+            builder_db.cypher_query.call_args.kwargs["params"],
+        )
+        self.assertIn("sar.uid AS study_selection_uid", query)
+        self.assertIn("arm_name AS name", query)
+        # the order is the position in the study, as in the study arm aggregate
+        self.assertIn("WITH study_uid, collect(", query)
+        self.assertIn("WITH study_uid, index + 1 AS order, ", query)
+        self.assertIn("WHERE randomization_group=$randomization_group_0", query)
+        self.assertIn("ORDER BY toLower(name) DESC,order", query)
+        self.assertTrue(
+            query.endswith("SKIP $page_number * $page_size LIMIT $page_size")
+        )
+        self.assertEqual(params["uid"], "Study_000001")
+        self.assertEqual(params["page_number"], 1)
+        self.assertIn(
+            "RETURN count(*) AS total_count",
+            repository_db.cypher_query.call_args.kwargs["query"],
+        )
+
+        self.assertEqual(total, 3)
+        self.assertEqual(len(page), 1)
+        arm, order = page[0]
+        self.assertEqual(arm.study_selection_uid, "StudyArm_000002")
+        self.assertEqual(arm.name, "Placebo")
+        self.assertEqual(order, 2)
+
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_find_selections_page_sorts_by_study_and_order_by_default(self, builder_db):
+        builder_db.cypher_query.return_value = ([], COLUMNS)
+
+        page, total = StudySelectionArmRepository().find_selections_page()
+
+        query = builder_db.cypher_query.call_args.kwargs["query"]
+        self.assertIn("ORDER BY toLower(study_uid) ASC,order ASC", query)
+        self.assertNotIn("SKIP", query)
+        self.assertEqual((page, total), ([], 0))
@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_compound_repository import (
+    StudySelectionCompoundRepository,
+)
+
+ROW = {
+    "study_uid": "Study_000001",
+    "study_compound_uid": "StudyCompound_000001",
+    "order": 1,
+    "other_information": None,
+    "compound_uid": "Compound_000001",
+    "compound_alias_uid": "CompoundAlias_000001",
+    "medicinal_product_uid": None,
+    "type_of_treatment_uid": None,
+    "dose_frequency_uid": None,
+    "dose_frequency": None,
+    "delivery_device_uid": None,
+    "delivery_device": None,
+    "dispenser_uid": None,
+    "dispenser": None,
+    "reason_for_missing": None,
+    "study_compound_dosing_count": 0,
+    "start_date": None,
+    "author_id": "unknown-user",
+    "author_username": "unknown-user",
+}
+
+
+class TestStudySelectionCompoundRepository(unittest.TestCase):
+    @patch(
+        "clinical_mdr_api.services.user_info.UserInfoService.get_author_username_from_id",
+        return_value="unknown-user",
+    )
+    @patch(
+        "clinical_mdr_api.domain_repositories.study_selections.study_compound_repository.db"
+    )
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_find_selections_page_filters_sorts_and_paginates_in_database(
+        self, builder_db, repository_db, _
+    ):
+        builder_db.cypher_query.return_value = ([list(ROW.values())], list(ROW))
+        repository_db.cypher_query.return_value = ([[4]], ["total_count"])
+
+        page, total = StudySelectionCompoundRepository().find_selections_page(
+            study_uid="Study_000001",
+            sort_by={"compound.uid": True},
+            page_number=3,
+            page_size=1,
+            filter_by={"compound.uid": {"v": ["Compound_000001"], "op": "eq"}},
+            total_count=True,
+        )
+
+        query, params = (
+            builder_db.cypher_query.call_args.kwargs["query"],
+            builder_db.cypher_query.call_args.kwargs["params"],
+        )
+        self.assertIn("{uid: compound_uid} AS compound", query)
+        self.assertIn("WITH study_uid, index + 1 AS order, ", query)
+        self.assertIn("WHERE toLower(compound.uid)=$compound_uid_0", query)
+        self.assertIn("ORDER BY compound.uid ASC,order", query)
+        self.assertTrue(
+            query.endswith("SKIP $page_number * $page_size LIMIT $page_size")
+        )
+        self.assertEqual(params["uid"], "Study_000001")
+        self.assertEqual(params["page_number"], 2)
+        self.assertIn(
+            "RETURN count(*) AS total_count",
+            repository_db.cypher_query.call_args.kwargs["query"],
+        )
+
+        self.assertEqual(total, 4)
+        self.assertEqual(len(page), 1)
+        compound, order = page[0]
+        self.assertEqual(compound.study_selection_uid, "StudyCompound_000001")
+        self.assertEqual(compound.compound_uid, "Compound_000001")
+        self.assertEqual(order, 1)
@@ -0,0 +1,187 @@
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import neo4j
+
+from clinical_mdr_api.domain_repositories.study_definitions.study_definition_repository_impl import (
+    StudyDefinitionRepositoryImpl,
+)
+from clinical_mdr_api.domains.study_definition_aggregates.root import (
+    _DEF_INITIAL_HIGH_LEVEL_STUDY_DESIGN,
+    _DEF_INITIAL_STUDY_INTERVENTION,
+    _DEF_INITIAL_STUDY_POPULATION,
+    StudyDefinitionAR,
+)
+from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
+    StudyDescriptionVO,
+    StudyMetadataVO,
+    StudyStatus,
+    StudyVersionMetadataVO,
+)
+from clinical_mdr_api.models.study_selections.study import CompactStudy
+from clinical_mdr_api.tests.unit.domain.study_definition_aggregate.test_study_metadata import (
+    random_valid_id_metadata,
+)
+
+MODULE = StudyDefinitionRepositoryImpl.__module__
+
+
+class TestStudyChangeToken(unittest.TestCase):
+    @patch(MODULE + ".get_library_change_marker")
+    @patch(MODULE + ".db")
+    def test_token_changes_with_the_library(self, db, get_library_change_marker):
+        db.cypher_query.return_value = (
+            [["4:abc:1", "2024-01-01T00:00:00Z", 3, 1]],
+            [],
+        )
+        get_library_change_marker.side_effect = [
+            ("2024-01-01T00:00:00Z", 10),
+            ("2024-01-02T00:00:00Z", 11),
+        ]
+
+        before = StudyDefinitionRepositoryImpl.get_study_change_token("Study_000001")
+        after = StudyDefinitionRepositoryImpl.get_study_change_token("Study_000001")
+
+        self.assertNotEqual(before, after)
+
+    @patch(MODULE + ".get_library_change_marker")
+    @patch(MODULE + ".db")
+    def test_locked_version_token_changes_with_the_library(
+        self, db, get_library_change_marker
+    ):
+        db.cypher_query.return_value = ([[True]], [])
+        get_library_change_marker.side_effect = [
+            ("2024-01-01T00:00:00Z", 10),
+            ("2024-01-02T00:00:00Z", 11),
+        ]
+
+        before = StudyDefinitionRepositoryImpl.get_study_change_token(
+            "Study_000001", "1"
+        )
+        after = StudyDefinitionRepositoryImpl.get_study_change_token(
+            "Study_000001", "1"
+        )
+
+        self.assertEqual(before, "locked:1:2024-01-01T00:00:00Z:10")
+        self.assertNotEqual(before, after)
+        # only the version lock is looked up, not the study actions
+        self.assertEqual(db.cypher_query.call_count, 2)
+
+    @patch(MODULE + ".get_library_change_marker")
+    @patch(MODULE + ".db")
+    def test_unknown_study_has_no_token(self, db, get_library_change_marker):
+        db.cypher_query.return_value = ([], [])
+
+        self.assertIsNone(
+            StudyDefinitionRepositoryImpl.get_study_change_token("Study_000001")
+        )
+        get_library_change_marker.assert_not_called()
+
+
+class TestFindCompactStudies(unittest.TestCase):
+    @patch(MODULE + ".CypherQueryBuilder")
+    def test_projection_matches_released_study_aggregate(self, cypher_query_builder):
+        released_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        id_metadata = random_valid_id_metadata(
+            fixed_values={"project_number": "123", "description": "Description"}
+        )
+        study_description = StudyDescriptionVO(
+            study_title="Study title", study_short_title="Short title"
+        )
+        study = StudyDefinitionAR(
+            _uid="Study_000001",
+            study_parent_part_uid=None,
+            study_subpart_uids=[],
+            _draft_metadata=None,
+            _released_metadata=StudyMetadataVO(
+                id_metadata=id_metadata,
+                high_level_study_design=_DEF_INITIAL_HIGH_LEVEL_STUDY_DESIGN,
+                study_population=_DEF_INITIAL_STUDY_POPULATION,
+                study_intervention=_DEF_INITIAL_STUDY_INTERVENTION,
+                study_description=study_description,
+                ver_metadata=StudyVersionMetadataVO(
+                    study_status=StudyStatus.RELEASED,
+                    version_number=Decimal("0.1"),
+                    version_timestamp=released_at,
+                    version_author="unknown-user",
+                    version_description="making a release",
+                ),
+            ),
+            _locked_metadata_versions=[],
+            _deleted=False,
+        )
+        # The same study, as stored on its LATEST_RELEASED relationship and study value
+        cypher_query_builder.return_value.execute.return_value = (
+            [
+                [
+                    "Study_000001",
+                    None,
+                    [],
+                    False,
+                    {
+                        "identification_metadata": {
+                            "study_number": id_metadata.study_number,
+                            "subpart_id": id_metadata.subpart_id,
+                            "study_acronym": id_metadata.study_acronym,
+                            "study_subpart_acronym": id_metadata.study_subpart_acronym,
+                            "project_number": "123",
+                            "project_name": "Project",
+                            "description": "Description",
+                            "clinical_programme_name": "Programme",
+                            "study_id": id_metadata.study_id,
+                        },
+                        "version_metadata": {
+                            "study_status": "RELEASED",
+                            "version_number": "0.1",
+                            "version_timestamp": neo4j.time.DateTime.from_native(
+                                released_at
+                            ),
+                            "version_author": "unknown-user",
+                            "version_description": "making a release",
+                        },
+                        "study_description": {
+                            "study_title": "Study title",
+                            "study_short_title": "Short title",
+                        },
+                    },
+                ]
+            ],
+            [
+                "uid",
+                "study_parent_part_uid",
+                "study_subpart_uids",
+                "has_locked_version",
+                "current_metadata",
+            ],
+        )
+
+        projection = (
+            StudyDefinitionRepositoryImpl("unknown-user").find_compact_studies().items
+        )
+
+        match_clause = cypher_query_builder.call_args.kwargs["match_clause"]
+        self.assertIn("version_number: current_version.version,", match_clause)
+        self.assertIn(
+            "version_description: current_version.change_description", match_clause
+        )
+        self.assertEqual(
+            CompactStudy.from_projection(
+                projection[0],
+                find_study_parent_part_by_uid=lambda _: None,
+                find_term_by_uids=lambda *_, **__: None,
+            ),
+            CompactStudy.from_study_definition_ar(
+                study,
+                find_project_by_project_number=lambda _: SimpleNamespace(
+                    name="Project", clinical_programme_uid="ClinicalProgramme_000001"
+                ),
+                find_clinical_programme_by_uid=lambda _: SimpleNamespace(
+                    name="Programme"
+                ),
+                find_study_parent_part_by_uid=lambda _: None,
+                find_term_by_uids=lambda *_, **__: None,
+            ),
+        )
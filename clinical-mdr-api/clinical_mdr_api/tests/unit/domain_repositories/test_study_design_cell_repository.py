@@ -0,0 +1,115 @@
+import copy
+import datetime
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_design_cell_repository import (
+    StudyDesignCellRepository,
+)
+from clinical_mdr_api.domains.study_selections.study_design_cell import (
+    StudyDesignCellsAR,
+    StudyDesignCellVO,
+)
+from common import exceptions
+
+STUDY_VALUE_ROW = [
+    [["StudyArm_1", False], ["StudyArm_2", False], ["StudyArm_3", True]],
+    [],
+    ["StudyEpoch_1", "StudyEpoch_2"],
+    ["StudyElement_1"],
+]
+
+
+def create_design_cell(uid: str, arm_uid: str, epoch_uid: str, order: int):
+    return StudyDesignCellVO(
+        uid=uid,
+        study_uid="Study_1",
+        study_arm_uid=arm_uid,
+        study_epoch_uid=epoch_uid,
+        study_element_uid="StudyElement_1",
+        transition_rule=None,
+        order=order,
+        start_date=datetime.datetime.now(datetime.timezone.utc),
+        author_id="author",
+    )
+
+
+def create_aggregate() -> StudyDesignCellsAR:
+    aggregate = StudyDesignCellsAR(
+        study_uid="Study_1",
+        design_cells=[
+            create_design_cell("StudyDesignCell_1", "StudyArm_1", "StudyEpoch_1", 1),
+            create_design_cell("StudyDesignCell_2", "StudyArm_2", "StudyEpoch_1", 2),
+            create_design_cell("StudyDesignCell_3", "StudyArm_1", "StudyEpoch_2", 3),
+        ],
+    )
+    aggregate.repository_closure_data = copy.deepcopy(aggregate.design_cells)
+    return aggregate
+
+
+@patch(
+    "clinical_mdr_api.domain_repositories.study_selections.study_design_cell_repository.db"
+)
+class TestStudyDesignCellRepositorySaveAll(unittest.TestCase):
+    def test_changes_are_written_with_one_query_per_kind(self, db):
+        aggregate = create_aggregate()
+        aggregate.remove_design_cell("StudyDesignCell_1")
+        aggregate.design_cells[1].transition_rule = "rule"
+        aggregate.add_design_cell(
+            create_design_cell("StudyDesignCell_4", "StudyArm_2", "StudyEpoch_2", 0)
+        )
+        db.cypher_query.side_effect = [
+            ([STUDY_VALUE_ROW], []),
+            ([["StudyDesignCell_1", True, True, True]], []),
+            ([], []),
+        ]
+        repository = StudyDesignCellRepository()
+
+        with patch.object(
+            repository,
+            "find_all_design_cells_by_study",
+            return_value=copy.deepcopy(aggregate.design_cells),
+        ) as find_all:
+            repository.save_all(aggregate, "author")
+
+        self.assertEqual(db.cypher_query.call_count, 3)
+        find_all.assert_called_once_with("Study_1")
+        delete_params = db.cypher_query.call_args_list[1].args[1]
+        self.assertEqual(delete_params["design_cell_uids"], ["StudyDesignCell_1"])
+        save_params = db.cypher_query.call_args_list[2].args[1]
+        # the order of cell 2 shifted, cell 3 only changed its transition rule
+        self.assertEqual(
+            [
+                (cell["uid"], cell["update"], cell["order"], cell["transition_rule"])
+                for cell in save_params["design_cells"]
+            ],
+            [
+                ("StudyDesignCell_2", True, 1, None),
+                ("StudyDesignCell_3", True, 2, "rule"),
+                ("StudyDesignCell_4", False, 3, None),
+            ],
+        )
+        self.assertEqual(aggregate.repository_closure_data, aggregate.design_cells)
+
+    def test_unchanged_aggregate_is_not_written(self, db):
+        StudyDesignCellRepository().save_all(create_aggregate(), "author")
+
+        db.cypher_query.assert_not_called()
+
+    def test_arm_with_branch_arms_is_rejected_before_writing(self, db):
+        aggregate = create_aggregate()
+        aggregate.design_cells[0].study_arm_uid = "StudyArm_3"
+        db.cypher_query.return_value = ([STUDY_VALUE_ROW], [])
+
+        with self.assertRaises(exceptions.BusinessLogicException):
+            StudyDesignCellRepository().save_all(aggregate, "author")
+        db.cypher_query.assert_called_once()
+
+    def test_duplicated_arm_and_epoch_is_rejected_before_writing(self, db):
+        aggregate = create_aggregate()
+        aggregate.design_cells[2].study_epoch_uid = "StudyEpoch_1"
+        db.cypher_query.return_value = ([STUDY_VALUE_ROW], [])
+
+        with self.assertRaises(exceptions.AlreadyExistsException):
+            StudyDesignCellRepository().save_all(aggregate, "author")
+        db.cypher_query.assert_called_once()
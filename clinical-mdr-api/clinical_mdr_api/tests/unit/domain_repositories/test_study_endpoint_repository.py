@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_endpoint_repository import (
+    StudySelectionEndpointRepository,
+)
+
+ROW = {
+    "study_uid": "Study_000001",
+    "study_endpoint_uid": "StudyEndpoint_000001",
+    "order": 1,
+    "endpoint_uid": "Endpoint_000001",
+    "endpoint_order": 1,
+    "timeframe_uid": None,
+    "endpoint_version": "1.0",
+    "timeframe_version": None,
+    "endpoint_level_uid": "CTTerm_000001",
+    "endpoint_sublevel_uid": None,
+    "study_objective_uid": "StudyObjective_000001",
+    "start_date": None,
+    "is_instance": True,
+    "author_id": "unknown-user",
+    "values": {
+        "units": [{"uid": "UnitDefinition_000001", "name": "mg"}],
+        "separator": "or",
+    },
+    "accepted_version": False,
+    "author_username": "unknown-user",
+}
+
+
+class TestStudySelectionEndpointRepository(unittest.TestCase):
+    @patch(
+        "clinical_mdr_api.services.user_info.UserInfoService.get_author_username_from_id",
+        return_value="unknown-user",
+    )
+    @patch(
+        "clinical_mdr_api.domain_repositories.study_selections.study_endpoint_repository.db"
+    )
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_find_selections_page_filters_sorts_and_paginates_in_database(
+        self, builder_db, repository_db, _
+    ):
+        builder_db.cypher_query.return_value = ([list(ROW.values())], list(ROW))
+        repository_db.cypher_query.return_value = ([[5]], ["total_count"])
+
+        page, total = StudySelectionEndpointRepository().find_selections_page(
+            study_uids=["Study_000001", "Study_000002"],
+            sort_by={"study_objective.study_objective_uid": False},
+            page_number=2,
+            page_size=1,
+            filter_by={"endpoint_level.term_uid": {"v": ["CTTerm_000001"]}},
+            total_count=True,
+        )
+
+        query, params = (
+            builder_db.cypher_query.call_args.kwargs["query"],
+            builder_db.cypher_query.call_args.kwargs["params"],
+        )
+        self.assertIn("WITH * WHERE endpoint_uid IS NOT NULL", query)
+        # numbered after dropping the rows the endpoint aggregate leaves out
+        self.assertLess(
+            query.index("WITH * WHERE endpoint_uid IS NOT NULL"),
+            query.index("WITH study_uid, index + 1 AS order, "),
+        )
+        self.assertIn(
+            "CASE WHEN is_instance THEN {uid: endpoint_uid} END AS endpoint", query
+        )
+        self.assertIn(
+            "WHERE toLower(endpoint_level.term_uid)=$endpoint_level_term_uid_0", query
+        )
+        self.assertIn("ORDER BY study_objective.study_objective_uid DESC,order", query)
+        self.assertTrue(
+            query.endswith("SKIP $page_number * $page_size LIMIT $page_size")
+        )
+        self.assertEqual(params["uids"], ["Study_000001", "Study_000002"])
+        self.assertIn(
+            "RETURN count(*) AS total_count",
+            repository_db.cypher_query.call_args.kwargs["query"],
+        )
+
+        self.assertEqual(total, 5)
+        self.assertEqual(len(page), 1)
+        endpoint, order = page[0]
+        self.assertEqual(endpoint.study_selection_uid, "StudyEndpoint_000001")
+        self.assertEqual([unit["name"] for unit in endpoint.endpoint_units], ["mg"])
+        self.assertEqual(endpoint.unit_separator, "or")
+        self.assertEqual(order, 1)
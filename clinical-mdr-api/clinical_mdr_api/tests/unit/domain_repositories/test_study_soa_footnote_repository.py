@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_soa_footnote_repository import (
+    StudySoAFootnoteRepository,
+)
+
+ROW = {
+    "study_uid": "Study_000001",
+    "uid": "StudySoAFootnote_000001",
+    "footnote": {"uid": "Footnote_000001", "name": "Footnote"},
+    "footnote_template": {},
+    "referenced_items": [],
+}
+
+
+class TestStudySoAFootnoteRepository(unittest.TestCase):
+    @patch(
+        "clinical_mdr_api.domain_repositories.study_selections.study_soa_footnote_repository.db"
+    )
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_find_footnotes_page_filters_sorts_and_paginates_in_database(
+        self, builder_db, repository_db
+    ):
+        builder_db.cypher_query.return_value = ([[ROW, 3]], ["row", "order"])
+        repository_db.cypher_query.return_value = ([[12]], ["total_count"])
+
+        page, total = StudySoAFootnoteRepository().find_footnotes_page(
+            study_uids="Study_000001",
+            full_query=False,
+            sort_by={"footnote.name": True},
+            page_number=2,
+            page_size=2,
+            filter_by={"footnote.name": {"v": ["foot"], "op": "co"}},
+            total_count=True,
+        )
+
+        query, params = (
+            builder_db.cypher_query.call_args.kwargs["query"],
+            builder_db.cypher_query.call_args.kwargs["params"],
+        )
+        self.assertIn("UNWIND range(0, size(rows) - 1) AS index", query)
+        self.assertIn("WHERE toLower(footnote.name) CONTAINS $footnote_name_0", query)
+        self.assertIn("ORDER BY footnote.name ASC,order", query)
+        self.assertTrue(
+            query.endswith("SKIP $page_number * $page_size LIMIT $page_size")
+        )
+        self.assertEqual(params["uids"], "Study_000001")
+        self.assertEqual(params["page_number"], 1)
+        self.assertEqual(params["footnote_name_0"], "foot")
+        self.assertIn(
+            "RETURN count(*) AS total_count",
+            repository_db.cypher_query.call_args.kwargs["query"],
+        )
+
+        self.assertEqual(total, 12)
+        self.assertEqual(len(page), 1)
+        footnote, order = page[0]
+        self.assertEqual(footnote.uid, "StudySoAFootnote_000001")
+        self.assertEqual(footnote.footnote_name, "Footnote")
+        self.assertEqual(order, 3)
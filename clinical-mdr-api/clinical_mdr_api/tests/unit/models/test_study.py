@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from clinical_mdr_api.domains.study_definition_aggregates.root import StudyDefinitionAR
+from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
+    StudyStatus,
+)
+from clinical_mdr_api.models.study_selections.study import CompactStudy, StudyParentPart
+
+
+def projection(
+    uid: str = "Study_000002",
+    study_status: str = "DRAFT",
+    has_locked_version: bool = False,
+    study_parent_part_uid: str | None = None,
+) -> dict:
+    return {
+        "uid": uid,
+        "study_parent_part_uid": study_parent_part_uid,
+        "study_subpart_uids": [],
+        "has_locked_version": has_locked_version,
+        "current_metadata": {
+            "identification_metadata": {
+                "study_number": "0002",
+                "subpart_id": "a" if study_parent_part_uid else None,
+                "study_acronym": "ACR",
+                "study_subpart_acronym": None,
+                "project_number": "123",
+                "project_name": "Project",
+                "description": None,
+                "clinical_programme_name": "Programme",
+                "study_id": "CDISC DEV-0002",
+            },
+            "version_metadata": {
+                "study_status": study_status,
+                "version_number": "1" if study_status == "LOCKED" else None,
+                "version_timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "version_author": "author",
+            },
+            "study_description": {
+                "study_title": "Title",
+                "study_short_title": None,
+            },
+        },
+    }
+
+
+def test_compact_study_from_projection():
+    study = CompactStudy.from_projection(
+        projection(study_status="LOCKED", has_locked_version=True),
+        find_study_parent_part_by_uid=lambda _: None,
+        find_term_by_uids=lambda _: None,
+    )
+
+    assert study.uid == "Study_000002"
+    assert study.study_parent_part is None
+    assert study.possible_actions == ["unlock"]
+    assert study.current_metadata.identification_metadata.study_id == "CDISC DEV-0002"
+    assert study.current_metadata.identification_metadata.project_name == "Project"
+    assert study.current_metadata.version_metadata.study_status == "LOCKED"
+    assert study.current_metadata.version_metadata.version_number == Decimal(1)
+    assert study.current_metadata.study_description.study_title == "Title"
+
+
+@patch.object(StudyParentPart, "from_study_uid")
+def test_compact_study_from_projection_of_subpart(from_study_uid):
+    from_study_uid.return_value = StudyParentPart.model_construct(
+        uid="Study_000001", study_id="CDISC DEV-0001"
+    )
+    find_study_parent_part_by_uid = Mock()
+
+    study = CompactStudy.from_projection(
+        projection(study_parent_part_uid="Study_000001"),
+        find_study_parent_part_by_uid=find_study_parent_part_by_uid,
+        find_term_by_uids=lambda _: None,
+    )
+
+    assert from_study_uid.call_args.args[:2] == (
+        "Study_000001",
+        find_study_parent_part_by_uid,
+    )
+    assert study.study_parent_part.uid == "Study_000001"
+    assert study.possible_actions == ["delete"]
+
+
+@pytest.mark.parametrize(
+    "study_status, has_locked_version, expected",
+    [
+        ("DRAFT", False, ["delete", "lock", "release"]),
+        ("DRAFT", True, ["lock", "release"]),
+        ("LOCKED", True, ["unlock"]),
+        ("DELETED", False, []),
+    ],
+)
+def test_compact_study_possible_actions(study_status, has_locked_version, expected):
+    study = CompactStudy.from_projection(
+        projection(study_status=study_status, has_locked_version=has_locked_version),
+        find_study_parent_part_by_uid=lambda _: None,
+        find_term_by_uids=lambda _: None,
+    )
+
+    assert study.possible_actions == expected
+    assert study.possible_actions == sorted(
+        _.value
+        for _ in StudyDefinitionAR.possible_actions_for(
+            StudyStatus(study_status), has_locked_version, is_subpart=False
+        )
+    )
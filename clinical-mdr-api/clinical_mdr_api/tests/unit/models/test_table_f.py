@@ -1,21 +1,31 @@
 # pylint: disable=no-member
+import io
 from typing import Mapping
 
 import bs4
 import docx
+import openpyxl
 import pytest
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.shared import Inches
 from pyrate_limiter import Any
 
 from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
 from clinical_mdr_api.services.utils.table_f import (
+    Cell,
+    CellRef,
+    Ref,
+    Row,
     SimpleFootnote,
+    Table,
     TableCell,
     TableRow,
     TableWithFootnotes,
     table_to_docx,
     table_to_html,
+    table_to_xlsx,
 )
 
 DOCX_TEXT_DIRECTION_VALUE = (
@@ -331,6 +341,30 @@ def test_table_to_docx(test_table: TableWithFootnotes):
         compare_docx_footnotes(docx_doc, test_table.footnotes, DOCX_STYLES)
 
 
+def test_table_to_docx_merges_and_header_rows():
+    """Tests table_to_docx() merges spanning cells, repeats header rows and sets table properties"""
+
+    tablex = table_to_docx(TEST_TABLE, styles=DOCX_STYLES).document.tables[0]
+
+    # THEN the table has the table style and a wider first column
+    assert tablex.style.name == DOCX_STYLES["table"][0]
+    assert tablex.columns[0].width == Inches(4)
+
+    for row_idx, (rowx, row) in enumerate(
+        zip(tablex.rows, (row for row in TEST_TABLE.rows if not row.hide))
+    ):
+        # THEN header rows repeat on each page
+        tr_pr = rowx._tr.trPr
+        assert (tr_pr is not None and tr_pr.find(qn("w:tblHeader")) is not None) == (
+            row_idx < TEST_TABLE.num_header_rows
+        ), f"header flag in row {row_idx}"
+
+        # THEN spanning cells are merged
+        assert [tc.grid_span for tc in rowx._tr.tc_lst] == [
+            cell.span for cell in row.cells if cell.span
+        ], f"cell spans don't match in row {row_idx}"
+
+
 def compare_docx_table(
     tablex: docx.table.Table,
     test_table: TableWithFootnotes,
@@ -459,3 +493,113 @@ def compare_docx_footnotes(
         assert (
             textx == footnote.text_plain
         ), f"footnote text doesn't match in row {row_idx}"
+
+
+INTERNAL_TABLE = Table(
+    rows=[
+        Row(
+            cells=[
+                Cell("Epoch", style="header1", refs=[CellRef("StudyEpoch", "ep1")]),
+                Cell("Screening", span=2, vertical=True),
+                Cell(span=0),
+            ],
+        ),
+        Row(
+            cells=[Cell("Activity", footnotes=["a"]), Cell("X"), Cell()],
+            hide=True,
+            order=1,
+            level=2,
+        ),
+    ],
+    num_header_rows=1,
+    num_header_cols=1,
+    title="Internal Table",
+    footnotes=TEST_TABLE.footnotes,
+)
+
+
+def test_table_from_internal_table():
+    table = TableWithFootnotes.from_table(INTERNAL_TABLE)
+
+    assert table == TableWithFootnotes(
+        rows=[
+            TableRow(
+                cells=[
+                    TableCell(
+                        "Epoch", style="header1", refs=[Ref("StudyEpoch", "ep1")]
+                    ),
+                    TableCell("Screening", span=2, vertical=True),
+                    TableCell(span=0),
+                ],
+            ),
+            TableRow(
+                cells=[
+                    TableCell("Activity", footnotes=["a"]),
+                    TableCell("X"),
+                    TableCell(),
+                ],
+                hide=True,
+                order=1,
+                level=2,
+            ),
+        ],
+        num_header_rows=1,
+        num_header_cols=1,
+        title="Internal Table",
+        footnotes=TEST_TABLE.footnotes,
+    )
+
+
+def test_internal_table_copy():
+    table = INTERNAL_TABLE.copy()
+    assert table == INTERNAL_TABLE
+
+    table.rows[0].cells[0].refs.append(CellRef("StudyVisit", "v1"))
+    table.rows[1].cells[0].footnotes.append("b")
+    table.rows[1].hide = False
+    table.rows.pop()
+
+    assert INTERNAL_TABLE.rows[0].cells[0].refs == [CellRef("StudyEpoch", "ep1")]
+    assert INTERNAL_TABLE.rows[1].cells[0].footnotes == ["a"]
+    assert INTERNAL_TABLE.rows[1].hide is True
+
+
+def test_table_to_xlsx():
+    """Tests table_to_xlsx() by comparing the saved worksheet to the table"""
+
+    workbook = table_to_xlsx(TEST_TABLE, styles={"hi": "Heading 1", "data": "Note"})
+    stream = io.BytesIO()
+    workbook.save(stream)
+    worksheet = openpyxl.load_workbook(stream).active
+
+    # THEN the worksheet is named after the table
+    assert worksheet.title == TEST_TABLE.title
+
+    # THEN all rows are written, hidden ones too
+    values = list(worksheet.values)
+    assert len(values) == len(TEST_TABLE.rows)
+    for row_idx, (row, test_row) in enumerate(zip(values, TEST_TABLE.rows)):
+        for col_idx, (value, cell) in enumerate(zip(row, test_row.cells)):
+            assert (value or "") == cell.text, f"text mismatch in {row_idx}:{col_idx}"
+
+    # THEN spanning cells are merged
+    assert sorted(map(str, worksheet.merged_cells.ranges)) == [
+        "A7:B7",
+        "B1:C1",
+        "B2:C2",
+        "B3:C3",
+        "B5:C5",
+        "B6:C6",
+    ]
+
+    # THEN named styles are applied
+    assert worksheet["B1"].style == "Heading 1"
+    assert worksheet["C8"].style == "Note"
+    assert worksheet["A1"].style == "Normal"
+
+    # THEN columns are sized to the longest non-spanning text
+    assert worksheet.column_dimensions["A"].width == 14
+    assert worksheet.column_dimensions["C"].width == 11
+
+    # THEN header rows and columns are frozen
+    assert worksheet.freeze_panes == "C4"
@@ -21,11 +21,11 @@ from clinical_mdr_api.models.syntax_instances.footnote import (
     FootnoteTemplateWithType,
 )
 from clinical_mdr_api.services.utils.table_f import (
-    Ref,
+    Cell,
+    CellRef,
+    Row,
     SimpleFootnote,
-    TableCell,
-    TableRow,
-    TableWithFootnotes,
+    Table,
 )
 from common.config import settings
 
@@ -2712,147 +2712,147 @@ FOOTNOTES: list[StudySoAFootnote] = [
         footnote_template=None,
     ),
 ]
-DETAILED_SOA_TABLE = TableWithFootnotes(
+DETAILED_SOA_TABLE = Table(
     rows=[
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     style="header1",
                 ),
-                TableCell(
+                Cell(
                     text="Screening",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000004")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000004")],
                     footnotes=["a"],
                 ),
-                TableCell(
+                Cell(
                     text="Run-in",
                     span=2,
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000005")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000005")],
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     text="Treatment 1",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000006")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000006")],
                 ),
-                TableCell(
+                Cell(
                     text="Treatment 2",
                     span=3,
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000007")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000007")],
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     text="Follow-up",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000008")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000008")],
                 ),
             ],
             hide=False,
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Visit short name",
                     style="header2",
                 ),
-                TableCell(
+                Cell(
                     text="V1",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000012")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000012")],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="V2",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000013")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000013")],
                 ),
-                TableCell(
+                Cell(
                     text="V4",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000015")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000015")],
                     footnotes=["a"],
                 ),
-                TableCell(
+                Cell(
                     text="V5-V7",
                     style="header2",
                     refs=[
-                        Ref(type="StudyVisit", uid="StudyVisit_000016"),
-                        Ref(type="StudyVisit", uid="StudyVisit_000017"),
-                        Ref(type="StudyVisit", uid="StudyVisit_000018"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000016"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000017"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000018"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="V8",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000019")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000019")],
                 ),
-                TableCell(
+                Cell(
                     text="V9",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000020")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000020")],
                 ),
-                TableCell(
+                Cell(
                     text="V10",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000021")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000021")],
                 ),
-                TableCell(
+                Cell(
                     text="V11",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000022")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000022")],
                 ),
             ],
             hide=False,
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Study day",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-14",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-3",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-1",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="1-5",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="15",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="17",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="19",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="22",
                     style="header3",
                 ),
@@ -2861,41 +2861,41 @@ DETAILED_SOA_TABLE = TableWithFootnotes(
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Visit window (days)",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
@@ -2904,306 +2904,312 @@ DETAILED_SOA_TABLE = TableWithFootnotes(
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="SUBJECT RELATED INFORMATION",
                     style="soaGroup",
                     refs=[
-                        Ref(type="StudySoAGroup", uid="StudySoAGroup_000033"),
-                        Ref(type="CTTerm", uid="CTTerm_000066"),
+                        CellRef(type="StudySoAGroup", uid="StudySoAGroup_000033"),
+                        CellRef(type="CTTerm", uid="CTTerm_000066"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=1,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000033"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000010"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000033"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000010"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000033",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent Obtained",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000033"),
-                        Ref(type="Activity", uid="Activity_000059"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000033"),
+                        CellRef(type="Activity", uid="Activity_000059"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000167",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000222",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000223",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000224",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000237",
                         )
                     ],
                 ),
-                TableCell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000034"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000011"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000034"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000011"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=2,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000034",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000018"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000018"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria Met",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000034"),
-                        Ref(type="Activity", uid="Activity_000041"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000034"),
+                        CellRef(type="Activity", uid="Activity_000041"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000168",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000035"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000017"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000035"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000017"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=3,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000035",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000030"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000030"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000035"),
-                        Ref(type="Activity", uid="Activity_000062"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000035"),
+                        CellRef(type="Activity", uid="Activity_000062"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000217",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000218",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000219",
                         )
@@ -3214,171 +3220,175 @@ DETAILED_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Body Measurements",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000036"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000037"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000005"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000036"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000037"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000005"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=4,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Body Measurements",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000036",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000037",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000010"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000010"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Height",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000036"),
-                        Ref(type="Activity", uid="Activity_000054"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000036"),
+                        CellRef(type="Activity", uid="Activity_000054"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000169",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000221",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Weight",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000037"),
-                        Ref(type="Activity", uid="Activity_000025"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000037"),
+                        CellRef(type="Activity", uid="Activity_000025"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000170",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000175",
                         )
                     ],
                     footnotes=["c"],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000176",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000205",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000214",
                         ),
                     ],
                     footnotes=["c", "d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000143",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000144",
                         )
@@ -3390,98 +3400,100 @@ DETAILED_SOA_TABLE = TableWithFootnotes(
             order=2,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Laboratory Assessments",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000038"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000004"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000038"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000004"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=5,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Haematology",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000038",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000021"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000021"),
                     ],
                     footnotes=["b", "d"],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Erythrocytes",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000038"),
-                        Ref(type="Activity", uid="Activity_000044"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000038"),
+                        CellRef(type="Activity", uid="Activity_000044"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000173",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000166",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000165",
                         )
@@ -3492,130 +3504,136 @@ DETAILED_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Vital Signs",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000039"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000040"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000041"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000006"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000039"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000040"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000041"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000006"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=6,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Vital Signs",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000039",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000040",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000009"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000009"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Systolic Blood Pressure",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000039"),
-                        Ref(type="Activity", uid="Activity_000027"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000039"),
+                        CellRef(type="Activity", uid="Activity_000027"),
                     ],
                     footnotes=["b", "d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000137",
                         )
                     ],
                     footnotes=["c"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000145",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000187",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000151",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000206",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000216",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000163",
                         )
@@ -3626,162 +3644,162 @@ DETAILED_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Diastolic Blood Pressure",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000040"),
-                        Ref(type="Activity", uid="Activity_000026"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000040"),
+                        CellRef(type="Activity", uid="Activity_000026"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000227",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000229",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000230",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000231",
                         ),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000232",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000235",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(),
+                Cell(),
             ],
             hide=True,
             order=2,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000041",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Date of Birth",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000041"),
-                        Ref(type="Activity", uid="Activity_000037"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000041"),
+                        CellRef(type="Activity", uid="Activity_000037"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000140",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000146",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000186",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000184",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000207",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000215",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=2,
@@ -3815,147 +3833,147 @@ DETAILED_SOA_TABLE = TableWithFootnotes(
     title="Protocol Flowchart",
     id=None,
 )
-PROTOCOL_SOA_TABLE = TableWithFootnotes(
+PROTOCOL_SOA_TABLE = Table(
     rows=[
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     style="header1",
                 ),
-                TableCell(
+                Cell(
                     text="Screening",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000004")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000004")],
                     footnotes=["a"],
                 ),
-                TableCell(
+                Cell(
                     text="Run-in",
                     span=2,
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000005")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000005")],
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     text="Treatment 1",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000006")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000006")],
                 ),
-                TableCell(
+                Cell(
                     text="Treatment 2",
                     span=3,
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000007")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000007")],
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     text="Follow-up",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000008")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000008")],
                 ),
             ],
             hide=False,
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Visit short name",
                     style="header2",
                 ),
-                TableCell(
+                Cell(
                     text="V1",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000012")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000012")],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="V2",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000013")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000013")],
                 ),
-                TableCell(
+                Cell(
                     text="V4",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000015")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000015")],
                     footnotes=["a"],
                 ),
-                TableCell(
+                Cell(
                     text="V5-V7",
                     style="header2",
                     refs=[
-                        Ref(type="StudyVisit", uid="StudyVisit_000016"),
-                        Ref(type="StudyVisit", uid="StudyVisit_000017"),
-                        Ref(type="StudyVisit", uid="StudyVisit_000018"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000016"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000017"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000018"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="V8",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000019")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000019")],
                 ),
-                TableCell(
+                Cell(
                     text="V9",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000020")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000020")],
                 ),
-                TableCell(
+                Cell(
                     text="V10",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000021")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000021")],
                 ),
-                TableCell(
+                Cell(
                     text="V11",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000022")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000022")],
                 ),
             ],
             hide=False,
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Study day",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-14",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-3",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-1",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="1-5",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="15",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="17",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="19",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="22",
                     style="header3",
                 ),
@@ -3964,41 +3982,41 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Visit window (days)",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
@@ -4007,239 +4025,245 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="SUBJECT RELATED INFORMATION",
                     style="soaGroup",
                     refs=[
-                        Ref(type="StudySoAGroup", uid="StudySoAGroup_000033"),
-                        Ref(type="CTTerm", uid="CTTerm_000066"),
+                        CellRef(type="StudySoAGroup", uid="StudySoAGroup_000033"),
+                        CellRef(type="CTTerm", uid="CTTerm_000066"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=1,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000033"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000010"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000033"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000010"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000033",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent Obtained",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000033"),
-                        Ref(type="Activity", uid="Activity_000059"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000033"),
+                        CellRef(type="Activity", uid="Activity_000059"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000167",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000222",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000223",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000224",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000237",
                         )
                     ],
                 ),
-                TableCell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000034"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000011"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000034"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000011"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=2,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000034",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000018"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000018"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria Met",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000034"),
-                        Ref(type="Activity", uid="Activity_000041"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000034"),
+                        CellRef(type="Activity", uid="Activity_000041"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000168",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000035"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000017"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000035"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000017"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                 ),
             ],
@@ -4247,72 +4271,72 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=3,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000035",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000030"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000030"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000035"),
-                        Ref(type="Activity", uid="Activity_000062"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000035"),
+                        CellRef(type="Activity", uid="Activity_000062"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000217",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000218",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000219",
                         )
@@ -4323,66 +4347,70 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Body Measurements",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000036"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000037"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000005"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000036"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000037"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000005"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=4,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Body Measurements",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000036",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000037",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000010"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000010"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                 ),
             ],
@@ -4390,116 +4418,116 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Height",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000036"),
-                        Ref(type="Activity", uid="Activity_000054"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000036"),
+                        CellRef(type="Activity", uid="Activity_000054"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000169",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000221",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Weight",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000037"),
-                        Ref(type="Activity", uid="Activity_000025"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000037"),
+                        CellRef(type="Activity", uid="Activity_000025"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000170",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000175",
                         )
                     ],
                     footnotes=["c"],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000176",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000205",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000214",
                         ),
                     ],
                     footnotes=["c", "d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000143",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000144",
                         )
@@ -4511,29 +4539,31 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=2,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Laboratory Assessments",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000038"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000004"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000038"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000004"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                 ),
             ],
@@ -4541,74 +4571,74 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=5,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Haematology",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000038",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000021"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000021"),
                     ],
                     footnotes=["b", "d"],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Erythrocytes",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000038"),
-                        Ref(type="Activity", uid="Activity_000044"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000038"),
+                        CellRef(type="Activity", uid="Activity_000044"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000173",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000166",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000165",
                         )
@@ -4619,68 +4649,74 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Vital Signs",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000039"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000040"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000041"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000006"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000039"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000040"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000041"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000006"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=6,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Vital Signs",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000039",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000040",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000009"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000009"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
             ],
@@ -4688,75 +4724,75 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Systolic Blood Pressure",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000039"),
-                        Ref(type="Activity", uid="Activity_000027"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000039"),
+                        CellRef(type="Activity", uid="Activity_000027"),
                     ],
                     footnotes=["b", "d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000137",
                         )
                     ],
                     footnotes=["c"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000145",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000187",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000151",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000206",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000216",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000163",
                         )
@@ -4767,170 +4803,170 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Diastolic Blood Pressure",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000040"),
-                        Ref(type="Activity", uid="Activity_000026"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000040"),
+                        CellRef(type="Activity", uid="Activity_000026"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000227",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000229",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000230",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000231",
                         ),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000232",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000235",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(),
+                Cell(),
             ],
             hide=True,
             order=2,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000041",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(
+                Cell(
                     text="X",
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Date of Birth",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000041"),
-                        Ref(type="Activity", uid="Activity_000037"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000041"),
+                        CellRef(type="Activity", uid="Activity_000037"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000140",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000146",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000186",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000184",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000207",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000215",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=2,
@@ -4964,147 +5000,147 @@ PROTOCOL_SOA_TABLE = TableWithFootnotes(
     title="Protocol Flowchart",
     id=None,
 )
-PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
+PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = Table(
     rows=[
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     style="header1",
                 ),
-                TableCell(
+                Cell(
                     text="Screening",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000004")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000004")],
                     footnotes=["a"],
                 ),
-                TableCell(
+                Cell(
                     text="Run-in",
                     span=2,
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000005")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000005")],
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     text="Treatment 1",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000006")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000006")],
                 ),
-                TableCell(
+                Cell(
                     text="Treatment 2",
                     span=3,
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000007")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000007")],
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     span=0,
                 ),
-                TableCell(
+                Cell(
                     text="Follow-up",
                     style="header1",
-                    refs=[Ref(type="StudyEpoch", uid="StudyEpoch_000008")],
+                    refs=[CellRef(type="StudyEpoch", uid="StudyEpoch_000008")],
                 ),
             ],
             hide=False,
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Visit short name",
                     style="header2",
                 ),
-                TableCell(
+                Cell(
                     text="V1",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000012")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000012")],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="V2",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000013")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000013")],
                 ),
-                TableCell(
+                Cell(
                     text="V4",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000015")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000015")],
                     footnotes=["a"],
                 ),
-                TableCell(
+                Cell(
                     text="V5-V7",
                     style="header2",
                     refs=[
-                        Ref(type="StudyVisit", uid="StudyVisit_000016"),
-                        Ref(type="StudyVisit", uid="StudyVisit_000017"),
-                        Ref(type="StudyVisit", uid="StudyVisit_000018"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000016"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000017"),
+                        CellRef(type="StudyVisit", uid="StudyVisit_000018"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="V8",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000019")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000019")],
                 ),
-                TableCell(
+                Cell(
                     text="V9",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000020")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000020")],
                 ),
-                TableCell(
+                Cell(
                     text="V10",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000021")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000021")],
                 ),
-                TableCell(
+                Cell(
                     text="V11",
                     style="header2",
-                    refs=[Ref(type="StudyVisit", uid="StudyVisit_000022")],
+                    refs=[CellRef(type="StudyVisit", uid="StudyVisit_000022")],
                 ),
             ],
             hide=False,
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Study day",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-14",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-3",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="-1",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="1-5",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="15",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="17",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="19",
                     style="header3",
                 ),
-                TableCell(
+                Cell(
                     text="22",
                     style="header3",
                 ),
@@ -5113,41 +5149,41 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Visit window (days)",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
-                TableCell(
+                Cell(
                     text="0",
                     style="header4",
                 ),
@@ -5156,254 +5192,260 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=None,
             level=None,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="SUBJECT RELATED INFORMATION",
                     style="soaGroup",
                     refs=[
-                        Ref(type="StudySoAGroup", uid="StudySoAGroup_000033"),
-                        Ref(type="CTTerm", uid="CTTerm_000066"),
+                        CellRef(type="StudySoAGroup", uid="StudySoAGroup_000033"),
+                        CellRef(type="CTTerm", uid="CTTerm_000066"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=1,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000033"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000010"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000033"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000010"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000033",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent Obtained",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000033"),
-                        Ref(type="Activity", uid="Activity_000059"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000033"),
+                        CellRef(type="Activity", uid="Activity_000059"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000167",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000222",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000223",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000224",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000237",
                         )
                     ],
                 ),
-                TableCell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000034"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000011"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000034"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000011"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=2,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000034",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000018"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000018"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Eligibility Criteria Met",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000034"),
-                        Ref(type="Activity", uid="Activity_000041"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000034"),
+                        CellRef(type="Activity", uid="Activity_000041"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000168",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000035"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000017"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000035"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000017"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000217",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000218",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000219",
                         )
@@ -5414,72 +5456,72 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=3,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000035",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000030"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000030"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Medical History/Concomitant Illness",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000035"),
-                        Ref(type="Activity", uid="Activity_000062"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000035"),
+                        CellRef(type="Activity", uid="Activity_000062"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000217",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000218",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000219",
                         )
@@ -5490,111 +5532,115 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Body Measurements",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000036"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000037"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000005"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000036"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000037"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000005"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=4,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Body Measurements",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000036",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000037",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000010"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000010"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000169",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000170",
                         ),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000175",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000176",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000205",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000214",
                         ),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000143",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000221",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000144",
                         )
@@ -5605,116 +5651,116 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Height",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000036"),
-                        Ref(type="Activity", uid="Activity_000054"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000036"),
+                        CellRef(type="Activity", uid="Activity_000054"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000169",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000221",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Weight",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000037"),
-                        Ref(type="Activity", uid="Activity_000025"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000037"),
+                        CellRef(type="Activity", uid="Activity_000025"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000170",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000175",
                         )
                     ],
                     footnotes=["c"],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000176",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000205",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000214",
                         ),
                     ],
                     footnotes=["c", "d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000143",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000144",
                         )
@@ -5726,44 +5772,46 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=2,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Laboratory Assessments",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000038"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000004"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000038"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000004"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000173",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000166",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000165",
                         )
@@ -5774,74 +5822,74 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=5,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Haematology",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000038",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000021"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000021"),
                     ],
                     footnotes=["b", "d"],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Erythrocytes",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000038"),
-                        Ref(type="Activity", uid="Activity_000044"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000038"),
+                        CellRef(type="Activity", uid="Activity_000044"),
                     ],
                     footnotes=["b"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000173",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000166",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000165",
                         )
@@ -5852,131 +5900,137 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Vital Signs",
                     style="group",
                     refs=[
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000039"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000040"),
-                        Ref(type="StudyActivityGroup", uid="StudyActivityGroup_000041"),
-                        Ref(type="ActivityGroup", uid="ActivityGroup_000006"),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000039"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000040"
+                        ),
+                        CellRef(
+                            type="StudyActivityGroup", uid="StudyActivityGroup_000041"
+                        ),
+                        CellRef(type="ActivityGroup", uid="ActivityGroup_000006"),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=6,
             level=2,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Vital Signs",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000039",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000040",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000009"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000009"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000137",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000227",
                         ),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000145",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000187",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000151",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000206",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000216",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000229",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000230",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000231",
                         ),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000232",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000235",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000163",
                         )
@@ -5987,75 +6041,75 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Systolic Blood Pressure",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000039"),
-                        Ref(type="Activity", uid="Activity_000027"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000039"),
+                        CellRef(type="Activity", uid="Activity_000027"),
                     ],
                     footnotes=["b", "d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000137",
                         )
                     ],
                     footnotes=["c"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000145",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000187",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000151",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000206",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000216",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000163",
                         )
@@ -6066,202 +6120,202 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
             order=1,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Diastolic Blood Pressure",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000040"),
-                        Ref(type="Activity", uid="Activity_000026"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000040"),
+                        CellRef(type="Activity", uid="Activity_000026"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000227",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000229",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000230",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000231",
                         ),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000232",
                         )
                     ],
                 ),
-                TableCell(),
-                TableCell(
+                Cell(),
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000235",
                         )
                     ],
                     footnotes=["d"],
                 ),
-                TableCell(),
+                Cell(),
             ],
             hide=True,
             order=2,
             level=4,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Informed Consent and Demography",
                     style="subGroup",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySubGroup",
                             uid="StudyActivitySubGroup_000041",
                         ),
-                        Ref(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
+                        CellRef(type="ActivitySubGroup", uid="ActivitySubGroup_000016"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000140",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000146",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000186",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000184",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000207",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000215",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=False,
             order=1,
             level=3,
         ),
-        TableRow(
+        Row(
             cells=[
-                TableCell(
+                Cell(
                     text="Date of Birth",
                     style="activity",
                     refs=[
-                        Ref(type="StudyActivity", uid="StudyActivity_000041"),
-                        Ref(type="Activity", uid="Activity_000037"),
+                        CellRef(type="StudyActivity", uid="StudyActivity_000041"),
+                        CellRef(type="Activity", uid="Activity_000037"),
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000140",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000146",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000186",
                         )
                     ],
                 ),
-                TableCell(
+                Cell(
                     text="X",
                     style="activitySchedule",
                     refs=[
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000184",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000207",
                         ),
-                        Ref(
+                        CellRef(
                             type="StudyActivitySchedule",
                             uid="StudyActivitySchedule_000215",
                         ),
                     ],
                 ),
-                TableCell(),
-                TableCell(),
-                TableCell(),
-                TableCell(),
+                Cell(),
+                Cell(),
+                Cell(),
+                Cell(),
             ],
             hide=True,
             order=2,
@@ -6296,92 +6350,90 @@ PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION = TableWithFootnotes(
     id=None,
 )
 ADD_PROTOCOL_SECTION_COLUMN_CASE1 = (
-    TableWithFootnotes(
+    Table(
         rows=[
-            TableRow(
+            Row(
                 cells=[
-                    TableCell(),
-                    TableCell("A", style="header1"),
-                    TableCell("B"),
-                    TableCell("C", style="header1"),
+                    Cell(),
+                    Cell("A", style="header1"),
+                    Cell("B"),
+                    Cell("C", style="header1"),
                 ]
             ),
-            TableRow(
-                cells=[TableCell("Z"), TableCell("a"), TableCell("b"), TableCell("c")]
-            ),
-            TableRow(
+            Row(cells=[Cell("Z"), Cell("a"), Cell("b"), Cell("c")]),
+            Row(
                 cells=[
-                    TableCell(""),
-                    TableCell("aa", span=2),
-                    TableCell(span=0),
-                    TableCell("cc"),
+                    Cell(""),
+                    Cell("aa", span=2),
+                    Cell(span=0),
+                    Cell("cc"),
                 ]
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("x1"),
-                    TableCell("a x1"),
-                    TableCell("b x 1"),
-                    TableCell(),
+                    Cell("x1"),
+                    Cell("a x1"),
+                    Cell("b x 1"),
+                    Cell(),
                 ]
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("x 2"),
-                    TableCell("2 x a"),
-                    TableCell(),
-                    TableCell("x2 c"),
+                    Cell("x 2"),
+                    Cell("2 x a"),
+                    Cell(),
+                    Cell("x2 c"),
                 ]
             ),
         ],
         num_header_rows=3,
         num_header_cols=2,
     ),
-    TableWithFootnotes(
+    Table(
         rows=[
-            TableRow(
+            Row(
                 cells=[
-                    TableCell(),
-                    TableCell("A", style="header1"),
-                    TableCell("Protocol Section", style="header1"),
-                    TableCell("B"),
-                    TableCell("C", style="header1"),
+                    Cell(),
+                    Cell("A", style="header1"),
+                    Cell("Protocol Section", style="header1"),
+                    Cell("B"),
+                    Cell("C", style="header1"),
                 ]
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("Z"),
-                    TableCell("a"),
-                    TableCell(),
-                    TableCell("b"),
-                    TableCell("c"),
+                    Cell("Z"),
+                    Cell("a"),
+                    Cell(),
+                    Cell("b"),
+                    Cell("c"),
                 ],
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell(""),
-                    TableCell("aa", span=2),
-                    TableCell(),
-                    TableCell(span=0),
-                    TableCell("cc"),
+                    Cell(""),
+                    Cell("aa", span=2),
+                    Cell(),
+                    Cell(span=0),
+                    Cell("cc"),
                 ]
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("x1"),
-                    TableCell("a x1"),
-                    TableCell(),
-                    TableCell("b x 1"),
-                    TableCell(),
+                    Cell("x1"),
+                    Cell("a x1"),
+                    Cell(),
+                    Cell("b x 1"),
+                    Cell(),
                 ]
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("x 2"),
-                    TableCell("2 x a"),
-                    TableCell(),
-                    TableCell(),
-                    TableCell("x2 c"),
+                    Cell("x 2"),
+                    Cell("2 x a"),
+                    Cell(),
+                    Cell(),
+                    Cell("x2 c"),
                 ]
             ),
         ],
@@ -6390,62 +6442,54 @@ ADD_PROTOCOL_SECTION_COLUMN_CASE1 = (
     ),
 )
 ADD_PROTOCOL_SECTION_COLUMN_CASE2 = (
-    TableWithFootnotes(
+    Table(
         rows=[
-            TableRow(cells=[TableCell("A"), TableCell("B"), TableCell("C")]),
-            TableRow(cells=[TableCell("a"), TableCell("b"), TableCell("c")]),
-            TableRow(cells=[TableCell("aa"), TableCell("bb"), TableCell("cc")]),
+            Row(cells=[Cell("A"), Cell("B"), Cell("C")]),
+            Row(cells=[Cell("a"), Cell("b"), Cell("c")]),
+            Row(cells=[Cell("aa"), Cell("bb"), Cell("cc")]),
         ],
         num_header_rows=1,
         num_header_cols=0,
     ),
-    TableWithFootnotes(
+    Table(
         rows=[
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("Protocol Section", style="header1"),
-                    TableCell("A"),
-                    TableCell("B"),
-                    TableCell("C"),
+                    Cell("Protocol Section", style="header1"),
+                    Cell("A"),
+                    Cell("B"),
+                    Cell("C"),
                 ]
             ),
-            TableRow(
-                cells=[TableCell(), TableCell("a"), TableCell("b"), TableCell("c")]
-            ),
-            TableRow(
-                cells=[TableCell(), TableCell("aa"), TableCell("bb"), TableCell("cc")]
-            ),
+            Row(cells=[Cell(), Cell("a"), Cell("b"), Cell("c")]),
+            Row(cells=[Cell(), Cell("aa"), Cell("bb"), Cell("cc")]),
         ],
         num_header_rows=1,
         num_header_cols=0,
     ),
 )
 ADD_PROTOCOL_SECTION_COLUMN_CASE3 = (
-    TableWithFootnotes(
+    Table(
         rows=[
-            TableRow(cells=[TableCell("A"), TableCell("B"), TableCell("C")]),
-            TableRow(cells=[TableCell("a"), TableCell("b"), TableCell("c")]),
-            TableRow(cells=[TableCell("aa"), TableCell("bb"), TableCell("cc")]),
+            Row(cells=[Cell("A"), Cell("B"), Cell("C")]),
+            Row(cells=[Cell("a"), Cell("b"), Cell("c")]),
+            Row(cells=[Cell("aa"), Cell("bb"), Cell("cc")]),
         ],
         num_header_rows=0,
         num_header_cols=1,
     ),
-    TableWithFootnotes(
+    Table(
         rows=[
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("A"),
-                    TableCell("Protocol Section", style="header1"),
-                    TableCell("B"),
-                    TableCell("C"),
+                    Cell("A"),
+                    Cell("Protocol Section", style="header1"),
+                    Cell("B"),
+                    Cell("C"),
                 ]
             ),
-            TableRow(
-                cells=[TableCell("a"), TableCell(), TableCell("b"), TableCell("c")]
-            ),
-            TableRow(
-                cells=[TableCell("aa"), TableCell(), TableCell("bb"), TableCell("cc")]
-            ),
+            Row(cells=[Cell("a"), Cell(), Cell("b"), Cell("c")]),
+            Row(cells=[Cell("aa"), Cell(), Cell("bb"), Cell("cc")]),
         ],
         num_header_rows=0,
         num_header_cols=1,
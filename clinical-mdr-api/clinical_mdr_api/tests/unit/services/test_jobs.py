@@ -0,0 +1,183 @@
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import ValidationError
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.domain_repositories.user_repository import UserRepository
+from clinical_mdr_api.models.job import JobInput
+from clinical_mdr_api.models.user import UserInfo
+from clinical_mdr_api.routers.jobs import _content_disposition
+from clinical_mdr_api.services import jobs as jobs_service
+from clinical_mdr_api.services.jobs import JOB_TYPES, JobService, run_as
+from common.auth.dependencies import dummy_access_token_claims, dummy_auth_object
+from common.auth.user import user
+from common.config import settings
+from common.exceptions import ForbiddenException, NotFoundException, ValidationException
+from common.jobs import JobStatus, MemoryJobQueue
+
+
+def as_user(user_id: str):
+    return request_cycle_context(
+        {"auth": dummy_auth_object(dummy_access_token_claims(user_id=user_id))}
+    )
+
+
+@pytest.fixture
+def service():
+    runner = Mock(
+        queue=MemoryJobQueue(),
+        max_concurrency={
+            name: job_type.max_concurrency for name, job_type in JOB_TYPES.items()
+        },
+    )
+    with patch.object(jobs_service, "start_job_runner", return_value=runner):
+        yield JobService()
+
+
+def test_submit_job(service):
+    with as_user("user-1"):
+        job = service.submit_job(
+            JobInput(type="usdm", parameters={"study_uid": "Study_000001"})
+        )
+
+        assert job.status == JobStatus.QUEUED
+        assert [job.uid for job in service.get_all_jobs()] == [job.uid]
+    service.runner.wake.assert_called_once()
+
+    stored = service.runner.queue.get(job.uid)
+    assert stored.parameters == {"study_uid": "Study_000001"}
+    assert stored.owner["id"] == "user-1"
+
+
+def test_submit_invalid_job(service):
+    with as_user("user-1"):
+        with pytest.raises(ValidationException):
+            service.submit_job(JobInput(type="unknown"))
+        with pytest.raises(ValidationError):
+            service.submit_job(JobInput(type="usdm", parameters={}))
+
+        assert not service.get_all_jobs()
+
+
+def test_jobs_of_other_users_are_not_found(service):
+    with as_user("user-1"):
+        job = service.submit_job(
+            JobInput(type="usdm", parameters={"study_uid": "Study_000001"})
+        )
+
+    with as_user("user-2"):
+        assert not service.get_all_jobs()
+        with pytest.raises(NotFoundException):
+            service.get_job(job.uid)
+        with pytest.raises(NotFoundException):
+            service.cancel_job(job.uid)
+
+    with as_user("user-1"):
+        assert service.cancel_job(job.uid).status == JobStatus.CANCELLED
+        with pytest.raises(ValidationException):
+            service.get_job_result(job.uid)
+
+
+def test_get_job_result_from_queue(service):
+    with as_user("user-1"):
+        job = service.submit_job(
+            JobInput(type="usdm", parameters={"study_uid": "Study_000001"})
+        )
+        service.runner.queue.modify(
+            job.uid, lambda job: setattr(job, "status", JobStatus.SUCCEEDED)
+        )
+        with pytest.raises(NotFoundException):
+            service.get_job_result(job.uid)
+
+        service.runner.queue.set_result(job.uid, b"{}")
+        assert service.get_job_result(job.uid)[1] == b"{}"
+
+
+def test_running_lock_job_cannot_be_cancelled(service):
+    with as_user("user-1"):
+        job = service.submit_job(
+            JobInput(
+                type="study-lock",
+                parameters={"study_uid": "Study_000001", "change_description": "v1"},
+            )
+        )
+        service.runner.queue.claim(["study-lock"], "worker-1")
+
+        with pytest.raises(ValidationException):
+            service.cancel_job(job.uid)
+        assert not service.get_job(job.uid).cancel_requested
+
+
+def stored_user(user_id: str, roles: list[str]) -> UserInfo:
+    return UserInfo(
+        user_id=user_id,
+        username=user_id,
+        name=user_id,
+        email=None,
+        azp=None,
+        oid=user_id,
+        roles=roles,
+        created=datetime.now(),
+        updated=None,
+    )
+
+
+def test_job_runs_as_submitting_user(service):
+    with as_user("user-1"):
+        job = service.submit_job(
+            JobInput(type="usdm", parameters={"study_uid": "Study_000001"})
+        )
+    assert "roles" not in service.runner.queue.get(job.uid).owner
+
+    with patch.object(
+        UserRepository,
+        "get_user",
+        return_value=stored_user("user-1", ["Study.Read"]),
+    ):
+        with run_as(service.runner.queue.get(job.uid)):
+            assert user().id() == "user-1"
+            assert user().has_role("Study.Read")
+
+
+def test_job_runs_with_current_roles_of_user(service, monkeypatch):
+    monkeypatch.setattr(settings, "oauth_rbac_enabled", True)
+    with as_user("user-1"):
+        job = service.submit_job(
+            JobInput(type="usdm", parameters={"study_uid": "Study_000001"})
+        )
+
+    # the role was revoked after the job was submitted
+    with patch.object(
+        UserRepository, "get_user", return_value=stored_user("user-1", [])
+    ):
+        with pytest.raises(ForbiddenException):
+            with run_as(service.runner.queue.get(job.uid)):
+                pass
+
+
+def test_job_of_removed_user_fails(service):
+    with as_user("user-1"):
+        job = service.submit_job(
+            JobInput(type="usdm", parameters={"study_uid": "Study_000001"})
+        )
+
+    with patch.object(UserRepository, "get_user", return_value=None):
+        with pytest.raises(NotFoundException, match="User 'user-1' who submitted"):
+            with run_as(service.runner.queue.get(job.uid)):
+                pass
+
+
+def test_result_filename_is_escaped():
+    assert _content_disposition('Study "1"\r\nX-Header: 1 ä.xlsx') == (
+        'attachment; filename="Study _1___X-Header: 1 _.xlsx"; '
+        "filename*=UTF-8''Study%20%221%22%0D%0AX-Header%3A%201%20%C3%A4.xlsx"
+    )
+
+
+def test_job_types_have_parameters_schema(service):
+    job_types = {job_type.name: job_type for job_type in service.get_job_types()}
+
+    assert set(job_types) == set(JOB_TYPES)
+    assert "study_uid" in job_types["study-lock"].parameters_schema["properties"]
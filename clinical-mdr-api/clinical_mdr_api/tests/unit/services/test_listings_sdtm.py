@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from clinical_mdr_api.services.listings.listings_sdtm import SDTMListingsService
+
+COLUMNS = [
+    "STUDYID",
+    "DOMAIN",
+    "uid",
+    "ETCD",
+    "ELEMENT",
+    "TESTRL",
+    "TEENRL",
+    "TEDUR",
+]
+ROWS = [
+    ["CDISC DEV-0", "TE", "StudyElement_000001", 1, "Screening", None, None, None],
+    ["CDISC DEV-0", "TE", "StudyElement_000002", 2, "Treatment", None, None, None],
+]
+
+
+def list_te(**kwargs):
+    # Undecorated `list_te`, the database calls are mocked
+    return SDTMListingsService.list_te.__wrapped__(SDTMListingsService(), **kwargs)
+
+
+class TestSDTMListingsService(unittest.TestCase):
+    @patch("clinical_mdr_api.listings.query_service.db")
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_list_te_filters_sorts_and_paginates_in_database(
+        self, builder_db, query_service_db
+    ):
+        builder_db.cypher_query.return_value = (ROWS[1:], COLUMNS)
+        query_service_db.cypher_query.return_value = ([[2]], ["total_count"])
+
+        result = list_te(
+            study_uid="Study_000001",
+            sort_by={"ELEMENT": False},
+            page_number=2,
+            page_size=1,
+            filter_by={"DOMAIN": {"v": ["TE"], "op": "eq"}},
+            total_count=True,
+        )
+
+        query, params = (
+            builder_db.cypher_query.call_args.kwargs["query"],
+            builder_db.cypher_query.call_args.kwargs["params"],
+        )
+        self.assertIn("WHERE DOMAIN=$DOMAIN_0", query)
+        self.assertIn("ORDER BY ELEMENT DESC", query)
+        self.assertTrue(
+            query.endswith("SKIP $page_number * $page_size LIMIT $page_size")
+        )
+        self.assertEqual(params["study_uid"], "Study_000001")
+        self.assertEqual(params["page_number"], 1)
+
+        self.assertEqual(result.total, 2)
+        self.assertEqual([item.ELEMENT for item in result.items], ["Treatment"])
+        self.assertEqual(result.items[0].ETCD, "2")
+
+    @patch("clinical_mdr_api.repositories._utils.db")
+    def test_list_te_falls_back_to_service_level_filtering_for_converted_fields(
+        self, builder_db
+    ):
+        builder_db.cypher_query.return_value = (ROWS, COLUMNS)
+
+        result = list_te(
+            study_uid="Study_000001",
+            page_size=1,
+            filter_by={"ETCD": {"v": ["2"], "op": "eq"}},
+        )
+
+        query = builder_db.cypher_query.call_args.kwargs["query"]
+        self.assertNotIn("WHERE", query.split("ORDER BY se.order")[-1])
+        self.assertNotIn("SKIP", query)
+        self.assertEqual([item.ELEMENT for item in result.items], ["Treatment"])
@@ -0,0 +1,234 @@
+from collections import defaultdict
+from unittest.mock import patch
+
+import pytest
+
+from clinical_mdr_api.domain_repositories.concepts.odms.data_extractor_repository import (
+    DataExtractorRepository,
+)
+from clinical_mdr_api.domains.concepts.utils import TargetType
+from clinical_mdr_api.services.concepts.odms import odm_data_extractor
+from clinical_mdr_api.services.concepts.odms.odm_data_extractor import OdmDataExtractor
+from common.exceptions import NotFoundException
+
+
+def element(uid, **kwargs):
+    return {
+        "uid": uid,
+        "oid": f"{uid}_oid",
+        "name": uid,
+        "version": "1.0",
+        "descriptions": [],
+        "aliases": [],
+        "vendor_elements": [],
+        "vendor_attributes": [],
+        "vendor_element_attributes": [],
+        "forms": [],
+        "item_groups": [],
+        "items": [],
+        "sdtm_domains": [],
+        "unit_definitions": [],
+        "codelist": None,
+        "terms": [],
+    } | kwargs
+
+
+def ref(uid, **kwargs):
+    return {
+        "uid": uid,
+        "oid": f"{uid}_oid",
+        "name": uid,
+        "version": "1.0",
+        "order_number": 1,
+        "mandatory": True,
+        "collection_exception_condition_oid": None,
+        "vendor": None,
+    } | kwargs
+
+
+def item_ref(uid, **kwargs):
+    return ref(
+        uid,
+        **{
+            "key_sequence": None,
+            "method_oid": None,
+            "imputation_method_oid": None,
+            "role": None,
+            "role_codelist_oid": None,
+        }
+        | kwargs,
+    )
+
+
+def by_type(**elements):
+    return defaultdict(list, elements)
+
+
+def concept(uid, **kwargs):
+    return {
+        "uid": uid,
+        "oid": f"{uid}_oid",
+        "name": uid,
+        "version": "1.0",
+        "descriptions": [],
+        "aliases": [],
+        "formal_expressions": [],
+    } | kwargs
+
+
+NAMESPACE = {"uid": "namespace1", "name": "name", "prefix": "prefix", "url": "url"}
+
+ITEM = element(
+    "item1",
+    unit_definitions=[
+        {"uid": "unit1", "name": "unit1", "mandatory": True, "order": 1, "version": "1"}
+    ],
+    codelist={
+        "uid": "codelist1",
+        "name": "codelist1",
+        "submission_value": "CL1",
+        "preferred_term": "codelist1",
+        "version": "2.0",
+    },
+    terms=[
+        {
+            "term_uid": "term1",
+            "name": "term1",
+            "mandatory": True,
+            "order": 1,
+            "display_text": None,
+            "version": "1.0",
+            "nci_preferred_name": "term1",
+            "submission_value": "T1",
+        },
+        {
+            "term_uid": "term2",
+            "name": "term2",
+            "mandatory": False,
+            "order": 2,
+            "display_text": None,
+            "version": "1.0",
+            "nci_preferred_name": "term2",
+            "submission_value": None,
+        },
+    ],
+    vendor_elements=[
+        {
+            "uid": "element1",
+            "name": "element1",
+            "value": None,
+            "vendor_namespace": NAMESPACE,
+        }
+    ],
+)
+ITEM_GROUP = element(
+    "item_group1",
+    repeating=False,
+    items=[
+        item_ref(
+            "item1",
+            collection_exception_condition_oid="condition1",
+            method_oid="method1",
+            vendor='{"attributes": [{"uid": "attribute1", "value": "value"}]}',
+        ),
+        item_ref("item1", version="0.1"),
+    ],
+)
+FORM = element(
+    "form1",
+    repeating=True,
+    item_groups=[ref("item_group1", collection_exception_condition_oid="condition2")],
+)
+
+
+@pytest.fixture(name="repository")
+def fixture_repository():
+    with patch.object(odm_data_extractor, "DataExtractorRepository") as repository:
+        yield repository.return_value
+
+
+def test_elements_are_built_from_two_queries(repository):
+    repository.find_elements.return_value = by_type(
+        OdmForm=[FORM], OdmItemGroup=[ITEM_GROUP], OdmItem=[ITEM]
+    )
+    repository.find_references.return_value = by_type(
+        OdmCondition=[concept("condition1"), concept("condition2")],
+        OdmMethod=[concept("method1", method_type="Computation")],
+        OdmVendorAttribute=[
+            {"uid": "attribute1", "name": "attribute1", "vendor_namespace": NAMESPACE}
+        ],
+        OdmVendorNamespace=[NAMESPACE],
+    )
+
+    extractor = OdmDataExtractor(["form1"], TargetType.FORM, "1.0")
+
+    repository.find_elements.assert_called_once_with("OdmForm", ["form1"], "1.0")
+    repository.find_references.assert_called_once_with(
+        condition_oids=["condition2", "condition1"],
+        method_oids=["method1"],
+        vendor_attribute_uids=["attribute1"],
+    )
+
+    assert extractor.target_name == "form1"
+    assert extractor.odm_forms[0].repeating == "Yes"
+    assert extractor.odm_forms[0].item_groups[0].mandatory == "Yes"
+    assert [item.uid for item in extractor.odm_item_groups[0].items] == ["item1"]
+    assert extractor.odm_item_groups[0].items[0].vendor.attributes[0].value == "value"
+    assert extractor.odm_items[0].codelist.submission_value == "CL1"
+    assert [unit.uid for unit in extractor.unit_definitions] == ["unit1"]
+    assert [
+        (codelist.codelist_uid, codelist.version) for codelist in extractor.codelists
+    ] == [("codelist1", "2.0")]
+    assert extractor.ct_terms == [
+        {
+            "name": "term1",
+            "term_uid": "term1",
+            "codelist_uid": "codelist1",
+            "submission_value": "T1",
+            "nci_preferred_name": "term1",
+        }
+    ]
+    assert [condition.uid for condition in extractor.odm_conditions] == [
+        "condition1",
+        "condition2",
+    ]
+    assert [method.method_type for method in extractor.odm_methods] == ["Computation"]
+    assert extractor.odm_vendor_elements == {
+        "element1": {"name": "element1", "vendor_namespace": NAMESPACE}
+    }
+    assert extractor.ref_odm_vendor_attributes == {
+        "attribute1": {"name": "attribute1", "vendor_namespace": NAMESPACE}
+    }
+    assert extractor.odm_vendor_namespaces == {
+        "namespace1": {"name": "name", "prefix": "prefix", "url": "url"}
+    }
+    assert extractor.get_items_by_codelist_uid("codelist1") == extractor.odm_items
+
+
+def test_missing_target_raises(repository):
+    repository.find_elements.return_value = by_type()
+
+    with pytest.raises(NotFoundException):
+        OdmDataExtractor(["form1"], TargetType.FORM)
+
+    repository.find_references.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "target_label, version, traversed, not_traversed",
+    [
+        ("OdmStudyEvent", None, ["FORM_REF", "ITEM_GROUP_REF", "ITEM_REF"], []),
+        ("OdmItemGroup", "1.0", ["ITEM_REF"], ["FORM_REF", "ITEM_GROUP_REF"]),
+    ],
+)
+def test_elements_query_walks_down_from_the_target(
+    target_label, version, traversed, not_traversed
+):
+    query = DataExtractorRepository()._elements_query(target_label, version)
+
+    assert f"MATCH (target_root:{target_label}Root)" in query
+    assert ("AND hv.version = $version" in query) == (version is not None)
+    for ref in traversed:
+        assert f"(parent)-[:{ref}]->" in query
+    for ref in not_traversed:
+        assert f"(parent)-[:{ref}]->" not in query
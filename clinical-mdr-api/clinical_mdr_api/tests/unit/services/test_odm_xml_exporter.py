@@ -0,0 +1,209 @@
+import io
+from unittest.mock import patch
+from xml.dom.minidom import Document
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from clinical_mdr_api.domains.concepts.odms.odm_xml_definition import (
+    ODM,
+    Alias,
+    Attribute,
+    BasicDefinitions,
+    Description,
+    Element,
+    FormDef,
+    GlobalVariables,
+    MeasurementUnit,
+    MetaDataVersion,
+    ProtocolName,
+    Study,
+    StudyDescription,
+    StudyName,
+    Symbol,
+    TranslatedText,
+)
+from clinical_mdr_api.services.concepts.odms.odm_xml_exporter import (
+    OdmXmlExporterService,
+)
+from clinical_mdr_api.services.concepts.odms.odm_xml_stylesheets import (
+    OdmXmlStylesheetService,
+)
+from clinical_mdr_api.services.utils.odm_xml_mapper import map_xml
+
+MAPPER = (
+    "type,parent,from_name,to_name,to_alias,from_alias,alias_context\n"
+    "element,FormDef,Alias,,,true,context1\n"
+    "attribute,,osb:instruction,CompletionInstructions,,,\n"
+    "attribute,*,CompletionInstructions,,true,,\n"
+    "attribute,FormDef,osb:version,ov,,,\n"
+    "element,FormDef,ItemGroupRef,osb:ItemGroupRef,,,\n"
+    "element,*,MeasurementUnitRef,osb:measurementUnitRef,,,\n"
+    "element,,Study,StudyDef,,,\n"
+    "element,StudyDef,FormDef,Form,,,\n"
+)
+
+
+def translated_text(text: str) -> TranslatedText:
+    return TranslatedText(text, Attribute("xml:lang", "en"))
+
+
+def odm() -> ODM:
+    form_def = FormDef(
+        Attribute("OID", "oid1"),
+        Attribute("Name", "name & <1>"),
+        Attribute("Repeating", "Yes"),
+        Description([translated_text("description1")]),
+        [Alias(Attribute("Name", "name1"), Attribute("Context", "context1"))],
+        [
+            Element(
+                "ItemGroupRef",
+                item_group_oid=Attribute("ItemGroupOID", "oid1"),
+                vendor_attribute=Attribute("prefix:nameThree", "No"),
+            )
+        ],
+        instruction=Attribute("osb:instruction", "instruction1"),
+        version=Attribute("osb:version", "1.0"),
+    )
+    item_group_def = Element(
+        "ItemGroupDef",
+        oid=Attribute("OID", "oid1"),
+        measurement_unit_ref=Element(
+            "MeasurementUnitRef", oid=Attribute("MeasurementUnitOID", "unit1")
+        ),
+    )
+    return ODM(
+        Attribute("xmlns:odm", "http://www.cdisc.org/ns/odm/v1.3"),
+        Attribute("ODMVersion", "1.3.2"),
+        Attribute("FileType", "Snapshot"),
+        Attribute("FileOID", "OID.1"),
+        Attribute("CreationDateTime", "2024-01-01T00:00:00"),
+        Attribute("Granularity", "All"),
+        Study(
+            Attribute("OID", "study1"),
+            GlobalVariables(
+                ProtocolName("name1"), StudyName("name1"), StudyDescription("name1")
+            ),
+            BasicDefinitions(
+                [
+                    MeasurementUnit(
+                        Attribute("OID", "unit1"),
+                        Attribute("Name", "unit1"),
+                        Symbol(translated_text("kg")),
+                    )
+                ]
+            ),
+            MetaDataVersion(
+                Attribute("OID", "MDV.0.1"),
+                Attribute("Name", "MDV.0.1"),
+                Attribute("Description", "Draft version"),
+                [form_def],
+                [item_group_def],
+                [],
+                [],
+                [],
+                [],
+            ),
+        ),
+        osb=Attribute("xmlns:osb", "url2"),
+        prefix=Attribute("xmlns:prefix", "url1"),
+    )
+
+
+def mapper_file() -> UploadFile:
+    return UploadFile(
+        io.BytesIO(MAPPER.encode()), headers=Headers({"content-type": "text/csv"})
+    )
+
+
+def exporter(
+    mapper: UploadFile | None, pdf: bool = False, stylesheet: str = "sdtm-crf"
+) -> OdmXmlExporterService:
+    # skip the data extraction from the database
+    service = OdmXmlExporterService.__new__(OdmXmlExporterService)
+    service.odm = odm()
+    service.pdf = pdf
+    service.stylesheet = stylesheet
+    service.mapper_file = mapper
+    return service
+
+
+def full_document(mapper: UploadFile | None) -> bytes:
+    service = exporter(mapper)
+    xml_document = Document()
+    xml_document.appendChild(
+        xml_document.createProcessingInstruction(
+            "xml-stylesheet", 'type="text/xsl" href="sdtm-crf"'
+        )
+    )
+    service._generate_odm_xml(service.odm, xml_document, xml_document)
+    map_xml(xml_document, mapper)
+    return xml_document.toprettyxml(encoding="utf-8")
+
+
+def test_streamed_document_equals_full_document():
+    chunks = list(exporter(None).stream_odm_document())
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == full_document(None)
+
+
+ANCESTOR_MAPPER = (
+    "type,parent,from_name,to_name,to_alias,from_alias,alias_context\n"
+    "element,,ODM,Root,,,\n"
+    "element,Root,Study,Root,,,\n"
+    "element,Root,ItemGroupRef,osb:ItemGroupRef,,,\n"
+    "element,ODM,FormDef,Form,,,\n"
+    "element,MetaDataVersion,MetaDataVersion,Version,,,\n"
+)
+
+
+def test_streamed_document_maps_on_renamed_ancestors_like_full_document():
+    def mapper() -> UploadFile:
+        return UploadFile(
+            io.BytesIO(ANCESTOR_MAPPER.encode()),
+            headers=Headers({"content-type": "text/csv"}),
+        )
+
+    streamed = b"".join(exporter(mapper()).stream_odm_document())
+
+    assert streamed == full_document(mapper())
+    assert b"<osb:ItemGroupRef " in streamed
+    assert b"<FormDef " in streamed
+    assert b"<MetaDataVersion " in streamed
+
+
+def test_streamed_document_applies_mapper_like_full_document():
+    streamed = b"".join(exporter(mapper_file()).stream_odm_document())
+
+    assert streamed == full_document(mapper_file())
+    assert b"<StudyDef " in streamed
+    assert b'<Form OID="oid1"' in streamed
+    assert b'context1="name1"' in streamed
+    assert b'<Alias Name="instruction1" Context="CompletionInstructions"/>' in streamed
+    assert b'<osb:ItemGroupRef ItemGroupOID="oid1"' in streamed
+    assert b'<osb:measurementUnitRef MeasurementUnitOID="unit1"/>' in streamed
+
+
+@patch("weasyprint.HTML")
+def test_rendered_pdf_is_cached_by_document_content(html):
+    html.return_value.write_pdf.side_effect = [b"pdf 1", b"pdf 2"]
+    OdmXmlExporterService._pdf_cache.clear()
+
+    first = exporter(None, pdf=True, stylesheet="blank")
+    second = exporter(None, pdf=True, stylesheet="blank")
+    # a new export of the same content
+    second.odm.file_oid.value = "OID.2"
+    second.odm.creation_date_time.value = "2024-01-02T00:00:00"
+    with_mapper = exporter(mapper_file(), pdf=True, stylesheet="blank")
+
+    assert first.get_odm_document() == b"pdf 1"
+    assert second.get_odm_document() == b"pdf 1"
+    assert with_mapper.get_odm_document() == b"pdf 2"
+    assert html.call_count == 2
+
+
+def test_compiled_stylesheet_is_reused():
+    assert OdmXmlStylesheetService.get_compiled_stylesheet(
+        "blank"
+    ) is OdmXmlStylesheetService.get_compiled_stylesheet("blank")
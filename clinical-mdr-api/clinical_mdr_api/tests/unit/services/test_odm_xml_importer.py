@@ -0,0 +1,184 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from xml.dom import minidom
+
+import pytest
+
+from clinical_mdr_api.domains.concepts.utils import (
+    RelationType,
+    VendorAttributeCompatibleType,
+    VendorElementCompatibleType,
+)
+from clinical_mdr_api.repositories._utils import sb_clear_cache
+from clinical_mdr_api.services.concepts.odms.odm_xml_importer import (
+    OdmXmlImporterService,
+)
+from common.cache import LocalCacheBackend, SbTTLCache
+
+FORM_DEF = """
+<ODM xmlns:prefix="url1">
+    <FormDef OID="F.1" prefix:nameOne="value1" prefix:nameTwo="value2">
+        <prefix:ElementOne prefix:attributeOne="value3">text1</prefix:ElementOne>
+        <prefix:ElementOne>text2</prefix:ElementOne>
+    </FormDef>
+</ODM>
+"""
+
+
+def namespace(uid: str, prefix: str):
+    return SimpleNamespace(uid=uid, prefix=prefix)
+
+
+def importer() -> OdmXmlImporterService:
+    # skip the parsing of an uploaded file
+    service = OdmXmlImporterService.__new__(OdmXmlImporterService)
+    service.odm_vendor_attribute_service = MagicMock()
+    service.odm_vendor_element_service = MagicMock()
+    service.db_vendor_namespaces = []
+    service.db_vendor_elements = []
+    service.db_vendor_attributes = []
+    service.vendor_namespace_uids_by = {}
+    service.vendor_element_uids_by = {}
+    service.vendor_attribute_uids_by = {}
+    service.vendor_element_attribute_uids_by = {}
+    service.vendor_attribute_patterns = {}
+
+    service._add_vendor_namespaces([namespace("namespace1", "prefix")])
+    service._add_vendor_elements(
+        [
+            SimpleNamespace(
+                uid="element1",
+                name="ElementOne",
+                vendor_namespace=namespace("namespace1", "prefix"),
+            )
+        ]
+    )
+    service._add_vendor_attributes(
+        [
+            SimpleNamespace(
+                uid=f"attribute{idx}",
+                name=name,
+                value_regex=regex,
+                vendor_namespace=namespace("namespace1", "prefix"),
+                vendor_element=None,
+            )
+            for idx, name, regex in [(1, "nameOne", "^value"), (2, "nameTwo", None)]
+        ]
+        + [
+            SimpleNamespace(
+                uid="attribute3",
+                name="attributeOne",
+                value_regex=None,
+                vendor_namespace=None,
+                vendor_element=SimpleNamespace(uid="element1"),
+            )
+        ]
+    )
+    return service
+
+
+def test_vendors_are_looked_up_by_prefix_and_name():
+    service = importer()
+
+    assert service._vendor_attribute_exists("prefix", "nameOne")
+    assert not service._vendor_attribute_exists("prefix", "attributeOne")
+    assert service._vendor_element_attribute_exists("prefix", "attributeOne")
+    assert service.vendor_element_exists("prefix", "ElementOne")
+    assert not service.vendor_element_exists("other", "ElementOne")
+    assert service.vendor_attribute_patterns == {
+        "attribute1": "^value",
+        "attribute2": None,
+        "attribute3": None,
+    }
+
+
+def test_vendor_relationships_are_written_in_one_query_per_type():
+    service = importer()
+    repository = MagicMock()
+    form_def = minidom.parseString(FORM_DEF).getElementsByTagName("FormDef")[0]
+
+    service._create_relationships_with_vendors(
+        "OdmForm_000001",
+        form_def,
+        repository,
+        VendorAttributeCompatibleType.FORM_DEF,
+        VendorElementCompatibleType.FORM_DEF,
+    )
+
+    assert repository.add_vendor_relations.call_args_list == [
+        (
+            (
+                "OdmForm_000001",
+                RelationType.VENDOR_ATTRIBUTE,
+                {"attribute1": "value1", "attribute2": "value2"},
+            ),
+        ),
+        (
+            (
+                "OdmForm_000001",
+                RelationType.VENDOR_ELEMENT,
+                {"element1": "text2"},
+            ),
+        ),
+        (
+            (
+                "OdmForm_000001",
+                RelationType.VENDOR_ELEMENT_ATTRIBUTE,
+                {"attribute3": "value3"},
+            ),
+        ),
+        (("OdmForm_000001", RelationType.VENDOR_ELEMENT_ATTRIBUTE, {}),),
+    ]
+    repository.add_relation.assert_not_called()
+    attribute_service = service.odm_vendor_attribute_service
+    attribute_service.attribute_values_matches_their_regex.assert_called_once()
+    attribute_service.get_regex_patterns_of_attributes.assert_not_called()
+    service.odm_vendor_element_service.are_elements_vendor_compatible.assert_called_once()
+
+
+@pytest.mark.parametrize("validate_only", [True, False])
+@patch("clinical_mdr_api.services.concepts.odms.odm_xml_importer.db")
+def test_validate_only_rolls_the_import_back(db, validate_only):
+    service = OdmXmlImporterService.__new__(OdmXmlImporterService)
+
+    with patch.object(service, "_store_odm_xml", return_value={"forms": []}):
+        assert service.store_odm_xml(validate_only=validate_only) == {"forms": []}
+
+    db.begin.assert_called_once()
+    assert db.rollback.called is validate_only
+    assert db.commit.called is not validate_only
+
+
+class FormRepository:
+    def __init__(self):
+        self.cache_store_item_by_uid = SbTTLCache(
+            "FormRepository.cache_store_item_by_uid",
+            maxsize=10,
+            ttl=60,
+            backend=LocalCacheBackend(),
+        )
+
+    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def save(self, uid: str) -> None:
+        pass
+
+
+@pytest.mark.parametrize("validate_only", [True, False])
+@patch("clinical_mdr_api.services.concepts.odms.odm_xml_importer.db")
+def test_rolled_back_import_invalidates_cached_elements(db, validate_only):
+    service = OdmXmlImporterService.__new__(OdmXmlImporterService)
+    repository = FormRepository()
+    cache = repository.cache_store_item_by_uid
+    cache["OdmForm_000002"] = SimpleNamespace(uid="OdmForm_000002")
+
+    def store_odm_xml():
+        repository.save(uid="OdmForm_000001")
+        # read back within the transaction
+        cache["OdmForm_000001"] = SimpleNamespace(uid="OdmForm_000001")
+        return {"forms": ["OdmForm_000001"]}
+
+    with patch.object(service, "_store_odm_xml", side_effect=store_odm_xml):
+        service.store_odm_xml(validate_only=validate_only)
+
+    assert ("OdmForm_000001" in cache) is not validate_only
+    assert "OdmForm_000002" in cache
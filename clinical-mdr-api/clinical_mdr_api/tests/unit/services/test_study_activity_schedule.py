@@ -0,0 +1,163 @@
+import datetime
+import unittest
+from unittest.mock import MagicMock, patch
+
+from neomodel import db
+
+from clinical_mdr_api.domains.study_selections.study_activity_schedule import (
+    StudyActivityScheduleVO,
+)
+from clinical_mdr_api.models.study_selections.study_selection import (
+    StudyActivityScheduleBatchInput,
+    StudyActivityScheduleCreateInput,
+    StudyActivityScheduleDeleteInput,
+)
+from clinical_mdr_api.services.studies.study_activity_schedule import (
+    StudyActivityScheduleService,
+)
+
+MODULE = StudyActivityScheduleService.__module__
+
+
+def create_operation(study_activity_uid: str, study_visit_uid: str):
+    return StudyActivityScheduleBatchInput(
+        method="POST",
+        content=StudyActivityScheduleCreateInput(
+            study_activity_uid=study_activity_uid, study_visit_uid=study_visit_uid
+        ),
+    )
+
+
+def delete_operation(uid: str):
+    return StudyActivityScheduleBatchInput(
+        method="DELETE", content=StudyActivityScheduleDeleteInput(uid=uid)
+    )
+
+
+def schedule(uid: str, is_baseline: bool = False):
+    return {
+        "uid": uid,
+        "study_activity_uid": "StudyActivity_1",
+        "activity_exists": True,
+        "study_visit_uid": "StudyVisit_1",
+        "visit_exists": True,
+        "is_baseline": is_baseline,
+    }
+
+
+def bulk_create(study_uid, pairs, author_id):
+    return [
+        StudyActivityScheduleVO(
+            uid=f"StudyActivitySchedule_{index}",
+            study_uid=study_uid,
+            study_activity_uid=activity_uid,
+            study_activity_instance_uid=None,
+            study_visit_uid=visit_uid,
+            start_date=datetime.datetime.now(datetime.timezone.utc),
+            author_id=author_id,
+        )
+        for index, (activity_uid, visit_uid) in enumerate(pairs, start=100)
+    ]
+
+
+# run in the transaction of the caller, there is none to start in unit tests
+@patch.object(db, "_active_transaction", MagicMock())
+@patch(MODULE + ".acquire_write_lock_study_value")
+@patch(MODULE + ".StudyRoot")
+class TestStudyActivityScheduleBatchOperations(unittest.TestCase):
+    def setUp(self):
+        with patch(MODULE + ".user"):
+            self.service = StudyActivityScheduleService()
+        self.service._repos = MagicMock()
+        self.repository = self.service._repos.study_activity_schedule_repository
+        self.repository.get_schedules_for_bulk_delete.return_value = {
+            "StudyActivitySchedule_1": schedule("StudyActivitySchedule_1"),
+            "StudyActivitySchedule_2": schedule(
+                "StudyActivitySchedule_2", is_baseline=True
+            ),
+        }
+        self.repository.get_schedule_pairs_for_bulk_create.return_value = {
+            ("StudyActivity_1", "StudyVisit_1"): (
+                True,
+                True,
+                ["StudyActivitySchedule_1"],
+            ),
+            ("StudyActivity_1", "StudyVisit_2"): (True, True, []),
+            ("StudyActivity_1", "StudyVisit_3"): (True, False, []),
+        }
+        self.repository.bulk_create.side_effect = bulk_create
+
+    def test_operations_are_validated_in_order_and_written_in_bulk(self, *_mocks):
+        self.service.delete = MagicMock()
+
+        results = self.service.handle_batch_operations(
+            "Study_1",
+            [
+                # conflicts with the existing schedule, deleted by a later operation
+                create_operation("StudyActivity_1", "StudyVisit_1"),
+                delete_operation("StudyActivitySchedule_1"),
+                create_operation("StudyActivity_1", "StudyVisit_1"),
+                create_operation("StudyActivity_1", "StudyVisit_2"),
+                create_operation("StudyActivity_1", "StudyVisit_2"),
+                create_operation("StudyActivity_1", "StudyVisit_3"),
+                delete_operation("StudyActivitySchedule_1"),
+                delete_operation("StudyActivitySchedule_2"),
+                delete_operation("StudyActivitySchedule_3"),
+                StudyActivityScheduleBatchInput(
+                    method="PATCH",
+                    content=StudyActivityScheduleDeleteInput(uid="uid"),
+                ),
+            ],
+        )
+
+        self.assertEqual(
+            [result.response_code for result in results],
+            [400, 204, 201, 201, 400, 404, 404, 204, 404, 405],
+        )
+        self.assertEqual(
+            results[0].content.message,
+            "There already exist a schedule for the same Activity and Visit in the Study with UID 'Study_1'",
+        )
+        self.assertEqual(
+            results[5].content.message,
+            "Study Visit with UID 'StudyVisit_3' doesn't exist.",
+        )
+        self.assertEqual(
+            results[8].content.message,
+            "Study Activity Schedule with UID 'StudyActivitySchedule_3' doesn't exist.",
+        )
+        self.assertEqual(
+            [result.content.study_visit_uid for result in results[2:4]],
+            ["StudyVisit_1", "StudyVisit_2"],
+        )
+
+        self.repository.bulk_delete.assert_called_once_with(
+            "Study_1", ["StudyActivitySchedule_1"], self.service.author
+        )
+        self.repository.bulk_create.assert_called_once_with(
+            "Study_1",
+            [("StudyActivity_1", "StudyVisit_1"), ("StudyActivity_1", "StudyVisit_2")],
+            self.service.author,
+        )
+        # schedules of baseline visits of study activity instances are deleted one by one
+        self.service.delete.assert_called_once_with(
+            "Study_1", "StudyActivitySchedule_2"
+        )
+
+    def test_missing_study(self, study_root, *_mocks):
+        study_root.nodes.get_or_none.return_value = None
+
+        results = self.service.handle_batch_operations(
+            "Study_1",
+            [
+                create_operation("StudyActivity_1", "StudyVisit_1"),
+                delete_operation("StudyActivitySchedule_1"),
+            ],
+        )
+
+        self.assertEqual([result.response_code for result in results], [404, 404])
+        self.assertEqual(
+            results[0].content.message, "Study with UID 'Study_1' doesn't exist."
+        )
+        self.repository.bulk_create.assert_not_called()
+        self.repository.bulk_delete.assert_not_called()
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from clinical_mdr_api.services.studies.study_arm_selection import (
+    StudyArmSelectionService,
+)
+
+
+def arm_service():
+    # The repositories are mocked, so the service doesn't need a request context
+    service = StudyArmSelectionService.__new__(StudyArmSelectionService)
+    service._repos = MagicMock()
+    return service
+
+
+class TestStudyArmSelectionService(unittest.TestCase):
+    @patch.object(StudyArmSelectionService, "_transform_page_to_response_model")
+    def test_get_all_selections_for_all_studies_pages_in_database(self, transform):
+        service = arm_service()
+        service._repos.study_arm_repository.find_selections_page.return_value = (
+            [],
+            7,
+        )
+        transform.return_value = []
+
+        result = service.get_all_selections_for_all_studies(
+            project_number="123",
+            sort_by={"name": True},
+            page_number=2,
+            page_size=10,
+            filter_by={"study_uid": {"v": ["Study_000001"]}},
+            total_count=True,
+        )
+
+        service._repos.study_arm_repository.find_selections_page.assert_called_once()
+        service._repos.study_arm_repository.find_all.assert_not_called()
+        self.assertEqual(result.total, 7)
+
+    def test_get_all_selections_for_all_studies_falls_back_for_derived_fields(self):
+        service = arm_service()
+        service._repos.study_arm_repository.find_all.return_value = []
+
+        result = service.get_all_selections_for_all_studies(
+            filter_by={"arm_type.term_uid": {"v": ["CTTerm_000001"]}},
+        )
+
+        service._repos.study_arm_repository.find_selections_page.assert_not_called()
+        service._repos.study_arm_repository.find_all.assert_called_once()
+        self.assertEqual(result.items, [])
@@ -0,0 +1,165 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.services.studies import study_artifacts
+from clinical_mdr_api.services.studies.study import StudyService
+from clinical_mdr_api.services.studies.study_artifacts import (
+    PRERENDERED_ARTIFACTS,
+    StudyArtifactService,
+    artifact_key,
+    shutdown_prerender_executor,
+)
+from common.artifact_store import ArtifactStore
+from common.auth.dependencies import dummy_access_token_claims, dummy_auth_object
+
+
+@pytest.fixture(autouse=True)
+def library_change_marker():
+    with patch.object(
+        study_artifacts,
+        "get_library_change_marker",
+        return_value=("2024-01-01T00:00:00Z", 10),
+    ) as marker:
+        yield marker
+
+
+@pytest.fixture
+def renderers():
+    renderers = {
+        name: Mock(
+            side_effect=lambda study_uid, version, _name=name, **params: (
+                f"{_name} {study_uid} {version} {sorted(params.items())}".encode()
+            )
+        )
+        for name in study_artifacts.RENDERERS
+    }
+    with patch.dict(study_artifacts.RENDERERS, renderers):
+        yield renderers
+
+
+@pytest.fixture
+def locked_versions():
+    locked = {("Study_000001", "1")}
+    with patch.object(
+        study_artifacts.StudyDefinitionRepositoryImpl,
+        "check_if_study_version_is_locked",
+        side_effect=lambda study_uid, study_value_version: (
+            (study_uid, study_value_version) in locked
+        ),
+    ):
+        yield locked
+
+
+@pytest.fixture
+def service(tmp_path):
+    return StudyArtifactService(store=ArtifactStore(str(tmp_path)))
+
+
+def test_artifact_key_includes_rendering_parameters():
+    key = artifact_key(
+        "Study_000001", "1", "flowchart.docx", {"time_unit": None, "layout": "detailed"}
+    )
+
+    assert key[1:] == (
+        "Study_000001",
+        "1",
+        "2024-01-01T00:00:00Z:10",
+        "flowchart.docx;layout=detailed",
+    )
+    assert artifact_key("Study_000001", "1", "design.svg", {})[4] == "design.svg"
+
+
+def test_locked_version_artifact_is_rendered_once(service, renderers, locked_versions):
+    for _ in range(2):
+        content = service.get_locked_version_artifact(
+            "Study_000001", "1", "flowchart.docx", layout="protocol", time_unit="week"
+        )
+        assert (
+            content
+            == b"flowchart.docx Study_000001 1 [('layout', 'protocol'), ('time_unit', 'week')]"
+        )
+
+    assert renderers["flowchart.docx"].call_count == 1
+
+    service.get_locked_version_artifact(
+        "Study_000001", "1", "flowchart.docx", layout="protocol", time_unit="day"
+    )
+    assert renderers["flowchart.docx"].call_count == 2
+
+
+def test_locked_version_artifact_is_rendered_again_after_library_change(
+    service, renderers, locked_versions, library_change_marker
+):
+    service.get_locked_version_artifact("Study_000001", "1", "design.svg")
+    library_change_marker.return_value = ("2024-01-02T00:00:00Z", 11)
+    service.get_locked_version_artifact("Study_000001", "1", "design.svg")
+    service.get_locked_version_artifact("Study_000001", "1", "design.svg")
+
+    assert renderers["design.svg"].call_count == 2
+
+
+@pytest.mark.parametrize("study_value_version", [None, "2", "1.1"])
+def test_other_versions_are_not_served(
+    service, renderers, locked_versions, study_value_version
+):
+    assert (
+        service.get_locked_version_artifact(
+            "Study_000001", study_value_version, "design.svg"
+        )
+        is None
+    )
+    assert renderers["design.svg"].call_count == 0
+
+
+def test_prerender_stores_all_artifacts(service, renderers, locked_versions):
+    renderers["design.svg"].side_effect = ValueError("no design")
+
+    failed = service.prerender("Study_000001", "1")
+
+    assert failed == ["design.svg"]
+    assert sum(renderer.call_count for renderer in renderers.values()) == len(
+        PRERENDERED_ARTIFACTS
+    )
+
+    content = service.get_locked_version_artifact(
+        "Study_000001", "1", "flowchart.xlsx", layout="operational", time_unit=None
+    )
+    assert content.startswith(b"flowchart.xlsx Study_000001 1")
+    assert sum(renderer.call_count for renderer in renderers.values()) == len(
+        PRERENDERED_ARTIFACTS
+    )
+
+
+def test_operational_soa_xlsx_is_not_stored():
+    # its header has the time and the user of the download
+    assert "operational-soa.xlsx" not in study_artifacts.RENDERERS
+    assert all(name in study_artifacts.RENDERERS for name, _ in PRERENDERED_ARTIFACTS)
+
+
+def test_schedule_prerender_runs_in_background(tmp_path, renderers, locked_versions):
+    with patch.object(
+        study_artifacts, "get_artifact_store", return_value=ArtifactStore(str(tmp_path))
+    ):
+        future = StudyArtifactService.schedule_prerender("Study_000001", "1")
+        try:
+            assert future.result(timeout=10) == []
+        finally:
+            shutdown_prerender_executor()
+
+    assert renderers["design.svg"].call_count == 1
+
+
+def test_study_lock_schedules_prerender_of_the_locked_version():
+    study = Mock()
+    study.current_metadata.version_metadata.version_number = 2
+    with patch.object(StudyService, "_lock", return_value=study) as lock, patch.object(
+        StudyArtifactService, "schedule_prerender"
+    ) as schedule_prerender, request_cycle_context(
+        {"auth": dummy_auth_object(dummy_access_token_claims())}
+    ):
+        assert StudyService().lock("Study_000001", "Locking") is study
+
+    lock.assert_called_once_with(uid="Study_000001", change_description="Locking")
+    schedule_prerender.assert_called_once_with("Study_000001", "2")
@@ -1,6 +1,13 @@
 import datetime
+import threading
 from collections import OrderedDict
+from unittest.mock import Mock, patch
 
+import pytest
+
+from clinical_mdr_api.domain_repositories.study_definitions.study_definition_repository_impl import (
+    StudyDefinitionRepositoryImpl,
+)
 from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     SimpleCodelistTermModel,
 )
@@ -14,6 +21,8 @@ from clinical_mdr_api.models.study_selections.study_selection import (
 from clinical_mdr_api.models.study_selections.study_visit import StudyVisit
 from clinical_mdr_api.services.studies.study_design_figure import (
     StudyDesignFigureService,
+    _load_font,
+    _measure_text,
 )
 from clinical_mdr_api.tests.unit.domain.utils import AUTHOR_USERNAME
 
@@ -2400,6 +2409,15 @@ class MockStudyDesignFigureService(StudyDesignFigureService):
         return "week"
 
 
+# pylint: disable=redefined-outer-name
+@pytest.fixture(autouse=True)
+def study_change_token():
+    with patch.object(
+        StudyDefinitionRepositoryImpl, "get_study_change_token", return_value=None
+    ) as get_study_change_token:
+        yield get_study_change_token
+
+
 def test_mk_data_matrix():
     table = MockStudyDesignFigureService()._mk_data_matrix(
         STUDY_ARMS,
@@ -2468,3 +2486,48 @@ def test_get_svg_document():
     assert "markerWidth" in doc, '"markerWidth" found, missing arrowhead markers?'
 
     assert doc == SVG_DOCUMENT
+
+
+def test_get_svg_document_is_cached_until_study_changes(study_change_token):
+    service = MockStudyDesignFigureService()
+    study_change_token.return_value = "4:abc:1:2024-01-01T00:00:00Z:1:0"
+    service._build_svg_document = Mock(wraps=service._build_svg_document)
+    StudyDesignFigureService._svg_cache.clear()
+
+    svg = service.get_svg_document(STUDY_UID)
+    assert service.get_svg_document(STUDY_UID) == svg
+    assert service._build_svg_document.call_count == 1
+
+    # another version is a separate drawing
+    service.get_svg_document(STUDY_UID, study_value_version="1")
+    assert service._build_svg_document.call_count == 2
+
+    # a change of the study invalidates the cached drawings
+    study_change_token.return_value = "4:abc:1:2024-01-01T00:00:01Z:2:0"
+    assert service.get_svg_document(STUDY_UID) == svg
+    assert service._build_svg_document.call_count == 3
+
+
+def test_text_measurements_are_shared_between_instances():
+    _measure_text.cache_clear()
+
+    first = MockStudyDesignFigureService()._get_text_size_px("Screening")
+    second = MockStudyDesignFigureService()._get_text_size_px("Screening")
+
+    assert first == second
+    info = _measure_text.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_fonts_are_not_shared_between_threads():
+    service = MockStudyDesignFigureService()
+    fonts = []
+    thread = threading.Thread(
+        target=lambda: fonts.append(_load_font(service.font_path, service.font_size))
+    )
+    thread.start()
+    thread.join()
+
+    font = _load_font(service.font_path, service.font_size)
+    assert _load_font(service.font_path, service.font_size) is font
+    assert fonts[0] is not font
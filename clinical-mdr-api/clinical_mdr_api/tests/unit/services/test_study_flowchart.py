@@ -3,11 +3,15 @@
 from collections import defaultdict
 from copy import deepcopy
 from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 from docx.table import Table
 from pydantic import BaseModel
 
+from clinical_mdr_api.domain_repositories.study_definitions.study_definition_repository_impl import (
+    StudyDefinitionRepositoryImpl,
+)
 from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
     SoALayout,
 )
@@ -19,7 +23,7 @@ from clinical_mdr_api.models.study_selections.study_soa_footnote import StudySoA
 from clinical_mdr_api.models.study_selections.study_visit import StudyVisit
 from clinical_mdr_api.services.studies.study_flowchart import _T as _gettext
 from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
-from clinical_mdr_api.services.utils.table_f import TableRow, TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Row, Table
 from clinical_mdr_api.tests.unit.services.soa_test_data import (
     ADD_PROTOCOL_SECTION_COLUMN_CASE1,
     ADD_PROTOCOL_SECTION_COLUMN_CASE2,
@@ -72,7 +76,7 @@ class MockStudyFlowchartService(StudyFlowchartService):
 
 
 def check_flowchart_table_dimensions(
-    table: TableWithFootnotes,
+    table: Table,
     layout: SoALayout,
     soa_preferences: StudySoaPreferencesInput,
 ):
@@ -98,7 +102,7 @@ def check_flowchart_table_dimensions(
 
 
 def check_flowchart_table_first_rows(
-    table: TableWithFootnotes,
+    table: Table,
     layout: SoALayout,
     study_epochs: list[StudyEpoch | MockStudyEpoch],
     study_visits: list[StudyVisit],
@@ -289,7 +293,7 @@ def check_flowchart_table_footnotes(
 
 
 def check_flowchart_table_visit_rows(
-    table: TableWithFootnotes,
+    table: Table,
     layout: SoALayout,
     time_unit: str,
     study_visits: list[StudyVisit],
@@ -442,7 +446,7 @@ def check_flowchart_table_visit_rows(
     return visit_idx_by_uid
 
 
-def check_hidden_row_propagation(table: TableWithFootnotes):
+def check_hidden_row_propagation(table: Table):
     """Validates propagation of crosses from hidden rows to the first visible parent row"""
 
     path = []
@@ -539,6 +543,14 @@ def mock_study_flowchart_service():
     return MockStudyFlowchartService()
 
 
+@pytest.fixture(autouse=True)
+def study_change_token():
+    with patch.object(
+        StudyDefinitionRepositoryImpl, "get_study_change_token", return_value=None
+    ) as get_study_change_token:
+        yield get_study_change_token
+
+
 def test_get_flowchart_item_uid_coordinates(mock_study_flowchart_service):
     coordinates = mock_study_flowchart_service.get_flowchart_item_uid_coordinates(
         study_uid=""
@@ -690,7 +702,52 @@ def test_build_flowchart_table(mock_study_flowchart_service):
     assert table.title == DETAILED_SOA_TABLE.title
     assert table.footnotes == DETAILED_SOA_TABLE.footnotes
 
-    assert table.dict() == DETAILED_SOA_TABLE.model_dump()
+    assert table == DETAILED_SOA_TABLE
+
+
+def test_build_flowchart_table_is_cached_until_study_changes(
+    mock_study_flowchart_service, study_change_token
+):
+    service = mock_study_flowchart_service
+    study_change_token.return_value = "4:abc:1:2024-01-01T00:00:00Z:1:0"
+    service._build_flowchart_table = Mock(wraps=service._build_flowchart_table)
+    StudyFlowchartService._flowchart_table_cache.clear()
+
+    tables = [
+        service.build_flowchart_table(
+            study_uid="Study_000001",
+            study_value_version=None,
+            layout=SoALayout.DETAILED,
+            time_unit="day",
+        )
+        for _ in range(2)
+    ]
+
+    assert service._build_flowchart_table.call_count == 1
+    assert tables[0] == tables[1]
+    # returned tables are copies, altering one doesn't affect the cache
+    tables[0].rows.clear()
+    assert tables[1].rows
+
+    # another layout or time unit is a separate table
+    service.build_flowchart_table(
+        study_uid="Study_000001",
+        study_value_version=None,
+        layout=SoALayout.DETAILED,
+        time_unit="week",
+    )
+    assert service._build_flowchart_table.call_count == 2
+
+    # a change of the study invalidates the cached tables
+    study_change_token.return_value = "4:abc:1:2024-01-01T00:00:01Z:2:0"
+    table = service.build_flowchart_table(
+        study_uid="Study_000001",
+        study_value_version=None,
+        layout=SoALayout.DETAILED,
+        time_unit="day",
+    )
+    assert service._build_flowchart_table.call_count == 3
+    assert table == DETAILED_SOA_TABLE
 
 
 @pytest.mark.parametrize(
@@ -700,18 +757,16 @@ def test_build_flowchart_table(mock_study_flowchart_service):
         (True, DETAILED_SOA_TABLE, PROTOCOL_SOA_TABLE_WITH_REF_PROPAGATION),
     ],
 )
-def test_propagate_hidden_rows(
-    propagate_refs: bool, soa: TableWithFootnotes, expected_soa: TableWithFootnotes
-):
+def test_propagate_hidden_rows(propagate_refs: bool, soa: Table, expected_soa: Table):
     table = deepcopy(soa)
     StudyFlowchartService.propagate_hidden_rows(
         table.rows, propagate_refs=propagate_refs
     )
-    assert table.model_dump() == expected_soa.model_dump()
+    assert table == expected_soa
 
 
 def test_propagate_hidden_rows_2():
-    table: TableWithFootnotes = deepcopy(DETAILED_SOA_TABLE)
+    table: Table = deepcopy(DETAILED_SOA_TABLE)
     StudyFlowchartService.propagate_hidden_rows(table.rows)
     check_hidden_row_propagation(table)
 
@@ -726,7 +781,7 @@ def test_show_hidden_rows():
     assert table.footnotes == DETAILED_SOA_TABLE.footnotes
     assert len(table.rows) == len(DETAILED_SOA_TABLE.rows)
 
-    row: TableRow
+    row: Row
     for row, expected_row in zip(table.rows, DETAILED_SOA_TABLE.rows):
         assert row.cells == expected_row.cells
         assert row.hide is False
@@ -805,9 +860,7 @@ def test_get_header_rows_with_soa_preferences(
         layout=layout,
     )
 
-    table = TableWithFootnotes(
-        rows=header_rows, num_header_rows=len(header_rows), num_header_cols=1
-    )
+    table = Table(rows=header_rows, num_header_rows=len(header_rows), num_header_cols=1)
 
     # Test dimensions
     check_flowchart_table_dimensions(table, layout, soa_preferences)
@@ -830,4 +883,4 @@ def test_get_header_rows_with_soa_preferences(
 def test_add_protocol_section_column(test_table, expected_table):
     table = deepcopy(test_table)
     StudyFlowchartService.add_protocol_section_column(table)
-    assert table.dict() == expected_table.dict()
+    assert table == expected_table
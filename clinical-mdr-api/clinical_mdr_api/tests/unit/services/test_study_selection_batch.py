@@ -0,0 +1,544 @@
+import datetime
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from fastapi import status
+from neomodel import db
+
+from clinical_mdr_api.domains.study_selections.study_design_cell import (
+    StudyDesignCellsAR,
+    StudyDesignCellVO,
+)
+from clinical_mdr_api.domains.study_selections.study_selection_branch_arm import (
+    StudySelectionBranchArmAR,
+    StudySelectionBranchArmVO,
+)
+from clinical_mdr_api.models.error import BatchErrorResponse
+from clinical_mdr_api.models.study_selections.study_selection import (
+    StudyActivityScheduleBatchOutput,
+    StudyActivityScheduleDeleteInput,
+    StudyDesignCellBatchInput,
+    StudyDesignCellCreateInput,
+    StudyDesignCellDeleteInput,
+    StudyDesignCellEditInput,
+    StudySelectionActivityBatchDeleteInput,
+    StudySelectionBranchArmBatchInput,
+    StudySoAEditBatchInput,
+)
+from clinical_mdr_api.models.utils import BaseModel, BatchInputModel
+from clinical_mdr_api.services.studies.study_activity_selection import (
+    StudyActivitySelectionService,
+)
+from clinical_mdr_api.services.studies.study_branch_arm_selection import (
+    StudyBranchArmSelectionService,
+)
+from clinical_mdr_api.services.studies.study_design_cell import StudyDesignCellService
+from clinical_mdr_api.services.studies.study_selection_base import (
+    StudySelectionBatchOperation,
+    StudySelectionMixin,
+)
+from common import exceptions
+
+
+class CreateInput(BaseModel):
+    name: str
+
+
+class UpdateInput(BaseModel):
+    uid: str
+    name: str
+
+
+class DeleteInput(BaseModel):
+    uid: str
+
+
+class BatchInput(BatchInputModel):
+    method: str
+    content: UpdateInput | CreateInput | DeleteInput
+
+
+class BatchOutput(BaseModel):
+    response_code: int
+    content: dict | BatchErrorResponse | None
+
+
+class Aggregate:
+    def __init__(self):
+        self.selections = {"Selection_1": "first"}
+
+    def get_specific_object_selection(self, uid):
+        return self.selections[uid], list(self.selections).index(uid) + 1
+
+
+class Service(StudySelectionMixin):
+    author = "author"
+
+    def __init__(self):
+        self.repository = MagicMock()
+        self.repository.find_by_study.return_value = Aggregate()
+        self.validated = []
+
+    def _create(self, aggregate, content):
+        uid = f"Selection_{len(aggregate.selections) + 1}"
+        aggregate.selections[uid] = content.name
+        return uid
+
+    def _update(self, aggregate, content):
+        aggregate.selections[content.uid] = content.name
+        return content.uid
+
+    def extra_operation_kinds(self):
+        return {}
+
+    def handle_batch_operations(self, operations, report_item_errors=False):
+        def transform(aggregate, uid, _):
+            name, order = aggregate.get_specific_object_selection(uid)
+            return {"uid": uid, "name": name, "order": order}
+
+        return self._handle_selection_batch_operations(
+            study_uid="Study_000001",
+            operations=operations,
+            operation_kinds={
+                "POST": StudySelectionBatchOperation(
+                    CreateInput, status.HTTP_201_CREATED, self._create, transform
+                ),
+                "PATCH": StudySelectionBatchOperation(
+                    UpdateInput, status.HTTP_200_OK, self._update, transform
+                ),
+                **self.extra_operation_kinds(),
+            },
+            find_by_study=self.repository.find_by_study,
+            save=self.repository.save,
+            validate_selection=self.validated.append,
+            output_model=BatchOutput,
+            report_item_errors=report_item_errors,
+        )
+
+
+@patch.object(Service, "_extract_study_standards_effective_date", lambda *_, **__: None)
+class TestStudySelectionBatchOperations(unittest.TestCase):
+    def test_batch_is_applied_in_memory_and_saved_once(self):
+        service = Service()
+
+        results = service.handle_batch_operations(
+            [
+                BatchInput(method="POST", content=CreateInput(name="second")),
+                BatchInput(
+                    method="PATCH",
+                    content=UpdateInput(uid="Selection_1", name="changed"),
+                ),
+                BatchInput(
+                    method="PATCH",
+                    content=UpdateInput(uid="Selection_2", name="changed second"),
+                ),
+            ]
+        )
+
+        service.repository.find_by_study.assert_called_once_with(
+            study_uid="Study_000001", for_update=True
+        )
+        service.repository.save.assert_called_once()
+        self.assertEqual(service.validated, ["changed second", "changed"])
+        self.assertEqual([result.response_code for result in results], [201, 200, 200])
+        self.assertEqual(
+            [result.content for result in results],
+            [
+                {"uid": "Selection_2", "name": "changed second", "order": 2},
+                {"uid": "Selection_1", "name": "changed", "order": 1},
+                {"uid": "Selection_2", "name": "changed second", "order": 2},
+            ],
+        )
+
+    def test_operations_are_checked_before_the_study_is_locked(self):
+        service = Service()
+
+        with self.assertRaises(exceptions.MethodNotAllowedException):
+            service.handle_batch_operations(
+                [
+                    BatchInput(method="POST", content=CreateInput(name="second")),
+                    BatchInput(method="DELETE", content=CreateInput(name="other")),
+                ]
+            )
+        with self.assertRaisesRegex(
+            exceptions.ValidationException,
+            "PATCH operation requires UpdateInput as request payload.",
+        ):
+            service.handle_batch_operations(
+                [BatchInput(method="PATCH", content=CreateInput(name="second"))]
+            )
+
+        service.repository.find_by_study.assert_not_called()
+        service.repository.save.assert_not_called()
+
+    def test_removed_selections_are_not_validated_and_saved_before_cascades(self):
+        saved = []
+
+        class ServiceWithDelete(Service):
+            def _delete(self, aggregate, content):
+                del aggregate.selections[content.uid]
+                return content.uid
+
+            def extra_operation_kinds(self):
+                return {
+                    "DELETE": StudySelectionBatchOperation(
+                        DeleteInput,
+                        status.HTTP_204_NO_CONTENT,
+                        self._delete,
+                        after_save=lambda aggregate, uid: saved.append(
+                            (uid, self.repository.save.called)
+                        ),
+                    )
+                }
+
+        service = ServiceWithDelete()
+        service.repository.find_by_study.return_value.selections["Selection_9"] = "old"
+
+        results = service.handle_batch_operations(
+            [
+                BatchInput(
+                    method="PATCH",
+                    content=UpdateInput(uid="Selection_1", name="changed"),
+                ),
+                BatchInput(method="POST", content=CreateInput(name="second")),
+                BatchInput(method="DELETE", content=DeleteInput(uid="Selection_9")),
+            ]
+        )
+
+        service.repository.save.assert_called_once()
+        self.assertEqual(saved, [("Selection_9", True)])
+        self.assertEqual(service.validated, ["changed", "second"])
+        self.assertEqual([result.response_code for result in results], [200, 201, 204])
+        self.assertIsNone(results[2].content)
+
+    def test_missing_aggregate_is_not_found(self):
+        service = Service()
+        service.repository.find_by_study.return_value = None
+
+        with self.assertRaises(exceptions.NotFoundException):
+            service.handle_batch_operations(
+                [BatchInput(method="POST", content=CreateInput(name="second"))]
+            )
+        service.repository.save.assert_not_called()
+
+    def test_selections_deleted_by_the_batch_cannot_be_changed_by_it(self):
+        class ServiceWithDelete(Service):
+            def _delete(self, aggregate, content):
+                del aggregate.selections[content.uid]
+                return content.uid
+
+            def extra_operation_kinds(self):
+                return {
+                    "DELETE": StudySelectionBatchOperation(
+                        DeleteInput, status.HTTP_204_NO_CONTENT, self._delete
+                    )
+                }
+
+        operations = [
+            BatchInput(method="POST", content=CreateInput(name="second")),
+            BatchInput(
+                method="PATCH", content=UpdateInput(uid="Selection_1", name="changed")
+            ),
+            BatchInput(method="DELETE", content=DeleteInput(uid="Selection_1")),
+        ]
+        service = ServiceWithDelete()
+
+        with self.assertRaisesRegex(
+            exceptions.ValidationException,
+            "Study selection with UID 'Selection_1' is deleted by another operation of the batch.",
+        ):
+            service.handle_batch_operations(operations)
+        service.repository.save.assert_not_called()
+
+        service = ServiceWithDelete()
+        results = service.handle_batch_operations(operations, report_item_errors=True)
+
+        service.repository.save.assert_called_once()
+        self.assertEqual([result.response_code for result in results], [201, 400, 204])
+        self.assertEqual(results[0].content["uid"], "Selection_2")
+        self.assertIsInstance(results[1].content, BatchErrorResponse)
+
+    def test_item_errors_are_reported_per_operation(self):
+        service = Service()
+
+        results = service.handle_batch_operations(
+            [
+                BatchInput(method="DELETE", content=DeleteInput(uid="Selection_1")),
+                BatchInput(method="PATCH", content=CreateInput(name="not an update")),
+                BatchInput(method="POST", content=CreateInput(name="second")),
+            ],
+            report_item_errors=True,
+        )
+
+        service.repository.save.assert_called_once()
+        self.assertEqual([result.response_code for result in results], [405, 400, 201])
+        self.assertEqual(
+            results[1].content.message,
+            "PATCH operation requires UpdateInput as request payload.",
+        )
+        self.assertEqual(service.validated, ["second"])
+
+
+def create_branch_arm(uid: str) -> StudySelectionBranchArmVO:
+    return StudySelectionBranchArmVO(
+        study_selection_uid=uid,
+        study_uid="Study_000001",
+        name=uid,
+        short_name=uid,
+        code=None,
+        description=None,
+        randomization_group=None,
+        number_of_subjects=None,
+        arm_root_uid="StudyArm_1",
+        study_cohorts=[],
+        start_date=datetime.datetime.now(datetime.timezone.utc),
+        author_id="author",
+        end_date=None,
+        status=None,
+        change_type=None,
+    )
+
+
+def create_design_cell(branch_arm_uid: str, order: int) -> StudyDesignCellVO:
+    return StudyDesignCellVO(
+        uid=f"StudyDesignCell_of_{branch_arm_uid}",
+        study_uid="Study_000001",
+        study_epoch_uid="StudyEpoch_1",
+        study_element_uid="StudyElement_1",
+        study_branch_arm_uid=branch_arm_uid,
+        transition_rule=None,
+        order=order,
+        start_date=datetime.datetime.now(datetime.timezone.utc),
+        author_id="author",
+    )
+
+
+@patch.object(db, "_active_transaction", MagicMock())
+@patch.object(
+    StudyBranchArmSelectionService,
+    "_extract_study_standards_effective_date",
+    lambda *_, **__: None,
+)
+class TestBranchArmBatchOperations(unittest.TestCase):
+    def test_deleted_branch_arms_cascade_to_their_design_cells(self):
+        service = StudyBranchArmSelectionService.__new__(StudyBranchArmSelectionService)
+        service.author = "author"
+        service._repos = repos = MagicMock()
+        branch_arms = [
+            create_branch_arm("StudyBranchArm_1"),
+            create_branch_arm("StudyBranchArm_2"),
+        ]
+        branch_arm_aggregate = StudySelectionBranchArmAR.from_repository_values(
+            study_uid="Study_000001", study_branch_arms_selection=branch_arms
+        )
+        branch_arm_aggregate.repository_closure_data = branch_arms
+        repos.study_branch_arm_repository.find_by_study.return_value = (
+            branch_arm_aggregate
+        )
+        design_cells_aggregate = StudyDesignCellsAR(
+            study_uid="Study_000001",
+            design_cells=[
+                create_design_cell("StudyBranchArm_1", 1),
+                create_design_cell("StudyBranchArm_2", 2),
+            ],
+        )
+        repos.study_design_cell_repository.find_by_study.return_value = (
+            design_cells_aggregate
+        )
+        repos.study_design_cell_repository.get_design_cells_connected_to_branch_arm.side_effect = lambda study_uid, study_branch_arm_uid: [
+            MagicMock(uid=f"StudyDesignCell_of_{study_branch_arm_uid}")
+        ]
+
+        results = service.handle_batch_operations(
+            "Study_000001",
+            [
+                StudySelectionBranchArmBatchInput(
+                    method="DELETE", content={"branch_arm_uid": "StudyBranchArm_1"}
+                ),
+                StudySelectionBranchArmBatchInput(
+                    method="DELETE", content={"branch_arm_uid": "StudyBranchArm_2"}
+                ),
+            ],
+        )
+
+        repos.study_branch_arm_repository.save.assert_called_once_with(
+            branch_arm_aggregate, "author"
+        )
+        self.assertEqual(branch_arm_aggregate.study_branch_arms_selection, ())
+        # the cells of a removed branch arm are deleted,
+        # the ones of the last branch arm of a study arm go back to the study arm
+        self.assertEqual(
+            [
+                (cell.uid, cell.order, cell.study_arm_uid, cell.study_branch_arm_uid)
+                for cell in design_cells_aggregate.design_cells
+            ],
+            [("StudyDesignCell_of_StudyBranchArm_2", 1, "StudyArm_1", None)],
+        )
+        self.assertEqual(
+            repos.study_design_cell_repository.save_all.call_args_list,
+            [call(design_cells_aggregate, "author", allow_none_arm_branch_arm=True)]
+            * 2,
+        )
+        self.assertEqual([result.response_code for result in results], [204, 204])
+
+
+@patch.object(db, "_active_transaction", MagicMock())
+@patch.object(
+    StudyDesignCellService,
+    "_extract_study_standards_effective_date",
+    lambda *_, **__: None,
+)
+class TestDesignCellBatchOperations(unittest.TestCase):
+    def create_service(self, design_cells_aggregate):
+        service = StudyDesignCellService.__new__(StudyDesignCellService)
+        service.author = "author"
+        service._repos = repos = MagicMock()
+        repos.study_design_cell_repository.find_by_study.return_value = (
+            design_cells_aggregate
+        )
+        repos.study_design_cell_repository.generate_uid.return_value = (
+            "StudyDesignCell_new"
+        )
+        return service
+
+    def test_reordered_cells_are_shifted_by_later_operations(self):
+        design_cells_aggregate = StudyDesignCellsAR(
+            study_uid="Study_000001",
+            design_cells=[
+                create_design_cell(f"StudyBranchArm_{order}", order)
+                for order in range(1, 5)
+            ],
+        )
+        service = self.create_service(design_cells_aggregate)
+
+        results = service.handle_batch_operations(
+            "Study_000001",
+            [
+                StudyDesignCellBatchInput(
+                    method="PATCH",
+                    content=StudyDesignCellEditInput(
+                        study_design_cell_uid="StudyDesignCell_of_StudyBranchArm_4",
+                        order=1,
+                    ),
+                ),
+                StudyDesignCellBatchInput(
+                    method="POST",
+                    content=StudyDesignCellCreateInput(
+                        study_epoch_uid="StudyEpoch_2",
+                        study_element_uid="StudyElement_1",
+                        study_arm_uid="StudyArm_1",
+                        order=2,
+                    ),
+                ),
+                StudyDesignCellBatchInput(
+                    method="DELETE",
+                    content=StudyDesignCellDeleteInput(
+                        uid="StudyDesignCell_of_StudyBranchArm_2"
+                    ),
+                ),
+            ],
+        )
+
+        repos = service._repos
+        repos.study_design_cell_repository.save_all.assert_called_once_with(
+            design_cells_aggregate, "author"
+        )
+        self.assertEqual(
+            [(cell.uid, cell.order) for cell in design_cells_aggregate.design_cells],
+            [
+                ("StudyDesignCell_of_StudyBranchArm_4", 1),
+                ("StudyDesignCell_new", 2),
+                ("StudyDesignCell_of_StudyBranchArm_1", 3),
+                ("StudyDesignCell_of_StudyBranchArm_3", 4),
+            ],
+        )
+        self.assertEqual([result.response_code for result in results], [200, 201, 204])
+        self.assertEqual(results[0].content.order, 1)
+        self.assertEqual(results[1].content.order, 2)
+
+    def test_failed_operations_are_reported_and_the_others_saved(self):
+        design_cells_aggregate = StudyDesignCellsAR(
+            study_uid="Study_000001",
+            design_cells=[create_design_cell("StudyBranchArm_1", 1)],
+        )
+        service = self.create_service(design_cells_aggregate)
+
+        results = service.handle_batch_operations(
+            "Study_000001",
+            [
+                StudyDesignCellBatchInput(
+                    method="DELETE",
+                    content=StudyDesignCellDeleteInput(uid="StudyDesignCell_missing"),
+                ),
+                StudyDesignCellBatchInput(
+                    method="DELETE",
+                    content=StudyDesignCellDeleteInput(
+                        uid="StudyDesignCell_of_StudyBranchArm_1"
+                    ),
+                ),
+            ],
+        )
+
+        service._repos.study_design_cell_repository.save_all.assert_called_once()
+        self.assertEqual(design_cells_aggregate.design_cells, [])
+        self.assertEqual([result.response_code for result in results], [404, 204])
+        self.assertIsInstance(results[0].content, BatchErrorResponse)
+
+
+SOA_MODULE = StudyActivitySelectionService.__module__
+
+
+# run in the transaction of the caller, there is none to start in unit tests
+@patch.object(db, "_active_transaction", MagicMock())
+@patch(SOA_MODULE + ".StudyActivityScheduleService")
+class TestSoAEditBatchOperations(unittest.TestCase):
+    def test_consecutive_schedule_operations_are_written_together(
+        self, schedule_service_class
+    ):
+        schedule_service = schedule_service_class.return_value
+        schedule_service.handle_batch_operations.side_effect = (
+            lambda study_uid, operations: [
+                StudyActivityScheduleBatchOutput(
+                    response_code=status.HTTP_204_NO_CONTENT, content=None
+                )
+                for _ in operations
+            ]
+        )
+        service = StudyActivitySelectionService.__new__(StudyActivitySelectionService)
+
+        def schedule_operation(uid):
+            return StudySoAEditBatchInput(
+                method="DELETE",
+                object="StudyActivitySchedule",
+                content=StudyActivityScheduleDeleteInput(uid=uid),
+            )
+
+        with patch.object(service, "delete_selection") as delete_selection:
+            results = service.handle_soa_edit_batch_operations(
+                "Study_000001",
+                [
+                    schedule_operation("StudyActivitySchedule_1"),
+                    schedule_operation("StudyActivitySchedule_2"),
+                    StudySoAEditBatchInput(
+                        method="DELETE",
+                        object="StudyActivity",
+                        content=StudySelectionActivityBatchDeleteInput(
+                            study_activity_uid="StudyActivity_1"
+                        ),
+                    ),
+                    schedule_operation("StudyActivitySchedule_3"),
+                ],
+            )
+
+        delete_selection.assert_called_once_with("Study_000001", "StudyActivity_1")
+        self.assertEqual(
+            [
+                [operation.content.uid for operation in call.args[1]]
+                for call in schedule_service.handle_batch_operations.call_args_list
+            ],
+            [
+                ["StudyActivitySchedule_1", "StudyActivitySchedule_2"],
+                ["StudyActivitySchedule_3"],
+            ],
+        )
+        self.assertEqual([result.response_code for result in results], [204] * 4)
@@ -28,6 +28,39 @@ class BaseTestObject(BaseModel):
         ]
 
 
+class NestedTestObject(BaseModel):
+    name: str | None = None
+    level: int | None = None
+
+
+class FilterPlanTestObject(BaseModel):
+    uid: str
+    name: str
+    status: ComparisonOperator | None = None
+    nested: NestedTestObject | None = None
+    nested_list: list[NestedTestObject] = []
+
+    @staticmethod
+    def get_all_items() -> list["FilterPlanTestObject"]:
+        return [
+            FilterPlanTestObject(
+                uid=f"uid{index}",
+                name=f"Name {index % 7}",
+                status=list(ComparisonOperator)[index % 3] if index % 4 else None,
+                nested=(
+                    NestedTestObject(name=f"nested {index % 5}", level=index % 3)
+                    if index % 6
+                    else None
+                ),
+                nested_list=[
+                    NestedTestObject(name=f"item {index + offset}")
+                    for offset in range(index % 3)
+                ],
+            )
+            for index in range(60)
+        ]
+
+
 class TestServiceUtils(unittest.TestCase):
     @parameterized.expand(
         [
@@ -266,3 +299,119 @@ class TestServiceUtils(unittest.TestCase):
             item, filter_key, filter_values, filter_operator
         )
         assert out == expected
+
+    @parameterized.expand(
+        [
+            (None, None, True),
+            ({"uid": {"v": ["x"]}}, {"modified": False}, True),
+            ({"footnote.name": {"v": ["x"], "op": "co"}}, None, True),
+            ({"referenced_items.item_name": {"v": ["x"]}}, None, False),
+            (None, {"study_version": True}, False),
+            ({"*": {"v": ["x"]}}, None, False),
+            ({"metadata.description.title": {"v": ["x"]}}, None, True),
+            (None, {"metadata.description": True}, True),
+            ({"metadata.version.status": {"v": ["x"]}}, None, False),
+            (None, {"metadata": True}, False),
+        ]
+    )
+    def test_is_database_filterable(self, filter_by, sort_by, expected):
+        db_fields = frozenset({"uid", "footnote", "modified", "metadata.description"})
+        assert _utils.is_database_filterable(db_fields, filter_by, sort_by) == expected
+
+    @parameterized.expand(
+        [
+            ("name", ComparisonOperator.EQUALS, ["Name 1", "Name 2"]),
+            ("name", ComparisonOperator.NOT_EQUALS, ["Name 1"]),
+            ("name", ComparisonOperator.CONTAINS, ["NAME 3", "e 4"]),
+            ("name", ComparisonOperator.GREATER_THAN, ["Name 3"]),
+            ("name", ComparisonOperator.BETWEEN, ["Name 5", "name 2"]),
+            ("status", ComparisonOperator.EQUALS, ["co"]),
+            ("status", ComparisonOperator.EQUALS, []),
+            ("nested.name", ComparisonOperator.CONTAINS, ["nested 1"]),
+            ("nested.level", ComparisonOperator.LESS_THAN_OR_EQUAL_TO, ["1"]),
+            ("nested_list.name", ComparisonOperator.CONTAINS, ["item 1"]),
+            ("nested_list.name", ComparisonOperator.EQUALS, []),
+            ("*", ComparisonOperator.CONTAINS, ["nested 3"]),
+            ("*", ComparisonOperator.EQUALS, ["none"]),
+            ("*", ComparisonOperator.CONTAINS, ["item 5", "name 6"]),
+        ]
+    )
+    def test_filter_plan_matches_filter_aggregated_items(
+        self, filter_key, filter_operator, filter_values
+    ):
+        items = FilterPlanTestObject.get_all_items()
+        plan = _utils.compile_filter_plan(
+            {filter_key: {"v": list(filter_values), "op": filter_operator.value}},
+            FilterOperator.AND,
+            {},
+        )
+
+        assert plan.filter(items) == [
+            item
+            for item in items
+            if _utils.filter_aggregated_items(
+                item, filter_key, list(filter_values), filter_operator
+            )
+        ]
+
+    @parameterized.expand(
+        [
+            ({"name": True},),
+            ({"name": False, "uid": False},),
+            ({"nested.name": True, "name": False},),
+            ({"name": False, "nested.level": True, "uid": False},),
+        ]
+    )
+    def test_filter_plan_sorts_like_sequential_sorts(self, sort_by):
+        items = FilterPlanTestObject.get_all_items()
+        expected = list(items)
+        distinct_sort_orders = set(sort_by.values())
+        if len(distinct_sort_orders) == 1:
+            expected.sort(
+                key=lambda x: [
+                    (
+                        _utils.rgetattr(x, key)
+                        if _utils.rgetattr(x, key) is not None
+                        else (
+                            "-1"
+                            if issubclass(_utils.rgetattr_type(x, key), str)
+                            else -1
+                        )
+                    )
+                    for key in sort_by
+                ],
+                reverse=not distinct_sort_orders.pop(),
+            )
+        else:
+            for key, ascending in sort_by.items():
+                expected.sort(
+                    key=lambda x, key=key: (
+                        _utils.rgetattr(x, key)
+                        if _utils.rgetattr(x, key) is not None
+                        else (
+                            "-1"
+                            if issubclass(_utils.rgetattr_type(x, key), str)
+                            else -1
+                        )
+                    ),
+                    reverse=not ascending,
+                )
+
+        out = _utils.generic_item_filtering(items, sort_by=sort_by)
+
+        assert [item.uid for item in out] == [item.uid for item in expected]
+
+    def test_filter_plans_are_cached(self):
+        filter_by = {"name": {"v": ["Name 1"], "op": "co"}}
+
+        plan = _utils.compile_filter_plan(filter_by, FilterOperator.OR, {"uid": True})
+
+        assert plan is _utils.compile_filter_plan(
+            dict(filter_by), FilterOperator.OR, {"uid": True}
+        )
+        assert plan is not _utils.compile_filter_plan(
+            filter_by, FilterOperator.AND, {"uid": True}
+        )
+        assert plan is not _utils.compile_filter_plan(
+            filter_by, FilterOperator.OR, {"uid": False}
+        )
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+# modules rendering documents, which must not load the document libraries when imported
+DOCUMENT_MODULES = [
+    "clinical_mdr_api.routers.ctr_xml.ctr_xml",
+    "clinical_mdr_api.routers.export",
+    "clinical_mdr_api.services.concepts.odms.odm_xml_exporter",
+    "clinical_mdr_api.services.studies.study_design_figure",
+    "clinical_mdr_api.services.studies.study_flowchart",
+    "clinical_mdr_api.services.studies.study_interventions",
+    "clinical_mdr_api.services.studies.study_objectives",
+    "clinical_mdr_api.services.utils.table_f",
+]
+DOCUMENT_LIBRARIES = ["ctrxml", "docx", "openpyxl", "PIL", "weasyprint", "xsdata"]
+
+
+def test_document_libraries_are_loaded_on_first_use():
+    code = (
+        "import sys\n"
+        + "".join(f"import {module}\n" for module in DOCUMENT_MODULES)
+        + f"print(' '.join(m for m in {DOCUMENT_LIBRARIES!r} if m in sys.modules))"
+    )
+
+    rs = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert rs.stdout.strip() == ""
@@ -0,0 +1,180 @@
+"""
+Content-addressed file store for rendered documents.
+
+Documents are stored once per content, under their SHA-256 digest in `objects/`.
+Named references in `refs/` map a key (e.g. a study uid, a version and a document name) to the digest of a document,
+so identical documents rendered for different keys share storage.
+
+Files are written to a temporary file and moved into place, so readers never see partial documents,
+and all API workers pointed to the same directory share the stored documents. Documents are checked against
+their digest when read, a corrupted document is deleted and rendered again.
+
+References not read for `ARTIFACT_STORE_MAX_AGE` seconds are deleted, together with the documents
+no other reference points to, by a garbage collection run at most every `ARTIFACT_STORE_GC_INTERVAL` seconds.
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+from functools import lru_cache
+from urllib.parse import quote
+
+from common.config import settings
+from common.utils import ensure_private_directory
+
+log = logging.getLogger(__name__)
+
+DIGEST_RE = re.compile(r"[0-9a-f]{64}")
+
+
+class ArtifactStore:
+    """Stores documents by content digest and resolves named references to them"""
+
+    def __init__(
+        self,
+        path: str,
+        max_age: float | None = None,
+        gc_interval: float | None = None,
+    ):
+        self.path = path
+        self.max_age = settings.artifact_store_max_age if max_age is None else max_age
+        self.gc_interval = (
+            settings.artifact_store_gc_interval if gc_interval is None else gc_interval
+        )
+        self._objects_path = os.path.join(path, "objects")
+        self._refs_path = os.path.join(path, "refs")
+        self._gc_stamp_path = os.path.join(path, "gc.stamp")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_path, digest[:2], digest)
+
+    def _ref_path(self, key: tuple[str, ...]) -> str:
+        return os.path.join(self._refs_path, *(quote(part, safe="") for part in key))
+
+    @staticmethod
+    def _write(path: str, content: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get_digest(self, key: tuple[str, ...]) -> str | None:
+        """Returns the digest of the document referenced by `key`, or `None` if no document is stored for it"""
+
+        try:
+            with open(self._ref_path(key), "r", encoding="ascii") as file:
+                digest = file.read().strip()
+        except FileNotFoundError:
+            return None
+        if not DIGEST_RE.fullmatch(digest):
+            return None
+        return digest if os.path.exists(self._object_path(digest)) else None
+
+    def get(self, key: tuple[str, ...]) -> bytes | None:
+        """Returns the document referenced by `key`, or `None` if no document is stored for it"""
+
+        if (digest := self.get_digest(key)) is None:
+            return None
+        object_path = self._object_path(digest)
+        try:
+            with open(object_path, "rb") as file:
+                content = file.read()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(content).hexdigest() != digest:
+            log.warning("Deleting corrupted artifact %s of %s", digest, key)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(object_path)
+            return None
+        # the age of a reference is the time since its last use, see `collect_garbage`
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(self._ref_path(key))
+        return content
+
+    def put(self, key: tuple[str, ...], content: bytes) -> str:
+        """Stores a document (unless a document with the same content is already stored) under `key`, returns its digest"""
+
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            self._write(object_path, content)
+        self._write(self._ref_path(key), digest.encode("ascii"))
+        log.debug("Stored artifact %s as %s", key, digest)
+        self._collect_garbage_if_due()
+        return digest
+
+    def _collect_garbage_if_due(self) -> None:
+        try:
+            last_run = os.stat(self._gc_stamp_path).st_mtime
+        except FileNotFoundError:
+            last_run = 0
+        if time.time() - last_run < self.gc_interval:
+            return
+        self._write(self._gc_stamp_path, b"")
+        try:
+            self.collect_garbage()
+        except OSError:
+            log.exception("Artifact store garbage collection failed")
+
+    def collect_garbage(self) -> tuple[int, int]:
+        """
+        Deletes the references not used for `max_age` seconds and the documents no reference points to,
+        returns the numbers of deleted references and documents.
+
+        Documents and temporary files younger than `gc_interval` are kept, they may belong to a document being stored.
+        """
+
+        now = time.time()
+        refs_deleted = 0
+        referenced = set()
+        for directory, _, names in os.walk(self._refs_path):
+            for name in names:
+                path = os.path.join(directory, name)
+                with contextlib.suppress(FileNotFoundError):
+                    if now - os.stat(path).st_mtime > self.max_age:
+                        os.unlink(path)
+                        refs_deleted += 1
+                        continue
+                    with open(path, "r", encoding="ascii") as file:
+                        referenced.add(file.read().strip())
+
+        objects_deleted = 0
+        for directory, _, names in os.walk(self._objects_path):
+            for name in names:
+                path = os.path.join(directory, name)
+                with contextlib.suppress(FileNotFoundError):
+                    if (
+                        name not in referenced
+                        and now - os.stat(path).st_mtime > self.gc_interval
+                    ):
+                        os.unlink(path)
+                        objects_deleted += 1
+
+        log.info(
+            "Deleted %d unused artifact references and %d artifacts",
+            refs_deleted,
+            objects_deleted,
+        )
+        return refs_deleted, objects_deleted
+
+
+@lru_cache(maxsize=1)
+def get_artifact_store() -> ArtifactStore | None:
+    """Returns the process-wide artifact store at `settings.artifact_store_path`, `None` if it isn't configured"""
+
+    if not settings.artifact_store_path:
+        log.info("Artifact store is disabled because ARTIFACT_STORE_PATH is not set")
+        return None
+    path = ensure_private_directory(settings.artifact_store_path, "ARTIFACT_STORE_PATH")
+    log.info("Using artifact store: %s", path)
+    return ArtifactStore(path)
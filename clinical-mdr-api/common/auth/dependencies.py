@@ -4,8 +4,9 @@ from typing import Annotated
 from authlib.integrations.starlette_client import OAuth
 from authlib.jose.errors import JoseError
 from authlib.jose.rfc7519.claims import JWTClaims
-from fastapi import Depends, Security
+from fastapi import Depends, Request, Security
 from fastapi.security import OAuth2AuthorizationCodeBearer
+from fastapi.security.utils import get_authorization_scheme_param
 from opencensus.trace import execution_context
 from opencensus.trace.tracer import Tracer
 from pydantic import ValidationError
@@ -85,6 +86,31 @@ async def validate_token(token: Annotated[str, Depends(oauth_scheme)]):
     persist_user(user_info=user())
 
 
+async def is_request_authorized(request: Request, roles: set[str]) -> bool:
+    """
+    Authenticates a request outside of the route dependencies, e.g. in a middleware.
+
+    Args:
+        request (Request): The request object.
+        roles (set[str]): Roles of which the user needs at least one, if Role-Based Access Control is enabled.
+
+    Returns:
+        bool: True if the request has a valid access token and the user has one of the roles, False otherwise.
+    """
+    if not settings.oauth_enabled:
+        return True
+
+    scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        await validate_token(token)
+    except NotAuthenticatedException:
+        return False
+
+    return not settings.oauth_rbac_enabled or user().has_roles(*roles, has_all=False)
+
+
 def dummy_user_test_auth(user_id: str = "unknown-user"):
     """
     Sets context Auth object with dummy data when running tests.
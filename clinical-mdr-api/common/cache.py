@@ -0,0 +1,719 @@
+"""
+Repository cache stores.
+
+Repositories keep memoized aggregates in `cachetools.TTLCache` stores. With a single API worker that is all we need,
+but behind a load balancer every worker holds its own copy, and a write handled by one worker leaves the others stale
+until the entries expire.
+
+`SbTTLCache` is a drop-in `TTLCache` which is backed by a pluggable `CacheBackend`:
+    - `LocalCacheBackend` (default, `CACHE_BACKEND=local`) keeps today's per-process behaviour.
+    - `SqliteCacheBackend` (`CACHE_BACKEND=sqlite`) shares entries between all workers on the host through an SQLite
+      file (`CACHE_SHARED_PATH`), so an entry loaded by one worker is a hit for all others.
+      The file must be in a directory private to the user running the API, and entries are signed with
+      `CACHE_SHARED_SECRET`: values are unpickled only if their signature matches.
+
+Entries are tagged with the uid of the cached aggregate and the uids it references (e.g. the codelists of a term,
+the parameter terms of a template), see `cache_tags`. Entries that can't be attributed to a single aggregate
+(lists, `None` results) get the `ANY_TAG` tag.
+
+Every invalidation is recorded by the backend under a new generation of the cache store:
+    - `SbTTLCache.invalidate(uids)` evicts the entries tagged with any of the uids, and all `ANY_TAG` entries.
+    - `SbTTLCache.clear()` evicts all entries.
+Each worker replays the invalidations of newer generations before reading the backend or writing an entry,
+and before serving local hits at most every `CACHE_SYNC_INTERVAL` seconds,
+so a write on one worker invalidates the affected entries everywhere.
+A value is stored only if no invalidation affecting it happened since the lookup which missed it,
+otherwise it may have been loaded from the database before the write and is dropped.
+"""
+
+import abc
+import collections
+import contextlib
+import dataclasses
+import hashlib
+import hmac
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Hashable
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+from common.config import settings
+from common.telemetry.request_metrics import get_request_metrics
+from common.utils import ensure_private_directory
+
+log = logging.getLogger(__name__)
+
+ANY_TAG = "*"
+INVALIDATION_HISTORY_SIZE = 1000
+TAG_WALK_MAX_DEPTH = 4
+SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+Invalidation = frozenset[str] | None
+"""Tags evicted by an invalidation, or `None` if the whole cache store was cleared."""
+
+
+def _is_uid_field(name: str) -> bool:
+    name = name.lstrip("_")
+    return name == "uid" or name.endswith("_uid")
+
+
+def referenced_uids(obj: Any, depth: int = TAG_WALK_MAX_DEPTH) -> set[str]:
+    """
+    Collects the values of all `uid` and `*_uid(s)` fields of a dataclass or Pydantic model, recursively.
+    """
+
+    uids: set[str] = set()
+    if depth <= 0 or obj is None or isinstance(obj, (str, int, float, Enum)):
+        return uids
+
+    if isinstance(obj, Mapping):
+        items: Iterable[tuple[str | None, Any]] = (
+            (k if isinstance(k, str) else None, v) for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = ((None, v) for v in obj)
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        items = (
+            (f.name, getattr(obj, f.name, None))
+            for f in dataclasses.fields(obj)
+            if f.name != "repository_closure_data"
+        )
+    elif isinstance(obj, BaseModel):
+        items = ((name, getattr(obj, name, None)) for name in type(obj).model_fields)
+    else:
+        return uids
+
+    for name, value in items:
+        if isinstance(value, str):
+            if name is not None and _is_uid_field(name):
+                uids.add(value)
+        elif (
+            name is not None
+            and name.lstrip("_").endswith("_uids")
+            and isinstance(value, (list, tuple, set, frozenset))
+        ):
+            uids.update(v for v in value if isinstance(v, str))
+        else:
+            uids |= referenced_uids(value, depth - 1)
+    return uids
+
+
+def cache_tags(value: Any) -> frozenset[str]:
+    """
+    Returns the tags of a cached value: the uid of the cached aggregate and all uids it references.
+
+    Values without a uid of their own (lists, tuples, `None`) get the `ANY_TAG` tag only.
+    """
+
+    uid = getattr(value, "uid", None)
+    if not isinstance(uid, str):
+        return frozenset({ANY_TAG})
+    return frozenset({uid} | referenced_uids(value))
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class CacheBackend(abc.ABC):
+    """Second-level storage and invalidation history shared by cache stores."""
+
+    @abc.abstractmethod
+    def get_generation(self, name: str) -> int:
+        """Returns the current generation of the named cache store."""
+
+    @abc.abstractmethod
+    def invalidate(self, name: str, tags: Invalidation) -> int:
+        """
+        Records an invalidation of the named cache store and evicts the affected shared entries.
+
+        Returns the new generation.
+        """
+
+    @abc.abstractmethod
+    def invalidations_since(
+        self, name: str, generation: int
+    ) -> list[Invalidation] | None:
+        """
+        Returns the invalidations of generations newer than `generation`, oldest first,
+        or `None` if the history doesn't reach back that far.
+        """
+
+    @abc.abstractmethod
+    def get(self, name: str, key: Hashable) -> tuple[Any, frozenset[str]]:
+        """Returns a stored value and its tags, raises `KeyError` if missing or expired."""
+
+    @abc.abstractmethod
+    def set(
+        self,
+        name: str,
+        generation: int,
+        key: Hashable,
+        value: Any,
+        tags: frozenset[str],
+        ttl: float,
+    ) -> None:
+        """
+        Stores a value loaded at `generation` of the named cache store.
+
+        The value is discarded if it has been invalidated by a newer generation in the meantime.
+        """
+
+
+class LocalCacheBackend(CacheBackend):
+    """In-process only: nothing is shared, the invalidation history is kept per process."""
+
+    def __init__(self):
+        self._generations: dict[str, int] = {}
+        self._history: dict[str, collections.deque[tuple[int, Invalidation]]] = (
+            collections.defaultdict(
+                lambda: collections.deque(maxlen=INVALIDATION_HISTORY_SIZE)
+            )
+        )
+        self._lock = threading.Lock()
+
+    def get_generation(self, name: str) -> int:
+        return self._generations.get(name, 0)
+
+    def invalidate(self, name: str, tags: Invalidation) -> int:
+        with self._lock:
+            generation = self._generations.get(name, 0) + 1
+            self._generations[name] = generation
+            self._history[name].append((generation, tags))
+            return generation
+
+    def invalidations_since(
+        self, name: str, generation: int
+    ) -> list[Invalidation] | None:
+        with self._lock:
+            history = [tags for gen, tags in self._history[name] if gen > generation]
+            if len(history) != self._generations.get(name, 0) - generation:
+                return None
+            return history
+
+    def get(self, name: str, key: Hashable) -> tuple[Any, frozenset[str]]:
+        raise KeyError(key)
+
+    def set(
+        self,
+        name: str,
+        generation: int,
+        key: Hashable,
+        value: Any,
+        tags: frozenset[str],
+        ttl: float,
+    ) -> None:
+        pass
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    Host-wide shared cache backed by an SQLite file.
+
+    All API workers pointed to the same file share cached entries and the invalidation history.
+    Values are pickled and signed with `secret`, entries with a wrong signature are ignored;
+    values that can't be pickled stay in the local cache only.
+    """
+
+    def __init__(self, path: str, secret: bytes):
+        self.path = path
+        self._secret = secret
+        self._local = threading.local()
+        conn = self._connection()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS generations (name TEXT PRIMARY KEY, generation INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS invalidations (
+                name TEXT NOT NULL, generation INTEGER NOT NULL, tags TEXT, PRIMARY KEY (name, generation)
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                name TEXT NOT NULL, key TEXT NOT NULL, expires REAL NOT NULL, value BLOB NOT NULL,
+                PRIMARY KEY (name, key)
+            );
+            CREATE TABLE IF NOT EXISTS entry_tags (
+                name TEXT NOT NULL, key TEXT NOT NULL, tag TEXT NOT NULL, PRIMARY KEY (name, key, tag)
+            );
+            CREATE INDEX IF NOT EXISTS entry_tags_by_tag ON entry_tags (name, tag);
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return repr(key)
+
+    def _sign(self, name: str, db_key: str, data: bytes) -> bytes:
+        return hmac.new(
+            self._secret,
+            b"\0".join((name.encode(), db_key.encode(), data)),
+            hashlib.sha256,
+        ).digest()
+
+    def _transaction(self, function, *args):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = function(conn, *args)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    @staticmethod
+    def _generation(conn: sqlite3.Connection, name: str) -> int:
+        row = conn.execute(
+            "SELECT generation FROM generations WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _history(
+        conn: sqlite3.Connection, name: str, generation: int
+    ) -> list[Invalidation] | None:
+        rows = conn.execute(
+            "SELECT tags FROM invalidations WHERE name = ? AND generation > ? ORDER BY generation",
+            (name, generation),
+        ).fetchall()
+        if len(rows) != SqliteCacheBackend._generation(conn, name) - generation:
+            return None
+        return [
+            None if tags is None else frozenset(json.loads(tags)) for (tags,) in rows
+        ]
+
+    def get_generation(self, name: str) -> int:
+        return self._generation(self._connection(), name)
+
+    def invalidate(self, name: str, tags: Invalidation) -> int:
+        def _invalidate(conn: sqlite3.Connection) -> int:
+            generation = self._generation(conn, name) + 1
+            conn.execute(
+                "INSERT OR REPLACE INTO generations (name, generation) VALUES (?, ?)",
+                (name, generation),
+            )
+            conn.execute(
+                "INSERT INTO invalidations (name, generation, tags) VALUES (?, ?, ?)",
+                (name, generation, None if tags is None else json.dumps(sorted(tags))),
+            )
+            conn.execute(
+                "DELETE FROM invalidations WHERE name = ? AND generation <= ?",
+                (name, generation - INVALIDATION_HISTORY_SIZE),
+            )
+            if tags is None:
+                conn.execute("DELETE FROM entries WHERE name = ?", (name,))
+                conn.execute("DELETE FROM entry_tags WHERE name = ?", (name,))
+            else:
+                evicted_tags = sorted(tags | {ANY_TAG})
+                placeholders = ",".join("?" * len(evicted_tags))
+                keys = conn.execute(
+                    f"SELECT DISTINCT key FROM entry_tags WHERE name = ? AND tag IN ({placeholders})",
+                    (name, *evicted_tags),
+                ).fetchall()
+                conn.executemany(
+                    "DELETE FROM entries WHERE name = ? AND key = ?",
+                    ((name, key) for (key,) in keys),
+                )
+                conn.executemany(
+                    "DELETE FROM entry_tags WHERE name = ? AND key = ?",
+                    ((name, key) for (key,) in keys),
+                )
+            return generation
+
+        return self._transaction(_invalidate)
+
+    def invalidations_since(
+        self, name: str, generation: int
+    ) -> list[Invalidation] | None:
+        return self._history(self._connection(), name, generation)
+
+    def get(self, name: str, key: Hashable) -> tuple[Any, frozenset[str]]:
+        conn = self._connection()
+        db_key = self._key(key)
+        row = conn.execute(
+            "SELECT value FROM entries WHERE name = ? AND key = ? AND expires > ?",
+            (name, db_key, time.time()),
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        signature, data = row[0][:SIGNATURE_SIZE], row[0][SIGNATURE_SIZE:]
+        if not hmac.compare_digest(signature, self._sign(name, db_key, data)):
+            log.warning("Ignoring cache entry of '%s' with an invalid signature", name)
+            raise KeyError(key)
+        tags = conn.execute(
+            "SELECT tag FROM entry_tags WHERE name = ? AND key = ?", (name, db_key)
+        ).fetchall()
+        return pickle.loads(data), frozenset(tag for (tag,) in tags)
+
+    def set(
+        self,
+        name: str,
+        generation: int,
+        key: Hashable,
+        value: Any,
+        tags: frozenset[str],
+        ttl: float,
+    ) -> None:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as ex:
+            log.debug("Not sharing cache entry of '%s': %s", name, ex)
+            return
+
+        def _set(conn: sqlite3.Connection) -> None:
+            history = self._history(conn, name, generation)
+            if history is None or any(
+                invalidation is None or ANY_TAG in tags or invalidation & tags
+                for invalidation in history
+            ):
+                return
+            db_key = self._key(key)
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (name, key, expires, value) VALUES (?, ?, ?, ?)",
+                (
+                    name,
+                    db_key,
+                    time.time() + ttl,
+                    self._sign(name, db_key, data) + data,
+                ),
+            )
+            conn.execute(
+                "DELETE FROM entry_tags WHERE name = ? AND key = ?", (name, db_key)
+            )
+            conn.executemany(
+                "INSERT INTO entry_tags (name, key, tag) VALUES (?, ?, ?)",
+                ((name, db_key, tag) for tag in tags),
+            )
+
+        self._transaction(_set)
+
+
+@lru_cache(maxsize=1)
+def get_cache_backend() -> CacheBackend:
+    """Returns the process-wide cache backend selected by `settings.cache_backend`."""
+
+    if settings.cache_backend == "sqlite":
+        path = settings.cache_shared_path
+        ensure_private_directory(
+            os.path.dirname(os.path.abspath(path)) if path else "", "CACHE_SHARED_PATH"
+        )
+        secret = settings.cache_shared_secret.get_secret_value()
+        if not secret:
+            raise EnvironmentError("Failed because CACHE_SHARED_SECRET is not set.")
+        log.info("Using shared SQLite cache backend: %s", path)
+        return SqliteCacheBackend(path, secret.encode("utf-8"))
+    return LocalCacheBackend()
+
+
+class SbTTLCache(TTLCache):
+    """
+    `TTLCache` with a second-level `CacheBackend`, tag-based invalidation and hit/miss/eviction counters.
+
+    Local misses of lookups, `in` and `get` fall through to the backend, local writes are written through to it.
+    The invalidations recorded by any worker are applied to the local copy before each write and each backend read,
+    and before local hits at most every `sync_interval` seconds; invalidations made through this store apply at once.
+    The store is thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: float,
+        backend: CacheBackend | None = None,
+        sync_interval: float | None = None,
+    ):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.name = name
+        self.stats = CacheStats()
+        self.sync_interval = (
+            settings.cache_sync_interval if sync_interval is None else sync_interval
+        )
+        self._backend = backend
+        self._generation: int | None = None
+        self._synced_at = 0.0
+        self._keys_by_tag: dict[str, set[Hashable]] = collections.defaultdict(set)
+        self._tags_by_key: dict[Hashable, frozenset[str]] = {}
+        self._lock = threading.RLock()
+        self._thread_state = threading.local()
+
+    @property
+    def backend(self) -> CacheBackend:
+        if self._backend is None:
+            self._backend = get_cache_backend()
+        return self._backend
+
+    @property
+    def generation(self) -> int:
+        self._sync(force=True)
+        return self._generation  # type: ignore[return-value]
+
+    @property
+    def _internal(self) -> bool:
+        """Whether this thread is evicting entries, lookups then go to the local `TTLCache` only"""
+
+        return getattr(self._thread_state, "internal", False)
+
+    @contextlib.contextmanager
+    def _internal_scope(self):
+        internal = self._internal
+        self._thread_state.internal = True
+        try:
+            yield internal
+        finally:
+            self._thread_state.internal = internal
+
+    def _sync(self, force: bool = False) -> None:
+        if self._internal:
+            return
+        now = time.monotonic()
+        if (
+            not force
+            and self._generation is not None
+            and now - self._synced_at < self.sync_interval
+        ):
+            return
+        generation = self.backend.get_generation(self.name)
+
+        with self._lock:
+            self._synced_at = now
+            if self._generation is not None and generation <= self._generation:
+                # up to date, or another thread has applied a newer generation meanwhile
+                return
+            history = (
+                None
+                if self._generation is None
+                else self.backend.invalidations_since(self.name, self._generation)
+            )
+            if history is None or None in history:
+                self._evict_all()
+            else:
+                for tags in history:
+                    self._evict_tags(tags)  # type: ignore[arg-type]
+            self._generation = generation
+
+    @property
+    def _miss_generations(self) -> dict[Hashable, int]:
+        """Generation of the cache store at the last miss of each key in this thread, until the key is stored"""
+
+        generations = getattr(self._thread_state, "miss_generations", None)
+        if generations is None or len(generations) > self.maxsize:
+            # misses which were never followed by a write are forgotten eventually
+            generations = self._thread_state.miss_generations = {}
+        return generations
+
+    def _record_miss(self, key: Hashable, generation: int) -> None:
+        self._miss_generations.setdefault(key, generation)
+
+    def _invalidated_since(self, generation: int, tags: frozenset[str]) -> bool:
+        if generation == self._generation:
+            return False
+        history = self.backend.invalidations_since(self.name, generation)
+        return history is None or any(
+            invalidation is None or ANY_TAG in tags or invalidation & tags
+            for invalidation in history
+        )
+
+    def _index(self, key: Hashable, tags: frozenset[str]) -> None:
+        self._unindex(key)
+        self._tags_by_key[key] = tags
+        for tag in tags:
+            self._keys_by_tag[tag].add(key)
+        if len(self._tags_by_key) > 2 * self.maxsize:
+            # entries expired by `TTLCache.expire` don't go through `popitem`, drop them from the index
+            for stale_key in [
+                k for k in self._tags_by_key if not TTLCache.__contains__(self, k)
+            ]:
+                self._unindex(stale_key)
+
+    def _unindex(self, key: Hashable) -> None:
+        for tag in self._tags_by_key.pop(key, ()):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def _evict_all(self) -> None:
+        with self._lock, self._internal_scope():
+            evicted = self.currsize
+            # `TTLCache.clear` pops entries one by one through `__getitem__`, which must not sync nor count lookups
+            TTLCache.clear(self)
+            self._keys_by_tag.clear()
+            self._tags_by_key.clear()
+        self._count_evictions(evicted)
+
+    def _evict_tags(self, tags: frozenset[str]) -> None:
+        evicted = 0
+        with self._lock, self._internal_scope():
+            keys: set[Hashable] = set()
+            for tag in tags | {ANY_TAG}:
+                keys |= self._keys_by_tag.get(tag, set())
+            for key in keys:
+                self._unindex(key)
+                try:
+                    TTLCache.__delitem__(self, key)
+                    evicted += 1
+                except KeyError:
+                    pass
+        self._count_evictions(evicted)
+
+    def _count_evictions(self, evicted: int) -> None:
+        self.stats.evictions += evicted
+        if evicted and (metrics := get_request_metrics()):
+            metrics.cache_evictions += evicted
+
+    def _count_lookup(self, hit: bool) -> None:
+        metrics = get_request_metrics()
+        if hit:
+            self.stats.hits += 1
+            if metrics:
+                metrics.cache_hits += 1
+        else:
+            self.stats.misses += 1
+            if metrics:
+                metrics.cache_misses += 1
+
+    def _load(self, key: Hashable) -> Any:
+        """Reads a locally missing entry from the backend, raises `KeyError` and records the miss if it's missing there"""
+
+        # the backend is read anyway, check for invalidations along with it
+        self._sync(force=True)
+        generation = self._generation or 0
+        try:
+            value, tags = self.backend.get(self.name, key)
+        except KeyError:
+            self._record_miss(key, generation)
+            raise
+        with self._lock:
+            if self._invalidated_since(generation, tags):
+                # invalidated by another thread while it was being read
+                self._record_miss(key, generation)
+                raise KeyError(key)
+            TTLCache.__setitem__(self, key, value)
+            self._index(key, tags)
+        return value
+
+    def __getitem__(self, key, cache_getitem=TTLCache.__getitem__):
+        if self._internal:
+            return cache_getitem(self, key)
+        self._sync()
+        with self._lock, self._internal_scope():
+            try:
+                value = cache_getitem(self, key)
+            except KeyError:
+                pass
+            else:
+                self._count_lookup(hit=True)
+                return value
+        try:
+            value = self._load(key)
+        except KeyError:
+            self._count_lookup(hit=False)
+            raise
+        self._count_lookup(hit=True)
+        return value
+
+    def __contains__(self, key):
+        if self._internal:
+            return super().__contains__(key)
+        self._sync()
+        with self._lock:
+            if super().__contains__(key):
+                return True
+        try:
+            self._load(key)
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value, cache_setitem=TTLCache.__setitem__):
+        miss_generation = self._miss_generations.pop(key, None)
+        self._sync(force=True)
+        tags = cache_tags(value)
+        with self._lock:
+            generation = self._generation or 0
+            if miss_generation is not None:
+                if self._invalidated_since(miss_generation, tags):
+                    # loaded before a write which invalidated it, possibly stale
+                    log.debug("Not caching invalidated entry of '%s'", self.name)
+                    return
+                generation = miss_generation
+            cache_setitem(self, key, value)
+            self._index(key, tags)
+        self.backend.set(self.name, generation, key, value, tags, self.ttl)
+
+    def popitem(self):
+        with self._lock, self._internal_scope() as internal:
+            # `TTLCache.popitem` looks the evicted entry up through `__getitem__`
+            key, value = super().popitem()
+            self._unindex(key)
+        if not internal:
+            self._count_evictions(1)
+        return key, value
+
+    def invalidate(self, uids: Iterable[str]) -> None:
+        """Evicts the entries of the given aggregates, their dependents and all `ANY_TAG` entries from all workers."""
+
+        tags = frozenset(uids)
+        log.debug("Invalidate cache '%s' for uids: %s", self.name, sorted(tags))
+        self.stats.invalidations += 1
+        self.backend.invalidate(self.name, tags)
+        self._sync(force=True)
+
+    def clear(self):
+        self.stats.invalidations += 1
+        self.backend.invalidate(self.name, None)
+        self._sync(force=True)
+
+
+def create_cache(
+    name: str,
+    maxsize: int | None = None,
+    ttl: float | None = None,
+    shared: bool = True,
+) -> SbTTLCache:
+    """
+    Creates a repository cache store.
+
+    Args:
+        name (str): Unique name of the store, shared by all workers, e.g. `ProjectRepository.cache_store_item_by_uid`.
+        maxsize (int | None): Maximum number of local entries, defaults to `settings.cache_max_size`.
+        ttl (float | None): Time to live of entries in seconds, defaults to `settings.cache_ttl`.
+        shared (bool): Whether entries are written to the configured backend and shared by all workers.
+            Stores of large values which are cheap to miss keep them in the process only.
+    """
+
+    return SbTTLCache(
+        name=name,
+        maxsize=settings.cache_max_size if maxsize is None else maxsize,
+        ttl=settings.cache_ttl if ttl is None else ttl,
+        backend=None if shared else LocalCacheBackend(),
+    )
@@ -0,0 +1,123 @@
+"""Conditional GET (ETag / If-None-Match) of resources with a cheap change token"""
+
+import hashlib
+import logging
+import re
+from typing import Awaitable, Callable, Iterable
+
+from fastapi import Request, Response, status
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+log = logging.getLogger(__name__)
+
+# Returns the change token of a resource, `None` if it doesn't exist
+ChangeTokenGetter = Callable[[str, str | None], str | None]
+
+
+class ConditionalGetMiddleware:
+    """
+    Answers GET requests of resources which only change when their change token changes, without running the route.
+
+    `paths` are regular expressions of the request paths, with a `uid` group for the resource.
+    The change token of the resource is fetched with `get_change_token(uid, version)`, where version is the value of the
+    `version_param` query parameter. The strong ETag of a response hashes the change token with the path, the query
+    and whether the client accepts gzip, so each representation has its own ETag.
+
+    - A request with a matching `If-None-Match` header is answered with `304 Not Modified`, once `authorize(request)`
+      confirmed the client may read the resource. The route, and with it the service layer, doesn't run.
+    - Otherwise the route runs, and a 200 response gets the ETag.
+    Clients revalidate responses on every use, as the change token is cheaper to get than the resource.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        get_change_token: ChangeTokenGetter,
+        authorize: Callable[[Request], Awaitable[bool]],
+        version_param: str = "study_value_version",
+        salt: str = "",
+    ) -> None:
+        self.app = app
+        self.paths = [re.compile(path) for path in paths]
+        self.get_change_token = get_change_token
+        self.authorize = authorize
+        self.version_param = version_param
+        self.salt = salt
+
+    def _match_uid(self, path: str) -> str | None:
+        for pattern in self.paths:
+            if match := pattern.fullmatch(path):
+                return match.group("uid")
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or (uid := self._match_uid(scope["path"])) is None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        token = await run_in_threadpool(
+            self.get_change_token, uid, request.query_params.get(self.version_param)
+        )
+        if token is None:
+            # unknown resource, the route answers
+            await self.app(scope, receive, send)
+            return
+
+        etag = self._etag(request, token)
+        cache_control = "private, no-cache"
+
+        if _etag_matches(
+            request.headers.get("If-None-Match"), etag
+        ) and await self.authorize(request):
+            response = Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": cache_control},
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] == status.HTTP_200_OK
+            ):
+                headers = MutableHeaders(scope=message)
+                if "ETag" not in headers:
+                    headers["ETag"] = etag
+                    headers["Cache-Control"] = cache_control
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+    def _etag(self, request: Request, token: str) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            self.salt,
+            token,
+            request.url.path,
+            # same query in any order, same representation
+            "&".join(sorted(request.url.query.split("&"))),
+            "gzip" in request.headers.get("Accept-Encoding", ""),
+        ):
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+        return f'"{digest.hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """`If-None-Match` uses the weak comparison: `W/` prefixes are ignored"""
+
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
@@ -71,6 +71,73 @@ class Settings(BaseSettings):
     # Cache Configuration
     cache_max_size: int = 1000
     cache_ttl: int = 3600
+    cache_backend: str = Field(
+        default="local",
+        pattern="^(local|sqlite)$",
+        description="Repository cache backend: 'local' (per-process) or 'sqlite' (shared by all workers on the host)",
+    )
+    cache_shared_path: str = Field(
+        default="",
+        description="Path of the SQLite file used by the 'sqlite' cache backend, required by it, "
+        "in a directory only accessible to the user running the API",
+    )
+    cache_shared_secret: SecretStr = Field(
+        default=SecretStr(""),
+        description="Key signing the entries of the 'sqlite' cache backend, required by it",
+    )
+    cache_sync_interval: float = Field(
+        default=0.1,
+        description="Seconds local cache hits may be served without checking for invalidations made by other workers",
+    )
+    odm_pdf_cache_max_size: int = Field(
+        default=50,
+        description="Number of rendered ODM PDF exports kept in the cache, keyed by the content of the exported document, 0 disables it",
+    )
+    artifact_store_path: str = Field(
+        default="",
+        description="Private directory of the documents rendered for locked study versions, they aren't stored if not set",
+    )
+    artifact_store_max_age: int = Field(
+        default=30 * 86400,
+        description="Seconds after the last use after which documents are deleted from the artifact store",
+    )
+    artifact_store_gc_interval: int = Field(
+        default=3600,
+        description="Seconds between garbage collections of the artifact store",
+    )
+    artifact_prerender_max_workers: int = Field(
+        default=1,
+        description="Number of background threads rendering the documents of newly locked study versions, 0 disables pre-rendering",
+    )
+    job_queue_backend: str = Field(
+        default="neo4j",
+        pattern="^(neo4j|sqlite|local)$",
+        description="Background job queue, which also keeps the job results: 'neo4j' (shared by all workers),"
+        " 'sqlite' (shared by all workers on the host)"
+        " or 'local' (per-process, single worker only)",
+    )
+    job_queue_path: str = Field(
+        default="",
+        description="Path of the SQLite file used by the 'sqlite' job queue, in a private directory",
+    )
+    job_max_workers: int = Field(
+        default=4, description="Number of background jobs running at once per worker"
+    )
+    job_max_concurrency: dict[str, int] = Field(
+        default={},
+        description="Number of jobs of a type running at once per worker by job type, overrides the default of the type",
+    )
+    job_retention: int = Field(
+        default=86400,
+        description="Seconds after which finished background jobs and their results are deleted",
+    )
+    job_poll_interval: float = Field(
+        default=2.0, description="Seconds between two checks of the job queue"
+    )
+    job_heartbeat_timeout: int = Field(
+        default=300,
+        description="Seconds without heartbeat after which a running job is considered interrupted and failed",
+    )
 
     # Security & CORS
     allow_origin_regex: str | None = None
@@ -96,9 +163,18 @@ class Settings(BaseSettings):
     max_page_size: int = 1000
     page_size_100: int = 100
     consumer_api_audit_trail_max_rows: int = 10000
+    consumer_api_change_feed_settle_time: int = Field(
+        default=300,
+        description="Seconds after which study changes are returned by the change feed, "
+        "longer than any transaction writing study changes",
+    )
 
     # Performance
     slow_query_duration: int = 1
+    fetch_executor_max_workers: int = Field(
+        default=16,
+        description="Number of threads shared by all requests for running independent database reads in parallel",
+    )
 
     # Tracing & Monitoring
     uvicorn_log_config: str = ""
@@ -156,6 +232,12 @@ class Settings(BaseSettings):
         default=5, ge=0, le=9, description="gzip compression level (0 to 9)"
     )
 
+    # Conditional GET of study-scoped resources (ETag / If-None-Match)
+    study_etag_enabled: bool = Field(
+        default=True,
+        description="Answer GET requests of study-scoped resources with ETags, and with 304 Not Modified if the study didn't change",
+    )
+
     # endregion
 
     # region non-.env variables
@@ -0,0 +1,127 @@
+"""Application-wide thread pool for running independent database reads in parallel"""
+
+import dataclasses
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from opencensus.common.runtime_context import RuntimeContext
+
+from common.config import settings
+from common.telemetry.request_metrics import get_request_metrics
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class FetchExecutorStats:
+    submitted: int = 0
+    completed: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    wait_time: float = 0
+    max_wait_time: float = 0
+
+
+class FetchExecutor:
+    """
+    Bounded thread pool shared by all requests, for services fanning out independent Cypher reads.
+
+    Tasks run with the tracing context of the submitting thread.
+    Queue depth (tasks waiting for a worker) and wait times are counted in `stats` and in the request metrics.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.stats = FetchExecutorStats()
+        self._lock = threading.Lock()
+        self._worker = threading.local()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="fetch",
+            initializer=self._init_worker,
+        )
+
+    def _init_worker(self) -> None:
+        self._worker.active = True
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        if getattr(self._worker, "active", False):
+            # A task fanning out again could wait for the worker it occupies, run it in place
+            future: Future[T] = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+            return future
+
+        metrics = get_request_metrics()
+        task = RuntimeContext.with_current_context(fn)
+        submitted_at = time.perf_counter()
+
+        with self._lock:
+            self.stats.submitted += 1
+            self.stats.queue_depth += 1
+            queue_depth = self.stats.queue_depth
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, queue_depth)
+        if metrics:
+            metrics.fetch_count += 1
+            metrics.fetch_queue_depth = max(metrics.fetch_queue_depth, queue_depth)
+
+        def run() -> T:
+            wait_time = time.perf_counter() - submitted_at
+            with self._lock:
+                self.stats.queue_depth -= 1
+                self.stats.wait_time += wait_time
+                self.stats.max_wait_time = max(self.stats.max_wait_time, wait_time)
+                if metrics:
+                    metrics.fetch_wait_time += wait_time
+            try:
+                return task(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.stats.completed += 1
+
+        return self._executor.submit(run)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_fetch_executor: FetchExecutor | None = None
+_fetch_executor_lock = threading.Lock()
+
+
+def start_fetch_executor(max_workers: int | None = None) -> FetchExecutor:
+    """Creates the application-wide fetch executor, called from the application lifespan"""
+
+    global _fetch_executor  # pylint: disable=global-statement
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = FetchExecutor(
+                max_workers or settings.fetch_executor_max_workers
+            )
+            log.info(
+                "Started fetch executor with %d workers", _fetch_executor.max_workers
+            )
+        return _fetch_executor
+
+
+def shutdown_fetch_executor() -> None:
+    """Waits for running tasks and shuts the application-wide fetch executor down"""
+
+    global _fetch_executor  # pylint: disable=global-statement
+    with _fetch_executor_lock:
+        executor, _fetch_executor = _fetch_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def get_fetch_executor() -> FetchExecutor:
+    """Returns the application-wide fetch executor, starting it if needed (e.g. in scripts and tests)"""
+
+    return _fetch_executor or start_fetch_executor()
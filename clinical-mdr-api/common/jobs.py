@@ -0,0 +1,832 @@
+"""
+Background jobs for long-running operations.
+
+A client submits a job of a registered `JobType` with its parameters and gets the job id back right away.
+It then polls the status and progress of the job, and downloads the result once the job succeeded.
+Jobs run on a local worker pool (`JobRunner`), not in the thread of the HTTP request.
+
+Jobs are kept in a pluggable `JobQueue`:
+    - `Neo4jJobQueue` (default, `JOB_QUEUE_BACKEND=neo4j`) keeps jobs as `BackgroundJob` nodes in the database.
+      All workers on all hosts share it, a job submitted to one worker can run on another, and queued jobs survive
+      a restart. Results are `BackgroundJobResult` nodes, so any worker can return them.
+    - `SqliteJobQueue` (`JOB_QUEUE_BACKEND=sqlite`) keeps jobs in an SQLite file (`JOB_QUEUE_PATH`), shared by the
+      workers of one host.
+    - `MemoryJobQueue` (`JOB_QUEUE_BACKEND=local`) keeps jobs in the memory of the process, only for a single worker.
+Results are stored in the queue next to their job and are deleted with it after `JOB_RETENTION` seconds. Jobs run with the current roles of the user who submitted them.
+
+Each worker runs at most `JOB_MAX_WORKERS` jobs at once, and at most `max_concurrency` jobs of the same type,
+so a burst of heavy exports can't take all threads.
+
+Jobs report progress and check for cancellation through their `JobContext`. Cancelling a queued job drops it,
+a running job stops at its next progress report. Jobs of types which aren't `cancellable`, e.g. jobs committing
+changes to the database, can only be cancelled before they start. A job whose worker stopped meanwhile stops sending
+heartbeats, and is failed once its last heartbeat is older than `JOB_HEARTBEAT_TIMEOUT` seconds.
+"""
+
+import abc
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, ContextManager, Iterable, Mapping
+
+from neo4j import ManagedTransaction
+from neomodel import config as neomodel_config
+from pydantic import BaseModel
+
+from common.config import settings
+from common.exceptions import ValidationException
+from common.utils import ensure_private_directory
+
+log = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclasses.dataclass
+class Job:
+    uid: str
+    type: str
+    parameters: dict[str, Any]
+    owner: dict[str, Any]
+    """The user who submitted the job, the job runs on their behalf"""
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0
+    message: str | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    submitted_at: float = dataclasses.field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    heartbeat_at: float | None = None
+    worker: str | None = None
+    result_media_type: str | None = None
+    result_filename: str | None = None
+    result_size: int | None = None
+
+    def to_json(self) -> str:
+        return json.dumps(dataclasses.asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> "Job":
+        job = cls(**json.loads(data))
+        job.status = JobStatus(job.status)
+        return job
+
+
+@dataclasses.dataclass(frozen=True)
+class JobResult:
+    content: bytes
+    media_type: str
+    filename: str
+
+
+class JobCancelledException(Exception):
+    """Raised in a running job when its cancellation was requested"""
+
+
+class JobContext:
+    """Passed to a running job: its validated parameters, progress reporting and cancellation checks"""
+
+    def __init__(
+        self, queue: "JobQueue", job: Job, parameters: Any, cancellable: bool = True
+    ):
+        self.queue = queue
+        self.job = job
+        self.parameters = parameters
+        self.cancellable = cancellable
+
+    def raise_if_cancelled(self) -> None:
+        if not self.cancellable:
+            return
+        job = self.queue.get(self.job.uid)
+        if job is None or job.cancel_requested:
+            raise JobCancelledException(self.job.uid)
+
+    def report_progress(self, progress: float, message: str | None = None) -> None:
+        """Records the progress (0 to 1) of the job, raises `JobCancelledException` if the job got cancelled"""
+
+        self.raise_if_cancelled()
+
+        def _update(job: Job) -> None:
+            job.progress = min(max(progress, 0), 1)
+            job.message = message
+            job.heartbeat_at = time.time()
+
+        self.queue.modify(self.job.uid, _update)
+
+
+@dataclasses.dataclass(frozen=True)
+class JobType:
+    name: str
+    run: Callable[[JobContext], JobResult]
+    parameters_model: type[BaseModel] | None = None
+    roles: frozenset[str] = frozenset()
+    """Roles of which the submitting user needs at least one"""
+    max_concurrency: int = 1
+    """Number of jobs of this type running at once on a worker, `JOB_MAX_CONCURRENCY` overrides it"""
+    cancellable: bool = True
+    """Whether a running job of this type may be cancelled, jobs with side effects can only be cancelled while queued"""
+    description: str = ""
+
+    def validate_parameters(self, parameters: Mapping[str, Any]) -> Any:
+        if self.parameters_model is None:
+            ValidationException.raise_if(
+                parameters, msg=f"Job type '{self.name}' takes no parameters."
+            )
+            return None
+        return self.parameters_model(**parameters)
+
+
+class JobQueue(abc.ABC):
+    """Storage of jobs, shared by the API and the job runners"""
+
+    @abc.abstractmethod
+    def add(self, job: Job) -> None:
+        """Stores a new job"""
+
+    @abc.abstractmethod
+    def get(self, uid: str) -> Job | None:
+        """Returns a job, `None` if it doesn't exist"""
+
+    @abc.abstractmethod
+    def find(self, owner_id: str | None = None) -> list[Job]:
+        """Returns all jobs, or the jobs submitted by the user with `owner_id`, newest first"""
+
+    @abc.abstractmethod
+    def modify(self, uid: str, update: Callable[[Job], None]) -> Job | None:
+        """Applies `update` to a job atomically, returns the updated job, `None` if it doesn't exist"""
+
+    @abc.abstractmethod
+    def claim(self, types: Iterable[str], worker: str) -> Job | None:
+        """Atomically takes the oldest queued job of one of the `types` and marks it as running on `worker`"""
+
+    @abc.abstractmethod
+    def remove(self, uids: Iterable[str]) -> None:
+        """Deletes jobs with their results"""
+
+    @abc.abstractmethod
+    def set_result(self, uid: str, content: bytes) -> None:
+        """Stores the result of a job"""
+
+    @abc.abstractmethod
+    def get_result(self, uid: str) -> bytes | None:
+        """Returns the result of a job, `None` if it has none"""
+
+    def request_cancel(self, uid: str, cancel_running: bool = True) -> Job | None:
+        """
+        Cancels a queued job, or asks a running job to stop unless `cancel_running` is False, returns the updated job
+        """
+
+        def _cancel(job: Job) -> None:
+            if job.status == JobStatus.QUEUED:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = time.time()
+            elif job.status == JobStatus.RUNNING and cancel_running:
+                job.cancel_requested = True
+
+        return self.modify(uid, _cancel)
+
+    def heartbeat(self, uids: Iterable[str]) -> None:
+        now = time.time()
+        for uid in uids:
+            self.modify(uid, lambda job: setattr(job, "heartbeat_at", now))
+
+    def fail_stale(self, heartbeat_before: float) -> list[str]:
+        """Fails running jobs with no heartbeat since `heartbeat_before`, their worker stopped while running them"""
+
+        failed = []
+
+        def _fail(job: Job) -> None:
+            if _fail_if_stale(job, heartbeat_before):
+                failed.append(job.uid)
+
+        for job in self.find():
+            if job.status == JobStatus.RUNNING:
+                self.modify(job.uid, _fail)
+        return failed
+
+    def expired(self, finished_before: float) -> list[str]:
+        """Returns the uids of the jobs finished before `finished_before`"""
+
+        return [
+            job.uid
+            for job in self.find()
+            if job.status.is_finished and (job.finished_at or 0) < finished_before
+        ]
+
+
+class MemoryJobQueue(JobQueue):
+    """In-process only: jobs are lost on restart and run on the worker they were submitted to"""
+
+    def __init__(self):
+        self._jobs: dict[str, str] = {}
+        self._results: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def add(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.uid] = job.to_json()
+
+    def get(self, uid: str) -> Job | None:
+        with self._lock:
+            data = self._jobs.get(uid)
+        return None if data is None else Job.from_json(data)
+
+    def find(self, owner_id: str | None = None) -> list[Job]:
+        with self._lock:
+            jobs = [Job.from_json(data) for data in self._jobs.values()]
+        return sorted(
+            (job for job in jobs if owner_id is None or job.owner["id"] == owner_id),
+            key=lambda job: -job.submitted_at,
+        )
+
+    def modify(self, uid: str, update: Callable[[Job], None]) -> Job | None:
+        with self._lock:
+            if (data := self._jobs.get(uid)) is None:
+                return None
+            job = Job.from_json(data)
+            update(job)
+            self._jobs[uid] = job.to_json()
+            return job
+
+    def claim(self, types: Iterable[str], worker: str) -> Job | None:
+        types = set(types)
+        with self._lock:
+            queued = [
+                job
+                for job in map(Job.from_json, self._jobs.values())
+                if job.status == JobStatus.QUEUED and job.type in types
+            ]
+            if not queued:
+                return None
+            job = min(queued, key=lambda job: job.submitted_at)
+            _mark_running(job, worker)
+            self._jobs[job.uid] = job.to_json()
+            return job
+
+    def remove(self, uids: Iterable[str]) -> None:
+        with self._lock:
+            for uid in uids:
+                self._jobs.pop(uid, None)
+                self._results.pop(uid, None)
+
+    def set_result(self, uid: str, content: bytes) -> None:
+        with self._lock:
+            self._results[uid] = content
+
+    def get_result(self, uid: str) -> bytes | None:
+        with self._lock:
+            return self._results.get(uid)
+
+
+class SqliteJobQueue(JobQueue):
+    """Host-wide job queue backed by an SQLite file, shared by all API workers pointed to the same file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._connection().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                uid TEXT PRIMARY KEY, type TEXT NOT NULL, status TEXT NOT NULL, owner_id TEXT,
+                submitted_at REAL NOT NULL, data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, submitted_at);
+            CREATE TABLE IF NOT EXISTS results (uid TEXT PRIMARY KEY, content BLOB NOT NULL);
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self, function, *args):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = function(conn, *args)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    @staticmethod
+    def _save(conn: sqlite3.Connection, job: Job) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO jobs (uid, type, status, owner_id, submitted_at, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                job.uid,
+                job.type,
+                job.status.value,
+                job.owner.get("id"),
+                job.submitted_at,
+                job.to_json(),
+            ),
+        )
+
+    def add(self, job: Job) -> None:
+        self._transaction(self._save, job)
+
+    def get(self, uid: str) -> Job | None:
+        row = (
+            self._connection()
+            .execute("SELECT data FROM jobs WHERE uid = ?", (uid,))
+            .fetchone()
+        )
+        return None if row is None else Job.from_json(row[0])
+
+    def find(self, owner_id: str | None = None) -> list[Job]:
+        if owner_id is None:
+            rows = self._connection().execute(
+                "SELECT data FROM jobs ORDER BY submitted_at DESC"
+            )
+        else:
+            rows = self._connection().execute(
+                "SELECT data FROM jobs WHERE owner_id = ? ORDER BY submitted_at DESC",
+                (owner_id,),
+            )
+        return [Job.from_json(data) for (data,) in rows.fetchall()]
+
+    def modify(self, uid: str, update: Callable[[Job], None]) -> Job | None:
+        def _modify(conn: sqlite3.Connection) -> Job | None:
+            row = conn.execute("SELECT data FROM jobs WHERE uid = ?", (uid,)).fetchone()
+            if row is None:
+                return None
+            job = Job.from_json(row[0])
+            update(job)
+            self._save(conn, job)
+            return job
+
+        return self._transaction(_modify)
+
+    def claim(self, types: Iterable[str], worker: str) -> Job | None:
+        types = sorted(types)
+        if not types:
+            return None
+
+        def _claim(conn: sqlite3.Connection) -> Job | None:
+            placeholders = ",".join("?" * len(types))
+            row = conn.execute(
+                f"SELECT data FROM jobs WHERE status = ? AND type IN ({placeholders}) ORDER BY submitted_at LIMIT 1",
+                (JobStatus.QUEUED.value, *types),
+            ).fetchone()
+            if row is None:
+                return None
+            job = Job.from_json(row[0])
+            _mark_running(job, worker)
+            self._save(conn, job)
+            return job
+
+        return self._transaction(_claim)
+
+    def remove(self, uids: Iterable[str]) -> None:
+        def _remove(conn: sqlite3.Connection, uids: list[tuple[str]]) -> None:
+            conn.executemany("DELETE FROM jobs WHERE uid = ?", uids)
+            conn.executemany("DELETE FROM results WHERE uid = ?", uids)
+
+        self._transaction(_remove, [(uid,) for uid in uids])
+
+    def set_result(self, uid: str, content: bytes) -> None:
+        self._transaction(
+            lambda conn: conn.execute(
+                "INSERT OR REPLACE INTO results (uid, content) VALUES (?, ?)",
+                (uid, content),
+            )
+        )
+
+    def get_result(self, uid: str) -> bytes | None:
+        row = (
+            self._connection()
+            .execute("SELECT content FROM results WHERE uid = ?", (uid,))
+            .fetchone()
+        )
+        return None if row is None else row[0]
+
+
+class Neo4jJobQueue(JobQueue):
+    """
+    Job queue of `BackgroundJob` nodes, shared by all API workers connected to the database
+
+    Queue operations run in their own sessions, so progress reports of a job commit right away,
+    even while the job itself is in a transaction. Results are kept in separate `BackgroundJobResult` nodes,
+    listing and polling jobs doesn't load them.
+    """
+
+    def _execute(self, function: Callable[..., Any], *args, write: bool = True) -> Any:
+        with neomodel_config.DRIVER.session(
+            database=neomodel_config.DATABASE_NAME
+        ) as session:
+            if write:
+                return session.execute_write(function, *args)
+            return session.execute_read(function, *args)
+
+    @staticmethod
+    def _save(tx: ManagedTransaction, job: Job) -> None:
+        tx.run(
+            """
+            MERGE (j:BackgroundJob {uid: $uid})
+            SET j.type = $type, j.status = $status, j.owner_id = $owner_id, j.submitted_at = $submitted_at,
+                j.heartbeat_at = $heartbeat_at, j.finished_at = $finished_at, j.data = $data
+            REMOVE j.locked
+            """,
+            uid=job.uid,
+            type=job.type,
+            status=job.status.value,
+            owner_id=job.owner.get("id"),
+            submitted_at=job.submitted_at,
+            heartbeat_at=job.heartbeat_at,
+            finished_at=job.finished_at,
+            data=job.to_json(),
+        ).consume()
+
+    @staticmethod
+    def _lock(tx: ManagedTransaction, uid: str) -> Job | None:
+        # setting a property takes the write lock of the node, the data read afterwards is the latest committed
+        record = tx.run(
+            "MATCH (j:BackgroundJob {uid: $uid}) SET j.locked = true RETURN j.data AS data",
+            uid=uid,
+        ).single()
+        return None if record is None else Job.from_json(record["data"])
+
+    def add(self, job: Job) -> None:
+        self._execute(self._save, job)
+
+    def get(self, uid: str) -> Job | None:
+        def _get(tx: ManagedTransaction) -> Job | None:
+            record = tx.run(
+                "MATCH (j:BackgroundJob {uid: $uid}) RETURN j.data AS data", uid=uid
+            ).single()
+            return None if record is None else Job.from_json(record["data"])
+
+        return self._execute(_get, write=False)
+
+    def find(self, owner_id: str | None = None) -> list[Job]:
+        def _find(tx: ManagedTransaction) -> list[Job]:
+            result = tx.run(
+                """
+                MATCH (j:BackgroundJob)
+                WHERE $owner_id IS NULL OR j.owner_id = $owner_id
+                RETURN j.data AS data
+                ORDER BY j.submitted_at DESC
+                """,
+                owner_id=owner_id,
+            )
+            return [Job.from_json(record["data"]) for record in result]
+
+        return self._execute(_find, write=False)
+
+    def modify(self, uid: str, update: Callable[[Job], None]) -> Job | None:
+        def _modify(tx: ManagedTransaction) -> Job | None:
+            if (job := self._lock(tx, uid)) is None:
+                return None
+            update(job)
+            self._save(tx, job)
+            return job
+
+        return self._execute(_modify)
+
+    def claim(self, types: Iterable[str], worker: str) -> Job | None:
+        types = sorted(types)
+        if not types:
+            return None
+
+        def _claim(tx: ManagedTransaction) -> tuple[bool, Job | None]:
+            record = tx.run(
+                """
+                MATCH (j:BackgroundJob)
+                WHERE j.status = $status AND j.type IN $types
+                WITH j ORDER BY j.submitted_at LIMIT 1
+                RETURN j.uid AS uid
+                """,
+                status=JobStatus.QUEUED.value,
+                types=types,
+            ).single()
+            if record is None:
+                return False, None
+            job = self._lock(tx, record["uid"])
+            if job is None or job.status != JobStatus.QUEUED:
+                return True, None
+            _mark_running(job, worker)
+            self._save(tx, job)
+            return True, job
+
+        while True:
+            found, job = self._execute(_claim)
+            # another worker claimed or cancelled the job before we got its lock, look for the next one
+            if job is not None or not found:
+                return job
+
+    def remove(self, uids: Iterable[str]) -> None:
+        self._execute(
+            lambda tx, uids: tx.run(
+                """
+                MATCH (j:BackgroundJob) WHERE j.uid IN $uids
+                OPTIONAL MATCH (j)-[:HAS_RESULT]->(r:BackgroundJobResult)
+                DETACH DELETE j, r
+                """,
+                uids=uids,
+            ).consume(),
+            list(uids),
+        )
+
+    def set_result(self, uid: str, content: bytes) -> None:
+        self._execute(
+            lambda tx: tx.run(
+                """
+                MATCH (j:BackgroundJob {uid: $uid})
+                MERGE (j)-[:HAS_RESULT]->(r:BackgroundJobResult)
+                SET r.content = $content
+                """,
+                uid=uid,
+                content=content,
+            ).consume()
+        )
+
+    def get_result(self, uid: str) -> bytes | None:
+        def _get_result(tx: ManagedTransaction) -> bytes | None:
+            record = tx.run(
+                """
+                MATCH (:BackgroundJob {uid: $uid})-[:HAS_RESULT]->(r:BackgroundJobResult)
+                RETURN r.content AS content
+                """,
+                uid=uid,
+            ).single()
+            return None if record is None else bytes(record["content"])
+
+        return self._execute(_get_result, write=False)
+
+    def fail_stale(self, heartbeat_before: float) -> list[str]:
+        def _fail_stale(tx: ManagedTransaction) -> list[str]:
+            result = tx.run(
+                """
+                MATCH (j:BackgroundJob)
+                WHERE j.status = $status AND coalesce(j.heartbeat_at, 0) < $heartbeat_before
+                SET j.locked = true
+                RETURN j.data AS data
+                """,
+                status=JobStatus.RUNNING.value,
+                heartbeat_before=heartbeat_before,
+            )
+            # the jobs are locked, but a heartbeat may have committed before the lock was taken
+            jobs = [Job.from_json(record["data"]) for record in result]
+            failed = []
+            for job in jobs:
+                if _fail_if_stale(job, heartbeat_before):
+                    failed.append(job.uid)
+                self._save(tx, job)
+            return failed
+
+        return self._execute(_fail_stale)
+
+    def expired(self, finished_before: float) -> list[str]:
+        def _expired(tx: ManagedTransaction) -> list[str]:
+            result = tx.run(
+                """
+                MATCH (j:BackgroundJob)
+                WHERE j.status IN $statuses AND j.finished_at < $finished_before
+                RETURN j.uid AS uid
+                """,
+                statuses=[status.value for status in JobStatus if status.is_finished],
+                finished_before=finished_before,
+            )
+            return [record["uid"] for record in result]
+
+        return self._execute(_expired, write=False)
+
+
+def _mark_running(job: Job, worker: str) -> None:
+    job.status = JobStatus.RUNNING
+    job.worker = worker
+    job.started_at = job.heartbeat_at = time.time()
+
+
+def _fail_if_stale(job: Job, heartbeat_before: float) -> bool:
+    """Fails a running job with no heartbeat since `heartbeat_before`, returns whether it did"""
+
+    if job.status != JobStatus.RUNNING or (job.heartbeat_at or 0) >= heartbeat_before:
+        return False
+    job.status = JobStatus.FAILED
+    job.error = "The job was interrupted."
+    job.finished_at = time.time()
+    return True
+
+
+class JobRunner:
+    """
+    Runs queued jobs on a bounded thread pool, with a concurrency limit per job type.
+
+    A dispatcher thread claims jobs when threads are free, sends heartbeats for the running jobs,
+    fails stale jobs of stopped workers and deletes expired jobs.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        job_types: Mapping[str, JobType],
+        max_workers: int,
+        max_concurrency: Mapping[str, int] | None = None,
+        run_as: Callable[[Job], ContextManager] | None = None,
+    ):
+        self.queue = queue
+        self.job_types = dict(job_types)
+        self.max_workers = max_workers
+        self.max_concurrency = {
+            name: (max_concurrency or {}).get(name, job_type.max_concurrency)
+            for name, job_type in self.job_types.items()
+        }
+        self.run_as = run_as or (lambda job: contextlib.nullcontext())
+        self.worker = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._running: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job"
+        )
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="job-dispatcher", daemon=True
+        )
+        self._dispatcher.start()
+
+    def wake(self) -> None:
+        """Looks for queued jobs right away, e.g. after a job was submitted"""
+
+        self._wakeup.set()
+
+    def running_counts(self) -> dict[str, int]:
+        with self._lock:
+            counts = dict.fromkeys(self.job_types, 0)
+            for job_type in self._running.values():
+                counts[job_type] += 1
+            return counts
+
+    def _dispatch_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self._maintain()
+                self._dispatch()
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("Job dispatcher failed")
+            self._wakeup.wait(settings.job_poll_interval)
+            self._wakeup.clear()
+
+    def _maintain(self) -> None:
+        with self._lock:
+            running = list(self._running)
+        self.queue.heartbeat(running)
+        now = time.time()
+        for uid in self.queue.fail_stale(now - settings.job_heartbeat_timeout):
+            log.warning("Job %s was interrupted", uid)
+        if expired := self.queue.expired(now - settings.job_retention):
+            self.queue.remove(expired)
+
+    def _dispatch(self) -> None:
+        while not self._stopping.is_set():
+            counts = self.running_counts()
+            if sum(counts.values()) >= self.max_workers:
+                return
+            types = [
+                name
+                for name, count in counts.items()
+                if count < self.max_concurrency[name]
+            ]
+            if not types or (job := self.queue.claim(types, self.worker)) is None:
+                return
+            with self._lock:
+                self._running[job.uid] = job.type
+            self._executor.submit(self._run, job)
+
+    def _run(self, job: Job) -> None:
+        job_type = self.job_types[job.type]
+        log.info("Running job %s of type %s", job.uid, job.type)
+        try:
+            with self.run_as(job):
+                context = JobContext(
+                    self.queue,
+                    job,
+                    job_type.validate_parameters(job.parameters),
+                    cancellable=job_type.cancellable,
+                )
+                result = job_type.run(context)
+            # a job which finished isn't cancelled anymore, its changes are committed
+            self.queue.set_result(job.uid, result.content)
+
+            def _succeed(job: Job) -> None:
+                job.status = JobStatus.SUCCEEDED
+                job.progress = 1
+                job.result_media_type = result.media_type
+                job.result_filename = result.filename
+                job.result_size = len(result.content)
+
+            self._finish(job.uid, _succeed)
+        except JobCancelledException:
+            log.info("Job %s was cancelled", job.uid)
+            self._finish(
+                job.uid, lambda job: setattr(job, "status", JobStatus.CANCELLED)
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.exception("Job %s failed", job.uid)
+
+            def _fail(job: Job) -> None:
+                job.status = JobStatus.FAILED
+                job.error = getattr(exc, "msg", None) or str(exc) or type(exc).__name__
+
+            self._finish(job.uid, _fail)
+        finally:
+            with self._lock:
+                self._running.pop(job.uid, None)
+            self.wake()
+
+    def _finish(self, uid: str, update: Callable[[Job], None]) -> None:
+        def _update(job: Job) -> None:
+            update(job)
+            job.finished_at = time.time()
+
+        self.queue.modify(uid, _update)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops claiming jobs, running jobs finish unless `wait` is False"""
+
+        self._stopping.set()
+        self._wakeup.set()
+        self._dispatcher.join()
+        self._executor.shutdown(wait=wait)
+
+
+def create_job_queue() -> JobQueue:
+    """Creates the job queue selected by `settings.job_queue_backend`"""
+
+    if settings.job_queue_backend == "sqlite":
+        path = settings.job_queue_path
+        ensure_private_directory(
+            os.path.dirname(os.path.abspath(path)) if path else "", "JOB_QUEUE_PATH"
+        )
+        log.info("Using shared SQLite job queue: %s", path)
+        return SqliteJobQueue(path)
+    if settings.job_queue_backend == "local":
+        log.warning("Using in-process job queue, jobs aren't shared between workers")
+        return MemoryJobQueue()
+    return Neo4jJobQueue()
+
+
+_job_runner: JobRunner | None = None
+_job_runner_lock = threading.Lock()
+
+
+def start_job_runner(
+    job_types: Mapping[str, JobType],
+    run_as: Callable[[Job], ContextManager] | None = None,
+) -> JobRunner:
+    """Creates the application-wide job runner, called from the application lifespan"""
+
+    global _job_runner  # pylint: disable=global-statement
+    with _job_runner_lock:
+        if _job_runner is None:
+            _job_runner = JobRunner(
+                queue=create_job_queue(),
+                job_types=job_types,
+                max_workers=settings.job_max_workers,
+                max_concurrency=settings.job_max_concurrency,
+                run_as=run_as,
+            )
+            log.info(
+                "Started job runner %s with %d workers",
+                _job_runner.worker,
+                _job_runner.max_workers,
+            )
+        return _job_runner
+
+
+def shutdown_job_runner() -> None:
+    """Waits for running jobs and shuts the application-wide job runner down"""
+
+    global _job_runner  # pylint: disable=global-statement
+    with _job_runner_lock:
+        runner, _job_runner = _job_runner, None
+    if runner is not None:
+        runner.shutdown(wait=True)
@@ -47,6 +47,30 @@ class RequestMetrics(BaseModel):
         alias="cypher.slowest.query.params",
         description="Parameters of the slowest Cypher query",
     )
+    cache_hits: int = Field(
+        0, alias="cache.hits", description="Number of repository cache hits"
+    )
+    cache_misses: int = Field(
+        0, alias="cache.misses", description="Number of repository cache misses"
+    )
+    cache_evictions: int = Field(
+        0,
+        alias="cache.evictions",
+        description="Number of repository cache entries evicted by invalidations and capacity limits",
+    )
+    fetch_count: int = Field(
+        0, alias="fetch.count", description="Number of tasks run by the fetch executor"
+    )
+    fetch_wait_time: float = Field(
+        0,
+        alias="fetch.wait.time",
+        description="Cumulative time (in seconds) tasks waited for a fetch executor worker",
+    )
+    fetch_queue_depth: int = Field(
+        0,
+        alias="fetch.queue.depth",
+        description="Highest number of fetch executor tasks waiting for a worker when a task was submitted",
+    )
 
 
 def init_request_metrics():
@@ -80,7 +104,14 @@ def add_request_metrics_header(
     """Adds custom response header with request metrics"""
 
     metrics = get_request_metrics().model_dump(
-        by_alias=True, include={"cypher_count", "cypher_times", "cypher_slowest_time"}
+        by_alias=True,
+        include={
+            "cypher_count",
+            "cypher_times",
+            "cypher_slowest_time",
+            "cache_hits",
+            "cache_misses",
+        },
     )
     metrics = {
         k: (round(v, 4) if isinstance(v, float) else v) for k, v in metrics.items()
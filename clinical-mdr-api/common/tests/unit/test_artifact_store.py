@@ -0,0 +1,123 @@
+import os
+import time
+
+import pytest
+
+from common.artifact_store import ArtifactStore, get_artifact_store
+from common.config import settings
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(str(tmp_path))
+
+
+def test_get_returns_stored_document(store):
+    assert store.get(("Study_000001", "1", "design.svg")) is None
+
+    digest = store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+
+    assert store.get(("Study_000001", "1", "design.svg")) == b"<svg/>"
+    assert store.get_digest(("Study_000001", "1", "design.svg")) == digest
+    assert store.get(("Study_000001", "2", "design.svg")) is None
+
+
+def test_documents_are_stored_once_per_content(store, tmp_path):
+    first = store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+    second = store.put(("Study_000001", "2", "design.svg"), b"<svg/>")
+    third = store.put(("Study_000002", "1", "design.svg"), b"<svg></svg>")
+
+    assert first == second != third
+    objects = [
+        name
+        for _, _, names in os.walk(tmp_path / "objects")
+        for name in names
+        if not name.startswith(".tmp-")
+    ]
+    assert sorted(objects) == sorted([first, third])
+
+
+def test_put_replaces_reference(store):
+    store.put(("Study_000001", "1", "flowchart.docx;layout=protocol"), b"old")
+    store.put(("Study_000001", "1", "flowchart.docx;layout=protocol"), b"new")
+
+    assert store.get(("Study_000001", "1", "flowchart.docx;layout=protocol")) == b"new"
+
+
+def test_key_parts_are_escaped(store, tmp_path):
+    store.put(("../Study_000001", "1/2", "design.svg"), b"<svg/>")
+
+    assert store.get(("../Study_000001", "1/2", "design.svg")) == b"<svg/>"
+    assert not (tmp_path / "Study_000001").exists()
+    assert len(os.listdir(tmp_path / "refs")) == 1
+
+
+def test_missing_object_is_not_found(store):
+    digest = store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+    os.unlink(store._object_path(digest))
+
+    assert store.get(("Study_000001", "1", "design.svg")) is None
+
+
+def test_corrupted_document_is_deleted_and_stored_again(store):
+    digest = store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+    with open(store._object_path(digest), "wb") as file:
+        file.write(b"<script/>")
+
+    assert store.get(("Study_000001", "1", "design.svg")) is None
+    assert not os.path.exists(store._object_path(digest))
+
+    store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+    assert store.get(("Study_000001", "1", "design.svg")) == b"<svg/>"
+
+
+def test_reference_to_invalid_digest_is_not_found(store, tmp_path):
+    store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+    with open(store._ref_path(("Study_000001", "1", "design.svg")), "w") as file:
+        file.write("../../refs/x")
+
+    assert store.get(("Study_000001", "1", "design.svg")) is None
+
+
+def test_unused_documents_are_collected(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_age=3600, gc_interval=60)
+    kept = store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+    unused = store.put(("Study_000001", "2", "design.svg"), b"<svg></svg>")
+    shared = store.put(("Study_000002", "1", "design.svg"), b"<svg/>")
+    old = time.time() - 7200
+    os.utime(store._ref_path(("Study_000001", "2", "design.svg")), (old, old))
+    os.utime(store._ref_path(("Study_000002", "1", "design.svg")), (old, old))
+    for digest in (kept, unused):
+        os.utime(store._object_path(digest), (old, old))
+
+    assert store.collect_garbage() == (2, 1)
+
+    assert kept == shared
+    assert store.get(("Study_000001", "1", "design.svg")) == b"<svg/>"
+    assert store.get(("Study_000001", "2", "design.svg")) is None
+    assert not os.path.exists(store._object_path(unused))
+
+
+def test_reading_a_document_keeps_it(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_age=3600, gc_interval=60)
+    store.put(("Study_000001", "1", "design.svg"), b"<svg/>")
+    old = time.time() - 7200
+    os.utime(store._ref_path(("Study_000001", "1", "design.svg")), (old, old))
+
+    assert store.get(("Study_000001", "1", "design.svg")) == b"<svg/>"
+    assert store.collect_garbage() == (0, 0)
+
+
+def test_store_requires_private_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "artifact_store_path", "")
+    assert get_artifact_store.__wrapped__() is None
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    monkeypatch.setattr(settings, "artifact_store_path", str(shared))
+    with pytest.raises(EnvironmentError, match="ARTIFACT_STORE_PATH"):
+        get_artifact_store.__wrapped__()
+
+    monkeypatch.setattr(settings, "artifact_store_path", str(tmp_path / "private"))
+    assert get_artifact_store.__wrapped__().path == str(tmp_path / "private")
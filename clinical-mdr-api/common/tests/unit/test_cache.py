@@ -0,0 +1,371 @@
+import os
+import pickle
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+
+import pytest
+from cachetools import cached
+from pydantic import SecretStr
+
+from common.cache import (
+    ANY_TAG,
+    CacheStats,
+    LocalCacheBackend,
+    SbTTLCache,
+    SqliteCacheBackend,
+    cache_tags,
+    create_cache,
+    get_cache_backend,
+)
+from common.config import settings
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    return SqliteCacheBackend(str(tmp_path / "cache.sqlite3"), b"secret")
+
+
+def test_local_backend_behaves_like_ttl_cache():
+    cache = SbTTLCache("test.local", maxsize=10, ttl=60, backend=LocalCacheBackend())
+
+    cache["a"] = 1
+    assert cache["a"] == 1
+    assert "a" in cache
+    with pytest.raises(KeyError):
+        _ = cache["b"]
+
+    cache.clear()
+    assert cache.currsize == 0
+    with pytest.raises(KeyError):
+        _ = cache["a"]
+
+
+def test_sqlite_backend_shares_entries_between_workers(sqlite_backend):
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+    worker_2 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+
+    worker_1[("uid", 1)] = {"name": "value"}
+
+    assert worker_2[("uid", 1)] == {"name": "value"}
+    assert worker_2.currsize == 1
+
+
+def test_get_and_contains_read_shared_entries(sqlite_backend):
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+    worker_2 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+    worker_3 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+
+    worker_1["key"] = "value"
+
+    assert worker_2.get("key") == "value"
+    assert "key" in worker_3
+    assert worker_3.currsize == 1
+    assert worker_3.get("other", "default") == "default"
+    assert "other" not in worker_3
+
+
+def test_unshared_cache_keeps_entries_in_the_process(sqlite_backend, monkeypatch):
+    monkeypatch.setattr("common.cache.get_cache_backend", lambda: sqlite_backend)
+    shared = create_cache("test.unshared", maxsize=10, ttl=60)
+    unshared = create_cache("test.unshared", maxsize=10, ttl=60, shared=False)
+
+    unshared["key"] = b"large value"
+
+    assert unshared.get("key") == b"large value"
+    assert shared.get("key") is None
+    with pytest.raises(KeyError):
+        sqlite_backend.get("test.unshared", "key")
+
+
+def test_sqlite_backend_ignores_entries_with_invalid_signature(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    worker_1 = SbTTLCache(
+        "test.shared", maxsize=10, ttl=60, backend=SqliteCacheBackend(path, b"secret")
+    )
+    worker_2 = SbTTLCache(
+        "test.shared", maxsize=10, ttl=60, backend=SqliteCacheBackend(path, b"other")
+    )
+    worker_1["key"] = "value"
+    worker_1["tampered"] = "value"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "UPDATE entries SET value = ? WHERE key = ?",
+            (bytes(32) + pickle.dumps("forged"), repr("tampered")),
+        )
+
+    with pytest.raises(KeyError):
+        _ = worker_2["key"]
+    assert "tampered" not in SbTTLCache(
+        "test.shared", maxsize=10, ttl=60, backend=SqliteCacheBackend(path, b"secret")
+    )
+
+
+def test_sqlite_backend_requires_private_path_and_secret(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_backend", "sqlite")
+    monkeypatch.setattr(settings, "cache_shared_path", "")
+    monkeypatch.setattr(settings, "cache_shared_secret", SecretStr("secret"))
+    with pytest.raises(EnvironmentError):
+        get_cache_backend.__wrapped__()
+
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir(mode=0o777)
+    os.chmod(shared_dir, 0o777)
+    monkeypatch.setattr(settings, "cache_shared_path", str(shared_dir / "cache.db"))
+    with pytest.raises(EnvironmentError):
+        get_cache_backend.__wrapped__()
+
+    os.chmod(shared_dir, 0o700)
+    monkeypatch.setattr(settings, "cache_shared_secret", SecretStr(""))
+    with pytest.raises(EnvironmentError):
+        get_cache_backend.__wrapped__()
+
+    monkeypatch.setattr(settings, "cache_shared_secret", SecretStr("secret"))
+    assert isinstance(get_cache_backend.__wrapped__(), SqliteCacheBackend)
+
+
+def test_sqlite_backend_clear_invalidates_all_workers(sqlite_backend):
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+    worker_2 = SbTTLCache(
+        "test.shared", maxsize=10, ttl=60, backend=sqlite_backend, sync_interval=0
+    )
+
+    worker_1["key"] = "old"
+    assert worker_2["key"] == "old"
+
+    worker_1.clear()
+
+    with pytest.raises(KeyError):
+        _ = worker_2["key"]
+    assert worker_2.currsize == 0
+
+    worker_2["key"] = "new"
+    assert worker_1["key"] == "new"
+
+
+def test_sqlite_backend_keeps_unpicklable_values_local(sqlite_backend):
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+    worker_2 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+
+    worker_1["key"] = lambda: None
+
+    assert callable(worker_1["key"])
+    with pytest.raises(KeyError):
+        _ = worker_2["key"]
+
+
+def test_cached_decorator_with_shared_cache(sqlite_backend):
+    calls = []
+
+    def make_worker():
+        @cached(
+            cache=SbTTLCache(
+                "test.decorated", maxsize=10, ttl=60, backend=sqlite_backend
+            )
+        )
+        def find_by_uid(uid):
+            calls.append(uid)
+            return uid.upper()
+
+        return find_by_uid
+
+    worker_1, worker_2 = make_worker(), make_worker()
+
+    assert worker_1("abc") == "ABC"
+    assert worker_2("abc") == "ABC"
+    assert calls == ["abc"]
+
+
+@dataclass
+class _Codelist:
+    codelist_uid: str
+
+
+@dataclass
+class _Term:
+    _uid: str
+    name: str
+    codelists: list[_Codelist] = field(default_factory=list)
+
+    @property
+    def uid(self):
+        return self._uid
+
+
+def test_cache_tags():
+    term = _Term("Term_1", "name", [_Codelist("CL_1"), _Codelist("CL_2")])
+
+    assert cache_tags(term) == {"Term_1", "CL_1", "CL_2"}
+    assert cache_tags([term]) == {ANY_TAG}
+    assert cache_tags(None) == {ANY_TAG}
+
+
+@pytest.mark.parametrize("backend", ["local", "sqlite"])
+def test_invalidate_evicts_tagged_and_untagged_entries_only(backend, tmp_path):
+    cache_backend = (
+        LocalCacheBackend()
+        if backend == "local"
+        else SqliteCacheBackend(str(tmp_path / "cache.sqlite3"), b"secret")
+    )
+    cache = SbTTLCache("test.tags", maxsize=10, ttl=60, backend=cache_backend)
+
+    cache["term_1"] = _Term("Term_1", "first", [_Codelist("CL_1")])
+    cache["term_2"] = _Term("Term_2", "second", [_Codelist("CL_2")])
+    cache["all_terms"] = ["Term_1", "Term_2"]
+    cache["missing"] = None
+
+    cache.invalidate(["CL_1"])
+
+    assert "term_1" not in cache
+    assert "all_terms" not in cache
+    assert "missing" not in cache
+    assert cache["term_2"].name == "second"
+    assert cache.stats.evictions == 3
+    assert cache.stats.invalidations == 1
+
+
+def test_invalidate_propagates_to_other_workers(sqlite_backend):
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+    worker_2 = SbTTLCache(
+        "test.shared", maxsize=10, ttl=60, backend=sqlite_backend, sync_interval=0
+    )
+
+    worker_1["term_1"] = _Term("Term_1", "first")
+    worker_1["term_2"] = _Term("Term_2", "second")
+    assert worker_2["term_1"].name == "first"
+    assert worker_2["term_2"].name == "second"
+
+    worker_1.invalidate(["Term_1"])
+
+    with pytest.raises(KeyError):
+        _ = worker_2["term_1"]
+    assert worker_2["term_2"].name == "second"
+
+
+class _CountingBackend(LocalCacheBackend):
+    def __init__(self):
+        super().__init__()
+        self.generation_reads = 0
+
+    def get_generation(self, name):
+        self.generation_reads += 1
+        return super().get_generation(name)
+
+
+def test_local_hits_check_invalidations_at_most_every_sync_interval():
+    backend = _CountingBackend()
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=backend)
+    worker_2 = SbTTLCache(
+        "test.shared", maxsize=10, ttl=60, backend=backend, sync_interval=3600
+    )
+    worker_2["term_1"] = _Term("Term_1", "first")
+    reads = backend.generation_reads
+
+    for _ in range(10):
+        assert worker_2["term_1"].name == "first"
+    assert backend.generation_reads == reads
+
+    # invalidations of other workers are seen by the next backend read or write
+    worker_1.invalidate(["Term_1"])
+    assert worker_2["term_1"].name == "first"
+    with pytest.raises(KeyError):
+        _ = worker_2["term_2"]
+    with pytest.raises(KeyError):
+        _ = worker_2["term_1"]
+
+    # and those made through the store itself at once
+    worker_2["term_1"] = _Term("Term_1", "second")
+    worker_2.invalidate(["Term_1"])
+    with pytest.raises(KeyError):
+        _ = worker_2["term_1"]
+
+
+def test_misses_during_invalidation_by_another_thread_are_recorded():
+    cache = SbTTLCache("test.threads", maxsize=10, ttl=60, backend=LocalCacheBackend())
+    cache["term_1"] = _Term("Term_1", "old")
+    evicting, resume, missed, invalidated = (threading.Event() for _ in range(4))
+    original_evict_tags = cache._evict_tags
+
+    def _evict_tags(tags):
+        evicting.set()
+        resume.wait(5)
+        original_evict_tags(tags)
+
+    def load():
+        # misses while the other thread is evicting entries, then loads a value which is updated meanwhile
+        with pytest.raises(KeyError):
+            _ = cache["term_1"]
+        missed.set()
+        invalidated.wait(5)
+        cache["term_1"] = _Term("Term_1", "stale")
+
+    cache._evict_tags = _evict_tags
+    invalidation = threading.Thread(target=cache.invalidate, args=(["Term_1"],))
+    invalidation.start()
+    assert evicting.wait(5)
+    loader = threading.Thread(target=load)
+    loader.start()
+    resume.set()
+    invalidation.join(5)
+    assert missed.wait(5)
+    cache.invalidate(["Term_1"])
+    invalidated.set()
+    loader.join(5)
+
+    assert "term_1" not in cache
+
+
+def test_stale_value_is_not_shared_after_invalidation(sqlite_backend):
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+    worker_2 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=sqlite_backend)
+
+    generation = worker_1.generation
+    worker_2.invalidate(["Term_1"])
+    # value loaded by worker 1 before the invalidation made by worker 2
+    sqlite_backend.set(
+        "test.shared", generation, "term_1", "stale", frozenset({"Term_1"}), 60
+    )
+
+    with pytest.raises(KeyError):
+        _ = worker_2["term_1"]
+
+
+@pytest.mark.parametrize("backend", ["local", "sqlite"])
+def test_value_loaded_before_invalidation_is_not_cached(backend, tmp_path):
+    cache_backend = (
+        LocalCacheBackend()
+        if backend == "local"
+        else SqliteCacheBackend(str(tmp_path / "cache.sqlite3"), b"secret")
+    )
+    worker_1 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=cache_backend)
+    worker_2 = SbTTLCache("test.shared", maxsize=10, ttl=60, backend=cache_backend)
+
+    with pytest.raises(KeyError):
+        _ = worker_1["term_1"]
+    with pytest.raises(KeyError):
+        _ = worker_1["term_2"]
+    # the value of term 1 is read from the database, then another worker updates it
+    worker_2.invalidate(["Term_1"])
+    worker_1["term_1"] = _Term("Term_1", "stale")
+    worker_1["term_2"] = _Term("Term_2", "second")
+
+    with pytest.raises(KeyError):
+        _ = worker_1["term_1"]
+    assert worker_1["term_2"].name == "second"
+    if backend == "sqlite":
+        with pytest.raises(KeyError):
+            _ = worker_2["term_1"]
+        assert worker_2["term_2"].name == "second"
+
+
+def test_stats():
+    cache = SbTTLCache("test.stats", maxsize=2, ttl=60, backend=LocalCacheBackend())
+
+    with pytest.raises(KeyError):
+        _ = cache["a"]
+    cache["a"] = 1
+    _ = cache["a"]
+    cache["b"] = 2
+    cache["c"] = 3
+
+    assert cache.stats == CacheStats(hits=1, misses=1, evictions=1, invalidations=0)
@@ -0,0 +1,126 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware import Middleware
+
+from common.conditional_get import ConditionalGetMiddleware
+
+TOKENS = {
+    ("Study_000001", None): "draft-1",
+    ("Study_000001", "1"): "locked:1",
+}
+
+
+@pytest.fixture
+def state():
+    return {"calls": 0, "tokens": dict(TOKENS), "authorized": True}
+
+
+@pytest.fixture
+def client(state):
+    async def _authorize(_request):
+        return state["authorized"]
+
+    app = FastAPI(
+        middleware=[
+            Middleware(
+                ConditionalGetMiddleware,
+                paths=[r"/studies/(?P<uid>[^/]+)/study-visits(/.*)?"],
+                get_change_token=lambda uid, version: state["tokens"].get(
+                    (uid, version)
+                ),
+                authorize=_authorize,
+            )
+        ]
+    )
+
+    @app.get("/studies/{study_uid}/study-visits")
+    def get_visits(study_uid: str, study_value_version: str | None = None):
+        state["calls"] += 1
+        return {"study_uid": study_uid, "version": study_value_version}
+
+    @app.get("/studies/{study_uid}/study-arms")
+    def get_arms(study_uid: str):
+        state["calls"] += 1
+        return {"study_uid": study_uid}
+
+    return TestClient(app)
+
+
+def test_not_modified_response_skips_route(client, state):
+    response = client.get("/studies/Study_000001/study-visits")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = client.get(
+        "/studies/Study_000001/study-visits", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert state["calls"] == 1
+
+
+def test_study_change_changes_etag(client, state):
+    etag = client.get("/studies/Study_000001/study-visits").headers["ETag"]
+    state["tokens"][("Study_000001", None)] = "draft-2"
+
+    response = client.get(
+        "/studies/Study_000001/study-visits", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert state["calls"] == 2
+
+
+def test_etag_depends_on_query(client):
+    first = client.get("/studies/Study_000001/study-visits?a=1&b=2")
+    second = client.get("/studies/Study_000001/study-visits?b=2&a=1")
+    third = client.get("/studies/Study_000001/study-visits?a=2&b=2")
+
+    assert first.headers["ETag"] == second.headers["ETag"] != third.headers["ETag"]
+
+
+def test_locked_version_is_revalidated(client, state):
+    response = client.get(
+        "/studies/Study_000001/study-visits", params={"study_value_version": "1"}
+    )
+
+    assert response.json()["version"] == "1"
+    # the library items and CT terms shown with a locked version can change
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = client.get(
+        "/studies/Study_000001/study-visits",
+        params={"study_value_version": "1"},
+        headers={"If-None-Match": f'W/{response.headers["ETag"]}, "other"'},
+    )
+    assert response.status_code == 304
+    assert state["calls"] == 1
+
+
+def test_unauthorized_request_runs_route(client, state):
+    etag = client.get("/studies/Study_000001/study-visits").headers["ETag"]
+    state["authorized"] = False
+
+    response = client.get(
+        "/studies/Study_000001/study-visits", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert state["calls"] == 2
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/studies/Study_000002/study-visits", "/studies/Study_000001/study-arms"],
+)
+def test_other_resources_have_no_etag(client, path):
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
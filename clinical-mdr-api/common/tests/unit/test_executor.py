@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+from opencensus.common.runtime_context import RuntimeContext
+
+from common.executor import (
+    FetchExecutor,
+    get_fetch_executor,
+    shutdown_fetch_executor,
+    start_fetch_executor,
+)
+
+
+@pytest.fixture
+def executor():
+    executor = FetchExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_runs_tasks_with_tracing_context(executor):
+    RuntimeContext.current_span = "span"
+
+    futures = [
+        executor.submit(lambda x, y=0: (x + y, RuntimeContext.current_span), i, y=1)
+        for i in range(5)
+    ]
+
+    assert [future.result() for future in futures] == [
+        (i + 1, "span") for i in range(5)
+    ]
+    assert executor.stats.submitted == 5
+    assert executor.stats.completed == 5
+    assert executor.stats.queue_depth == 0
+
+
+def test_counts_queue_depth_and_wait_time(executor):
+    started = threading.Barrier(3)
+    release = threading.Event()
+
+    def block():
+        started.wait()
+        return release.wait(timeout=5)
+
+    blocking = [executor.submit(block) for _ in range(2)]
+    started.wait(timeout=5)
+    queued = executor.submit(lambda: "done")
+
+    try:
+        assert executor.stats.queue_depth == 1
+        assert executor.stats.max_queue_depth >= 1
+    finally:
+        release.set()
+
+    assert queued.result() == "done"
+    assert all(future.result() for future in blocking)
+    assert executor.stats.queue_depth == 0
+    assert executor.stats.max_wait_time > 0
+    assert executor.stats.wait_time >= executor.stats.max_wait_time
+
+
+def test_nested_tasks_run_in_place(executor):
+    def fan_out():
+        futures = [executor.submit(threading.current_thread) for _ in range(4)]
+        return threading.current_thread(), [future.result() for future in futures]
+
+    # would deadlock if nested tasks waited for a worker
+    parents = [executor.submit(fan_out) for _ in range(2)]
+    for parent in parents:
+        thread, nested_threads = parent.result(timeout=5)
+        assert all(nested is thread for nested in nested_threads)
+
+
+def test_exceptions_are_raised_by_result(executor):
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        executor.submit(fail).result()
+
+    with pytest.raises(ValueError, match="failed"):
+        executor.submit(lambda: executor.submit(fail).result()).result()
+
+
+def test_application_executor_lifecycle():
+    # other tests may have started the application executor through get_fetch_executor
+    shutdown_fetch_executor()
+    executor = start_fetch_executor(max_workers=3)
+    assert get_fetch_executor() is executor
+    assert start_fetch_executor() is executor
+    assert executor.max_workers == 3
+
+    shutdown_fetch_executor()
+    assert get_fetch_executor() is not executor
+    shutdown_fetch_executor()
@@ -0,0 +1,355 @@
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from common.config import settings
+from common.exceptions import ValidationException
+from common.jobs import (
+    Job,
+    JobContext,
+    JobResult,
+    JobRunner,
+    JobStatus,
+    JobType,
+    MemoryJobQueue,
+    SqliteJobQueue,
+    create_job_queue,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def queue(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteJobQueue(str(tmp_path / "jobs.sqlite3"))
+    return MemoryJobQueue()
+
+
+def new_job(uid: str, job_type: str = "export", owner_id: str = "user-1", **kwargs):
+    return Job(uid=uid, type=job_type, parameters={}, owner={"id": owner_id}, **kwargs)
+
+
+def wait_for(queue, uid: str, timeout: float = 10) -> Job:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if (job := queue.get(uid)).status.is_finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {uid} didn't finish")
+
+
+def test_queue_stores_jobs(queue):
+    queue.add(new_job("Job_1", submitted_at=1))
+    queue.add(new_job("Job_2", submitted_at=2, owner_id="user-2"))
+    queue.add(new_job("Job_3", submitted_at=3))
+
+    assert queue.get("Job_2").owner == {"id": "user-2"}
+    assert queue.get("Job_4") is None
+    assert [job.uid for job in queue.find()] == ["Job_3", "Job_2", "Job_1"]
+    assert [job.uid for job in queue.find("user-1")] == ["Job_3", "Job_1"]
+
+    queue.remove(["Job_1", "Job_2"])
+    assert [job.uid for job in queue.find()] == ["Job_3"]
+
+
+def test_queue_stores_results_until_job_is_removed(queue):
+    queue.add(new_job("Job_1"))
+    assert queue.get_result("Job_1") is None
+
+    queue.set_result("Job_1", b"result")
+    assert queue.get_result("Job_1") == b"result"
+
+    queue.remove(["Job_1"])
+    assert queue.get_result("Job_1") is None
+
+
+def test_queue_claims_oldest_job_of_types_once(queue):
+    queue.add(new_job("Job_1", job_type="export", submitted_at=1))
+    queue.add(new_job("Job_2", job_type="lock", submitted_at=2))
+    queue.add(new_job("Job_3", job_type="export", submitted_at=3))
+
+    assert queue.claim(["lock"], "worker-1").uid == "Job_2"
+    assert queue.claim(["lock"], "worker-1") is None
+    job = queue.claim(["lock", "export"], "worker-2")
+    assert job.uid == "Job_1"
+    assert queue.get("Job_1").status == JobStatus.RUNNING
+    assert queue.get("Job_1").worker == "worker-2"
+    assert queue.claim([], "worker-1") is None
+
+
+def test_claims_from_threads_are_exclusive(queue):
+    for i in range(50):
+        queue.add(new_job(f"Job_{i}", submitted_at=i))
+    claimed = []
+
+    def _claim():
+        while job := queue.claim(["export"], threading.current_thread().name):
+            claimed.append(job.uid)
+
+    threads = [threading.Thread(target=_claim) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(f"Job_{i}" for i in range(50))
+
+
+def test_cancel_queued_and_running_jobs(queue):
+    queue.add(new_job("Job_1"))
+    queue.add(new_job("Job_2", status=JobStatus.RUNNING))
+    queue.add(new_job("Job_3", status=JobStatus.SUCCEEDED))
+
+    assert queue.request_cancel("Job_1").status == JobStatus.CANCELLED
+    job = queue.request_cancel("Job_2")
+    assert job.status == JobStatus.RUNNING and job.cancel_requested
+    job = queue.request_cancel("Job_3")
+    assert job.status == JobStatus.SUCCEEDED and not job.cancel_requested
+    assert queue.request_cancel("Job_4") is None
+
+    queue.add(new_job("Job_5", status=JobStatus.RUNNING))
+    job = queue.request_cancel("Job_5", cancel_running=False)
+    assert job.status == JobStatus.RUNNING and not job.cancel_requested
+
+
+def test_stale_and_expired_jobs(queue):
+    queue.add(new_job("Job_1", status=JobStatus.RUNNING, heartbeat_at=10))
+    queue.add(new_job("Job_2", status=JobStatus.RUNNING, heartbeat_at=30))
+    queue.add(new_job("Job_3", status=JobStatus.FAILED, finished_at=10))
+    queue.add(new_job("Job_4", status=JobStatus.QUEUED))
+
+    assert queue.fail_stale(heartbeat_before=20) == ["Job_1"]
+    assert queue.get("Job_1").status == JobStatus.FAILED
+    assert queue.get("Job_1").error == "The job was interrupted."
+    assert queue.get("Job_2").status == JobStatus.RUNNING
+    assert queue.get("Job_4").status == JobStatus.QUEUED
+    assert queue.expired(finished_before=20) == ["Job_3"]
+
+
+class ExportParameters(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(settings, "job_poll_interval", 0.05)
+
+
+@pytest.fixture
+def make_runner(queue, fast_polling):
+    runners = []
+
+    def _make_runner(job_types, **kwargs):
+        runner = JobRunner(
+            queue=queue,
+            job_types={job_type.name: job_type for job_type in job_types},
+            max_workers=kwargs.pop("max_workers", 4),
+            **kwargs,
+        )
+        runners.append(runner)
+        return runner
+
+    yield _make_runner
+    for runner in runners:
+        runner.shutdown(wait=False)
+
+
+def test_runner_runs_jobs_and_stores_results(queue, make_runner):
+    def _export(context: JobContext) -> JobResult:
+        context.report_progress(0.5, "Halfway")
+        return JobResult(
+            content=context.parameters.name.encode(),
+            media_type="text/plain",
+            filename="export.txt",
+        )
+
+    runner = make_runner(
+        [JobType("export", _export, parameters_model=ExportParameters)]
+    )
+    job = new_job("Job_1")
+    job.parameters = {"name": "Study_000001"}
+    queue.add(job)
+    runner.wake()
+
+    job = wait_for(queue, "Job_1")
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.progress == 1
+    assert job.message == "Halfway"
+    assert (job.result_media_type, job.result_filename, job.result_size) == (
+        "text/plain",
+        "export.txt",
+        12,
+    )
+    assert queue.get_result("Job_1") == b"Study_000001"
+
+
+def test_runner_records_failures(queue, make_runner):
+    def _fail(_context: JobContext) -> JobResult:
+        raise ValidationException(msg="Study doesn't exist")
+
+    runner = make_runner(
+        [
+            JobType("export", _fail),
+            JobType("import", _fail, parameters_model=ExportParameters),
+        ]
+    )
+    queue.add(new_job("Job_1"))
+    queue.add(new_job("Job_2", job_type="import"))
+    runner.wake()
+
+    job = wait_for(queue, "Job_1")
+    assert job.status == JobStatus.FAILED
+    assert job.error == "Study doesn't exist"
+    # invalid parameters
+    assert wait_for(queue, "Job_2").status == JobStatus.FAILED
+    assert queue.get_result("Job_1") is None
+
+
+def test_runner_limits_concurrency_per_type(queue, make_runner):
+    release = threading.Event()
+    running = {"export": 0, "lock": 0}
+    max_running = dict(running)
+    lock = threading.Lock()
+
+    def _run(context: JobContext) -> JobResult:
+        with lock:
+            running[context.job.type] += 1
+            max_running[context.job.type] = max(
+                max_running[context.job.type], running[context.job.type]
+            )
+        release.wait(10)
+        with lock:
+            running[context.job.type] -= 1
+        return JobResult(b"", "text/plain", "result.txt")
+
+    runner = make_runner(
+        [JobType("export", _run, max_concurrency=2), JobType("lock", _run)],
+        max_workers=3,
+        max_concurrency={"lock": 1},
+    )
+    for i in range(4):
+        queue.add(new_job(f"Job_export_{i}", job_type="export", submitted_at=i))
+        queue.add(new_job(f"Job_lock_{i}", job_type="lock", submitted_at=i))
+    runner.wake()
+
+    deadline = time.time() + 10
+    while sum(runner.running_counts().values()) < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert runner.running_counts() == {"export": 2, "lock": 1}
+
+    release.set()
+    for job in queue.find():
+        assert wait_for(queue, job.uid).status == JobStatus.SUCCEEDED
+    assert max_running == {"export": 2, "lock": 1}
+
+
+def test_runner_cancels_running_job(queue, make_runner):
+    started = threading.Event()
+
+    def _run(context: JobContext) -> JobResult:
+        started.set()
+        while True:
+            context.report_progress(0.1)
+            time.sleep(0.01)
+
+    runner = make_runner([JobType("export", _run)])
+    queue.add(new_job("Job_1"))
+    runner.wake()
+    assert started.wait(10)
+
+    queue.request_cancel("Job_1")
+
+    job = wait_for(queue, "Job_1")
+    assert job.status == JobStatus.CANCELLED
+    assert job.finished_at is not None
+
+
+def test_runner_completes_job_which_is_not_cancellable(queue, make_runner):
+    def _run(context: JobContext) -> JobResult:
+        context.report_progress(0.1)
+        # the job commits its changes, a cancellation requested meanwhile doesn't stop it
+        queue.modify(
+            context.job.uid, lambda job: setattr(job, "cancel_requested", True)
+        )
+        context.report_progress(0.9, "Committed")
+        return JobResult(b"", "text/plain", "a.txt")
+
+    runner = make_runner([JobType("export", _run, cancellable=False)])
+    queue.add(new_job("Job_1"))
+    runner.wake()
+
+    job = wait_for(queue, "Job_1")
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.message == "Committed"
+
+
+def test_runner_runs_jobs_as_owner(queue, make_runner):
+    owners = []
+
+    class _RunAs:
+        def __init__(self, job: Job):
+            self.job = job
+
+        def __enter__(self):
+            owners.append(self.job.owner["id"])
+
+        def __exit__(self, *args):
+            pass
+
+    runner = make_runner(
+        [JobType("export", lambda context: JobResult(b"", "text/plain", "a.txt"))],
+        run_as=_RunAs,
+    )
+    queue.add(new_job("Job_1", owner_id="user-2"))
+    runner.wake()
+
+    assert wait_for(queue, "Job_1").status == JobStatus.SUCCEEDED
+    assert owners == ["user-2"]
+
+
+def test_runner_deletes_expired_jobs_and_results(queue, make_runner, monkeypatch):
+    runner = make_runner(
+        [JobType("export", lambda context: JobResult(b"x", "text/plain", "a.txt"))]
+    )
+    queue.add(new_job("Job_1"))
+    runner.wake()
+    wait_for(queue, "Job_1")
+    assert queue.get_result("Job_1") == b"x"
+
+    monkeypatch.setattr(settings, "job_retention", -1)
+    runner.wake()
+
+    deadline = time.time() + 10
+    while queue.get("Job_1") is not None and time.time() < deadline:
+        time.sleep(0.01)
+    assert queue.get("Job_1") is None
+    assert queue.get_result("Job_1") is None
+
+
+def test_job_type_without_parameters_model_takes_no_parameters():
+    job_type = JobType("export", lambda context: None)
+
+    assert job_type.validate_parameters({}) is None
+    with pytest.raises(ValidationException):
+        job_type.validate_parameters({"name": "x"})
+
+
+def test_sqlite_queue_requires_private_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "job_queue_backend", "sqlite")
+    monkeypatch.setattr(settings, "job_queue_path", "")
+    with pytest.raises(EnvironmentError, match="JOB_QUEUE_PATH"):
+        create_job_queue()
+
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    monkeypatch.setattr(settings, "job_queue_path", str(shared / "jobs.sqlite3"))
+    with pytest.raises(EnvironmentError, match="JOB_QUEUE_PATH"):
+        create_job_queue()
+
+    monkeypatch.setattr(
+        settings, "job_queue_path", str(tmp_path / "private" / "jobs.sqlite3")
+    )
+    assert isinstance(create_job_queue(), SqliteJobQueue)
@@ -1,6 +1,8 @@
+import dataclasses
 import logging
 import os
 import re
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -63,6 +65,37 @@ class BaseTimelineAR(Generic[StudyVisit]):
     study_uid: str
     _visits: list[StudyVisit]
 
+    # Derived from _visits by _generate_timeline(), kept until visits are added, removed or updated
+    _ordered_visits: list[StudyVisit] | None = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+    _visits_by_uid: dict[str, StudyVisit] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+    _absolute_durations: dict[int, int | None] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def _invalidate_timeline(self) -> None:
+        self._ordered_visits = None
+
+    def _get_ordered_visits(self) -> list[StudyVisit]:
+        if self._ordered_visits is None:
+            self._ordered_visits = self._generate_timeline()
+        return self._ordered_visits
+
+    def get_visit_by_uid(self, uid: str) -> StudyVisit | None:
+        """Returns the visit with the given uid, with all properties derived from the timeline"""
+        self._get_ordered_visits()
+        return self._visits_by_uid.get(uid)
+
+    def get_absolute_duration(self, visit: StudyVisit) -> int | None:
+        """Returns the absolute timing of a visit derived along with the timeline"""
+        self._get_ordered_visits()
+        if id(visit) in self._absolute_durations:
+            return self._absolute_durations[id(visit)]
+        return visit.get_absolute_duration()
+
     @trace_calls
     def _generate_timeline(self):
         """
@@ -73,14 +106,11 @@ class BaseTimelineAR(Generic[StudyVisit]):
             visit.uid: visit for visit in self._visits
         }
         subvisit_sets: dict[str, list[Subvisit]] = {}
-        references = [
+        amount_of_subvisits_for_visit: dict[str, int] = Counter(
             visit.visit_sublabel_reference
             for visit in self._visits
             if visit.visit_sublabel_reference
-        ]
-        amount_of_subvisits_for_visit: dict[str, int] = {
-            ref: references.count(ref) for ref in references
-        }
+        )
         special_visits_for_visit_anchor: dict[str, StudyVisit] = {}
 
         # Create Anchor lookups
@@ -129,12 +159,14 @@ class BaseTimelineAR(Generic[StudyVisit]):
             elif visit.visit_class == VisitClass.SPECIAL_VISIT:
                 visit.anchor_visit = visits_dict.get(visit.visit_sublabel_reference)
 
+        # derive the timing of each visit once, following each anchor chain only once
+        durations: dict[int, int | None] = {}
+        for visit in self._visits:
+            visit.get_absolute_duration(durations)
+
         ordered_visits = sorted(
             self._visits,
-            key=lambda x: (
-                x.get_absolute_duration() is None,
-                x.get_absolute_duration(),
-            ),
+            key=lambda x: (durations[id(x)] is None, durations[id(x)]),
         )
 
         last_visit_num = 1
@@ -182,17 +214,12 @@ class BaseTimelineAR(Generic[StudyVisit]):
             subvisit_sets=subvisit_sets,
             amount_of_subvisits_for_visit=amount_of_subvisits_for_visit,
             special_visits_for_visit_anchor=special_visits_for_visit_anchor,
+            durations=durations,
         )
 
-        # sort visits that are returned in the end to capture all timing changes
-        ordered_visits = sorted(
-            self._visits,
-            key=lambda x: (
-                x.get_absolute_duration() is None,
-                x.get_absolute_duration(),
-            ),
-        )
-
+        # numbering doesn't change the timings, so ordered_visits is still in order
+        self._visits_by_uid = visits_dict
+        self._absolute_durations = durations
         return ordered_visits
 
     @trace_calls
@@ -202,6 +229,7 @@ class BaseTimelineAR(Generic[StudyVisit]):
         subvisit_sets: dict[str, list[Subvisit]],
         amount_of_subvisits_for_visit: dict[str, int],
         special_visits_for_visit_anchor: dict[str, StudyVisit],
+        durations: dict[int, int | None],
     ) -> None:
         for visit in ordered_visits:
             if (
@@ -222,10 +250,7 @@ class BaseTimelineAR(Generic[StudyVisit]):
                     increment_step = 1
                 num = visits[-1].number + increment_step
                 # if additional visit is taking place before anchor visit in group of subvisits
-                if (
-                    visits[-1].visit.get_absolute_duration()
-                    > visit.get_absolute_duration()
-                ):
+                if durations[id(visits[-1].visit)] > durations[id(visit)]:
                     last_subvisit_number = visits[-1].number
                     # take subvisit number from the last visit
                     visit.subvisit_number = last_subvisit_number
@@ -382,6 +407,26 @@ def load_env(key: str, default: str | None = None):
     return default
 
 
+def ensure_private_directory(path: str, key: str) -> str:
+    """
+    Creates the directory configured by the `key` environment variable, or checks an existing one.
+
+    Files read back by the API, e.g. pickled cache entries or job results, must not be writable by other users,
+    so the directory must be owned by the user running the API and not be accessible to anyone else.
+    """
+
+    if not path:
+        raise EnvironmentError(f"Failed because {key} is not set.")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    stat = os.stat(path)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        raise EnvironmentError(
+            f"Failed because the directory '{path}' of {key} must be owned by the user running the API "
+            "and must not be accessible to other users (mode 700)."
+        )
+    return path
+
+
 def get_field_type(tp: Any) -> type[Any]:
     """
     Determines the actual type of a given type hint, handling generic types and nested types.
@@ -45,8 +45,7 @@ from common.telemetry.traceback_middleware import ExceptionTracebackMiddleware
 from consumer_api.shared.common import get_api_version
 from consumer_api.system.routes import router as system_router
 from consumer_api.v1.main import router as v1_router
-
-# from consumer_api.v2.main import router as v2_router
+from consumer_api.v2.main import router as v2_router
 
 log = logging.getLogger(__name__)
 
@@ -217,7 +216,7 @@ async def handle_request_validation_error(
 app.include_router(system_router, tags=["System"])
 
 app.include_router(v1_router, prefix="/v1")
-# app.include_router(v2_router, prefix="/v2")
+app.include_router(v2_router, prefix="/v2")
 
 
 def custom_openapi():
@@ -1,9 +1,15 @@
+import base64
+import binascii
+import json
 import logging
 import os
 import urllib.parse
 from enum import Enum
-from typing import Any
+from typing import Any, Iterator
 
+from neo4j import READ_ACCESS
+from neo4j.exceptions import Neo4jError
+from neomodel import config as neomodel_config
 from neomodel.sync_.core import db
 
 from common.exceptions import ValidationException
@@ -52,6 +58,23 @@ def query(
     return rows, columns
 
 
+def stream_query(
+    cypher_query: str, params: dict[Any, Any] | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Runs a read query in its own session and yields the rows as dictionaries while they are received,
+    unlike `query()` which loads all rows first
+    """
+    with neomodel_config.DRIVER.session(
+        database=neomodel_config.DATABASE_NAME, default_access_mode=READ_ACCESS
+    ) as session:
+        try:
+            for record in session.run(cypher_query, params or {}):
+                yield record.data()
+        except Neo4jError as e:
+            raise ValidationException(msg=f"Database query failed: {e.message}") from e
+
+
 def urlencode_link(link: str) -> str:
     """URL encodes a link"""
 
@@ -70,6 +93,36 @@ def db_pagination_clause(page_size: int, page_number: int) -> str:
     return f"SKIP {page_number - 1} * {page_size} LIMIT {page_size}"
 
 
+def encode_page_token(**values: Any) -> str:
+    """Encodes keyset pagination values (e.g. sort key of the last returned item) into an opaque page token"""
+    return base64.urlsafe_b64encode(
+        json.dumps(values, separators=(",", ":")).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_page_token(
+    page_token: str, required_keys: tuple[str, ...] = (), **expected_values: Any
+) -> dict[str, Any]:
+    """
+    Decodes a page token created by `encode_page_token`.
+
+    The token must contain all `required_keys`, and `expected_values` (e.g. sorting parameters)
+    must match the values stored in the token, so that a token can't be used to continue a listing with a different ordering.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(page_token.encode("ascii")))
+    except (ValueError, binascii.Error) as exc:
+        raise ValidationException(msg="Invalid page_token") from exc
+
+    ValidationException.raise_if(
+        not isinstance(values, dict)
+        or any(key not in values for key in required_keys)
+        or any(values.get(key) != value for key, value in expected_values.items()),
+        msg="Invalid page_token",
+    )
+    return values
+
+
 def db_sort_clause(
     sort_by: str,
     sort_order: str = "ASC",
@@ -81,6 +81,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
         page_number: int,
         items: list[T],
         query_param_names: list[str] | None = None,
+        page_token: str | None = None,
+        next_page_token: str | None = None,
     ) -> Self:
         path = request.url.path
 
@@ -100,6 +102,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
         self_link = f"{path}?{query_params}sort_by={sort_by}&sort_order={sort_order}&page_size={page_size}&page_number={page_number}"
         prev_link = f"{path}?{query_params}sort_by={sort_by}&sort_order={sort_order}&page_size={page_size}&page_number={prev_page_number}"
         next_link = f"{path}?{query_params}sort_by={sort_by}&sort_order={sort_order}&page_size={page_size}&page_number={page_number + 1}"
+        # Keyset pagination tokens, the next page token makes the next page start after the last returned item
+        if page_token:
+            self_link = f"{self_link}&page_token={page_token}"
+        if next_page_token:
+            next_link = f"{next_link}&page_token={next_page_token}"
+        elif page_token:
+            next_link = f"{next_link}&page_token={page_token}"
 
         # pylint: disable=kwarg-superseded-by-positional-arg
         return cls(
@@ -13,4 +13,5 @@ ALL_ROUTES_METHODS_ROLES = (
     ("/v1/papillons/soa", "GET", {"Study.Read"}),
     ("/v1/library/activities", "GET", {"Library.Read"}),
     ("/v1/library/activity-instances", "GET", {"Library.Read"}),
+    ("/v2/studies/changes", "GET", {"Study.Read"}),
 )
@@ -8,6 +8,7 @@ from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
+from neomodel.sync_.core import db
 
 from clinical_mdr_api.services.studies.study import StudyService
 from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
@@ -21,6 +22,7 @@ from clinical_mdr_api.tests.integration.utils.method_library import (
     input_metadata_in_study,
 )
 from clinical_mdr_api.tests.integration.utils.utils import TestUtils
+from common.config import settings
 from consumer_api.consumer_api import app
 from consumer_api.tests.utils import assert_response_status_code, set_db
 from consumer_api.v1 import models
@@ -267,6 +269,79 @@ def test_get_study_audit_trail(api_client):
             ), "Author hash should be valid hexadecimal"
 
 
+def test_get_study_audit_trail_page_token(api_client, monkeypatch):
+    from_ts = datetime.fromtimestamp(time.time() - 86400).isoformat()  # 24 hours ago
+    to_ts = datetime.fromtimestamp(time.time() + 86400).isoformat()  # 24 hours from now
+    params = {"from_ts": from_ts, "to_ts": to_ts}
+
+    response = api_client.get(f"{BASE_URL}/studies/audit-trail", params=params)
+    expected_rows = list(csv.DictReader(response.content.decode("utf-8").splitlines()))
+    assert "X-Next-Page-Token" not in response.headers
+
+    monkeypatch.setattr(settings, "consumer_api_audit_trail_max_rows", 7)
+    rows: list[dict[str, Any]] = []
+    page_params: dict[str, Any] = dict(params)
+    while True:
+        response = api_client.get(f"{BASE_URL}/studies/audit-trail", params=page_params)
+        assert_response_status_code(response, 200)
+        page = list(csv.DictReader(response.content.decode("utf-8").splitlines()))
+        assert len(page) <= 7
+        rows.extend(page)
+        if "X-Next-Page-Token" not in response.headers:
+            break
+        page_params["page_token"] = response.headers["X-Next-Page-Token"]
+
+    assert rows == expected_rows
+
+    response = api_client.get(
+        f"{BASE_URL}/studies/audit-trail", params=params | {"page_token": "invalid"}
+    )
+    assert_response_status_code(response, 400)
+
+
+def test_get_study_audit_trail_page_token_with_entries_of_same_timestamp_and_uid(
+    api_client, monkeypatch
+):
+    # entries of one timestamp, with the same entity uid or without an entity uid
+    db.cypher_query(
+        """
+        MATCH (sr:StudyRoot {uid: $study_uid})
+        CREATE (entity:StudyVisit {uid: "StudyVisit_AuditTrailPaging"})
+        CREATE (no_uid_visit:StudyVisit)
+        CREATE (no_uid_activity:StudyActivity)
+        WITH sr, entity, no_uid_visit, no_uid_activity, datetime("2023-06-01T12:00:00Z") AS ts
+        CREATE (sr)-[:AUDIT_TRAIL]->(:StudyAction:Create {date: ts})-[:AFTER]->(entity)
+        CREATE (sr)-[:AUDIT_TRAIL]->(:StudyAction:Edit {date: ts})-[:AFTER]->(entity)
+        CREATE (sr)-[:AUDIT_TRAIL]->(:StudyAction:Delete {date: ts})-[:AFTER]->(entity)
+        CREATE (sr)-[:AUDIT_TRAIL]->(:StudyAction:Create {date: ts})-[:AFTER]->(no_uid_visit)
+        CREATE (sr)-[:AUDIT_TRAIL]->(:StudyAction:Create {date: ts})-[:AFTER]->(no_uid_activity)
+        """,
+        {"study_uid": studies[0].uid},
+    )
+    params = {
+        "from_ts": "2023-06-01T00:00:00Z",
+        "to_ts": "2023-06-02T00:00:00Z",
+        "exclude_study_ids": ["NO-SUCH-STUDY"],
+    }
+
+    response = api_client.get(f"{BASE_URL}/studies/audit-trail", params=params)
+    expected_rows = list(csv.DictReader(response.content.decode("utf-8").splitlines()))
+    assert len(expected_rows) == 5
+
+    monkeypatch.setattr(settings, "consumer_api_audit_trail_max_rows", 2)
+    rows: list[dict[str, Any]] = []
+    page_params: dict[str, Any] = dict(params)
+    while True:
+        response = api_client.get(f"{BASE_URL}/studies/audit-trail", params=page_params)
+        assert_response_status_code(response, 200)
+        rows.extend(csv.DictReader(response.content.decode("utf-8").splitlines()))
+        if "X-Next-Page-Token" not in response.headers:
+            break
+        page_params["page_token"] = response.headers["X-Next-Page-Token"]
+
+    assert rows == expected_rows
+
+
 def _add_study_activity(
     study_uid: str,
     idx: int,
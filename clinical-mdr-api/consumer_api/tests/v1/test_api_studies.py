@@ -538,6 +538,42 @@ def test_get_studies_all(api_client, page_size):
     TestUtils.assert_sort_order(all_fetched_studies, "uid", False)
 
 
+@pytest.mark.parametrize(
+    "sort_by, sort_order", [("uid", "asc"), ("id_prefix", "desc"), ("number", "asc")]
+)
+def test_get_studies_page_token(api_client, sort_by, sort_order):
+    response = api_client.get(
+        f"{BASE_URL}/studies?page_size=100&sort_by={sort_by}&sort_order={sort_order}"
+    )
+    expected_uids = [study["uid"] for study in response.json()["items"]]
+
+    fetched_uids = []
+    response = api_client.get(
+        f"{BASE_URL}/studies?page_size=4&sort_by={sort_by}&sort_order={sort_order}"
+    )
+    while response.json()["items"]:
+        fetched_uids.extend(study["uid"] for study in response.json()["items"])
+        assert "page_token=" in response.json()["next"]
+        response = api_client.get(response.json()["next"])
+        assert_response_status_code(response, 200)
+
+    assert fetched_uids == expected_uids
+
+
+def test_get_studies_invalid_page_token(api_client):
+    response = api_client.get(f"{BASE_URL}/studies?page_size=2")
+    next_link = response.json()["next"]
+
+    # Token created for a different sorting
+    response = api_client.get(f"{next_link.replace('sort_by=uid', 'sort_by=number')}")
+    assert_response_status_code(response, 400)
+    assert response.json()["message"] == "Invalid page_token"
+
+    response = api_client.get(f"{BASE_URL}/studies?page_token=invalid")
+    assert_response_status_code(response, 400)
+    assert response.json()["message"] == "Invalid page_token"
+
+
 def test_get_studies_filtering(api_client):
     # Find a study
     response = api_client.get(f"{BASE_URL}/studies")
@@ -0,0 +1,128 @@
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+
+import json
+import time
+from datetime import datetime
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from clinical_mdr_api.tests.integration.utils.api import inject_base_data
+from clinical_mdr_api.tests.integration.utils.utils import TestUtils
+from common.config import settings
+from consumer_api.consumer_api import app
+from consumer_api.tests.utils import assert_response_status_code, set_db
+
+BASE_URL = "/v2"
+
+STUDY_CHANGE_FIELDS = {
+    "watermark",
+    "ts",
+    "study_uid",
+    "study_id",
+    "action",
+    "entity_uid",
+    "entity_type",
+    "changed_properties",
+    "entity",
+    "author",
+}
+
+# Global variables shared between fixtures and tests
+study_uids: list[str]
+from_ts: str
+
+
+@pytest.fixture(scope="module")
+def api_client(test_data):
+    """Create FastAPI test client
+    using the database name set in the `test_data` fixture"""
+    yield TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def test_data():
+    """Initialize test data"""
+    db_name = "consumer-api-v2-study-changes"
+    set_db(db_name)
+    # the changes made by the tests are returned right away
+    settle_time = settings.consumer_api_change_feed_settle_time
+    settings.consumer_api_change_feed_settle_time = 0
+
+    global study_uids
+    global from_ts
+
+    from_ts = datetime.fromtimestamp(time.time() - 60).isoformat()
+    study, _test_data_dict = inject_base_data()
+    study_uids = [study.uid]
+    for _idx in range(1, 5):
+        rand = TestUtils.random_str(4)
+        study_uids.append(TestUtils.create_study(acronym=f"ACR-{rand}").uid)
+
+    yield
+    settings.consumer_api_change_feed_settle_time = settle_time
+
+
+def _get_changes(api_client, **params) -> tuple[list[dict[str, Any]], str | None]:
+    response = api_client.get(f"{BASE_URL}/studies/changes", params=params)
+    assert_response_status_code(response, 200)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    changes = [json.loads(line) for line in response.text.splitlines()]
+    return changes, changes[-1]["watermark"] if changes else params.get("after")
+
+
+def test_get_study_changes(api_client):
+    changes, watermark = _get_changes(api_client, from_ts=from_ts)
+
+    assert changes
+    for change in changes:
+        assert set(change.keys()) == STUDY_CHANGE_FIELDS
+    assert {change["study_uid"] for change in changes} >= set(study_uids)
+    assert [change["ts"] for change in changes] == sorted(
+        change["ts"] for change in changes
+    )
+
+    # Nothing happened after the last change
+    next_changes, next_watermark = _get_changes(api_client, after=watermark)
+    assert not next_changes
+    assert next_watermark == watermark
+
+
+def test_get_study_changes_after_watermark(api_client):
+    expected_changes, _ = _get_changes(api_client, from_ts=from_ts)
+
+    changes: list[dict[str, Any]] = []
+    page, watermark = _get_changes(api_client, from_ts=from_ts, limit=2)
+    while page:
+        assert len(page) <= 2
+        changes.extend(page)
+        page, watermark = _get_changes(api_client, after=watermark, limit=2)
+
+    assert changes == expected_changes
+
+
+def test_get_study_changes_filtered_by_study(api_client):
+    study_uid = study_uids[-1]
+    changes, _ = _get_changes(api_client, from_ts=from_ts)
+    study_id = next(
+        change["study_id"] for change in changes if change["study_uid"] == study_uid
+    )
+
+    changes, _ = _get_changes(api_client, from_ts=from_ts, study_id=study_id)
+    assert changes
+    assert all(change["study_id"] == study_id for change in changes)
+
+
+def test_get_study_changes_invalid_watermark(api_client):
+    response = api_client.get(f"{BASE_URL}/studies/changes?after=invalid")
+    assert_response_status_code(response, 400)
+    assert response.json()["message"] == "Invalid page_token"
+
+
+def test_get_study_changes_waits_until_changes_settle(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "consumer_api_change_feed_settle_time", 3600)
+
+    changes, _ = _get_changes(api_client, from_ts=from_ts)
+    assert not changes
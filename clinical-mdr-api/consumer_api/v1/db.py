@@ -10,6 +10,7 @@ from consumer_api.shared.common import (
     SortByType,
     db_pagination_clause,
     db_sort_clause,
+    encode_page_token,
     query,
 )
 from consumer_api.v1 import models
@@ -83,18 +84,51 @@ def get_studies(
     page_size: int = 10,
     page_number: int = 1,
     id: str | None = None,
+    page_token: dict[str, Any] | None = None,
 ) -> list[dict[Any, Any]]:
+    """
+    Returns a page of studies.
+
+    If `page_token` (decoded, see `get_studies_page_token`) is provided, the page starts right after
+    the study it was created from (keyset pagination) and `page_number` is ignored.
+    """
     validate_page_number_and_page_size(page_number, page_size)
 
-    params = {}
-    filter_clause = ""
+    params: dict[str, Any] = {}
+    filters = []
 
     if id is not None:
         params["id"] = id.strip()
-        filter_clause = "WHERE toUpper(id) CONTAINS toUpper($id)"
+        filters.append("toUpper(id) CONTAINS toUpper($id)")
+
+    if page_token is not None:
+        params["page_token_value"] = page_token["value"]
+        params["page_token_uid"] = page_token["uid"]
+        filters.append(
+            db_keyset_predicate(
+                f"toLower(toString({sort_by.value}))",
+                sort_order.value,
+                page_token["value"] is None,
+            )
+        )
+    filter_clause = f"WHERE {' AND '.join(filters)}" if filters else ""
 
+    # The filters and the page token only need the study root and value,
+    # they are applied before reading the versions of the studies
     base_query = f"""
         MATCH (study_root:StudyRoot)-[:LATEST]->(study_value:StudyValue)
+        WITH study_root,
+            study_root.uid as uid,
+            study_value.study_acronym as acronym,
+            study_value.study_id_prefix as id_prefix,
+            study_value.study_number as number,
+            CASE study_value.subpart_id
+                WHEN IS NULL THEN COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, '')
+                ELSE COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, '') + "-" + study_value.subpart_id
+            END AS id
+
+        {filter_clause}
+
         OPTIONAL MATCH (study_root)-[hv:HAS_VERSION|LATEST_DRAFT]->(:StudyValue)
         OPTIONAL MATCH (study_root)-[hv_ld:LATEST_DRAFT]->(:StudyValue)
         OPTIONAL MATCH (author:User) WHERE author.user_id = hv.author_id
@@ -105,14 +139,11 @@ def get_studies(
             }}) AS authors
         ORDER BY hv.start_date DESC
         WITH
-            study_root.uid as uid,
-            study_value.study_acronym as acronym,
-            study_value.study_id_prefix as id_prefix,
-            study_value.study_number as number,
-            CASE study_value.subpart_id
-                WHEN IS NULL THEN COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, '')
-                ELSE COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, '') + "-" + study_value.subpart_id
-            END AS id,
+            uid,
+            acronym,
+            id_prefix,
+            number,
+            id,
             hv_ld as version_latest_draft,
             COLLECT(DISTINCT {{
                 version_status: hv.status,
@@ -124,8 +155,6 @@ def get_studies(
                 version_description: hv.change_description
             }}) as versions_all
 
-        {filter_clause}
-
         WITH *,
             [v IN versions_all 
                 WHERE v.version_status IN ['RELEASED', 'LOCKED']
@@ -143,12 +172,50 @@ def get_studies(
         [
             base_query,
             db_sort_clause(sort_by.value, sort_order.value),
-            db_pagination_clause(page_size, page_number),
+            (
+                db_pagination_clause(page_size, 1)
+                if page_token is not None
+                else db_pagination_clause(page_size, page_number)
+            ),
         ]
     )
     return query(full_query, params)
 
 
+def db_keyset_predicate(sort_key: str, sort_order: str, after_null: bool) -> str:
+    """
+    Returns the predicate selecting the rows following the `$page_token_value` and `$page_token_uid` position,
+    for results ordered with `db_sort_clause` on `sort_key` (nulls last in ascending order, first in descending order)
+    and the hash of the uid as tie breaker.
+    """
+    after_uid = "apoc.util.md5([uid]) > apoc.util.md5([$page_token_uid])"
+    if sort_order.upper() == "DESC":
+        if after_null:
+            return f"({sort_key} IS NOT NULL OR ({sort_key} IS NULL AND {after_uid}))"
+        return f"({sort_key} < $page_token_value OR ({sort_key} = $page_token_value AND {after_uid}))"
+    if after_null:
+        return f"({sort_key} IS NULL AND {after_uid})"
+    return f"({sort_key} > $page_token_value OR {sort_key} IS NULL OR ({sort_key} = $page_token_value AND {after_uid}))"
+
+
+def get_studies_page_token(
+    studies: list[dict[Any, Any]],
+    sort_by: models.SortByStudies,
+    sort_order: models.SortOrder,
+) -> str | None:
+    """Returns the token of the page following the given page of studies, None if the page is empty"""
+    if not studies:
+        return None
+    last_study = studies[-1]
+    value = last_study[sort_by.value]
+    return encode_page_token(
+        sort_by=sort_by.value,
+        sort_order=sort_order.value,
+        value=str(value).lower() if value is not None else None,
+        uid=last_study["uid"],
+    )
+
+
 def get_study_version(
     study_uid: str, study_version_number: str | None
 ) -> dict[str, Any]:
@@ -834,13 +901,38 @@ def get_studies_audit_trail(
     entity_type: models.StudyAuditTrailEntity | None = None,
     exclude_study_ids: list[str] | None = None,
     page_number: int = 1,
+    page_token: dict[str, Any] | None = None,
 ) -> list[dict[Any, Any]]:
+    """
+    Returns a page of study audit trail entries, ordered by timestamp, entity uid and entry key.
+
+    An action can produce several entries with the same timestamp and entity uid (or without an entity uid),
+    the entry key, a hash of the other columns of the entry, sets their order.
+
+    If `page_token` (decoded, see `get_studies_audit_trail_page_token`) is provided, the page starts right after
+    the entry it was created from, seeking directly to its timestamp, and `page_number` is ignored.
+    """
     validate_page_number_and_page_size(
         page_number, settings.consumer_api_audit_trail_max_rows
     )
-    params = {"from_ts": from_ts.isoformat(), "to_ts": to_ts.isoformat()}
+    params: dict[str, Any] = {
+        "from_ts": from_ts.isoformat(),
+        "to_ts": to_ts.isoformat(),
+    }
 
     filters = []
+    seek_clause = ""
+    if page_token is not None:
+        params["page_token_ts"] = page_token["ts"]
+        params["page_token_uid"] = page_token["uid"]
+        params["page_token_key"] = page_token["key"]
+        seek_clause = "AND sa.date >= datetime($page_token_ts)"
+        filters.append(
+            """(ts > datetime($page_token_ts)
+            OR (ts = datetime($page_token_ts) AND COALESCE(entity_uid, '') > $page_token_uid)
+            OR (ts = datetime($page_token_ts) AND COALESCE(entity_uid, '') = $page_token_uid
+                AND entry_key > $page_token_key))"""
+        )
     if study_id:
         params["study_id"] = study_id.upper().strip()
         filters.append("toUpper(study_id) CONTAINS $study_id")
@@ -859,7 +951,7 @@ def get_studies_audit_trail(
         MATCH (sa:StudyAction)-[:AFTER]->(obj_after)
         OPTIONAL MATCH (sa)-[:BEFORE]->(obj_before)
         MATCH (sa)-[:AUDIT_TRAIL]-(sr:StudyRoot)-[:LATEST]->(sv:StudyValue)
-        WHERE sa.date >= datetime($from_ts) AND sa.date < datetime($to_ts)
+        WHERE sa.date >= datetime($from_ts) AND sa.date < datetime($to_ts) {seek_clause}
         
         WITH DISTINCT
             sa.date AS ts,
@@ -876,11 +968,20 @@ def get_studies_audit_trail(
                 THEN apoc.util.md5([sa.author_id])
                 ELSE ''
             END AS author
-            
+        WITH *, apoc.util.md5([
+            study_uid,
+            action,
+            COALESCE(entity_uid, ''),
+            apoc.text.join(entity_labels, '|'),
+            apoc.text.join(changed_properties, '|'),
+            author
+        ]) AS entry_key
+
         { 'WHERE ' + ' AND '.join(filters) if filters else ''}
 
         RETURN DISTINCT
             ts,
+            entry_key,
             study_uid,
             study_id,
             action,
@@ -888,15 +989,30 @@ def get_studies_audit_trail(
             apoc.text.join(entity_labels, '|') AS entity_type,
             changed_properties,
             author
-        ORDER BY ts ASC
+        ORDER BY ts ASC, COALESCE(entity_uid, '') ASC, entry_key ASC
         """
 
     full_query = " ".join(
         [
             base_query,
             db_pagination_clause(
-                settings.consumer_api_audit_trail_max_rows, page_number
+                settings.consumer_api_audit_trail_max_rows,
+                1 if page_token is not None else page_number,
             ),
         ]
     )
     return query(full_query, params)
+
+
+def get_studies_audit_trail_page_token(
+    audit_trail: list[dict[Any, Any]],
+) -> str | None:
+    """Returns the token of the page following the given page of audit trail entries, None if it is the last page"""
+    if len(audit_trail) < settings.consumer_api_audit_trail_max_rows:
+        return None
+    last_entry = audit_trail[-1]
+    return encode_page_token(
+        ts=str(last_entry["ts"]),
+        uid=last_entry["entity_uid"] or "",
+        key=last_entry["entry_key"],
+    )
@@ -11,6 +11,7 @@ from common.auth.dependencies import security
 from common.config import settings
 from common.models.error import ErrorResponse
 from common.utils import BaseTimelineAR
+from consumer_api.shared.common import decode_page_token
 from consumer_api.shared.responses import (
     PaginatedResponse,
     PaginatedResponseWithStudyVersion,
@@ -42,6 +43,13 @@ def get_studies(
             description="Filter by study ID (case-insensitive partial match), for example `NN1234-5678`."
         ),
     ] = None,
+    page_token: Annotated[
+        str | None,
+        Query(
+            description="Opaque token returned in the `next` link, to fetch the following page without skipping through previous ones. "
+            "When provided, `page_number` is only used to build pagination links."
+        ),
+    ] = None,
 ) -> PaginatedResponse[models.Study]:
     """
     Returns a paginated list of studies, sorted by the specified sort criteria and order.
@@ -50,6 +58,9 @@ def get_studies(
 
     Returned `version_number` value can be used in other endpoints to retrieve study entities (e.g. visits, activities, etc.)
     associated with a specific study version.
+
+    The `next` link contains a `page_token` which makes the following page start right after the last returned study,
+    which is faster than `page_number` based pagination for deep pages.
     """
     studies = DB.get_studies(
         sort_by=sort_by,
@@ -57,6 +68,16 @@ def get_studies(
         page_size=page_size,
         page_number=page_number,
         id=id,
+        page_token=(
+            decode_page_token(
+                page_token,
+                required_keys=("value", "uid"),
+                sort_by=sort_by.value,
+                sort_order=sort_order.value,
+            )
+            if page_token
+            else None
+        ),
     )
 
     return PaginatedResponse.from_input(
@@ -67,6 +88,8 @@ def get_studies(
         page_number=page_number,
         items=[models.Study.from_input(study) for study in studies],
         query_param_names=["id"],
+        page_token=page_token,
+        next_page_token=DB.get_studies_page_token(studies, sort_by, sort_order),
     )
 
 
@@ -594,6 +617,13 @@ def get_studies_audit_trail(
         ),
     ] = ["CDISC DEV"],
     page_number: Annotated[int, Query(ge=1)] = 1,
+    page_token: Annotated[
+        str | None,
+        Query(
+            description="Opaque token returned in the `X-Next-Page-Token` response header, to fetch the following page. "
+            "When provided, `page_number` is ignored."
+        ),
+    ] = None,
 ) -> Response:
     """
     Returns study audit trail entries between `from_ts` timestamp (including) and `to_ts` timestamp (excluding).
@@ -614,6 +644,8 @@ def get_studies_audit_trail(
       - `exclude_study_ids` - returns audit trail without the specified study IDs (case-insensitive partial match)
 
     Note: the maximum number of rows returned is limited to 10.000.
+    When more rows are available, the `X-Next-Page-Token` response header contains a `page_token`
+    to use with the same filters to fetch the next rows, which is faster than incrementing `page_number`.
     """
 
     audit_trail = DB.get_studies_audit_trail(
@@ -623,6 +655,11 @@ def get_studies_audit_trail(
         entity_type=entity_type,
         exclude_study_ids=exclude_study_ids,
         page_number=page_number,
+        page_token=(
+            decode_page_token(page_token, required_keys=("ts", "uid", "key"))
+            if page_token
+            else None
+        ),
     )
 
     # Convert audit trail to CSV format
@@ -641,4 +678,8 @@ def get_studies_audit_trail(
         csv_output += ",".join(str(entry[key]) for key in keys)
         csv_output += "\n"
 
-    return Response(content=csv_output, media_type="text/csv")
+    headers = {}
+    if next_page_token := DB.get_studies_audit_trail_page_token(audit_trail):
+        headers["X-Next-Page-Token"] = next_page_token
+
+    return Response(content=csv_output, media_type="text/csv", headers=headers)
@@ -1,7 +1,14 @@
-from typing import Any
+from typing import Any, Iterator
 
+from common.config import settings
 from common.utils import validate_page_number_and_page_size
-from consumer_api.shared.common import db_pagination_clause, db_sort_clause, query
+from consumer_api.shared.common import (
+    db_pagination_clause,
+    db_sort_clause,
+    encode_page_token,
+    query,
+    stream_query,
+)
 from consumer_api.v2 import models
 
 
@@ -29,3 +36,102 @@ def get_studies(
         ]
     )
     return query(full_query)
+
+
+def get_study_changes(
+    from_ts: str | None = None,
+    watermark: dict[str, Any] | None = None,
+    study_id: str | None = None,
+    entity_type: models.StudyAuditTrailEntity | None = None,
+    limit: int = settings.consumer_api_audit_trail_max_rows,
+) -> Iterator[dict[Any, Any]]:
+    """
+    Yields up to `limit` study changes ordered by timestamp and change key,
+    together with the properties of the changed entity, while they are read from the database.
+
+    A study action gets its timestamp before its transaction commits, so it can become visible after actions
+    with a later timestamp. Only changes older than `consumer_api_change_feed_settle_time` seconds are returned,
+    by then the transactions which recorded them have committed, and a watermark never skips a change.
+    Changes with the same timestamp are ordered by their change key, a hash of the study, the action and
+    the entity before and after the action. Unlike the internal ids of the nodes, which can be reused, it is stable.
+
+    If `watermark` (decoded, see `get_study_change_watermark`) is provided, the changes start right after
+    the change it was created from, seeking directly to its timestamp, and `from_ts` is ignored.
+    """
+    params: dict[str, Any] = {
+        "limit": limit,
+        "settle_time": settings.consumer_api_change_feed_settle_time,
+    }
+
+    seek_filters = ["sa.date <= datetime() - duration({seconds: $settle_time})"]
+    filters = []
+    if watermark is not None:
+        params["watermark_ts"] = watermark["ts"]
+        params["watermark_key"] = watermark["key"]
+        seek_filters.append("sa.date >= datetime($watermark_ts)")
+        filters.append(
+            """(ts > datetime($watermark_ts)
+            OR (ts = datetime($watermark_ts) AND change_key > $watermark_key))"""
+        )
+    elif from_ts is not None:
+        params["from_ts"] = from_ts
+        seek_filters.append("sa.date >= datetime($from_ts)")
+
+    if study_id:
+        params["study_id"] = study_id.upper().strip()
+        filters.append("toUpper(study_id) CONTAINS $study_id")
+
+    if entity_type:
+        params["entity_type"] = entity_type.value.strip()
+        filters.append("$entity_type IN entity_labels")
+
+    full_query = f"""
+        MATCH (sa:StudyAction)
+        WHERE {' AND '.join(seek_filters)}
+        MATCH (sa)-[:AFTER]->(obj_after)
+        OPTIONAL MATCH (sa)-[:BEFORE]->(obj_before)
+        MATCH (sa)-[:AUDIT_TRAIL]-(sr:StudyRoot)-[:LATEST]->(sv:StudyValue)
+
+        WITH DISTINCT
+            sa.date AS ts,
+            sr.uid AS study_uid,
+            CASE sv.subpart_id
+                WHEN IS NULL THEN toUpper(COALESCE(sv.study_id_prefix, '') + "-" + COALESCE(sv.study_number, ''))
+                ELSE toUpper(COALESCE(sv.study_id_prefix, '') + "-" + COALESCE(sv.study_number, '')) + "-" + sv.subpart_id
+            END AS study_id,
+            [label IN labels(sa) WHERE label <> 'StudyAction'][0] as action,
+            obj_after.uid as entity_uid,
+            labels(obj_after) as entity_labels,
+            [key IN keys(obj_after) WHERE obj_after[key] <> obj_before[key]] AS changed_properties,
+            properties(obj_after) AS entity,
+            CASE WHEN obj_before IS NULL THEN '' ELSE apoc.hashing.fingerprint(obj_before) END AS before_fingerprint,
+            apoc.hashing.fingerprint(obj_after) AS after_fingerprint,
+            CASE WHEN sa.author_id IS NOT NULL AND sa.author_id <> ''
+                THEN apoc.util.md5([sa.author_id])
+                ELSE ''
+            END AS author
+        WITH *, apoc.util.md5([study_uid, action, before_fingerprint, after_fingerprint]) AS change_key
+
+        {'WHERE ' + ' AND '.join(filters) if filters else ''}
+
+        RETURN
+            ts,
+            change_key,
+            study_uid,
+            study_id,
+            action,
+            entity_uid,
+            apoc.text.join(entity_labels, '|') AS entity_type,
+            changed_properties,
+            entity,
+            author
+        ORDER BY ts ASC, change_key ASC
+        LIMIT $limit
+        """
+
+    yield from stream_query(full_query, params)
+
+
+def get_study_change_watermark(change: dict[Any, Any]) -> str:
+    """Returns the watermark after which the changes following the given change are returned"""
+    return encode_page_token(ts=str(change["ts"]), key=change["change_key"])
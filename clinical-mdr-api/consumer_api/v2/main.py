@@ -1,16 +1,106 @@
 # RESTful API endpoints used by consumers that want to extract data from StudyBuilder
-# This file is a placeholder for version 2 of the consumer api,
-# and should be replaced by the real v2 code once that needs to be implemented.
+# pylint: disable=invalid-name
+import itertools
+from datetime import datetime
+from typing import Annotated, Iterator
 
-# from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
-# from consumer_api.auth import rbac
-# from consumer_api.shared import config
-# from consumer_api.shared.responses import PaginatedResponse
-# from consumer_api.v2 import db as DB
-# from consumer_api.v2 import models
+from common.auth import rbac
+from common.auth.dependencies import security
+from common.config import settings
+from consumer_api.shared.common import decode_page_token
+from consumer_api.v2 import db as DB
+from consumer_api.v2 import models
+
+router = APIRouter()
+
+
+# GET endpoint to stream study changes
+@router.get(
+    "/studies/changes",
+    tags=["[V2] Change feed"],
+    dependencies=[security, rbac.STUDY_READ],
+    status_code=200,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "Newline delimited JSON stream of study changes",
+        },
+    },
+)
+def get_study_changes(
+    after: Annotated[
+        str | None,
+        Query(
+            description="Watermark of the last change already applied by the consumer. "
+            "Only changes recorded after it are returned. When provided, `from_ts` is ignored."
+        ),
+    ] = None,
+    from_ts: Annotated[
+        datetime | None,
+        Query(
+            description="Start timestamp in ISO format with timezone, e.g. 2024-01-01T00:00:00Z, used when `after` is not provided"
+        ),
+    ] = None,
+    study_id: Annotated[
+        str | None,
+        Query(
+            description="Filter by study ID (case-insensitive partial match), for example `NN1234-5678`."
+        ),
+    ] = None,
+    entity_type: Annotated[
+        models.StudyAuditTrailEntity | None,
+        Query(description="Filter by entity type, for example `StudyActivity`."),
+    ] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.consumer_api_audit_trail_max_rows)
+    ] = settings.consumer_api_audit_trail_max_rows,
+) -> StreamingResponse:
+    """
+    Returns study changes (study audit trail entries) recorded after the `after` watermark,
+    in the order they were recorded, as newline delimited JSON (one change per line).
+
+    Each change contains:
+      - **watermark**: Opaque position of the change in the feed
+      - **ts**: Timestamp of the action
+      - **study_uid**: Study UID
+      - **study_id**: Study ID
+      - **action**: Action performed (Create, Edit, Delete)
+      - **entity_uid**: UID of the entity affected by the action
+      - **entity_type**: Type (i.e node labels) of the entity affected by the action, separated by '**|**' character
+      - **changed_properties**: List of properties that were changed during the Edit action
+      - **entity**: Properties of the entity affected by the action, after the action
+      - **author**: Hashed (MD5) value of the ID of a user that performed the action
+
+    At most `limit` changes are returned, and changes are only returned once they are older than a few minutes,
+    when no change recorded at the same time can still be pending. Pass the watermark of the last change received
+    as `after` in the next request; when fewer than `limit` changes are returned the consumer is up to date.
+    """
+    changes = DB.get_study_changes(
+        from_ts=from_ts.isoformat() if from_ts else None,
+        watermark=(
+            decode_page_token(after, required_keys=("ts", "key")) if after else None
+        ),
+        study_id=study_id,
+        entity_type=entity_type,
+        limit=limit,
+    )
+
+    # runs the query before the response starts, so that database errors get an error status
+    first_change = next(changes, None)
+
+    def stream() -> Iterator[str]:
+        if first_change is None:
+            return
+        for change in itertools.chain([first_change], changes):
+            yield models.StudyChange.from_input(
+                change, watermark=DB.get_study_change_watermark(change)
+            ).model_dump_json() + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
-# router = APIRouter()
 
 # Example v2 endpoint.
 # GET endpoint to retrieve a list of studies.
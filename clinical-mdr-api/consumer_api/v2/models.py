@@ -4,6 +4,8 @@ from typing import Annotated, Any
 
 from pydantic import BaseModel, Field
 
+from consumer_api.v1 import models as v1_models
+
 log = logging.getLogger(__name__)
 
 
@@ -18,6 +20,9 @@ class SortByStudies(Enum):
     NUMBER = "number"
 
 
+StudyAuditTrailEntity = v1_models.StudyAuditTrailEntity
+
+
 class Study(BaseModel):
     uid: Annotated[str, Field(description="Study UID")]
     acronym: Annotated[
@@ -39,3 +44,68 @@ class Study(BaseModel):
             id_prefix=val["id_prefix"],
             number=val["number"],
         )
+
+
+class StudyChange(BaseModel):
+    watermark: Annotated[
+        str,
+        Field(
+            description="Opaque watermark of the change, pass it as `after` to get the changes that follow it"
+        ),
+    ]
+    ts: Annotated[str, Field(description="Timestamp of the action")]
+    study_uid: Annotated[str, Field(description="Study UID")]
+    study_id: Annotated[str, Field(description="Study ID")]
+    action: Annotated[str, Field(description="Action performed (Create, Edit, Delete)")]
+    entity_uid: Annotated[
+        str | None,
+        Field(
+            description="UID of the entity affected by the action",
+            json_schema_extra={"nullable": True},
+        ),
+    ] = None
+    entity_type: Annotated[
+        str,
+        Field(
+            description="Node labels of the entity affected by the action, separated by '|'"
+        ),
+    ]
+    changed_properties: Annotated[
+        list[str],
+        Field(description="Properties that were changed during the Edit action"),
+    ] = []
+    entity: Annotated[
+        dict[str, Any],
+        Field(description="Properties of the entity after the action"),
+    ] = {}
+    author: Annotated[
+        str,
+        Field(description="Hashed (MD5) ID of the user that performed the action"),
+    ]
+
+    @classmethod
+    def from_input(cls, val: dict[str, Any], watermark: str):
+        log.debug("Create StudyChange from input: %s", val)
+        return cls(
+            watermark=watermark,
+            ts=str(val["ts"]),
+            study_uid=val["study_uid"],
+            study_id=val["study_id"],
+            action=val["action"],
+            entity_uid=val["entity_uid"],
+            entity_type=val["entity_type"],
+            changed_properties=val["changed_properties"] or [],
+            entity={
+                key: _json_value(value) for key, value in (val["entity"] or {}).items()
+            },
+            author=val["author"],
+        )
+
+
+def _json_value(value: Any) -> Any:
+    """Converts Neo4j temporal and spatial property values to their string representation"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    return str(value)
@@ -0,0 +1,131 @@
+"""Benchmarks table_to_docx() against rendering the same SoA-like table with python-docx cell objects"""
+
+import argparse
+import random
+import time
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches
+from lxml import etree
+
+from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+from clinical_mdr_api.services.utils.table_f import Cell, Row, Table, table_to_docx
+
+STYLES = {
+    "table": ("SoA Table", WD_STYLE_TYPE.TABLE),
+    "header": ("Table Header", WD_STYLE_TYPE.PARAGRAPH),
+    "activity": ("Table Activity", WD_STYLE_TYPE.PARAGRAPH),
+    "activitySchedule": ("Table Schedule", WD_STYLE_TYPE.PARAGRAPH),
+}
+
+
+def make_table(num_rows: int, num_cols: int) -> Table:
+    """Returns a table with two merged header rows and randomly checked schedule cells"""
+
+    random.seed(num_rows * num_cols)
+
+    epochs = [Cell("Epoch", style="header")]
+    for col in range(1, num_cols, 4):
+        span = min(4, num_cols - col)
+        epochs.append(Cell(f"Epoch {col // 4}", span=span, style="header"))
+        epochs.extend(Cell(span=0) for _ in range(span - 1))
+
+    visits = [Cell("Visit", style="header")] + [
+        Cell(f"V{col}", style="header", vertical=True) for col in range(1, num_cols)
+    ]
+
+    rows = [Row(epochs), Row(visits)]
+    for row in range(num_rows):
+        rows.append(
+            Row(
+                [Cell(f"Activity {row}", style="activity")]
+                + [
+                    Cell("X" if random.random() < 0.2 else "", style="activitySchedule")
+                    for _ in range(1, num_cols)
+                ]
+            )
+        )
+
+    return Table(rows=rows, num_header_rows=2, num_header_cols=1, title="SoA")
+
+
+def render_with_cell_objects(table: Table) -> DocxBuilder:
+    """Renders the table through python-docx _Cell objects, the way table_to_docx() did before"""
+
+    num_cols = sum(c.span for c in table.rows[0].cells)
+    docx = DocxBuilder(styles=STYLES, landscape=True, margins=[0.5, 0.5, 0.5, 0.5])
+    x_table = docx.create_table(
+        num_rows=sum(1 for row in table.rows if not row.hide), num_columns=num_cols
+    )
+    x_table.columns[0].width = Inches(4)
+    # pylint: disable=protected-access
+    x_cells = x_table._cells
+    x_rows = x_table.rows
+
+    for r, t_row in enumerate(row for row in table.rows if not row.hide):
+        num_merge, merge_to = 0, None
+        if r < table.num_header_rows:
+            docx.repeat_table_header(x_rows[r])
+        for c, t_cell in enumerate(t_row.cells):
+            x_cell = x_cells[r * num_cols + c]
+            if num_merge:
+                merge_to.merge(x_cell)
+                num_merge -= 1
+                continue
+            num_merge, merge_to = t_cell.span - 1, x_cell
+            x_para = x_cell.paragraphs[0]
+            if t_cell.text:
+                x_para.text = t_cell.text
+            x_para.style = STYLES[t_cell.style][0]
+            if c >= table.num_header_cols:
+                x_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            if t_cell.vertical:
+                docx.set_vertical_cell_direction(x_cell, "btLr")
+
+    return docx
+
+
+def canonical_xml(docx: DocxBuilder) -> bytes:
+    body = etree.tostring(docx.document.element.body)
+    parser = etree.XMLParser(remove_blank_text=True)
+    return etree.tostring(etree.fromstring(body, parser), method="c14n")
+
+
+def timed(render, table: Table) -> tuple[float, DocxBuilder]:
+    start = time.perf_counter()
+    docx = render(table)
+    docx.get_document_stream()
+    return time.perf_counter() - start, docx
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=300,
+        help="Number of activity rows (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cols",
+        type=int,
+        default=40,
+        help="Number of columns, including the activity column (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    soa_table = make_table(args.rows, args.cols)
+    direct_time, direct_docx = timed(
+        lambda t: table_to_docx(t, styles=STYLES), soa_table
+    )
+    cells_time, cells_docx = timed(render_with_cell_objects, soa_table)
+
+    print(f"Table of {len(soa_table.rows)} rows x {args.cols} columns")
+    print(f"python-docx cell objects: {cells_time:8.2f} s")
+    print(f"table_to_docx():          {direct_time:8.2f} s")
+    print(f"Speed-up:                 {cells_time / direct_time:8.1f} x")
+    print(
+        "Documents are equivalent:",
+        canonical_xml(direct_docx) == canonical_xml(cells_docx),
+    )
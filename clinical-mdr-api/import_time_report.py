@@ -0,0 +1,66 @@
+"""Reports where the import time of the API goes, per module and per top-level package"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+
+
+def measure_imports(module: str) -> list[tuple[str, int, int]]:
+    """Imports `module` in a fresh interpreter, returns (module, self us, cumulative us) for each imported module"""
+
+    rs = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = []
+    for line in rs.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            # the header line
+            continue
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def print_report(module: str, top: int):
+    imports = measure_imports(module)
+
+    packages: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in imports:
+        packages[name.split(".")[0]] += self_us
+    total_us = sum(packages.values())
+
+    print(f"Importing {module} took {total_us / 1e6:.2f}s ({len(imports)} modules)")
+
+    print(f"\nTop {top} top-level packages by import time")
+    for package, self_us in sorted(packages.items(), key=lambda p: -p[1])[:top]:
+        print(f"{self_us / 1e3:10.1f} ms {100 * self_us / total_us:5.1f}%  {package}")
+
+    print(f"\nTop {top} modules by cumulative import time")
+    for name, _, cumulative_us in sorted(imports, key=lambda i: -i[2])[:top]:
+        print(f"{cumulative_us / 1e3:10.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "module",
+        nargs="?",
+        default="clinical_mdr_api.main",
+        help="The module to import (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=25,
+        help="Number of packages and modules to list (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    print_report(args.module, args.top)
@@ -1,5 +1,7 @@
 import logging
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from os import environ
 
@@ -53,6 +55,7 @@ if not NEO4J_STAGING_DATABASE:
 
 
 BATCH_SIZE = 1000
+MERGE_WORKERS = 4
 
 
 def get_logger():
@@ -672,16 +675,37 @@ def make_clean_package_names(codelists):
                 vcat["uid"] = vcat["name"].replace(" ", "__")
 
 
-def merge_codelists(staging_db_driver, sb_db_driver, sideload_data: bool = False):
+def merge_codelists(
+    staging_db_driver,
+    sb_db_driver,
+    sideload_data: bool = False,
+    batch: bool = False,
+    chunk_size: int = BATCH_SIZE,
+    workers: int = MERGE_WORKERS,
+):
     with staging_db_driver.session() as staging_session, sb_db_driver.session() as sb_session:
         # Codelists
         codelists = fetch_versioned_codelists(staging_session)
         make_clean_package_names(codelists)
         merge_codelist_roots(sb_session, codelists, sideload_data)
         link_code_name_codelist_pairs(sb_session, codelists, sideload_data)
-        stats = None
-        for codelist in codelists:
-            stats = merge_codelist_versions(sb_session, codelist, stats, sideload_data)
+        if batch:
+            stats = merge_versions_in_batches(
+                sb_db_driver,
+                codelists,
+                lambda codelist: codelist["vcl"]["conceptId"],
+                extract_cl_names_and_attributes,
+                build_ct_package_codelist_uids,
+                CODELIST_VERSION_LABELS,
+                "codelists",
+                sideload_data=sideload_data,
+                chunk_size=chunk_size,
+                workers=workers,
+            )
+        else:
+            stats = None
+            for codelist in codelists:
+                stats = merge_codelist_versions(sb_session, codelist, stats, sideload_data)
         print_stats(stats)
 
 
@@ -1071,7 +1095,14 @@ def extract_term_names_and_attributes(term):
     return names, attributes
 
 
-def merge_terms(staging_db_driver, sb_db_driver, sideload_data: bool = False):
+def merge_terms(
+    staging_db_driver,
+    sb_db_driver,
+    sideload_data: bool = False,
+    batch: bool = False,
+    chunk_size: int = BATCH_SIZE,
+    workers: int = MERGE_WORKERS,
+):
     with staging_db_driver.session() as staging_session, sb_db_driver.session() as sb_session:
         # Terms
         LOGGER.info("Fetch staged terms")
@@ -1081,14 +1112,292 @@ def merge_terms(staging_db_driver, sb_db_driver, sideload_data: bool = False):
         LOGGER.info("Merge term roots")
         merge_term_roots(sb_session, terms, sideload_data)
         LOGGER.info("Merge term versions")
-        stats = None
-        for term in terms:
-            stats = merge_term_versions(
-                sb_session, term, stats=stats, sideload_data=sideload_data
+        if batch:
+            stats = merge_versions_in_batches(
+                sb_db_driver,
+                terms,
+                lambda term: term["term"]["conceptId"],
+                extract_term_names_and_attributes,
+                build_ct_package_term_uids,
+                TERM_VERSION_LABELS,
+                "terms",
+                sideload_data=sideload_data,
+                chunk_size=chunk_size,
+                workers=workers,
             )
+        else:
+            stats = None
+            for term in terms:
+                stats = merge_term_versions(
+                    sb_session, term, stats=stats, sideload_data=sideload_data
+                )
         print_stats(stats)
 
 
+###### Batched merge of codelist and term versions
+# The version chains are computed in Python from the staged data, and written per chunk of codelists or terms,
+# with one query per kind of write (UNWIND) instead of several queries per codelist or term.
+# A chunk only touches the roots, values and package codelists/terms of its own codelists or terms,
+# so chunks don't conflict and are committed in parallel, each in its own session.
+
+CODELIST_VERSION_LABELS = {
+    "root": "CTCodelistRoot",
+    "attributes_value": "CTCodelistAttributesValue",
+    "name_value": "CTCodelistNameValue",
+    "package_item": "CTPackageCodelist",
+    "package_item_uids": "package_codelist_uids",
+}
+
+TERM_VERSION_LABELS = {
+    "root": "CTTermRoot",
+    "attributes_value": "CTTermAttributesValue",
+    "name_value": "CTTermNameValue",
+    "package_item": "CTPackageTerm",
+    "package_item_uids": "package_term_uids",
+}
+
+
+def new_stats():
+    return {
+        "attrs_updated": 0,
+        "attrs_created": 0,
+        "attrs_unchanged": 0,
+        "names_updated": 0,
+        "names_created": 0,
+        "names_unchanged": 0,
+    }
+
+
+def to_utc_datetime(value):
+    if value is None:
+        return None
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def plan_version_merge(uid, new_versions, existing_versions, kind, stats):
+    """
+    Compares the version chain computed from the staged data with the versions already in the database.
+    Returns the versions to create and the end date updates of existing versions, counting them in stats.
+    """
+    to_create = []
+    to_update = []
+    for version in new_versions:
+        version["uid"] = uid
+        if not existing_versions:
+            to_create.append(version)
+            stats[f"{kind}_created"] += 1
+            continue
+        start_date = to_utc_datetime(version["start_date"])
+        end_date = to_utc_datetime(version.get("end_date"))
+        matching = find_item_with_matching_start_date(start_date, existing_versions)
+        if matching is not None:
+            if matching["end_date"] == end_date:
+                stats[f"{kind}_unchanged"] += 1
+            else:
+                # the version was retired (or reopened) in the standards data since the last import
+                to_update.append(
+                    {
+                        "uid": uid,
+                        "start_date": matching["start_date"],
+                        "version": matching["version"],
+                        "end_date": version.get("end_date"),
+                    }
+                )
+                matching["end_date"] = end_date
+                stats[f"{kind}_updated"] += 1
+        else:
+            # a new version, retire the version active until now
+            existing_active = find_item_active_at_date(start_date, existing_versions)
+            if existing_active is not None:
+                to_update.append(
+                    {
+                        "uid": uid,
+                        "start_date": existing_active["start_date"],
+                        "version": existing_active["version"],
+                        "end_date": version["start_date"],
+                    }
+                )
+                existing_active["end_date"] = start_date
+                stats[f"{kind}_updated"] += 1
+            to_create.append(version)
+            stats[f"{kind}_created"] += 1
+    return to_create, to_update
+
+
+def fetch_existing_versions_batch(tx, uids, labels, suffix):
+    query = f"""
+        UNWIND $uids AS uid
+        MATCH (ar)<-[:HAS_ATTRIBUTES_ROOT]-(:{labels["root"]}{suffix} {{uid: uid}})-[:HAS_NAME_ROOT]->(nr)
+        RETURN uid,
+            COLLECT {{
+                MATCH (ar)-[hv:HAS_VERSION]->(:{labels["attributes_value"]}{suffix})
+                WITH hv ORDER BY hv.start_date
+                RETURN {{start_date: hv.start_date, end_date: hv.end_date, version: hv.version}}
+            }} AS avs,
+            COLLECT {{
+                MATCH (nr)-[hv:HAS_VERSION]->(:{labels["name_value"]}{suffix})
+                WITH hv ORDER BY hv.start_date
+                RETURN {{start_date: hv.start_date, end_date: hv.end_date, version: hv.version}}
+            }} AS nvs
+        """
+    return {
+        record["uid"]: (record["avs"], record["nvs"])
+        for record in tx.run(query, uids=uids).data()
+    }
+
+
+def write_versions_batch(tx, attr_updates, name_updates, attrs, names, labels, suffix):
+    update_query = """
+        UNWIND $updates AS update
+        MATCH (:{root}{suffix} {{uid: update.uid}})-[:{root_rel}]->(vr)-[hv:HAS_VERSION]->(v:{value}{suffix})
+        WHERE hv.start_date = update.start_date AND hv.version = update.version
+        SET hv.end_date = datetime(update.end_date)
+        WITH vr, v, update WHERE update.end_date IS NOT NULL
+        OPTIONAL MATCH (vr)-[l:LATEST|LATEST_FINAL]->(v)
+        DELETE l
+        """
+    create_query = """
+        UNWIND $versions AS version
+        MATCH (:{root}{suffix} {{uid: version.uid}})-[:{root_rel}]->(vr)
+        CREATE (vr)-[:HAS_VERSION {{start_date: datetime(version.start_date), end_date: datetime(version.end_date), version: version.version, status: "Final", user_initials: $user_initials}}]->(v:{value}{suffix})
+        SET v = version.value
+        FOREACH (_ IN CASE WHEN version.end_date IS NULL THEN [1] ELSE [] END |
+            MERGE (vr)-[:LATEST]->(v)
+            MERGE (vr)-[:LATEST_FINAL]->(v)
+        )
+        WITH v, version
+        UNWIND coalesce(version.{package_item_uids}, []) AS package_item_uid
+        MATCH (package_item:{package_item}{suffix} {{uid: package_item_uid}})
+        MERGE (v)<-[:CONTAINS_ATTRIBUTES]-(package_item)
+        """
+    for updates, versions, root_rel, value in (
+        (attr_updates, attrs, "HAS_ATTRIBUTES_ROOT", labels["attributes_value"]),
+        (name_updates, names, "HAS_NAME_ROOT", labels["name_value"]),
+    ):
+        params = {
+            "root": labels["root"],
+            "root_rel": root_rel,
+            "value": value,
+            "package_item": labels["package_item"],
+            "package_item_uids": labels["package_item_uids"],
+            "suffix": suffix,
+        }
+        # retire versions before creating the new ones, which take over LATEST
+        if updates:
+            tx.run(update_query.format(**params), updates=updates).consume()
+        if versions:
+            tx.run(
+                create_query.format(**params),
+                versions=versions,
+                user_initials=IMPORT_USERNAME,
+            ).consume()
+
+
+def merge_versions_chunk(
+    driver, items, get_uid, extract_names_and_attributes, build_package_item_uids, labels, sideload_data
+):
+    """Merges the versions of a chunk of codelists or terms in one write transaction of its own session"""
+    suffix = SIDELOAD_SUFFIX if sideload_data else ""
+    stats = new_stats()
+    attr_updates, name_updates, attrs, names = [], [], [], []
+    with driver.session() as session:
+        existing = session.execute_read(
+            fetch_existing_versions_batch, [get_uid(item) for item in items], labels, suffix
+        )
+        for item in items:
+            uid = get_uid(item)
+            existing_attrs, existing_names = existing.get(uid, ([], []))
+            names_to_merge, attrs_to_merge = extract_names_and_attributes(item)
+            for attr in attrs_to_merge:
+                build_package_item_uids(item, attr)
+                # neo4j doesn't like sets, convert to a list
+                attr["value"]["synonyms"] = list(attr["value"]["synonyms"])
+            to_create, to_update = plan_version_merge(
+                uid, attrs_to_merge, existing_attrs, "attrs", stats
+            )
+            attrs.extend(to_create)
+            attr_updates.extend(to_update)
+            to_create, to_update = plan_version_merge(
+                uid, names_to_merge, existing_names, "names", stats
+            )
+            names.extend(to_create)
+            name_updates.extend(to_update)
+        session.execute_write(
+            write_versions_batch, attr_updates, name_updates, attrs, names, labels, suffix
+        )
+    return stats
+
+
+class MergeProgress:
+    """Logs the progress and throughput of a batched merge"""
+
+    def __init__(self, label, total):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.started = time.monotonic()
+
+    def update(self, count):
+        self.done += count
+        elapsed = time.monotonic() - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0
+        remaining = (self.total - self.done) / rate if rate > 0 else 0
+        LOGGER.info(
+            "Merged %s versions: %d/%d (%.1f%%), %.1f %s/s, %.0fs elapsed, %.0fs remaining",
+            self.label,
+            self.done,
+            self.total,
+            100 * self.done / self.total if self.total else 100,
+            rate,
+            self.label,
+            elapsed,
+            remaining,
+        )
+
+
+def merge_versions_in_batches(
+    driver,
+    items,
+    get_uid,
+    extract_names_and_attributes,
+    build_package_item_uids,
+    labels,
+    label,
+    sideload_data: bool = False,
+    chunk_size: int = BATCH_SIZE,
+    workers: int = MERGE_WORKERS,
+):
+    stats = new_stats()
+    progress = MergeProgress(label, len(items))
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    LOGGER.info(
+        "Merge %s versions in %d chunks of %d with %d workers",
+        label,
+        len(chunks),
+        chunk_size,
+        workers,
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                merge_versions_chunk,
+                driver,
+                chunk,
+                get_uid,
+                extract_names_and_attributes,
+                build_package_item_uids,
+                labels,
+                sideload_data,
+            ): len(chunk)
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            for key, value in future.result().items():
+                stats[key] += value
+            progress.update(futures[future])
+    return stats
+
+
 ##### Link terms to codelists
 def fetch_codelists_with_terms(session):
     query = """
@@ -1136,8 +1445,30 @@ def main():
         action="store_true",
         help="Sideload the data in the MDR database to keep existing data",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Merge the codelist and term versions in batches, committed in parallel",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="Number of codelists or terms merged per batch",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MERGE_WORKERS,
+        help="Number of batches merged in parallel",
+    )
     args = parser.parse_args()
     sideload_data = args.sideload_data
+    batch_args = {
+        "batch": args.batch,
+        "chunk_size": args.chunk_size,
+        "workers": args.workers,
+    }
 
     # Connect to both databases
     staging_db_driver = get_staging_db_driver()
@@ -1150,9 +1481,13 @@ def main():
         staging_db_driver, sb_db_driver, sideload_data=sideload_data
     )
 
-    merge_codelists(staging_db_driver, sb_db_driver, sideload_data=sideload_data)
+    merge_codelists(
+        staging_db_driver, sb_db_driver, sideload_data=sideload_data, **batch_args
+    )
 
-    merge_terms(staging_db_driver, sb_db_driver, sideload_data=sideload_data)
+    merge_terms(
+        staging_db_driver, sb_db_driver, sideload_data=sideload_data, **batch_args
+    )
 
     link_terms_to_codelists(
         staging_db_driver, sb_db_driver, sideload_data=sideload_data
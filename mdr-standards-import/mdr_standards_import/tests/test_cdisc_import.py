@@ -0,0 +1,153 @@
+import importlib
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+ENVIRONMENT = {
+    "NEO4J_MDR_HOST": "localhost",
+    "NEO4J_MDR_BOLT_PORT": "7687",
+    "NEO4J_MDR_AUTH_USER": "neo4j",
+    "NEO4J_MDR_AUTH_PASSWORD": "test1234",
+    "NEO4J_MDR_DATABASE": "neo4j",
+    "NEO4J_CDISC_IMPORT_HOST": "localhost",
+    "NEO4J_CDISC_IMPORT_BOLT_PORT": "7687",
+    "NEO4J_CDISC_IMPORT_AUTH_USER": "neo4j",
+    "NEO4J_CDISC_IMPORT_AUTH_PASSWORD": "test1234",
+    "NEO4J_CDISC_IMPORT_DATABASE": "cdisc",
+}
+
+
+@pytest.fixture(scope="module")
+def cdisc_import():
+    # the connection settings are checked on import
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, value in ENVIRONMENT.items():
+            monkeypatch.setenv(name, value)
+        yield importlib.import_module("cdisc_import")
+
+
+def utc(value):
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+class Test:
+    def test__plan_version_merge_creates_all_versions_of_new_item(self, cdisc_import):
+        # given
+        stats = Counter()
+        new_versions = [
+            {"start_date": "2020-01-01T00:00:00", "end_date": "2021-01-01T00:00:00"},
+            {"start_date": "2021-01-01T00:00:00", "end_date": None},
+        ]
+
+        # when
+        to_create, to_update = cdisc_import.plan_version_merge(
+            "C1", new_versions, [], "codelist", stats
+        )
+
+        # then
+        assert to_create == new_versions
+        assert all(version["uid"] == "C1" for version in to_create)
+        assert to_update == []
+        assert stats == {"codelist_created": 2}
+
+    def test__plan_version_merge_skips_unchanged_versions(self, cdisc_import):
+        # given
+        stats = Counter()
+        existing_versions = [
+            {
+                "start_date": utc("2020-01-01T00:00:00"),
+                "end_date": utc("2021-01-01T00:00:00"),
+                "version": "1.0",
+            },
+            {
+                "start_date": utc("2021-01-01T00:00:00"),
+                "end_date": None,
+                "version": "2.0",
+            },
+        ]
+        new_versions = [
+            {"start_date": "2020-01-01T00:00:00", "end_date": "2021-01-01T00:00:00"},
+            {"start_date": "2021-01-01T00:00:00", "end_date": None},
+        ]
+
+        # when
+        to_create, to_update = cdisc_import.plan_version_merge(
+            "C1", new_versions, existing_versions, "term", stats
+        )
+
+        # then
+        assert to_create == []
+        assert to_update == []
+        assert stats == {"term_unchanged": 2}
+
+    def test__plan_version_merge_updates_end_date_of_existing_version(
+        self, cdisc_import
+    ):
+        # given
+        stats = Counter()
+        existing_versions = [
+            {
+                "start_date": utc("2020-01-01T00:00:00"),
+                "end_date": None,
+                "version": "1.0",
+            },
+        ]
+        new_versions = [
+            {"start_date": "2020-01-01T00:00:00", "end_date": "2022-01-01T00:00:00"},
+        ]
+
+        # when
+        to_create, to_update = cdisc_import.plan_version_merge(
+            "C1", new_versions, existing_versions, "codelist", stats
+        )
+
+        # then
+        assert to_create == []
+        assert to_update == [
+            {
+                "uid": "C1",
+                "start_date": utc("2020-01-01T00:00:00"),
+                "version": "1.0",
+                "end_date": "2022-01-01T00:00:00",
+            }
+        ]
+        assert existing_versions[0]["end_date"] == utc("2022-01-01T00:00:00")
+        assert stats == {"codelist_updated": 1}
+
+    def test__plan_version_merge_retires_active_version_for_new_version(
+        self, cdisc_import
+    ):
+        # given
+        stats = Counter()
+        existing_versions = [
+            {
+                "start_date": utc("2020-01-01T00:00:00"),
+                "end_date": None,
+                "version": "1.0",
+            },
+        ]
+        new_versions = [
+            {"start_date": "2020-01-01T00:00:00", "end_date": "2023-01-01T00:00:00"},
+            {"start_date": "2023-01-01T00:00:00", "end_date": None},
+        ]
+
+        # when
+        to_create, to_update = cdisc_import.plan_version_merge(
+            "C1", new_versions, existing_versions, "term", stats
+        )
+
+        # then
+        assert to_create == [
+            {"uid": "C1", "start_date": "2023-01-01T00:00:00", "end_date": None}
+        ]
+        assert to_update == [
+            {
+                "uid": "C1",
+                "start_date": utc("2020-01-01T00:00:00"),
+                "version": "1.0",
+                "end_date": "2023-01-01T00:00:00",
+            }
+        ]
+        assert existing_versions[0]["end_date"] == utc("2023-01-01T00:00:00")
+        assert stats == {"term_updated": 1, "term_created": 1}
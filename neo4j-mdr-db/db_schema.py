@@ -121,6 +121,9 @@ INDEXES = [
     ("OdmAliasRoot", "uid"),
     ("OdmDescriptionRoot", "uid"),
     ("DataSupplierValue", "name"),
+    ("BackgroundJob", "status"),
+    ("BackgroundJob", "owner_id"),
+    ("StudyAction", "date"),
 ]
 
 # array of text indexes to create [label, property]
@@ -147,6 +150,8 @@ REL_INDEXES = [
     ("HAS_DATASET_VARIABLE", "version_number"),
     ("HAS_VERSION", "start_date"),
     ("HAS_VERSION", "end_date"),
+    ("HAS_TERM", "start_date"),
+    ("HAS_TERM", "end_date"),
 ]
 
 # array of constraints to create [label, property, type["NODE KEY", "UNIQUE", "NOT NULL"]]
@@ -236,6 +241,7 @@ CONSTRAINTS = [
     ("FootnotePreInstanceRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("OdmVendorElementRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("ComplexityBurden", "burden_id", CONSTRAINT_TYPE_UNIQUE),
+    ("BackgroundJob", "uid", CONSTRAINT_TYPE_NODE_KEY),
 ]
 
 